@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+Colour - Benchmarks
+===================
+
+Defines the *Colour* benchmarks, each module is runnable as a script, e.g.
+``python -m benchmarks.float_precision``.
+"""
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
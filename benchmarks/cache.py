@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent Caches Benchmark
+===========================
+
+Compares the time taken to compute derived datasets, e.g. the *CIE XYZ*
+colourspace outer surface, tables of tristimulus weighting factors,
+*Munsell Renotation System* indexes and the *CIE 2017 Test Colour Samples*
+data, with empty in-memory caches as in a new process, with and without the
+persistent caches enabled by the *COLOUR_SCIENCE__CACHE_DIR* environment
+variable.
+
+Usage: ``python -m benchmarks.cache``
+"""
+
+import os
+import shutil
+import tempfile
+
+from colour.colorimetry import (MSDS_CMFS, SDS_ILLUMINANTS, SpectralShape,
+                                sd_ones, sd_to_XYZ)
+from colour.notation import munsell
+from colour.quality.cfi2017 import _load_TCS_data_CIE2017
+from colour.utilities import CACHE_REGISTRY
+from colour.volume import XYZ_outer_surface
+
+from benchmarks.common import benchmark, print_benchmark_results
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['derived_datasets', 'benchmark_persistent_caches']
+
+
+def derived_datasets(cmfs, sd):
+    """
+    Computes the derived datasets after clearing the in-memory caches.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions to compute the *CIE XYZ*
+        colourspace outer surface with.
+    sd : SpectralDistribution
+        Spectral distribution to compute the tristimulus weighting factors
+        with.
+    """
+
+    CACHE_REGISTRY.clear_all_caches()
+    munsell._MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
+
+    XYZ_outer_surface(cmfs, sd_ones(cmfs.shape))
+    sd_to_XYZ(sd)
+    munsell._munsell_specifications()
+    munsell._munsell_maximum_chromas_from_renotation()
+    _load_TCS_data_CIE2017(SpectralShape(interval=1))
+    _load_TCS_data_CIE2017(SpectralShape(interval=5))
+
+
+def benchmark_persistent_caches(repeat=5):
+    """
+    Benchmarks :func:`benchmarks.cache.derived_datasets` definition with and
+    without the persistent caches.
+
+    Parameters
+    ----------
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+    """
+
+    cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer'].copy().align(
+        SpectralShape(360, 780, 1))
+    sd = SDS_ILLUMINANTS['FL2'].copy().interpolate(SpectralShape(380, 780, 10))
+
+    environment = os.environ.pop('COLOUR_SCIENCE__CACHE_DIR', None)
+    directory = tempfile.mkdtemp()
+    try:
+        results = [
+            benchmark(
+                'Derived Datasets', derived_datasets, cmfs, sd,
+                repeat=repeat)
+        ]
+
+        os.environ['COLOUR_SCIENCE__CACHE_DIR'] = directory
+
+        results.append(
+            benchmark(
+                'Derived Datasets - Persistent Caches',
+                derived_datasets,
+                cmfs,
+                sd,
+                repeat=repeat))
+    finally:
+        if environment is None:
+            os.environ.pop('COLOUR_SCIENCE__CACHE_DIR', None)
+        else:
+            os.environ['COLOUR_SCIENCE__CACHE_DIR'] = environment
+
+        shutil.rmtree(directory)
+        CACHE_REGISTRY.clear_all_caches()
+
+    print_benchmark_results('Derived Datasets - Empty In-Memory Caches',
+                            results)
+
+    return results
+
+
+if __name__ == '__main__':
+    benchmark_persistent_caches()
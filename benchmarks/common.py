@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks Common Utilities
+===========================
+
+Defines the common utilities objects used by the *Colour* benchmarks.
+"""
+
+import timeit
+import tracemalloc
+from collections import namedtuple
+
+from colour.utilities import message_box
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'BenchmarkResult', 'benchmark', 'peak_memory', 'format_bytes',
+    'print_benchmark_results'
+]
+
+
+class BenchmarkResult(
+        namedtuple('BenchmarkResult', ('name', 'best', 'mean', 'peak'))):
+    """
+    Defines a benchmark result.
+
+    Parameters
+    ----------
+    name : unicode
+        Benchmark name.
+    best : numeric
+        Best execution time in seconds.
+    mean : numeric
+        Mean execution time in seconds.
+    peak : integer
+        Peak memory allocated during a single execution in bytes.
+    """
+
+
+def peak_memory(definition, *args, **kwargs):
+    """
+    Returns the peak memory allocated while calling given definition with
+    given arguments.
+
+    *Numpy* reports its buffer allocations to :mod:`tracemalloc`, thus the
+    returned value accounts for the temporary arrays created by the definition.
+
+    Parameters
+    ----------
+    definition : callable
+        Definition to call.
+
+    Other Parameters
+    ----------------
+    \\*args : list, optional
+        Arguments to call the definition with.
+    \\**kwargs : dict, optional
+        Keywords arguments to call the definition with.
+
+    Returns
+    -------
+    integer
+        Peak memory allocated in bytes.
+    """
+
+    tracemalloc.start()
+    try:
+        definition(*args, **kwargs)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def benchmark(name, definition, *args, **kwargs):
+    """
+    Benchmarks given definition with given arguments.
+
+    Parameters
+    ----------
+    name : unicode
+        Benchmark name.
+    definition : callable
+        Definition to benchmark.
+
+    Other Parameters
+    ----------------
+    repeat : integer, optional
+        Number of timing repetitions.
+    number : integer, optional
+        Number of definition calls per timing repetition.
+    \\*args : list, optional
+        Arguments to call the definition with.
+    \\**kwargs : dict, optional
+        Keywords arguments to call the definition with.
+
+    Returns
+    -------
+    BenchmarkResult
+        Benchmark result.
+    """
+
+    repeat = kwargs.pop('repeat', 5)
+    number = kwargs.pop('number', 1)
+
+    # Warming up caches and lazy initialisations.
+    definition(*args, **kwargs)
+
+    timings = [
+        timing / number for timing in timeit.repeat(
+            lambda: definition(*args, **kwargs), repeat=repeat, number=number)
+    ]
+
+    return BenchmarkResult(name, min(timings),
+                           sum(timings) / len(timings),
+                           peak_memory(definition, *args, **kwargs))
+
+
+def format_bytes(size):
+    """
+    Formats given size in bytes to a human readable string.
+
+    Parameters
+    ----------
+    size : integer
+        Size in bytes.
+
+    Returns
+    -------
+    unicode
+        Human readable size.
+    """
+
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(size) < 1024:
+            return '{0:.1f} {1}'.format(size, unit)
+        size /= 1024
+
+    return '{0:.1f} GiB'.format(size)
+
+
+def print_benchmark_results(title, results, reference=None):
+    """
+    Prints given benchmark results.
+
+    Parameters
+    ----------
+    title : unicode
+        Benchmark results title.
+    results : array_like
+        Benchmark results.
+    reference : BenchmarkResult, optional
+        Reference benchmark result used to compute the speedups, default to
+        the first result.
+    """
+
+    if reference is None:
+        reference = results[0]
+
+    message_box(title)
+
+    for result in results:
+        print('{0:<40} best: {1:>9.3f} ms | mean: {2:>9.3f} ms | '
+              'peak: {3:>10} | speedup: {4:>6.2f}x'.format(
+                  result.name, result.best * 1000, result.mean * 1000,
+                  format_bytes(result.peak), reference.best / result.best))
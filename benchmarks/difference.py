@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Difference Benchmark
+===========================
+
+Compares the throughput and peak memory of
+:func:`colour.difference.delta_E_CIE2000` definition with its previous
+implementation allocating a full-size array for each intermediate quantity.
+
+Usage: ``python -m benchmarks.difference``
+"""
+
+import numpy as np
+
+from colour.difference import delta_E_CIE2000
+from colour.utilities import ignore_numpy_errors, to_domain_100, tsplit
+
+from benchmarks.common import benchmark, format_bytes, print_benchmark_results
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['delta_E_CIE2000_reference', 'benchmark_delta_E_CIE2000']
+
+
+def delta_E_CIE2000_reference(Lab_1, Lab_2, textiles=False):
+    """
+    Returns the difference :math:`\\Delta E_{00}` between two given
+    *CIE L\\*a\\*b\\** colourspace arrays using *CIE 2000* recommendation.
+
+    This is the previous implementation of
+    :func:`colour.difference.delta_E_CIE2000` definition, kept as benchmark
+    reference.
+
+    Parameters
+    ----------
+    Lab_1 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 1.
+    Lab_2 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 2.
+    textiles : bool, optional
+        Textiles application specific parametric factors
+        :math:`k_L=2,\\ k_C=k_H=1` weights are used instead of
+        :math:`k_L=k_C=k_H=1`.
+
+    Returns
+    -------
+    numeric or ndarray
+        Colour difference :math:`\\Delta E_{00}`.
+    """
+
+    L_1, a_1, b_1 = tsplit(to_domain_100(Lab_1))
+    L_2, a_2, b_2 = tsplit(to_domain_100(Lab_2))
+
+    k_L = 2 if textiles else 1
+    k_C = 1
+    k_H = 1
+
+    l_bar_prime = 0.5 * (L_1 + L_2)
+
+    c_1 = np.hypot(a_1, b_1)
+    c_2 = np.hypot(a_2, b_2)
+
+    c_bar = 0.5 * (c_1 + c_2)
+    c_bar7 = c_bar ** 7
+
+    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + 25 ** 7)))
+
+    a_1_prime = a_1 * (1 + g)
+    a_2_prime = a_2 * (1 + g)
+    c_1_prime = np.hypot(a_1_prime, b_1)
+    c_2_prime = np.hypot(a_2_prime, b_2)
+    c_bar_prime = 0.5 * (c_1_prime + c_2_prime)
+
+    h_1_prime = np.degrees(np.arctan2(b_1, a_1_prime)) % 360
+    h_2_prime = np.degrees(np.arctan2(b_2, a_2_prime)) % 360
+
+    h_bar_prime = np.where(
+        np.fabs(h_1_prime - h_2_prime) <= 180,
+        0.5 * (h_1_prime + h_2_prime),
+        (0.5 * (h_1_prime + h_2_prime + 360)),
+    )
+
+    t = (1 - 0.17 * np.cos(np.deg2rad(h_bar_prime - 30)) +
+         0.24 * np.cos(np.deg2rad(2 * h_bar_prime)) +
+         0.32 * np.cos(np.deg2rad(3 * h_bar_prime + 6)) -
+         0.20 * np.cos(np.deg2rad(4 * h_bar_prime - 63)))
+
+    h = h_2_prime - h_1_prime
+    delta_h_prime = np.where(h_2_prime <= h_1_prime, h - 360, h + 360)
+    delta_h_prime = np.where(np.fabs(h) <= 180, h, delta_h_prime)
+
+    delta_L_prime = L_2 - L_1
+    delta_C_prime = c_2_prime - c_1_prime
+    delta_H_prime = (2 * np.sqrt(c_1_prime * c_2_prime) * np.sin(
+        np.deg2rad(0.5 * delta_h_prime)))
+
+    s_L = 1 + ((0.015 * (l_bar_prime - 50) * (l_bar_prime - 50)) /
+               np.sqrt(20 + (l_bar_prime - 50) * (l_bar_prime - 50)))
+    s_C = 1 + 0.045 * c_bar_prime
+    s_H = 1 + 0.015 * c_bar_prime * t
+
+    delta_theta = (
+        30 * np.exp(-((h_bar_prime - 275) / 25) * ((h_bar_prime - 275) / 25)))
+
+    c_bar_prime7 = c_bar_prime ** 7
+
+    r_C = np.sqrt(c_bar_prime7 / (c_bar_prime7 + 25 ** 7))
+    r_T = -2 * r_C * np.sin(np.deg2rad(2 * delta_theta))
+
+    d_E = np.sqrt((delta_L_prime / (k_L * s_L)) ** 2 +
+                  (delta_C_prime / (k_C * s_C)) ** 2 +
+                  (delta_H_prime / (k_H * s_H)) ** 2 +
+                  (delta_C_prime / (k_C * s_C)) * (delta_H_prime /
+                                                   (k_H * s_H)) * r_T)
+
+    return d_E
+
+
+@ignore_numpy_errors
+def benchmark_delta_E_CIE2000(shape=(2160, 3840, 3), repeat=3):
+    """
+    Benchmarks :func:`colour.difference.delta_E_CIE2000` definition against
+    :func:`benchmarks.difference.delta_E_CIE2000_reference` definition.
+
+    Parameters
+    ----------
+    shape : array_like, optional
+        Shape of the random image-like *ndarray* to process.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+
+    Notes
+    -----
+    -   The peak memory is traced with :mod:`tracemalloc` module and accounts
+        for the *Numpy* allocations performed by the definitions, it is used
+        as a deterministic proxy for the peak resident set size.
+    """
+
+    random_state = np.random.RandomState(4)
+    Lab_1 = random_state.uniform(-100, 100, shape)
+    Lab_1[..., 0] = np.abs(Lab_1[..., 0])
+    Lab_2 = Lab_1 + random_state.normal(0, 5, shape)
+
+    np.testing.assert_allclose(
+        delta_E_CIE2000(Lab_1[:64], Lab_2[:64]),
+        delta_E_CIE2000_reference(Lab_1[:64], Lab_2[:64]),
+        atol=1e-7)
+
+    results = [
+        benchmark('delta_E_CIE2000 - Reference', delta_E_CIE2000_reference,
+                  Lab_1, Lab_2, repeat=repeat),
+        benchmark('delta_E_CIE2000', delta_E_CIE2000, Lab_1, Lab_2,
+                  repeat=repeat),
+    ]
+
+    print_benchmark_results(
+        'delta_E_CIE2000 - {0} inputs of {1}'.format(
+            'x'.join(str(i) for i in shape), format_bytes(Lab_1.nbytes)),
+        results)
+
+    return results
+
+
+if __name__ == '__main__':
+    benchmark_delta_E_CIE2000()
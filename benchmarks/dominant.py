@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Dominant Wavelength Benchmark
+=============================
+
+Compares the throughput and peak memory of
+:func:`colour.colorimetry.dominant.closest_spectral_locus_wavelength`
+definition, binary searching the spectral locus segments sorted by hue angle,
+with its previous implementation intersecting every colour stimulus with every
+spectral locus segment, and reports the throughput of the definitions built
+on it for large arrays.
+
+Usage: ``python -m benchmarks.dominant``
+"""
+
+import numpy as np
+import scipy.spatial.distance
+
+from colour.algebra import extend_line_segment, intersect_line_segments
+from colour.colorimetry import (MSDS_CMFS, colorimetric_purity,
+                                dominant_wavelength)
+from colour.colorimetry.dominant import closest_spectral_locus_wavelength
+from colour.models import XYZ_to_xy
+from colour.utilities import as_float_array, ignore_numpy_errors
+
+from benchmarks.common import benchmark, format_bytes, print_benchmark_results
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'closest_spectral_locus_wavelength_reference', 'benchmark_dominant'
+]
+
+
+def closest_spectral_locus_wavelength_reference(xy, xy_n, xy_s,
+                                                inverse=False):
+    """
+    Returns the coordinates and closest spectral locus wavelength index to the
+    point where the line defined by the given achromatic stimulus :math:`xy_n`
+    to colour stimulus :math:`xy_n` *CIE xy* chromaticity coordinates
+    intersects the spectral locus.
+
+    This is the previous implementation of
+    :func:`colour.colorimetry.dominant.closest_spectral_locus_wavelength`
+    definition, kept as benchmark reference.
+
+    Parameters
+    ----------
+    xy : array_like
+        Colour stimulus *CIE xy* chromaticity coordinates.
+    xy_n : array_like
+        Achromatic stimulus *CIE xy* chromaticity coordinates.
+    xy_s : array_like
+        Spectral locus *CIE xy* chromaticity coordinates.
+    inverse : bool, optional
+        The intersection will be computed using the colour stimulus :math:`xy`
+        to achromatic stimulus :math:`xy_n` inverse direction.
+
+    Returns
+    -------
+    tuple
+        Closest wavelength index, intersection point *CIE xy* chromaticity
+        coordinates.
+    """
+
+    xy = as_float_array(xy)
+    xy_n = np.resize(xy_n, xy.shape)
+    xy_s = as_float_array(xy_s)
+
+    xy_e = (extend_line_segment(xy, xy_n)
+            if inverse else extend_line_segment(xy_n, xy))
+
+    xy_s = np.vstack([xy_s, xy_s[0, :]])
+
+    xy_wl = intersect_line_segments(
+        np.concatenate((xy_n, xy_e), -1),
+        np.hstack([xy_s, np.roll(xy_s, 1, axis=0)])).xy
+    xy_wl = xy_wl[~np.isnan(xy_wl).any(axis=-1)]
+
+    i_wl = np.argmin(scipy.spatial.distance.cdist(xy_wl, xy_s), axis=-1)
+
+    i_wl = np.reshape(i_wl, xy.shape[0:-1])
+    xy_wl = np.reshape(xy_wl, xy.shape)
+
+    return i_wl, xy_wl
+
+
+@ignore_numpy_errors
+def benchmark_dominant(count=10000, count_large=1000000, repeat=3):
+    """
+    Benchmarks :func:`colour.colorimetry.dominant.\
+closest_spectral_locus_wavelength` definition against
+    :func:`benchmarks.dominant.closest_spectral_locus_wavelength_reference`
+    definition and the definitions using it on large arrays.
+
+    Parameters
+    ----------
+    count : integer, optional
+        Colour stimuli count to process with both implementations.
+    count_large : integer, optional
+        Colour stimuli count to process with the current implementation only.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+
+    Notes
+    -----
+    -   The peak memory is traced with :mod:`tracemalloc` module and accounts
+        for the *Numpy* allocations performed by the definitions, it is used
+        as a deterministic proxy for the peak resident set size.
+    """
+
+    cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+    xy_s = XYZ_to_xy(cmfs.values)
+    xy_n = np.array([0.31270000, 0.32900000])
+
+    # The previous implementation only supports colour stimuli whose lines
+    # intersect a single spectral locus segment, i.e. not pointing to the long
+    # wavelengths end where the spectral locus folds back on itself.
+    random_state = np.random.RandomState(4)
+    xy = random_state.uniform([0.05, 0.02], [0.72, 0.82], (count_large, 2))
+
+    np.testing.assert_allclose(
+        closest_spectral_locus_wavelength(xy[:64], xy_n, xy_s)[1],
+        closest_spectral_locus_wavelength_reference(xy[:64], xy_n, xy_s)[1],
+        atol=1e-12)
+
+    results = [
+        benchmark(
+            'Closest Wavelength - Reference',
+            closest_spectral_locus_wavelength_reference,
+            xy[:count],
+            xy_n,
+            xy_s,
+            repeat=repeat),
+        benchmark(
+            'Closest Wavelength',
+            closest_spectral_locus_wavelength,
+            xy[:count],
+            xy_n,
+            xy_s,
+            repeat=repeat),
+    ]
+
+    print_benchmark_results(
+        'Closest Spectral Locus Wavelength - {0} Colour Stimuli'.format(count),
+        results)
+
+    results_large = [
+        benchmark(
+            'Closest Wavelength',
+            closest_spectral_locus_wavelength,
+            xy,
+            xy_n,
+            xy_s,
+            repeat=repeat),
+        benchmark(
+            'Dominant Wavelength',
+            dominant_wavelength,
+            xy,
+            xy_n,
+            cmfs,
+            repeat=repeat),
+        benchmark(
+            'Colorimetric Purity',
+            colorimetric_purity,
+            xy,
+            xy_n,
+            cmfs,
+            repeat=repeat),
+    ]
+
+    print_benchmark_results(
+        'Dominant Wavelength and Purity - {0} Colour Stimuli of {1}'.format(
+            count_large, format_bytes(xy.nbytes)), results_large)
+
+    return results + results_large
+
+
+if __name__ == '__main__':
+    benchmark_dominant()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Float Precision Benchmark
+=========================
+
+Compares the throughput and peak memory of typical image processing
+definitions when *Colour* float precision is set to *float64* and *float32*
+with :func:`colour.utilities.set_float_precision` definition.
+
+Usage: ``python -m benchmarks.float_precision``
+"""
+
+import numpy as np
+
+from colour.adaptation import chromatic_adaptation
+from colour.appearance import XYZ_to_CAM16
+from colour.io import LUT3D
+from colour.models import (RGB_COLOURSPACES, RGB_to_RGB, XYZ_to_Lab,
+                           eotf_inverse)
+from colour.utilities import ignore_numpy_errors, set_float_precision
+
+from benchmarks.common import benchmark, print_benchmark_results
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['BENCHMARK_DEFINITIONS', 'benchmark_float_precision']
+
+BENCHMARK_DEFINITIONS = {
+    'RGB_to_RGB (sRGB -> ACEScg)':
+        lambda a: RGB_to_RGB(a, RGB_COLOURSPACES['sRGB'],
+                             RGB_COLOURSPACES['ACEScg'],
+                             apply_cctf_decoding=True),
+    'eotf_inverse (ST 2084)':
+        lambda a: eotf_inverse(a * 1000, 'ST 2084'),
+    'XYZ_to_Lab':
+        lambda a: XYZ_to_Lab(a),
+    'chromatic_adaptation (Von Kries)':
+        lambda a: chromatic_adaptation(
+            a, np.array([0.95045593, 1.00000000, 1.08905775]),
+            np.array([0.96429568, 1.00000000, 0.82510460])),
+    'XYZ_to_CAM16':
+        lambda a: XYZ_to_CAM16(a * 100, np.array([95.05, 100.00, 108.88]),
+                               318.31, 20.0),
+    'LUT3D.apply (33^3)':
+        lambda a: LUT3D(LUT3D.linear_table(33) ** (1 / 2.2)).apply(a),
+}
+"""
+Definitions to benchmark, each one expects an image-like *ndarray*.
+
+BENCHMARK_DEFINITIONS : dict
+"""
+
+
+@ignore_numpy_errors
+def benchmark_float_precision(shape=(1080, 1920, 3), repeat=3):
+    """
+    Benchmarks :attr:`BENCHMARK_DEFINITIONS` attribute definitions in *float64*
+    and *float32* precision.
+
+    Parameters
+    ----------
+    shape : array_like, optional
+        Shape of the random image-like *ndarray* to process.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    dict
+        Benchmark results for each definition.
+    """
+
+    image = np.random.RandomState(4).random_sample(shape)
+
+    results = {}
+    for name, definition in BENCHMARK_DEFINITIONS.items():
+        results[name] = []
+        for dtype in (np.float64, np.float32):
+            set_float_precision(dtype)
+            try:
+                results[name].append(
+                    benchmark('{0} - {1}'.format(name, dtype.__name__),
+                              definition,
+                              image.astype(dtype),
+                              repeat=repeat))
+            finally:
+                set_float_precision(np.float64)
+
+        print_benchmark_results(name, results[name])
+
+    return results
+
+
+if __name__ == '__main__':
+    benchmark_float_precision()
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Geometry Benchmark
+==================
+
+Compares the throughput and peak memory of
+:func:`colour.algebra.intersect_line_segments` definition, computing the
+intersections in chunks of line segments, and of
+:func:`colour.algebra.intersect_line_segments_indexed` definition, testing
+only the line segments whose bounding boxes overlap a common uniform grid
+cell, with the previous implementation tiling every coordinate to the size of
+the line segments pairs, and reports the throughput of the indexed definition
+on large polylines.
+
+Usage: ``python -m benchmarks.geometry``
+"""
+
+import numpy as np
+
+from colour.algebra import (LineSegmentsIntersections_Specification,
+                            intersect_line_segments,
+                            intersect_line_segments_indexed)
+from colour.utilities import ignore_numpy_errors, tstack
+
+from benchmarks.common import benchmark, format_bytes, print_benchmark_results
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'intersect_line_segments_reference', 'random_walk_line_segments',
+    'benchmark_intersect_line_segments'
+]
+
+
+def intersect_line_segments_reference(l_1, l_2):
+    """
+    Computes :math:`l_1` line segments intersections with :math:`l_2` line
+    segments.
+
+    This is the previous implementation of
+    :func:`colour.algebra.intersect_line_segments` definition, kept as
+    benchmark reference.
+
+    Parameters
+    ----------
+    l_1 : array_like
+        :math:`l_1` line segments array.
+    l_2 : array_like
+        :math:`l_2` line segments array.
+
+    Returns
+    -------
+    LineSegmentsIntersections_Specification
+        Line segments intersections specification.
+    """
+
+    l_1 = np.reshape(l_1, (-1, 4))
+    l_2 = np.reshape(l_2, (-1, 4))
+
+    r_1, c_1 = l_1.shape[0], l_1.shape[1]
+    r_2, c_2 = l_2.shape[0], l_2.shape[1]
+
+    x_1, y_1, x_2, y_2 = [
+        np.tile(l_1[:, i, np.newaxis], (1, r_2)) for i in range(c_1)
+    ]
+
+    l_2 = np.transpose(l_2)
+
+    x_3, y_3, x_4, y_4 = [np.tile(l_2[i, :], (r_1, 1)) for i in range(c_2)]
+
+    x_4_x_3 = x_4 - x_3
+    y_1_y_3 = y_1 - y_3
+    y_4_y_3 = y_4 - y_3
+    x_1_x_3 = x_1 - x_3
+    x_2_x_1 = x_2 - x_1
+    y_2_y_1 = y_2 - y_1
+
+    numerator_a = x_4_x_3 * y_1_y_3 - y_4_y_3 * x_1_x_3
+    numerator_b = x_2_x_1 * y_1_y_3 - y_2_y_1 * x_1_x_3
+    denominator = y_4_y_3 * x_2_x_1 - x_4_x_3 * y_2_y_1
+
+    u_a = numerator_a / denominator
+    u_b = numerator_b / denominator
+
+    intersect = np.logical_and.reduce((u_a >= 0, u_a <= 1, u_b >= 0, u_b <= 1))
+    xy = tstack([x_1 + x_2_x_1 * u_a, y_1 + y_2_y_1 * u_a])
+    xy[~intersect] = np.nan
+    parallel = denominator == 0
+    coincident = np.logical_and.reduce((numerator_a == 0, numerator_b == 0,
+                                        parallel))
+
+    return LineSegmentsIntersections_Specification(xy, intersect, parallel,
+                                                   coincident)
+
+
+def random_walk_line_segments(count, seed=4):
+    """
+    Returns the line segments of a random walk polyline.
+
+    Parameters
+    ----------
+    count : integer
+        Line segments count.
+    seed : integer, optional
+        Random generator seed.
+
+    Returns
+    -------
+    ndarray
+        Line segments array.
+    """
+
+    random_state = np.random.RandomState(seed)
+    p = np.cumsum(random_state.normal(size=(count + 1, 2)), axis=0)
+
+    return np.hstack([p[:-1], p[1:]])
+
+
+@ignore_numpy_errors
+def benchmark_intersect_line_segments(count=2000,
+                                      count_large=100000,
+                                      repeat=3):
+    """
+    Benchmarks :func:`colour.algebra.intersect_line_segments` and
+    :func:`colour.algebra.intersect_line_segments_indexed` definitions
+    against :func:`benchmarks.geometry.intersect_line_segments_reference`
+    definition on the self-intersections of random walk polylines.
+
+    Parameters
+    ----------
+    count : integer, optional
+        Polyline line segments count to process with all the implementations.
+    count_large : integer, optional
+        Polyline line segments count to process with
+        :func:`colour.algebra.intersect_line_segments_indexed` definition
+        only.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+
+    Notes
+    -----
+    -   The peak memory is traced with :mod:`tracemalloc` module and accounts
+        for the *Numpy* allocations performed by the definitions, it is used
+        as a deterministic proxy for the peak resident set size.
+    """
+
+    l = random_walk_line_segments(count)  # noqa
+
+    s_r = intersect_line_segments_reference(l, l)
+    s = intersect_line_segments(l, l)
+    for a, b in zip(s_r, s):
+        np.testing.assert_array_equal(a, b)
+
+    s_i = intersect_line_segments_indexed(l, l)
+    np.testing.assert_array_equal(s_i.indexes, np.argwhere(s_r.intersect))
+    np.testing.assert_array_equal(s_i.xy, s_r.xy[s_r.intersect])
+
+    results = [
+        benchmark(
+            'Intersect - Reference',
+            intersect_line_segments_reference,
+            l,
+            l,
+            repeat=repeat),
+        benchmark(
+            'Intersect', intersect_line_segments, l, l, repeat=repeat),
+        benchmark(
+            'Intersect - Indexed',
+            intersect_line_segments_indexed,
+            l,
+            l,
+            repeat=repeat),
+    ]
+
+    print_benchmark_results(
+        'Line Segments Intersections - {0} x {0} Line Segments'.format(count),
+        results)
+
+    l = random_walk_line_segments(count_large)  # noqa
+
+    results_large = [
+        benchmark(
+            'Intersect - Indexed',
+            intersect_line_segments_indexed,
+            l,
+            l,
+            repeat=repeat),
+    ]
+
+    print_benchmark_results(
+        'Line Segments Intersections - {0} x {0} Line Segments of {1}'.format(
+            count_large, format_bytes(l.nbytes)), results_large)
+
+    return results + results_large
+
+
+if __name__ == '__main__':
+    benchmark_intersect_line_segments()
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Quality Benchmark
+========================
+
+Compares the time taken by the *Colour Rendering Index*, *Colour Quality
+Scale*, *CIE 2017 Colour Fidelity Index* and *ANSI/IES TM-30-18 Colour
+Fidelity Index* computations of a set of light sources when called for each
+spectral distribution and when called once on the multi-spectral
+distributions, with the reference illuminants colorimetry interpolated from
+the reference illuminants banks or computed exactly. The time taken to
+generate the *ANSI/IES TM-30-18 Colour Rendition Report* data is compared in
+the same way, and so is the time taken to compute the *Academy Spectral
+Similarity Index* (SSI) of each light source with each light source.
+
+Usage: ``python -m benchmarks.quality``
+"""
+
+import numpy as np
+
+from colour.colorimetry import (SDS_ILLUMINANTS, SDS_LIGHT_SOURCES,
+                                SpectralDistribution, SpectralShape)
+from colour.quality import (
+    colour_fidelity_index_ANSIIESTM3018,
+    colour_fidelity_index_ANSIIESTM3018_msds, colour_fidelity_index_CIE2017,
+    colour_fidelity_index_CIE2017_msds, colour_quality_scale,
+    colour_quality_scale_msds, colour_rendering_index,
+    colour_rendering_index_msds, spectral_similarity_index,
+    spectral_similarity_index_matrix, tm3018_report_data)
+
+from benchmarks.common import benchmark, print_benchmark_results
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'light_sources', 'per_sd_quality', 'benchmark_colour_quality',
+    'per_sd_tm3018_report_data', 'benchmark_tm3018_report_data',
+    'per_sd_spectral_similarity_index',
+    'benchmark_spectral_similarity_index_matrix'
+]
+
+
+def light_sources(count, shape):
+    """
+    Returns given count of light sources aligned to given spectral shape.
+
+    Parameters
+    ----------
+    count : integer
+        Light sources count.
+    shape : SpectralShape
+        Spectral shape to align the light sources to.
+
+    Returns
+    -------
+    list
+        Light sources.
+    """
+
+    return [
+        SpectralDistribution(sd.copy().align(shape).values, shape.range())
+        for sd in (list(SDS_ILLUMINANTS.values()) +
+                   list(SDS_LIGHT_SOURCES.values()))
+    ][:count]
+
+
+def per_sd_quality(definition, sds):
+    """
+    Computes the colour quality metric of given spectral distributions one
+    spectral distribution at a time with given definition.
+
+    Parameters
+    ----------
+    definition : callable
+        Colour quality metric definition, e.g.
+        :func:`colour.colour_rendering_index`.
+    sds : array_like
+        Spectral distributions.
+
+    Returns
+    -------
+    ndarray
+        Colour quality metric values.
+    """
+
+    return np.array([definition(sd) for sd in sds])
+
+
+def benchmark_colour_quality(count=12, repeat=1):
+    """
+    Benchmarks the *Colour Quality* multi-spectral distributions definitions
+    against :func:`benchmarks.quality.per_sd_quality` definition.
+
+    Parameters
+    ----------
+    count : integer, optional
+        Light sources count.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+    """
+
+    shape = SpectralShape(380, 780, 5)
+    sds = light_sources(count, shape)
+    values = np.array([sd.values for sd in sds])
+
+    results = []
+    for name, definition, msds_definition in (
+        ('CRI', colour_rendering_index, colour_rendering_index_msds),
+        ('CQS', colour_quality_scale, colour_quality_scale_msds),
+        ('CFI 2017', colour_fidelity_index_CIE2017,
+         colour_fidelity_index_CIE2017_msds),
+        ('TM-30-18', colour_fidelity_index_ANSIIESTM3018,
+         colour_fidelity_index_ANSIIESTM3018_msds),
+    ):
+        np.testing.assert_allclose(
+            msds_definition(values[:2], shape=shape, exact=True),
+            per_sd_quality(definition, sds[:2]),
+            atol=1e-7)
+
+        method_results = [
+            benchmark(
+                '{0} - Per Spectral Distribution'.format(name),
+                per_sd_quality,
+                definition,
+                sds,
+                repeat=repeat),
+            benchmark(
+                '{0} - Batch - Exact'.format(name),
+                msds_definition,
+                values,
+                shape=shape,
+                exact=True,
+                repeat=repeat),
+            benchmark(
+                '{0} - Batch - Bank'.format(name),
+                msds_definition,
+                values,
+                shape=shape,
+                repeat=repeat),
+        ]
+
+        print_benchmark_results('{0} - {1} light sources'.format(
+            name, len(sds)), method_results)
+
+        results.extend(method_results)
+
+    return results
+
+
+def per_sd_tm3018_report_data(sds):
+    """
+    Computes the *ANSI/IES TM-30-18 Colour Rendition Report* quantities of
+    given spectral distributions one spectral distribution at a time, as the
+    report plotting definitions do.
+
+    Parameters
+    ----------
+    sds : array_like
+        Spectral distributions.
+
+    Returns
+    -------
+    list
+        *ANSI/IES TM-30-18 Colour Rendition Report* specifications and
+        *Colour Rendering Index* (CRI) specifications.
+    """
+
+    return [(colour_fidelity_index_ANSIIESTM3018(sd, True),
+             colour_rendering_index(sd, True)) for sd in sds]
+
+
+def benchmark_tm3018_report_data(count=12, repeat=1):
+    """
+    Benchmarks :func:`colour.quality.tm3018_report_data` definition against
+    :func:`benchmarks.quality.per_sd_tm3018_report_data` definition.
+
+    Parameters
+    ----------
+    count : integer, optional
+        Light sources count.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+    """
+
+    shape = SpectralShape(380, 780, 5)
+    sds = light_sources(count, shape)
+    values = np.array([sd.values for sd in sds])
+
+    results = [
+        benchmark(
+            'Report Data - Per Spectral Distribution',
+            per_sd_tm3018_report_data,
+            sds,
+            repeat=repeat),
+        benchmark(
+            'Report Data - Batch - Exact',
+            tm3018_report_data,
+            values,
+            shape,
+            exact=True,
+            repeat=repeat),
+        benchmark(
+            'Report Data - Batch - Bank',
+            tm3018_report_data,
+            values,
+            shape,
+            repeat=repeat),
+    ]
+
+    print_benchmark_results(
+        'TM-30-18 Report Data - {0} light sources'.format(len(sds)), results)
+
+    return results
+
+
+def per_sd_spectral_similarity_index(sds_test, sds_reference):
+    """
+    Computes the *Academy Spectral Similarity Index* (SSI) of each given test
+    spectral distribution with each given reference spectral distribution one
+    pair at a time.
+
+    Parameters
+    ----------
+    sds_test : array_like
+        Test spectral distributions.
+    sds_reference : array_like
+        Reference spectral distributions.
+
+    Returns
+    -------
+    ndarray
+        *Academy Spectral Similarity Index* (SSI) array.
+    """
+
+    return np.array([[
+        spectral_similarity_index(sd_test, sd_reference)
+        for sd_reference in sds_reference
+    ] for sd_test in sds_test])
+
+
+def benchmark_spectral_similarity_index_matrix(count=50, repeat=1):
+    """
+    Benchmarks :func:`colour.quality.spectral_similarity_index_matrix`
+    definition against
+    :func:`benchmarks.quality.per_sd_spectral_similarity_index` definition.
+
+    Parameters
+    ----------
+    count : integer, optional
+        Light sources count.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+    """
+
+    shape = SpectralShape(380, 780, 5)
+    sds = light_sources(count, shape)
+    values = np.array([sd.values for sd in sds])
+
+    np.testing.assert_equal(
+        spectral_similarity_index_matrix(values, values[:4], shape),
+        per_sd_spectral_similarity_index(sds, sds[:4]))
+
+    results = [
+        benchmark(
+            'SSI - Per Spectral Distribution',
+            per_sd_spectral_similarity_index,
+            sds,
+            sds,
+            repeat=repeat),
+        benchmark(
+            'SSI - Matrix',
+            spectral_similarity_index_matrix,
+            values,
+            values,
+            shape,
+            repeat=repeat),
+    ]
+
+    print_benchmark_results(
+        'SSI - {0}x{0} light sources'.format(len(sds)), results)
+
+    return results
+
+
+if __name__ == '__main__':
+    benchmark_colour_quality()
+    benchmark_tm3018_report_data()
+    benchmark_spectral_similarity_index_matrix()
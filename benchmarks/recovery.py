@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Reflectance Recovery Benchmark
+==============================
+
+Compares the throughput and peak memory of
+:func:`colour.recovery.RGB_to_spectral_array_Smits1999` and
+:func:`colour.recovery.RGB_to_spectral_array_Mallett2019` definitions with
+the per-pixel :func:`colour.recovery.RGB_to_sd_Smits1999` and
+:func:`colour.recovery.RGB_to_sd_Mallett2019` definitions.
+
+Usage: ``python -m benchmarks.recovery``
+"""
+
+import numpy as np
+
+from colour.recovery import (RGB_to_sd_Mallett2019, RGB_to_sd_Smits1999,
+                             RGB_to_spectral_array_Mallett2019,
+                             RGB_to_spectral_array_Smits1999)
+
+from benchmarks.common import benchmark, format_bytes, print_benchmark_results
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['per_pixel_spectral_array', 'benchmark_RGB_to_spectral_array']
+
+
+def per_pixel_spectral_array(definition, RGB):
+    """
+    Recovers the spectral reflectance values of given *RGB* colourspace array
+    pixel by pixel with given spectral distribution recovery definition.
+
+    Parameters
+    ----------
+    definition : callable
+        Spectral distribution recovery definition, e.g.
+        :func:`colour.recovery.RGB_to_sd_Smits1999`.
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array.
+
+    Returns
+    -------
+    ndarray, (..., W)
+        Recovered spectral reflectance values.
+    """
+
+    RGB = np.asarray(RGB)
+
+    R = np.array([definition(RGB_i).values for RGB_i in RGB.reshape(-1, 3)])
+
+    return np.reshape(R, RGB.shape[:-1] + R.shape[-1:])
+
+
+def benchmark_RGB_to_spectral_array(shape=(64, 64, 3), repeat=3):
+    """
+    Benchmarks :func:`colour.recovery.RGB_to_spectral_array_Smits1999` and
+    :func:`colour.recovery.RGB_to_spectral_array_Mallett2019` definitions
+    against :func:`benchmarks.recovery.per_pixel_spectral_array` definition.
+
+    Parameters
+    ----------
+    shape : array_like, optional
+        Shape of the random texture-like *ndarray* to process.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+    """
+
+    RGB = np.random.RandomState(4).uniform(0, 1, shape)
+
+    results = []
+    for name, definition, array_definition in (
+        ('Smits 1999', RGB_to_sd_Smits1999, RGB_to_spectral_array_Smits1999),
+        ('Mallett 2019', RGB_to_sd_Mallett2019,
+         RGB_to_spectral_array_Mallett2019),
+    ):
+        np.testing.assert_allclose(
+            array_definition(RGB[:4], dtype=np.float64),
+            per_pixel_spectral_array(definition, RGB[:4]),
+            atol=1e-7)
+
+        method_results = [
+            benchmark('{0} - Per Pixel'.format(name),
+                      per_pixel_spectral_array, definition, RGB,
+                      repeat=repeat),
+            benchmark('{0} - float64'.format(name), array_definition, RGB,
+                      dtype=np.float64, repeat=repeat),
+            benchmark('{0} - float32'.format(name), array_definition, RGB,
+                      dtype=np.float32, repeat=repeat),
+        ]
+
+        print_benchmark_results(
+            '{0} - {1} inputs of {2}'.format(
+                name, 'x'.join(str(i) for i in shape),
+                format_bytes(RGB.nbytes)), method_results)
+
+        results.extend(method_results)
+
+    return results
+
+
+if __name__ == '__main__':
+    benchmark_RGB_to_spectral_array()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Startup Benchmark
+=================
+
+Compares the time taken by a new *Python* process to import **Colour** and to
+access some of its attributes, with the sub-packages, datasets and *SciPy*
+modules imported on first access and the spectral datasets read from their
+*.npz* archives on first key access, against the time taken to import the whole
+**Colour** namespace.
+
+Usage: ``python -m benchmarks.startup``
+"""
+
+import subprocess  # nosec
+import sys
+
+from benchmarks.common import BenchmarkResult, print_benchmark_results
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['STATEMENTS_STARTUP', 'startup_time', 'benchmark_startup']
+
+STATEMENTS_STARTUP = {
+    'Import - Whole Namespace': 'from colour import *',
+    'Import': 'import colour',
+    'Import - XYZ_to_Lab': 'import colour; colour.XYZ_to_Lab',
+    'Import - RGB_to_HEX': 'from colour.notation import RGB_to_HEX',
+    'Import - xy_to_CCT': 'import colour; colour.xy_to_CCT',
+    'Import - sd_to_XYZ': 'import colour; colour.sd_to_XYZ',
+    'Import - SDS_ILLUMINANTS': "import colour; colour.SDS_ILLUMINANTS['D65']",
+    'Import - MSDS_CMFS': "import colour; colour.MSDS_CMFS['cie_2_1931']",
+    'Import - MUNSELL_COLOURS': "import colour; colour.MUNSELL_COLOURS['all']",
+}
+"""
+Statements executed in a new *Python* process, the first one importing the
+whole **Colour** namespace as importing **Colour** used to.
+
+STATEMENTS_STARTUP : dict
+"""
+
+_STARTUP_TIME_SCRIPT = """
+import time
+start = time.perf_counter()
+{0}
+duration = time.perf_counter() - start
+try:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+except ImportError:
+    peak = 0
+print(duration, peak)
+"""
+
+
+def startup_time(statement):
+    """
+    Returns the time taken to execute given statement in a new *Python*
+    process and the peak resident memory of the process.
+
+    Parameters
+    ----------
+    statement : unicode
+        Statement to execute.
+
+    Returns
+    -------
+    tuple
+        Execution time in seconds and peak resident memory in bytes.
+    """
+
+    output = subprocess.check_output(  # nosec
+        [sys.executable, '-c',
+         _STARTUP_TIME_SCRIPT.format(statement)])
+
+    duration, peak = output.split()
+
+    return float(duration), int(peak)
+
+
+def benchmark_startup(repeat=5):
+    """
+    Benchmarks the statements from
+    :attr:`benchmarks.startup.STATEMENTS_STARTUP` attribute.
+
+    Parameters
+    ----------
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+    """
+
+    results = []
+    for name, statement in STATEMENTS_STARTUP.items():
+        # Warming up the filesystem and bytecode caches.
+        startup_time(statement)
+
+        timings, peaks = zip(
+            *[startup_time(statement) for _ in range(repeat)])
+
+        results.append(
+            BenchmarkResult(name, min(timings),
+                            sum(timings) / len(timings), max(peaks)))
+
+    print_benchmark_results('Startup', results)
+
+    return results
+
+
+if __name__ == '__main__':
+    benchmark_startup()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Viewing Conditions Benchmark
+============================
+
+Compares the throughput of the *CIECAM02* and *CAM16* colour appearance models
+functional API with the precomputed viewing conditions objects when
+converting an image processed in tiles under fixed viewing conditions.
+
+Usage: ``python -m benchmarks.viewing_conditions``
+"""
+
+import numpy as np
+
+from colour.appearance import (
+    CAM16_to_XYZ, CIECAM02_to_XYZ, ViewingConditions_CAM16,
+    ViewingConditions_CIECAM02, XYZ_to_CAM16, XYZ_to_CIECAM02)
+from colour.utilities import ignore_numpy_errors
+
+from benchmarks.common import benchmark, print_benchmark_results
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['benchmark_viewing_conditions']
+
+
+@ignore_numpy_errors
+def benchmark_viewing_conditions(shape=(1080, 1920, 3),
+                                 tile_size=64,
+                                 repeat=3):
+    """
+    Benchmarks the *CIECAM02* and *CAM16* colour appearance models viewing
+    conditions objects against the functional API.
+
+    Parameters
+    ----------
+    shape : array_like, optional
+        Shape of the random image-like *ndarray* to process.
+    tile_size : integer, optional
+        Size of the square tiles the image is processed with.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    dict
+        Benchmark results for each colour appearance model.
+    """
+
+    XYZ = np.random.RandomState(4).random_sample(shape) * 100
+    tiles = [
+        XYZ[i:i + tile_size, j:j + tile_size]
+        for i in range(0, shape[0], tile_size)
+        for j in range(0, shape[1], tile_size)
+    ]
+    XYZ_w = np.array([95.05, 100.00, 108.88])
+    L_A = 318.31
+    Y_b = 20.0
+
+    def functional(forward, inverse):
+        """
+        Converts the tiles with the functional API.
+        """
+
+        for tile in tiles:
+            inverse(forward(tile, XYZ_w, L_A, Y_b), XYZ_w, L_A, Y_b)
+
+    def viewing_conditions(cls):
+        """
+        Converts the tiles with the viewing conditions objects.
+        """
+
+        conditions = cls(XYZ_w, L_A, Y_b)
+        for tile in tiles:
+            conditions.inverse(conditions.forward(tile))
+
+    results = {}
+    for name, forward, inverse, cls in (
+        ('CIECAM02', XYZ_to_CIECAM02, CIECAM02_to_XYZ,
+         ViewingConditions_CIECAM02),
+        ('CAM16', XYZ_to_CAM16, CAM16_to_XYZ, ViewingConditions_CAM16),
+    ):
+        results[name] = [
+            benchmark('{0} - Functional'.format(name), functional, forward,
+                      inverse, repeat=repeat),
+            benchmark('{0} - {1}'.format(name, cls.__name__),
+                      viewing_conditions, cls, repeat=repeat),
+        ]
+
+        print_benchmark_results(
+            '{0} - {1} tiles of {2}x{2} pixels'.format(
+                name, len(tiles), tile_size), results[name])
+
+    return results
+
+
+if __name__ == '__main__':
+    benchmark_viewing_conditions()
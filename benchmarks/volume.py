@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Volume Benchmark
+=======================
+
+Compares the time taken by the *Monte Carlo* *RGB* colourspace volume and
+coverage computation definitions to reach 3 significant digits with the
+mesh integration based definitions, and the time taken by the point-in-gamut
+queries with the previous implementation building a *Delaunay* triangulation
+on every call. The time taken to generate the *CIE XYZ* colourspace outer
+surface is compared with the previous implementation integrating every pulse
+wave.
+
+Usage: ``python -m benchmarks.volume``
+"""
+
+import numpy as np
+from scipy.spatial import Delaunay
+
+from colour.colorimetry import (MSDS_CMFS, SpectralShape, msds_to_XYZ,
+                                sd_ones)
+from colour.models import (CCS_ILLUMINANT_POINTER_GAMUT,
+                           DATA_POINTER_GAMUT_VOLUME, LCHab_to_Lab, Lab_to_XYZ,
+                           RGB_COLOURSPACE_sRGB)
+from colour.volume import (GamutHull, RGB_colourspace_limits,
+                           RGB_colourspace_pointer_gamut_coverage,
+                           RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
+                           RGB_colourspace_volume,
+                           RGB_colourspace_volume_MonteCarlo,
+                           XYZ_outer_surface, generate_pulse_waves,
+                           is_within_mesh_volume)
+from colour.volume.spectrum import _CACHE_OUTER_SURFACE_XYZ
+
+from benchmarks.common import benchmark, print_benchmark_results
+
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'benchmark_RGB_colourspace_volume', 'is_within_mesh_volume_reference',
+    'benchmark_is_within_mesh_volume', 'XYZ_outer_surface_reference',
+    'XYZ_outer_surface_uncached', 'benchmark_XYZ_outer_surface'
+]
+
+
+def benchmark_RGB_colourspace_volume(colourspace=RGB_COLOURSPACE_sRGB,
+                                     samples=10e6,
+                                     repeat=1):
+    """
+    Benchmarks :func:`colour.RGB_colourspace_volume` and
+    :func:`colour.RGB_colourspace_pointer_gamut_coverage` definitions against
+    their *Monte Carlo* counterparts.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace, optional
+        *RGB* colourspace to compute the volume of.
+    samples : numeric, optional
+        *Monte Carlo* samples count.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+    """
+
+    limits = RGB_colourspace_limits(colourspace)
+
+    results = [
+        benchmark(
+            'Volume - Monte Carlo',
+            RGB_colourspace_volume_MonteCarlo,
+            colourspace,
+            samples,
+            limits,
+            seed=1,
+            repeat=repeat),
+        benchmark(
+            'Volume - Mesh',
+            RGB_colourspace_volume,
+            colourspace,
+            repeat=repeat),
+    ]
+
+    print_benchmark_results(
+        'RGB_colourspace_volume - {0}: {1:.1f} (Monte Carlo: {2:.1f})'.format(
+            colourspace.name,
+            RGB_colourspace_volume(colourspace),
+            RGB_colourspace_volume_MonteCarlo(
+                colourspace, samples, limits, seed=1)), results)
+
+    coverage_results = [
+        benchmark(
+            'Pointer Gamut Coverage - Monte Carlo',
+            RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
+            colourspace,
+            samples,
+            seed=1,
+            repeat=repeat),
+        benchmark(
+            'Pointer Gamut Coverage - Mesh',
+            RGB_colourspace_pointer_gamut_coverage,
+            colourspace,
+            repeat=repeat),
+    ]
+
+    print_benchmark_results(
+        'RGB_colourspace_pointer_gamut_coverage - {0}: {1:.3f}%'.format(
+            colourspace.name,
+            RGB_colourspace_pointer_gamut_coverage(colourspace)),
+        coverage_results)
+
+    return results + coverage_results
+
+
+def is_within_mesh_volume_reference(points, mesh, tolerance=None):
+    """
+    Returns if given points are within given mesh volume using Delaunay
+    triangulation.
+
+    This is the previous implementation of
+    :func:`colour.volume.is_within_mesh_volume` definition, kept as benchmark
+    reference.
+
+    Parameters
+    ----------
+    points : array_like
+        Points to check if they are within ``mesh`` volume.
+    mesh : array_like
+        Points of the volume used to generate the Delaunay triangulation.
+    tolerance : numeric, optional
+        Tolerance allowed in the inside-triangle check.
+
+    Returns
+    -------
+    bool
+        Is within mesh volume.
+    """
+
+    triangulation = Delaunay(mesh)
+
+    simplex = triangulation.find_simplex(points, tol=tolerance)
+    simplex = np.where(simplex >= 0, True, False)
+
+    return simplex
+
+
+def benchmark_is_within_mesh_volume(shape=(100, 100, 3), repeat=3):
+    """
+    Benchmarks :func:`colour.volume.is_within_mesh_volume` definition and
+    :class:`colour.volume.GamutHull` class against
+    :func:`benchmarks.volume.is_within_mesh_volume_reference` definition.
+
+    Parameters
+    ----------
+    shape : array_like, optional
+        Shape of the random image-like *ndarray* to process.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+    """
+
+    XYZ = np.random.RandomState(4).uniform(0, 1, shape)
+
+    meshes = {
+        "Pointer's Gamut":
+            Lab_to_XYZ(
+                LCHab_to_Lab(DATA_POINTER_GAMUT_VOLUME),
+                CCS_ILLUMINANT_POINTER_GAMUT),
+        'Visible Spectrum':
+            XYZ_outer_surface(),
+    }
+
+    results = []
+    for name, mesh in meshes.items():
+        hull = GamutHull(mesh)
+
+        results_m = [
+            benchmark(
+                'is_within_mesh_volume - Reference',
+                is_within_mesh_volume_reference,
+                XYZ,
+                mesh,
+                repeat=repeat),
+            benchmark(
+                'is_within_mesh_volume',
+                is_within_mesh_volume,
+                XYZ,
+                mesh,
+                repeat=repeat),
+            benchmark('GamutHull.contains', hull.contains, XYZ, repeat=repeat),
+        ]
+
+        print_benchmark_results(
+            '{0} - {1} inputs'.format(name, 'x'.join(
+                str(i) for i in shape)), results_m)
+
+        results += results_m
+
+    return results
+
+
+def XYZ_outer_surface_reference(cmfs, illuminant):
+    """
+    Generates the *CIE XYZ* colourspace outer surface by integrating every
+    pulse wave.
+
+    This is the previous implementation of
+    :func:`colour.volume.XYZ_outer_surface` definition, kept as benchmark
+    reference.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+
+    Returns
+    -------
+    ndarray
+        Outer surface *CIE XYZ* tristimulus values.
+    """
+
+    return msds_to_XYZ(
+        generate_pulse_waves(len(cmfs.wavelengths)),
+        cmfs,
+        illuminant,
+        method='Integration',
+        shape=cmfs.shape) / 100
+
+
+def XYZ_outer_surface_uncached(cmfs, illuminant):
+    """
+    Generates the *CIE XYZ* colourspace outer surface with
+    :func:`colour.volume.XYZ_outer_surface` definition after clearing its
+    cache.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+
+    Returns
+    -------
+    ndarray
+        Outer surface *CIE XYZ* tristimulus values.
+    """
+
+    _CACHE_OUTER_SURFACE_XYZ.clear()
+
+    return XYZ_outer_surface(cmfs, illuminant)
+
+
+def benchmark_XYZ_outer_surface(intervals=(10, 5, 2), repeat=1):
+    """
+    Benchmarks :func:`colour.volume.XYZ_outer_surface` definition against
+    :func:`benchmarks.volume.XYZ_outer_surface_reference` definition.
+
+    Parameters
+    ----------
+    intervals : array_like, optional
+        Colour matching functions wavelength intervals to benchmark.
+    repeat : integer, optional
+        Number of timing repetitions.
+
+    Returns
+    -------
+    list
+        Benchmark results.
+    """
+
+    results = []
+    for interval in intervals:
+        shape = SpectralShape(360, 780, interval)
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer'].copy().align(
+            shape)
+        illuminant = sd_ones(shape)
+
+        np.testing.assert_allclose(
+            XYZ_outer_surface_uncached(cmfs, illuminant),
+            XYZ_outer_surface_reference(cmfs, illuminant),
+            atol=1e-12)
+
+        results_i = [
+            benchmark(
+                'XYZ_outer_surface - Reference',
+                XYZ_outer_surface_reference,
+                cmfs,
+                illuminant,
+                repeat=repeat),
+            benchmark(
+                'XYZ_outer_surface',
+                XYZ_outer_surface_uncached,
+                cmfs,
+                illuminant,
+                repeat=repeat),
+        ]
+
+        print_benchmark_results(
+            'XYZ_outer_surface - {0}nm - {1} bins'.format(
+                interval, len(shape.range())), results_i)
+
+        results += results_i
+
+    return results
+
+
+if __name__ == '__main__':
+    benchmark_RGB_colourspace_volume()
+    benchmark_is_within_mesh_volume()
+    benchmark_XYZ_outer_surface()
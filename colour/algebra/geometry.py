@@ -9,6 +9,7 @@ Defines objects related to geometrical computations:
 -   :func:`colour.algebra.euclidean_distance`
 -   :func:`colour.algebra.extend_line_segment`
 -   :func:`colour.algebra.intersect_line_segments`
+-   :func:`colour.algebra.intersect_line_segments_indexed`
 -   :func:`colour.algebra.ellipse_coefficients_general_form`
 -   :func:`colour.algebra.ellipse_coefficients_canonical_form`
 -   :func:`colour.algebra.point_at_angle_on_ellipse`
@@ -38,8 +39,9 @@ extend-a-line-segment-a-specific-distance
 import numpy as np
 from collections import namedtuple
 
-from colour.utilities import (CaseInsensitiveMapping, as_float_array, ones,
-                              tsplit, tstack)
+from colour.constants import DEFAULT_INT_DTYPE
+from colour.utilities import (CaseInsensitiveMapping, as_float_array, batch,
+                              ones, tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -51,11 +53,22 @@ __status__ = 'Production'
 __all__ = [
     'normalise_vector', 'euclidean_distance', 'extend_line_segment',
     'LineSegmentsIntersections_Specification', 'intersect_line_segments',
-    'ellipse_coefficients_general_form', 'ellipse_coefficients_canonical_form',
-    'point_at_angle_on_ellipse', 'ellipse_fitting_Halir1998',
-    'ELLIPSE_FITTING_METHODS', 'ellipse_fitting'
+    'LineSegmentsIntersectionsIndexed_Specification',
+    'intersect_line_segments_indexed', 'ellipse_coefficients_general_form',
+    'ellipse_coefficients_canonical_form', 'point_at_angle_on_ellipse',
+    'ellipse_fitting_Halir1998', 'ELLIPSE_FITTING_METHODS', 'ellipse_fitting'
 ]
 
+_CHUNK_SIZE_LINE_SEGMENTS_INTERSECTIONS = 2 ** 16
+"""
+Line segments pairs, respectively grid cells overlapped by line segments,
+count processed at once by :func:`colour.algebra.intersect_line_segments`,
+respectively :func:`colour.algebra.intersect_line_segments_indexed`
+definitions, bounding the size of their intermediate arrays.
+
+_CHUNK_SIZE_LINE_SEGMENTS_INTERSECTIONS : integer
+"""
+
 
 def normalise_vector(a):
     """
@@ -250,19 +263,52 @@ def intersect_line_segments(l_1, l_2):
            [False, False, False]], dtype=bool)
     """
 
-    l_1 = np.reshape(l_1, (-1, 4))
-    l_2 = np.reshape(l_2, (-1, 4))
+    l_1 = np.reshape(as_float_array(l_1), (-1, 4))
+    l_2 = np.reshape(as_float_array(l_2), (-1, 4))
+
+    r_1, r_2 = l_1.shape[0], l_2.shape[0]
+
+    xy = np.empty((r_1, r_2, 2))
+    intersect = np.empty((r_1, r_2), dtype=np.bool_)
+    parallel = np.empty((r_1, r_2), dtype=np.bool_)
+    coincident = np.empty((r_1, r_2), dtype=np.bool_)
 
-    r_1, c_1 = l_1.shape[0], l_1.shape[1]
-    r_2, c_2 = l_2.shape[0], l_2.shape[1]
+    # The computations are performed in chunks of :math:`l_1` line segments
+    # so that the intermediate arrays size is bounded irrespective of the
+    # inputs size.
+    rows_count = max(1, _CHUNK_SIZE_LINE_SEGMENTS_INTERSECTIONS // max(r_2, 1))
+    for rows in batch(range(r_1), rows_count):
+        s = slice(rows.start, rows.stop)
+        xy[s], intersect[s], parallel[s], coincident[s] = (
+            _intersect_line_segments(l_1[s, np.newaxis, :],
+                                     l_2[np.newaxis, ...]))
+
+    return LineSegmentsIntersections_Specification(xy, intersect, parallel,
+                                                   coincident)
 
-    x_1, y_1, x_2, y_2 = [
-        np.tile(l_1[:, i, np.newaxis], (1, r_2)) for i in range(c_1)
-    ]
 
-    l_2 = np.transpose(l_2)
+def _intersect_line_segments(l_1, l_2):
+    """
+    Computes the intersections of given broadcastable :math:`l_1` and
+    :math:`l_2` line segments arrays.
 
-    x_3, y_3, x_4, y_4 = [np.tile(l_2[i, :], (r_1, 1)) for i in range(c_2)]
+    Parameters
+    ----------
+    l_1 : ndarray
+        :math:`l_1` line segments array whose last axis is
+        (:math:`x_1`, :math:`y_1`, :math:`x_2`, :math:`y_2`).
+    l_2 : ndarray
+        :math:`l_2` line segments array whose last axis is
+        (:math:`x_3`, :math:`y_3`, :math:`x_4`, :math:`y_4`).
+
+    Returns
+    -------
+    LineSegmentsIntersections_Specification
+        Line segments intersections specification.
+    """
+
+    x_1, y_1, x_2, y_2 = tsplit(l_1)
+    x_3, y_3, x_4, y_4 = tsplit(l_2)
 
     x_4_x_3 = x_4 - x_3
     y_1_y_3 = y_1 - y_3
@@ -289,6 +335,230 @@ def intersect_line_segments(l_1, l_2):
                                                    coincident)
 
 
+class LineSegmentsIntersectionsIndexed_Specification(
+        namedtuple('LineSegmentsIntersectionsIndexed_Specification',
+                   ('indexes', 'xy'))):
+    """
+    Defines the specification for the intersecting pairs of line segments
+    :math:`l_1` and :math:`l_2` returned by
+    :func:`colour.algebra.intersect_line_segments_indexed` definition.
+
+    Parameters
+    ----------
+    indexes : array_like
+        Array of the intersecting :math:`l_1` and :math:`l_2` line segments
+        indexes pairs, each row is a pair such as (:math:`i`, :math:`j`) where
+        :math:`i` and :math:`j` are respectively the indexes of the
+        :math:`l_1` and :math:`l_2` line segments.
+    xy : array_like
+        Array of the intersecting :math:`l_1` and :math:`l_2` line segments
+        intersections coordinates.
+    """
+
+
+def _line_segments_grid_cells(b, origin, size, columns):
+    """
+    Returns the uniform grid cells overlapped by given line segments bounding
+    boxes.
+
+    Parameters
+    ----------
+    b : ndarray
+        Line segments bounding boxes array, each row is a bounding box such as
+        (:math:`x_{min}`, :math:`y_{min}`, :math:`x_{max}`, :math:`y_{max}`).
+    origin : ndarray
+        Grid origin.
+    size : numeric
+        Grid cells size.
+    columns : integer
+        Grid columns count.
+
+    Returns
+    -------
+    tuple
+        Line segments indexes and overlapped grid cells indexes, a line
+        segment index is repeated for each grid cell it overlaps.
+    """
+
+    c_min = np.floor((b[..., 0:2] - origin) / size).astype(DEFAULT_INT_DTYPE)
+    c_max = np.floor((b[..., 2:4] - origin) / size).astype(DEFAULT_INT_DTYPE)
+
+    c_c = c_max - c_min + 1
+    c_n = c_c[..., 0] * c_c[..., 1]
+
+    i = np.repeat(np.arange(b.shape[0]), c_n)
+    o = np.arange(i.shape[0]) - np.repeat(np.cumsum(c_n) - c_n, c_n)
+
+    x = c_min[i, 0] + o % c_c[i, 0]
+    y = c_min[i, 1] + o // c_c[i, 0]
+
+    return i, y * columns + x
+
+
+def intersect_line_segments_indexed(l_1, l_2):
+    """
+    Computes :math:`l_1` line segments intersections with :math:`l_2` line
+    segments using a uniform grid index of their bounding boxes and returns
+    the intersecting pairs only.
+
+    Contrary to :func:`colour.algebra.intersect_line_segments` definition
+    whose output arrays size is the product of the :math:`l_1` and
+    :math:`l_2` line segments counts, only the line segments whose bounding
+    boxes overlap a common grid cell are tested against each other, making
+    the definition suitable for large line segments arrays, e.g. polylines
+    self-intersections. Line segments spanning most of the grid, e.g. long
+    rays, are tested against most of the other line segments, for which
+    :func:`colour.algebra.intersect_line_segments` definition is faster.
+
+    Parameters
+    ----------
+    l_1 : array_like
+        :math:`l_1` line segments array, each row is a line segment such as
+        (:math:`x_1`, :math:`y_1`, :math:`x_2`, :math:`y_2`) where
+        (:math:`x_1`, :math:`y_1`) and (:math:`x_2`, :math:`y_2`) are
+        respectively the start and end points of :math:`l_1` line segments.
+    l_2 : array_like
+        :math:`l_2` line segments array, each row is a line segment such as
+        (:math:`x_3`, :math:`y_3`, :math:`x_4`, :math:`y_4`) where
+        (:math:`x_3`, :math:`y_3`) and (:math:`x_4`, :math:`y_4`) are
+        respectively the start and end points of :math:`l_2` line segments.
+
+    Returns
+    -------
+    LineSegmentsIntersectionsIndexed_Specification
+        Intersecting line segments specification, the pairs are sorted by
+        :math:`l_1` and then :math:`l_2` line segments indexes.
+
+    References
+    ----------
+    :cite:`Bourkea`, :cite:`Erdema`
+
+    Notes
+    -----
+    -   Input line segments points coordinates are 2d coordinates.
+    -   The intersecting pairs and their intersections coordinates agree
+        with the ones of :func:`colour.algebra.intersect_line_segments`
+        definition, i.e. `np.argwhere(s.intersect)` and `s.xy[s.intersect]`,
+        except for degenerate pairs, e.g. nearly collinear disjoint line
+        segments, for which rounding errors may produce spurious
+        intersections with the dense definition while the disjoint bounding
+        boxes of the line segments are not tested.
+
+    Examples
+    --------
+    >>> l_1 = np.array(
+    ...     [[[0.15416284, 0.7400497],
+    ...       [0.26331502, 0.53373939]],
+    ...      [[0.01457496, 0.91874701],
+    ...       [0.90071485, 0.03342143]]]
+    ... )
+    >>> l_2 = np.array(
+    ...     [[[0.95694934, 0.13720932],
+    ...        [0.28382835, 0.60608318]],
+    ...       [[0.94422514, 0.85273554],
+    ...        [0.00225923, 0.52122603]],
+    ...       [[0.55203763, 0.48537741],
+    ...        [0.76813415, 0.16071675]]]
+    ... )
+    >>> s = intersect_line_segments_indexed(l_1, l_2)
+    >>> s.indexes
+    array([[0, 1],
+           [1, 0],
+           [1, 1],
+           [1, 2]])
+    >>> s.xy  # doctest: +ELLIPSIS
+    array([[ 0.2279184...,  0.6006430...],
+           [ 0.4281451...,  0.5055568...],
+           [ 0.3056055...,  0.6279838...],
+           [ 0.7578749...,  0.1761301...]])
+    """
+
+    l_1 = np.reshape(as_float_array(l_1), (-1, 4))
+    l_2 = np.reshape(as_float_array(l_2), (-1, 4))
+
+    # Line segments with non-finite coordinates cannot intersect.
+    i_1 = np.where(np.all(np.isfinite(l_1), axis=-1))[0]
+    i_2 = np.where(np.all(np.isfinite(l_2), axis=-1))[0]
+
+    if i_1.size == 0 or i_2.size == 0:
+        return LineSegmentsIntersectionsIndexed_Specification(
+            np.zeros((0, 2), dtype=DEFAULT_INT_DTYPE), np.zeros((0, 2)))
+
+    b_1 = np.hstack([
+        np.minimum(l_1[i_1, 0:2], l_1[i_1, 2:4]),
+        np.maximum(l_1[i_1, 0:2], l_1[i_1, 2:4])
+    ])
+    b_2 = np.hstack([
+        np.minimum(l_2[i_2, 0:2], l_2[i_2, 2:4]),
+        np.maximum(l_2[i_2, 0:2], l_2[i_2, 2:4])
+    ])
+
+    # The grid covers the :math:`l_2` line segments bounding boxes, its cells
+    # size is the largest median extent of the :math:`l_1` and :math:`l_2`
+    # line segments bounding boxes so that most of them overlap a few cells,
+    # it is bounded so that the grid has at most 4096 columns and rows.
+    origin = np.min(b_2[:, 0:2], axis=0)
+    extent = np.max(b_2[:, 2:4], axis=0) - origin
+    size = max(
+        np.max(np.median(b_1[:, 2:4] - b_1[:, 0:2], axis=0)),
+        np.max(np.median(b_2[:, 2:4] - b_2[:, 0:2], axis=0)),
+        np.max(extent) / 4096)
+    if size == 0:
+        size = 1
+    columns = int(np.floor(extent[0] / size)) + 1
+
+    # The :math:`l_1` line segments bounding boxes are clipped to the grid,
+    # discarding those not overlapping it.
+    b_1 = np.hstack([
+        np.maximum(b_1[:, 0:2], origin),
+        np.minimum(b_1[:, 2:4], np.max(b_2[:, 2:4], axis=0))
+    ])
+    overlap = np.all(b_1[:, 0:2] <= b_1[:, 2:4], axis=-1)
+    i_1, b_1 = i_1[overlap], b_1[overlap]
+
+    i_c, c_1 = _line_segments_grid_cells(b_1, origin, size, columns)
+    j_c, c_2 = _line_segments_grid_cells(b_2, origin, size, columns)
+    sorting = np.argsort(c_2, kind='stable')
+    j_c, c_2 = j_c[sorting], c_2[sorting]
+
+    indexes = [np.zeros((0, 2), dtype=DEFAULT_INT_DTYPE)]
+    xy = [np.zeros((0, 2))]
+    for cells in batch(range(c_1.size),
+                       _CHUNK_SIZE_LINE_SEGMENTS_INTERSECTIONS):
+        cells = slice(cells.start, cells.stop)
+
+        start = np.searchsorted(c_2, c_1[cells], 'left')
+        count = np.searchsorted(c_2, c_1[cells], 'right') - start
+
+        i = np.repeat(i_c[cells], count)
+        j = j_c[np.repeat(start - np.cumsum(count) + count, count) +
+                np.arange(i.size)]
+        c = np.repeat(c_1[cells], count)
+
+        # A pair of line segments is only tested in the grid cell containing
+        # the lower left corner of the intersection of their bounding boxes,
+        # if any, so that it is tested once.
+        b_min = np.maximum(b_1[i, 0:2], b_2[j, 0:2])
+        b_max = np.minimum(b_1[i, 2:4], b_2[j, 2:4])
+        c_min = np.floor((b_min - origin) / size).astype(DEFAULT_INT_DTYPE)
+        candidate = np.logical_and(
+            np.all(b_min <= b_max, axis=-1),
+            c_min[..., 1] * columns + c_min[..., 0] == c)
+        i, j = i_1[i[candidate]], i_2[j[candidate]]
+
+        s = _intersect_line_segments(l_1[i], l_2[j])
+        indexes.append(
+            tstack([i[s.intersect], j[s.intersect]], DEFAULT_INT_DTYPE))
+        xy.append(s.xy[s.intersect])
+
+    indexes, xy = np.concatenate(indexes), np.concatenate(xy)
+
+    sorting = np.lexsort((indexes[..., 1], indexes[..., 0]))
+
+    return LineSegmentsIntersectionsIndexed_Specification(
+        indexes[sorting], xy[sorting])
+
+
 def ellipse_coefficients_general_form(coefficients):
     """
     Returns the general form ellipse coefficients from given canonical form
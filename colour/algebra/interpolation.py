@@ -1590,7 +1590,7 @@ def vertices_and_relative_coordinates(V_xyz, table):
         :math:`V_{xyz}` values to transform to indexes relative
         :math:`V_{xyzr}` values.
     table : array_like
-        4-Dimensional (NxNxNx3) interpolation table.
+        4-Dimensional (NxNxNxM) interpolation table.
 
     Returns
     -------
@@ -1660,11 +1660,14 @@ def vertices_and_relative_coordinates(V_xyz, table):
     # table axis, ``i_f`` and ``i_c`` respectively the floor and ceiling
     # indexes encompassing a given V_xyz value.
     i_m = np.array(table.shape[0:-1]) - 1
-    i_f = np.floor(V_xyz * i_m).astype(DEFAULT_INT_DTYPE)
+    V_xyzi = V_xyz * as_float_array(i_m)
+    V_xyzf = np.floor(V_xyzi)
+    i_f = V_xyzf.astype(DEFAULT_INT_DTYPE)
     i_c = np.clip(i_f + 1, 0, i_m)
 
-    # Relative to indexes ``V_xyz`` values.
-    V_xyzr = i_m * V_xyz - i_f
+    # Relative to indexes ``V_xyz`` values, computed in floating point domain
+    # to preserve the current float precision.
+    V_xyzr = V_xyzi - V_xyzf
 
     i_f_c = i_f, i_c
 
@@ -1689,7 +1692,7 @@ def table_interpolation_trilinear(V_xyz, table):
     V_xyz : array_like
         :math:`V_{xyz}` values to interpolate.
     table : array_like
-        4-Dimensional (NxNxNx3) interpolation table.
+        4-Dimensional (NxNxNxM) interpolation table.
 
     Returns
     -------
@@ -1734,7 +1737,8 @@ def table_interpolation_trilinear(V_xyz, table):
              (1 - x) * y * (1 - z), (1 - x) * y * z, x * (1 - y) * (1 - z),
              x * (1 - y) * z, x * y * (1 - z), x * y * z]), 0, -1)
 
-    xyz_o = np.reshape(np.sum(vertices * weights, 1), V_xyz.shape)
+    xyz_o = np.reshape(
+        np.sum(vertices * weights, 1), V_xyz.shape[:-1] + np.shape(table)[-1:])
 
     return xyz_o
 
@@ -1749,7 +1753,7 @@ def table_interpolation_tetrahedral(V_xyz, table):
     V_xyz : array_like
         :math:`V_{xyz}` values to interpolate.
     table : array_like
-        4-Dimensional (NxNxNx3) interpolation table.
+        4-Dimensional (NxNxNxM) interpolation table.
 
     Returns
     -------
@@ -1805,7 +1809,7 @@ def table_interpolation_tetrahedral(V_xyz, table):
         (1 - y) * V000 + (y - x) * V010 + (x - z) * V110 + z * V111,
     ])
 
-    xyz_o = np.reshape(xyz_o, V_xyz.shape)
+    xyz_o = np.reshape(xyz_o, V_xyz.shape[:-1] + np.shape(table)[-1:])
 
     return xyz_o
 
@@ -1836,7 +1840,7 @@ def table_interpolation(V_xyz, table, method='Trilinear'):
     V_xyz : array_like
         :math:`V_{xyz}` values to interpolate.
     table : array_like
-        4-Dimensional (NxNxNx3) interpolation table.
+        4-Dimensional (NxNxNxM) interpolation table.
     method : unicode, optional
         **{'Trilinear', 'Tetrahedral'}**,
         Interpolation method.
@@ -9,7 +9,8 @@ from itertools import permutations
 
 from colour.algebra import (
     normalise_vector, euclidean_distance, extend_line_segment,
-    intersect_line_segments, ellipse_coefficients_general_form,
+    intersect_line_segments, intersect_line_segments_indexed,
+    ellipse_coefficients_general_form,
     ellipse_coefficients_canonical_form, point_at_angle_on_ellipse,
     ellipse_fitting_Halir1998)
 from colour.utilities import ignore_numpy_errors
@@ -23,7 +24,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestNormaliseVector', 'TestEuclideanDistance', 'TestExtendLineSegment',
-    'TestIntersectLineSegments', 'TestEllipseCoefficientsCanonicalForm',
+    'TestIntersectLineSegments', 'TestIntersectLineSegmentsIndexed',
+    'TestEllipseCoefficientsCanonicalForm',
     'TestEllipseCoefficientsGeneralForm', 'TestPointAtAngleOnEllipse',
     'TestEllipseFittingHalir1998'
 ]
@@ -205,6 +207,83 @@ class TestIntersectLineSegments(unittest.TestCase):
             np.array([[False, False, False, False],
                       [False, False, False, True]]))
 
+        random_state = np.random.RandomState(4)
+        l_1 = random_state.uniform(size=(3, 4))
+        l_2 = random_state.uniform(size=(2 ** 16 + 1, 4))
+
+        s = intersect_line_segments(l_1, l_2)
+        for i in range(l_1.shape[0]):
+            s_i = intersect_line_segments(l_1[i], l_2)
+            for a, b in zip(s, s_i):
+                np.testing.assert_array_equal(a[i], b[0])
+
+
+class TestIntersectLineSegmentsIndexed(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.geometry.intersect_line_segments_indexed`
+    definition unit tests methods.
+    """
+
+    def test_intersect_line_segments_indexed(self):
+        """
+        Tests :func:`colour.algebra.geometry.intersect_line_segments_indexed`
+        definition.
+        """
+
+        l_1 = np.array([
+            [[0.15416284, 0.7400497], [0.26331502, 0.53373939]],
+            [[0.01457496, 0.91874701], [0.90071485, 0.03342143]],
+        ])
+        l_2 = np.array([
+            [[0.95694934, 0.13720932], [0.28382835, 0.60608318]],
+            [[0.94422514, 0.85273554], [0.00225923, 0.52122603]],
+            [[0.55203763, 0.48537741], [0.76813415, 0.16071675]],
+            [[0.01457496, 0.91874701], [0.90071485, 0.03342143]],
+        ])
+
+        s = intersect_line_segments_indexed(l_1, l_2)
+
+        np.testing.assert_array_equal(s.indexes,
+                                      np.array([[0, 1], [1, 0], [1, 1],
+                                                [1, 2]]))
+
+        np.testing.assert_almost_equal(
+            s.xy,
+            np.array([[0.22791841, 0.60064309], [0.42814517, 0.50555685],
+                      [0.30560559, 0.62798382], [0.7578749, 0.17613012]]),
+            decimal=7)
+
+        random_state = np.random.RandomState(4)
+        p = np.cumsum(random_state.normal(size=(1001, 2)), axis=0)
+        l_1 = np.hstack([p[:-1], p[1:]])
+        l_2 = np.vstack([
+            l_1,
+            random_state.randint(-10, 10, (100, 4)),
+            random_state.uniform(-50, 50, (100, 4)),
+        ])
+
+        s = intersect_line_segments(l_1, l_2)
+        s_i = intersect_line_segments_indexed(l_1, l_2)
+
+        np.testing.assert_array_equal(s_i.indexes, np.argwhere(s.intersect))
+        np.testing.assert_array_equal(s_i.xy, s.xy[s.intersect])
+
+    @ignore_numpy_errors
+    def test_nan_intersect_line_segments_indexed(self):
+        """
+        Tests :func:`colour.algebra.geometry.intersect_line_segments_indexed`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 4, r=4))))
+
+        s = intersect_line_segments_indexed(cases, cases)
+        self.assertTupleEqual(s.indexes.shape, (s.xy.shape[0], 2))
+
+        s = intersect_line_segments_indexed(cases, np.zeros((0, 4)))
+        self.assertTupleEqual(s.indexes.shape, (0, 2))
+
 
 class TestEllipseCoefficientsCanonicalForm(unittest.TestCase):
     """
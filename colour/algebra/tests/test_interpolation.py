@@ -1089,6 +1089,29 @@ table_interpolation_trilinear` definition.
                 [0.59220355, 0.93136492, 0.30063692],
             ]))
 
+    def test_n_channels_interpolation_trilinear(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition tables with an arbitrary channels
+        count support.
+        """
+
+        prng = np.random.RandomState(4)
+
+        V_xyz = random_triplet_generator(16, random_state=prng)
+        table = np.concatenate([LUT_TABLE, LUT_TABLE[..., :2]], axis=-1)
+
+        V_o = table_interpolation_trilinear(V_xyz, LUT_TABLE)
+        np.testing.assert_almost_equal(
+            table_interpolation_trilinear(V_xyz, table),
+            np.hstack([V_o, V_o[..., :2]]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            table_interpolation_trilinear(np.reshape(V_xyz, (4, 4, 3)), table),
+            np.reshape(np.hstack([V_o, V_o[..., :2]]), (4, 4, 5)),
+            decimal=7)
+
 
 class TestTableInterpolationTetrahedral(unittest.TestCase):
     """
@@ -1127,6 +1150,30 @@ table_interpolation_tetrahedral` definition.
                 [0.61272658, 0.92799297, 0.29650424],
             ]))
 
+    def test_n_channels_interpolation_tetrahedral(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition tables with an arbitrary channels
+        count support.
+        """
+
+        prng = np.random.RandomState(4)
+
+        V_xyz = random_triplet_generator(16, random_state=prng)
+        table = np.concatenate([LUT_TABLE, LUT_TABLE[..., :2]], axis=-1)
+
+        V_o = table_interpolation_tetrahedral(V_xyz, LUT_TABLE)
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(V_xyz, table),
+            np.hstack([V_o, V_o[..., :2]]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(
+                np.reshape(V_xyz, (4, 4, 3)), table),
+            np.reshape(np.hstack([V_o, V_o[..., :2]]), (4, 4, 5)),
+            decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
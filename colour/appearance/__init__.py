@@ -5,9 +5,10 @@ from .hunt import (InductionFactors_Hunt, VIEWING_CONDITIONS_HUNT,
 from .atd95 import CAM_Specification_ATD95, XYZ_to_ATD95
 from .ciecam02 import (InductionFactors_CIECAM02, VIEWING_CONDITIONS_CIECAM02,
                        CAM_Specification_CIECAM02, XYZ_to_CIECAM02,
-                       CIECAM02_to_XYZ)
+                       CIECAM02_to_XYZ, ViewingConditions_CIECAM02)
 from .cam16 import (InductionFactors_CAM16, VIEWING_CONDITIONS_CAM16,
-                    CAM_Specification_CAM16, XYZ_to_CAM16, CAM16_to_XYZ)
+                    CAM_Specification_CAM16, XYZ_to_CAM16, CAM16_to_XYZ,
+                    ViewingConditions_CAM16)
 from .llab import (InductionFactors_LLAB, VIEWING_CONDITIONS_LLAB,
                    CAM_Specification_LLAB, XYZ_to_LLAB)
 from .nayatani95 import CAM_Specification_Nayatani95, XYZ_to_Nayatani95
@@ -21,11 +22,13 @@ __all__ = [
 __all__ += ['CAM_Specification_ATD95', 'XYZ_to_ATD95']
 __all__ += [
     'InductionFactors_CIECAM02', 'VIEWING_CONDITIONS_CIECAM02',
-    'CAM_Specification_CIECAM02', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ'
+    'CAM_Specification_CIECAM02', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ',
+    'ViewingConditions_CIECAM02'
 ]
 __all__ += [
     'InductionFactors_CAM16', 'VIEWING_CONDITIONS_CAM16',
-    'CAM_Specification_CAM16', 'XYZ_to_CAM16', 'CAM16_to_XYZ'
+    'CAM_Specification_CAM16', 'XYZ_to_CAM16', 'CAM16_to_XYZ',
+    'ViewingConditions_CAM16'
 ]
 __all__ += [
     'InductionFactors_LLAB', 'VIEWING_CONDITIONS_LLAB',
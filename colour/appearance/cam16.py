@@ -10,6 +10,7 @@ Defines *CAM16* colour appearance model objects:
 -   :class:`colour.CAM_Specification_CAM16`
 -   :func:`colour.XYZ_to_CAM16`
 -   :func:`colour.CAM16_to_XYZ`
+-   :class:`colour.appearance.ViewingConditions_CAM16`
 
 References
 ----------
@@ -24,10 +25,12 @@ from collections import namedtuple
 
 from colour.algebra import spow
 from colour.appearance.ciecam02 import (
-    VIEWING_CONDITIONS_CIECAM02, P, achromatic_response_forward,
-    achromatic_response_inverse, brightness_correlate, chroma_correlate,
-    colourfulness_correlate, degree_of_adaptation, eccentricity_factor,
-    hue_angle, hue_quadrature, lightness_correlate,
+    VIEWING_CONDITIONS_CIECAM02, ViewingConditions_CIECAM02, P,
+    _requested_correlates, _specification,
+    achromatic_response_forward, achromatic_response_inverse,
+    brightness_correlate, chroma_correlate, colourfulness_correlate,
+    degree_of_adaptation, eccentricity_factor, hue_angle, hue_quadrature,
+    lightness_correlate,
     opponent_colour_dimensions_forward, opponent_colour_dimensions_inverse,
     post_adaptation_non_linear_response_compression_forward,
     post_adaptation_non_linear_response_compression_inverse,
@@ -35,9 +38,8 @@ from colour.appearance.ciecam02 import (
     saturation_correlate, temporary_magnitude_quantity_inverse,
     viewing_condition_dependent_parameters)
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              as_namedtuple, vector_dot, from_range_100,
-                              from_range_degrees, ones, to_domain_100,
-                              to_domain_degrees, tsplit)
+                              as_namedtuple, vector_dot, from_range_100, ones,
+                              to_domain_100, to_domain_degrees, tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -49,7 +51,7 @@ __status__ = 'Production'
 __all__ = [
     'MATRIX_16', 'MATRIX_INVERSE_16', 'InductionFactors_CAM16',
     'VIEWING_CONDITIONS_CAM16', 'CAM_Specification_CAM16', 'XYZ_to_CAM16',
-    'CAM16_to_XYZ'
+    'CAM16_to_XYZ', 'ViewingConditions_CAM16'
 ]
 
 MATRIX_16 = np.array([
@@ -157,7 +159,9 @@ def XYZ_to_CAM16(XYZ,
                  L_A,
                  Y_b,
                  surround=VIEWING_CONDITIONS_CAM16['Average'],
-                 discount_illuminant=False):
+                 discount_illuminant=False,
+                 correlates=None,
+                 structured_array=False):
     """
     Computes the *CAM16* colour appearance model correlates from given
     *CIE XYZ* tristimulus values.
@@ -184,10 +188,20 @@ def XYZ_to_CAM16(XYZ,
         Surround viewing conditions induction factors.
     discount_illuminant : bool, optional
         Truth value indicating if the illuminant should be discounted.
+    correlates : unicode or array_like, optional
+        Correlates to compute, e.g. *'JMh'* or *['J', 'M', 'h']*, the
+        computations of the correlates that are not required are skipped. All
+        the correlates are computed if *None*.
+    structured_array : bool, optional
+        Whether to return a *Numpy* record array storing the requested
+        correlates contiguously, in the requested order, instead of a
+        :class:`colour.CAM_Specification_CAM16` class instance. The
+        correlates are accessible by name and the record array is accepted
+        by the :func:`colour.CAM16_to_XYZ` definition.
 
     Returns
     -------
-    CAM_Specification_CAM16
+    CAM_Specification_CAM16 or recarray
         *CAM16* colour appearance model specification.
 
     Notes
@@ -234,8 +248,16 @@ def XYZ_to_CAM16(XYZ,
     CAM_Specification_CAM16(J=41.7312079..., C=0.1033557..., \
 h=217.0679597..., s=2.3450150..., Q=195.3717089..., M=0.1074367..., \
 H=275.5949861..., HC=None)
+    >>> specification = XYZ_to_CAM16(
+    ...     XYZ, XYZ_w, L_A, Y_b, surround, correlates='JMh',
+    ...     structured_array=True)
+    >>> specification.M  # doctest: +ELLIPSIS
+    array(0.1074367...)
     """
 
+    correlates, required = _requested_correlates(correlates,
+                                                 CAM_Specification_CAM16)
+
     XYZ = to_domain_100(XYZ)
     XYZ_w = to_domain_100(XYZ_w)
     _X_w, Y_w, _Z_w = tsplit(XYZ_w)
@@ -283,11 +305,8 @@ H=275.5949861..., HC=None)
     h = hue_angle(a, b)
 
     # Step 5
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
     # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
+    H = hue_quadrature(h) if 'H' in required else None
     # TODO: Compute hue composition.
 
     # Step 6
@@ -300,22 +319,37 @@ H=275.5949861..., HC=None)
 
     # Step 8
     # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
+    Q = (brightness_correlate(surround.c, J, A_w, F_L)
+         if 'Q' in required else None)
 
     # Step 9
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
-
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
-
-    return CAM_Specification_CAM16(
-        from_range_100(J), from_range_100(C), from_range_degrees(h),
-        from_range_100(s), from_range_100(Q), from_range_100(M),
-        from_range_degrees(H, 400), None)
+    C = M = s = None
+    if 'C' in required:
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing the correlate of *chroma* :math:`C`.
+        C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
+
+    if 'M' in required:
+        # Computing the correlate of *colourfulness* :math:`M`.
+        M = colourfulness_correlate(C, F_L)
+
+    if 's' in required:
+        # Computing the correlate of *saturation* :math:`s`.
+        s = saturation_correlate(M, Q)
+
+    return _specification(
+        CAM_Specification_CAM16,
+        correlates,
+        structured_array,
+        J=J,
+        C=C,
+        h=h,
+        s=s,
+        Q=Q,
+        M=M,
+        H=H)
 
 
 def CAM16_to_XYZ(specification,
@@ -331,11 +365,13 @@ def CAM16_to_XYZ(specification,
 
     Parameters
     ----------
-    specification : CAM_Specification_CAM16
+    specification : CAM_Specification_CAM16 or recarray
         *CAM16* colour appearance model specification. Correlate of
         *Lightness* :math:`J`, correlate of *chroma* :math:`C` or correlate of
         *colourfulness* :math:`M` and *hue* angle :math:`h` in degrees must be
-        specified, e.g. :math:`JCh` or :math:`JMh`.
+        specified, e.g. :math:`JCh` or :math:`JMh`. A *Numpy* record array as
+        returned by the :func:`colour.XYZ_to_CAM16` definition with the
+        ``structured_array`` argument set to *True* is also accepted.
     XYZ_w : array_like
         *CIE XYZ* tristimulus values of reference white.
     L_A : numeric or array_like
@@ -484,3 +520,109 @@ def CAM16_to_XYZ(specification,
     XYZ = vector_dot(MATRIX_INVERSE_16, RGB)
 
     return from_range_100(XYZ)
+
+
+class ViewingConditions_CAM16(ViewingConditions_CIECAM02):
+    """
+    Defines the *CAM16* colour appearance model viewing conditions.
+
+    The viewing conditions dependent quantities are computed once at
+    instantiation time so that converting many samples under fixed viewing
+    conditions only performs the per-sample computations, the conversion to
+    sharpened *RGB* values and the chromatic adaptation are combined into a
+    single matrix.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white.
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Luminous factor of background :math:`Y_b` such as
+        :math:`Y_b = 100 x L_b / L_w` where :math:`L_w` is the luminance of the
+        light source and :math:`L_b` is the luminance of the background.
+    surround : InductionFactors_CAM16, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Notes
+    -----
+    -   The domain-range scale of ``XYZ_w`` is the one in effect at
+        instantiation time.
+    -   The outputs of the
+        :meth:`~colour.appearance.ViewingConditions_CAM16.forward` and
+        :meth:`~colour.appearance.ViewingConditions_CAM16.inverse` methods
+        match those of the :func:`colour.XYZ_to_CAM16` and
+        :func:`colour.CAM16_to_XYZ` definitions respectively.
+
+    References
+    ----------
+    :cite:`Li2017`
+
+    Examples
+    --------
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> Y_b = 20.0
+    >>> viewing_conditions = ViewingConditions_CAM16(XYZ_w, L_A, Y_b)
+    >>> specification = viewing_conditions.forward(XYZ)
+    >>> specification  # doctest: +ELLIPSIS
+    CAM_Specification_CAM16(J=41.7312079..., C=0.1033557..., \
+h=217.0679597..., s=2.3450150..., Q=195.3717089..., M=0.1074367..., \
+H=275.5949861..., HC=None)
+    >>> viewing_conditions.inverse(specification)  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
+
+    _SPECIFICATION_CLASS = CAM_Specification_CAM16
+
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=VIEWING_CONDITIONS_CAM16['Average'],
+                 discount_illuminant=False):
+        super(ViewingConditions_CAM16, self).__init__(
+            XYZ_w, L_A, Y_b, surround, discount_illuminant)
+
+    def _degree_of_adaptation(self):
+        """
+        Computes the degree of adaptation :math:`D`.
+
+        Returns
+        -------
+        numeric or ndarray
+            Degree of adaptation :math:`D`.
+        """
+
+        return (np.clip(
+            degree_of_adaptation(self._surround.F, self._L_A), 0, 1)
+                if not self._discount_illuminant else ones(self._L_A.shape))
+
+    def _matrices_adapted_responses(self):
+        """
+        Computes the matrix converting *CIE XYZ* tristimulus values to adapted
+        sharpened *RGB* values, i.e. combining the conversion to sharpened
+        *RGB* values and the chromatic adaptation, and its inverse.
+
+        Returns
+        -------
+        tuple
+            Conversion matrix and its inverse.
+        """
+
+        _X_w, Y_w, _Z_w = tsplit(self._XYZ_w)
+
+        RGB_w = vector_dot(MATRIX_16, self._XYZ_w)
+        D = self._D[..., np.newaxis]
+        D_RGB = Y_w[..., np.newaxis] * D / RGB_w + 1 - D
+
+        M = D_RGB[..., np.newaxis] * as_float_array(MATRIX_16)
+        M_inverse = (
+            as_float_array(MATRIX_INVERSE_16) / D_RGB[..., np.newaxis, :])
+
+        return M, M_inverse
@@ -10,6 +10,7 @@ Defines *CIECAM02* colour appearance model objects:
 -   :class:`colour.CAM_Specification_CIECAM02`
 -   :func:`colour.XYZ_to_CIECAM02`
 -   :func:`colour.CIECAM02_to_XYZ`
+-   :class:`colour.appearance.ViewingConditions_CIECAM02`
 
 References
 ----------
@@ -27,7 +28,8 @@ References
 """
 
 import numpy as np
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from functools import partial
 
 from colour.algebra import spow
 from colour.adaptation import CAT_CAT02
@@ -36,8 +38,9 @@ from colour.appearance.hunt import (MATRIX_HPE_TO_XYZ, MATRIX_XYZ_TO_HPE,
 from colour.constants import EPSILON
 from colour.utilities import (
     CaseInsensitiveMapping, as_float_array, as_int_array, as_namedtuple,
-    as_float, from_range_degrees, matrix_dot, vector_dot, from_range_100, ones,
-    to_domain_100, to_domain_degrees, tsplit, tstack, zeros)
+    as_float, as_structured_array, from_range_degrees, matrix_dot, vector_dot,
+    from_range_100, ones, to_domain_100, to_domain_degrees, tsplit, tstack,
+    zeros)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -50,6 +53,7 @@ __all__ = [
     'CAT02_INVERSE_CAT', 'InductionFactors_CIECAM02',
     'VIEWING_CONDITIONS_CIECAM02', 'HUE_DATA_FOR_HUE_QUADRATURE',
     'CAM_Specification_CIECAM02', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ',
+    'ViewingConditions_CIECAM02',
     'chromatic_induction_factors', 'base_exponential_non_linearity',
     'viewing_condition_dependent_parameters', 'degree_of_adaptation',
     'full_chromatic_adaptation_forward', 'full_chromatic_adaptation_inverse',
@@ -168,12 +172,100 @@ CAM_Specification_CIECAM02` class.
             cls, J, C, h, s, Q, M, H, HC)
 
 
+def _requested_correlates(correlates, specification_class):
+    """
+    Returns the requested correlates of given colour appearance model
+    specification class and the set of correlates required to compute them.
+
+    Parameters
+    ----------
+    correlates : unicode or array_like
+        Correlates to compute, e.g. *'JMh'* or *['J', 'M', 'h']*, all the
+        correlates are computed if *None*.
+    specification_class : namedtuple
+        Colour appearance model specification class.
+
+    Returns
+    -------
+    tuple
+        Requested correlates and set of required correlates.
+    """
+
+    supported_correlates = specification_class._fields[:-1]
+
+    if correlates is None:
+        correlates = supported_correlates
+
+    correlates = tuple(correlates)
+    for correlate in correlates:
+        if correlate not in supported_correlates:
+            raise ValueError(
+                '"{0}" correlate is not supported, it must be one of {1}!'.
+                format(correlate, supported_correlates))
+
+    required = set(correlates)
+    if 's' in required:
+        required.update(['M', 'Q'])
+
+    if 'M' in required:
+        required.add('C')
+
+    if 'C' in required or 'Q' in required:
+        required.add('J')
+
+    return correlates, required
+
+
+def _specification(specification_class, correlates, structured_array,
+                   **kwargs):
+    """
+    Returns the colour appearance model specification with given requested
+    correlates scaled to the output range.
+
+    Parameters
+    ----------
+    specification_class : namedtuple
+        Colour appearance model specification class.
+    correlates : array_like
+        Requested correlates.
+    structured_array : bool
+        Whether to return a *Numpy* record array storing the requested
+        correlates contiguously instead of a specification class instance.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Correlates values.
+
+    Returns
+    -------
+    namedtuple or recarray
+        Colour appearance model specification.
+    """
+
+    range_conversion = {
+        'h': from_range_degrees,
+        'H': partial(from_range_degrees, scale_factor=400),
+    }
+
+    specification = OrderedDict(
+        (correlate, range_conversion.get(correlate, from_range_100)(
+            kwargs[correlate])) for correlate in correlates)
+
+    if structured_array:
+        return as_structured_array(specification)
+    else:
+        return specification_class(**specification)
+
+
 def XYZ_to_CIECAM02(XYZ,
                     XYZ_w,
                     L_A,
                     Y_b,
                     surround=VIEWING_CONDITIONS_CIECAM02['Average'],
-                    discount_illuminant=False):
+                    discount_illuminant=False,
+                    correlates=None,
+                    structured_array=False):
     """
     Computes the *CIECAM02* colour appearance model correlates from given
     *CIE XYZ* tristimulus values.
@@ -200,10 +292,20 @@ def XYZ_to_CIECAM02(XYZ,
         Surround viewing conditions induction factors.
     discount_illuminant : bool, optional
         Truth value indicating if the illuminant should be discounted.
+    correlates : unicode or array_like, optional
+        Correlates to compute, e.g. *'JMh'* or *['J', 'M', 'h']*, the
+        computations of the correlates that are not required are skipped. All
+        the correlates are computed if *None*.
+    structured_array : bool, optional
+        Whether to return a *Numpy* record array storing the requested
+        correlates contiguously, in the requested order, instead of a
+        :class:`colour.CAM_Specification_CIECAM02` class instance. The
+        correlates are accessible by name and the record array is accepted
+        by the :func:`colour.CIECAM02_to_XYZ` definition.
 
     Returns
     -------
-    CAM_Specification_CIECAM02
+    CAM_Specification_CIECAM02 or recarray
         *CIECAM02* colour appearance model specification.
 
     Notes
@@ -268,8 +370,16 @@ def XYZ_to_CIECAM02(XYZ,
     CAM_Specification_CIECAM02(J=41.7310911..., C=0.1047077..., \
 h=219.0484326..., s=2.3603053..., Q=195.3713259..., M=0.1088421..., \
 H=278.0607358..., HC=None)
+    >>> specification = XYZ_to_CIECAM02(
+    ...     XYZ, XYZ_w, L_A, Y_b, surround, correlates='JMh',
+    ...     structured_array=True)
+    >>> specification.M  # doctest: +ELLIPSIS
+    array(0.1088421...)
     """
 
+    correlates, required = _requested_correlates(correlates,
+                                                 CAM_Specification_CIECAM02)
+
     XYZ = to_domain_100(XYZ)
     XYZ_w = to_domain_100(XYZ_w)
     _X_w, Y_w, _Z_w = tsplit(XYZ_w)
@@ -308,12 +418,9 @@ H=278.0607358..., HC=None)
     h = hue_angle(a, b)
 
     # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
+    H = hue_quadrature(h) if 'H' in required else None
     # TODO: Compute hue composition.
 
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
     # Computing achromatic responses for the stimulus and the whitepoint.
     A = achromatic_response_forward(RGB_a, N_bb)
     A_w = achromatic_response_forward(RGB_aw, N_bb)
@@ -322,21 +429,36 @@ H=278.0607358..., HC=None)
     J = lightness_correlate(A, A_w, surround.c, z)
 
     # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
-
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
-
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
-
-    return CAM_Specification_CIECAM02(
-        from_range_100(J), from_range_100(C), from_range_degrees(h),
-        from_range_100(s), from_range_100(Q), from_range_100(M),
-        from_range_degrees(H, 400), None)
+    Q = (brightness_correlate(surround.c, J, A_w, F_L)
+         if 'Q' in required else None)
+
+    C = M = s = None
+    if 'C' in required:
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing the correlate of *chroma* :math:`C`.
+        C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
+
+    if 'M' in required:
+        # Computing the correlate of *colourfulness* :math:`M`.
+        M = colourfulness_correlate(C, F_L)
+
+    if 's' in required:
+        # Computing the correlate of *saturation* :math:`s`.
+        s = saturation_correlate(M, Q)
+
+    return _specification(
+        CAM_Specification_CIECAM02,
+        correlates,
+        structured_array,
+        J=J,
+        C=C,
+        h=h,
+        s=s,
+        Q=Q,
+        M=M,
+        H=H)
 
 
 def CIECAM02_to_XYZ(specification,
@@ -352,11 +474,13 @@ def CIECAM02_to_XYZ(specification,
 
     Parameters
     ----------
-    specification : CAM_Specification_CIECAM02
+    specification : CAM_Specification_CIECAM02 or recarray
         *CIECAM02* colour appearance model specification. Correlate of
         *Lightness* :math:`J`, correlate of *chroma* :math:`C` or correlate of
         *colourfulness* :math:`M` and *hue* angle :math:`h` in degrees must be
-        specified, e.g. :math:`JCh` or :math:`JMh`.
+        specified, e.g. :math:`JCh` or :math:`JMh`. A *Numpy* record array as
+        returned by the :func:`colour.XYZ_to_CIECAM02` definition with the
+        ``structured_array`` argument set to *True* is also accepted.
     XYZ_w : array_like
         *CIE XYZ* tristimulus values of reference white.
     L_A : numeric or array_like
@@ -532,6 +656,427 @@ def CIECAM02_to_XYZ(specification,
     return from_range_100(XYZ)
 
 
+class ViewingConditions_CIECAM02(object):
+    """
+    Defines the *CIECAM02* colour appearance model viewing conditions.
+
+    The viewing conditions dependent quantities, i.e. the viewing condition
+    dependent parameters :math:`n`, :math:`F_L`, :math:`N_{bb}`,
+    :math:`N_{cb}` and :math:`z`, the degree of adaptation :math:`D` and the
+    achromatic response :math:`A_w` of the whitepoint, are computed once at
+    instantiation time so that converting many samples under fixed viewing
+    conditions, e.g. an image or a sequence of image tiles, only performs the
+    per-sample computations. The chromatic adaptation and the conversion to
+    *Hunt-Pointer-Estevez* :math:`\\rho\\gamma\\beta` colourspace are also
+    combined into a single matrix.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white.
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Luminous factor of background :math:`Y_b` such as
+        :math:`Y_b = 100 x L_b / L_w` where :math:`L_w` is the luminance of the
+        light source and :math:`L_b` is the luminance of the background.
+    surround : InductionFactors_CIECAM02, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.XYZ_w`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.L_A`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.Y_b`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.surround`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.\
+discount_illuminant`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.parameters`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.D`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.A_w`
+
+    Methods
+    -------
+    -   :meth:`~colour.appearance.ViewingConditions_CIECAM02.__init__`
+    -   :meth:`~colour.appearance.ViewingConditions_CIECAM02.forward`
+    -   :meth:`~colour.appearance.ViewingConditions_CIECAM02.inverse`
+
+    Notes
+    -----
+    -   The domain-range scale of ``XYZ_w`` is the one in effect at
+        instantiation time.
+    -   The outputs of the
+        :meth:`~colour.appearance.ViewingConditions_CIECAM02.forward` and
+        :meth:`~colour.appearance.ViewingConditions_CIECAM02.inverse` methods
+        match those of the :func:`colour.XYZ_to_CIECAM02` and
+        :func:`colour.CIECAM02_to_XYZ` definitions respectively.
+
+    References
+    ----------
+    :cite:`Fairchild2004c`, :cite:`Luo2013`, :cite:`Moroneya`,
+    :cite:`Wikipedia2007a`
+
+    Examples
+    --------
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> Y_b = 20.0
+    >>> viewing_conditions = ViewingConditions_CIECAM02(XYZ_w, L_A, Y_b)
+    >>> specification = viewing_conditions.forward(XYZ)
+    >>> specification  # doctest: +ELLIPSIS
+    CAM_Specification_CIECAM02(J=41.7310911..., C=0.1047077..., \
+h=219.0484326..., s=2.3603053..., Q=195.3713259..., M=0.1088421..., \
+H=278.0607358..., HC=None)
+    >>> viewing_conditions.inverse(specification)  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
+
+    _SPECIFICATION_CLASS = CAM_Specification_CIECAM02
+
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=VIEWING_CONDITIONS_CIECAM02['Average'],
+                 discount_illuminant=False):
+        self._XYZ_w = to_domain_100(XYZ_w)
+        self._L_A = as_float_array(L_A)
+        self._Y_b = as_float_array(Y_b)
+        self._surround = surround
+        self._discount_illuminant = discount_illuminant
+
+        _X_w, Y_w, _Z_w = tsplit(self._XYZ_w)
+
+        self._parameters = viewing_condition_dependent_parameters(
+            self._Y_b, Y_w, self._L_A)
+        _n, F_L, N_bb, _N_cb, _z = tsplit(self._parameters)
+
+        self._D = self._degree_of_adaptation()
+
+        # Computing the matrix converting *CIE XYZ* tristimulus values to
+        # adapted responses, prior to the post-adaptation non linear response
+        # compression, and its inverse.
+        self._M, self._M_inverse = self._matrices_adapted_responses()
+
+        # Computing achromatic response for the whitepoint.
+        RGB_aw = post_adaptation_non_linear_response_compression_forward(
+            vector_dot(self._M, self._XYZ_w), F_L)
+        self._A_w = achromatic_response_forward(RGB_aw, N_bb)
+
+    @property
+    def XYZ_w(self):
+        """
+        Getter property for the *CIE XYZ* tristimulus values of reference
+        white.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values of reference white.
+        """
+
+        return self._XYZ_w
+
+    @property
+    def L_A(self):
+        """
+        Getter property for the adapting field *luminance* :math:`L_A`.
+
+        Returns
+        -------
+        numeric or ndarray
+            Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`.
+        """
+
+        return self._L_A
+
+    @property
+    def Y_b(self):
+        """
+        Getter property for the luminous factor of background :math:`Y_b`.
+
+        Returns
+        -------
+        numeric or ndarray
+            Luminous factor of background :math:`Y_b`.
+        """
+
+        return self._Y_b
+
+    @property
+    def surround(self):
+        """
+        Getter property for the surround viewing conditions induction factors.
+
+        Returns
+        -------
+        namedtuple
+            Surround viewing conditions induction factors.
+        """
+
+        return self._surround
+
+    @property
+    def discount_illuminant(self):
+        """
+        Getter property for whether the illuminant is discounted.
+
+        Returns
+        -------
+        bool
+            Whether the illuminant is discounted.
+        """
+
+        return self._discount_illuminant
+
+    @property
+    def parameters(self):
+        """
+        Getter property for the viewing condition dependent parameters
+        :math:`n`, :math:`F_L`, :math:`N_{bb}`, :math:`N_{cb}` and :math:`z`.
+
+        Returns
+        -------
+        ndarray
+            Viewing condition dependent parameters.
+        """
+
+        return self._parameters
+
+    @property
+    def D(self):
+        """
+        Getter property for the degree of adaptation :math:`D`.
+
+        Returns
+        -------
+        numeric or ndarray
+            Degree of adaptation :math:`D`.
+        """
+
+        return self._D
+
+    @property
+    def A_w(self):
+        """
+        Getter property for the achromatic response :math:`A_w` of the
+        whitepoint.
+
+        Returns
+        -------
+        numeric or ndarray
+            Achromatic response :math:`A_w` of the whitepoint.
+        """
+
+        return self._A_w
+
+    def _degree_of_adaptation(self):
+        """
+        Computes the degree of adaptation :math:`D`.
+
+        Returns
+        -------
+        numeric or ndarray
+            Degree of adaptation :math:`D`.
+        """
+
+        return (degree_of_adaptation(self._surround.F, self._L_A)
+                if not self._discount_illuminant else ones(self._L_A.shape))
+
+    def _matrices_adapted_responses(self):
+        """
+        Computes the matrix converting *CIE XYZ* tristimulus values to
+        *Hunt-Pointer-Estevez* :math:`\\rho\\gamma\\beta` colourspace adapted
+        responses, i.e. combining the conversion to *CMCCAT2000* transform
+        sharpened *RGB* values, the full chromatic adaptation and the
+        conversion to *Hunt-Pointer-Estevez* :math:`\\rho\\gamma\\beta`
+        colourspace, and its inverse.
+
+        Returns
+        -------
+        tuple
+            Conversion matrix and its inverse.
+        """
+
+        _X_w, Y_w, _Z_w = tsplit(self._XYZ_w)
+
+        RGB_w = vector_dot(CAT_CAT02, self._XYZ_w)
+        D = self._D[..., np.newaxis]
+        D_RGB = (Y_w[..., np.newaxis] * D / RGB_w + 1 - D)[..., np.newaxis]
+
+        M = matrix_dot(
+            matrix_dot(MATRIX_XYZ_TO_HPE, CAT02_INVERSE_CAT),
+            D_RGB * CAT_CAT02)
+        M_inverse = matrix_dot(
+            CAT02_INVERSE_CAT,
+            matrix_dot(CAT_CAT02, MATRIX_HPE_TO_XYZ) / D_RGB)
+
+        return M, M_inverse
+
+    def forward(self, XYZ, correlates=None, structured_array=False):
+        """
+        Computes the colour appearance model correlates from given *CIE XYZ*
+        tristimulus values under the viewing conditions.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus.
+        correlates : unicode or array_like, optional
+            Correlates to compute, e.g. *'JMh'* or *['J', 'M', 'h']*, all the
+            correlates are computed if *None*.
+        structured_array : bool, optional
+            Whether to return a *Numpy* record array storing the requested
+            correlates contiguously instead of a specification.
+
+        Returns
+        -------
+        namedtuple or recarray
+            Colour appearance model specification.
+        """
+
+        correlates, required = _requested_correlates(
+            correlates, self._SPECIFICATION_CLASS)
+
+        XYZ = to_domain_100(XYZ)
+
+        n, F_L, N_bb, N_cb, z = tsplit(self._parameters)
+        c, N_c = self._surround.c, self._surround.N_c
+
+        # Converting *CIE XYZ* tristimulus values to adapted responses.
+        RGB_p = vector_dot(self._M, XYZ)
+
+        # Applying forward post-adaptation non linear response compression.
+        RGB_a = post_adaptation_non_linear_response_compression_forward(
+            RGB_p, F_L)
+
+        # Converting to preliminary cartesian coordinates.
+        a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+
+        # Computing the *hue* angle :math:`h`.
+        h = hue_angle(a, b)
+
+        # Computing hue :math:`h` quadrature :math:`H`.
+        H = hue_quadrature(h) if 'H' in required else None
+
+        # Computing achromatic responses for the stimulus.
+        A = achromatic_response_forward(RGB_a, N_bb)
+
+        # Computing the correlate of *Lightness* :math:`J`.
+        J = lightness_correlate(A, self._A_w, c, z)
+
+        # Computing the correlate of *brightness* :math:`Q`.
+        Q = (brightness_correlate(c, J, self._A_w, F_L)
+             if 'Q' in required else None)
+
+        C = M = s = None
+        if 'C' in required:
+            # Computing eccentricity factor *e_t*.
+            e_t = eccentricity_factor(h)
+
+            # Computing the correlate of *chroma* :math:`C`.
+            C = chroma_correlate(J, n, N_c, N_cb, e_t, a, b, RGB_a)
+
+        if 'M' in required:
+            # Computing the correlate of *colourfulness* :math:`M`.
+            M = colourfulness_correlate(C, F_L)
+
+        if 's' in required:
+            # Computing the correlate of *saturation* :math:`s`.
+            s = saturation_correlate(M, Q)
+
+        return _specification(
+            self._SPECIFICATION_CLASS,
+            correlates,
+            structured_array,
+            J=J,
+            C=C,
+            h=h,
+            s=s,
+            Q=Q,
+            M=M,
+            H=H)
+
+    def inverse(self, specification):
+        """
+        Converts from given colour appearance model specification to *CIE XYZ*
+        tristimulus values under the viewing conditions.
+
+        Parameters
+        ----------
+        specification : namedtuple or recarray
+            Colour appearance model specification. Correlate of *Lightness*
+            :math:`J`, correlate of *chroma* :math:`C` or correlate of
+            *colourfulness* :math:`M` and *hue* angle :math:`h` in degrees must
+            be specified, e.g. :math:`JCh` or :math:`JMh`. A *Numpy* record
+            array as returned by the
+            :meth:`colour.appearance.ViewingConditions_CIECAM02.forward`
+            method with the ``structured_array`` argument set to *True* is
+            also accepted.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values.
+
+        Raises
+        ------
+        ValueError
+            If neither *C* or *M* correlates have been defined in the
+            specification.
+        """
+
+        J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(specification,
+                                                    self._SPECIFICATION_CLASS)
+        J = to_domain_100(J)
+        C = to_domain_100(C) if C is not None else C
+        h = to_domain_degrees(h)
+        M = to_domain_100(M) if M is not None else M
+
+        n, F_L, N_bb, N_cb, z = tsplit(self._parameters)
+        c, N_c = self._surround.c, self._surround.N_c
+
+        if C is None and M is not None:
+            C = M / spow(F_L, 0.25)
+        elif C is None:
+            raise ValueError('Either "C" or "M" correlate must be defined in '
+                             'the "{0}" argument!'.format(
+                                 self._SPECIFICATION_CLASS.__name__))
+
+        # Computing temporary magnitude quantity :math:`t`.
+        t = temporary_magnitude_quantity_inverse(C, J, n)
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic response :math:`A` for the stimulus.
+        A = achromatic_response_inverse(self._A_w, J, c, z)
+
+        # Computing *P_1* to *P_3*.
+        P_n = P(N_c, N_cb, e_t, t, A, N_bb)
+        _P_1, P_2, _P_3 = tsplit(P_n)
+
+        # Computing opponent colour dimensions :math:`a` and :math:`b`.
+        a, b = tsplit(opponent_colour_dimensions_inverse(P_n, h))
+
+        # Computing post-adaptation non linear response compression matrix.
+        RGB_a = matrix_post_adaptation_non_linear_response_compression(
+            P_2, a, b)
+
+        # Applying inverse post-adaptation non linear response compression.
+        RGB_p = post_adaptation_non_linear_response_compression_inverse(
+            RGB_a, F_L)
+
+        # Converting adapted responses to *CIE XYZ* tristimulus values.
+        XYZ = vector_dot(self._M_inverse, RGB_p)
+
+        return from_range_100(XYZ)
+
+
 def chromatic_induction_factors(n):
     """
     Returns the chromatic induction factors :math:`N_{bb}` and :math:`N_{cb}`.
@@ -5,11 +5,13 @@ Defines unit tests for :mod:`colour.appearance.ciecam02` module.
 """
 
 import numpy as np
+import unittest
 from itertools import permutations
 
 from colour.appearance import (
     VIEWING_CONDITIONS_CIECAM02, InductionFactors_CIECAM02,
-    CAM_Specification_CIECAM02, XYZ_to_CIECAM02, CIECAM02_to_XYZ)
+    CAM_Specification_CIECAM02, XYZ_to_CIECAM02, CIECAM02_to_XYZ,
+    ViewingConditions_CIECAM02)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import (as_namedtuple, domain_range_scale,
                               ignore_numpy_errors, tsplit, tstack)
@@ -23,7 +25,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCIECAM02ColourAppearanceModelForward',
-    'TestCIECAM02ColourAppearanceModelInverse'
+    'TestCIECAM02ColourAppearanceModelInverse',
+    'TestViewingConditions_CIECAM02'
 ]
 
 
@@ -100,6 +103,88 @@ class TestCIECAM02ColourAppearanceModelForward(ColourAppearanceModelTest):
                     specification * factor_b,
                     decimal=7)
 
+    def test_correlates_XYZ_to_CIECAM02(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.XYZ_to_CIECAM02` definition
+        correlates support.
+        """
+
+        XYZ = np.array([[19.01, 20.00, 21.78], [57.06, 43.06, 31.96]])
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+        specification = XYZ_to_CIECAM02(XYZ, XYZ_w, L_A, Y_b)
+
+        for correlates in ('JMh', 'JCh', 'Qs', 'H', ['J', 'C', 'M']):
+            specification_c = XYZ_to_CIECAM02(
+                XYZ, XYZ_w, L_A, Y_b, correlates=correlates)
+            for field in specification._fields[:-1]:
+                if field in correlates:
+                    np.testing.assert_almost_equal(
+                        getattr(specification_c, field),
+                        getattr(specification, field),
+                        decimal=7)
+                else:
+                    np.testing.assert_equal(
+                        getattr(specification_c, field), None)
+
+    def test_structured_array_XYZ_to_CIECAM02(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.XYZ_to_CIECAM02` definition
+        structured array support.
+        """
+
+        XYZ = np.array([[19.01, 20.00, 21.78], [57.06, 43.06, 31.96]])
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+        specification = XYZ_to_CIECAM02(XYZ, XYZ_w, L_A, Y_b)
+
+        specification_s = XYZ_to_CIECAM02(
+            XYZ, XYZ_w, L_A, Y_b, structured_array=True)
+        np.testing.assert_equal(specification_s.dtype.names,
+                                specification._fields[:-1])
+        np.testing.assert_equal(specification_s.shape, (2, ))
+        np.testing.assert_almost_equal(
+            specification_s.J, specification.J, decimal=7)
+
+        specification_s = XYZ_to_CIECAM02(
+            XYZ, XYZ_w, L_A, Y_b, correlates='JMh', structured_array=True)
+        np.testing.assert_equal(specification_s.dtype.names, ('J', 'M', 'h'))
+        np.testing.assert_almost_equal(
+            CIECAM02_to_XYZ(specification_s, XYZ_w, L_A, Y_b), XYZ, decimal=7)
+
+        with domain_range_scale(1):
+            specification_s = XYZ_to_CIECAM02(
+                XYZ / 100,
+                XYZ_w / 100,
+                L_A,
+                Y_b,
+                correlates='JMh',
+                structured_array=True)
+            np.testing.assert_almost_equal(
+                specification_s.h, specification.h / 360, decimal=7)
+            np.testing.assert_almost_equal(
+                CIECAM02_to_XYZ(specification_s, XYZ_w / 100, L_A, Y_b),
+                XYZ / 100,
+                decimal=7)
+
+    def test_raise_exception_XYZ_to_CIECAM02(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.XYZ_to_CIECAM02` definition
+        raised exception.
+        """
+
+        XYZ = np.array([19.01, 20.00, 21.78])
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+
+        try:
+            XYZ_to_CIECAM02(XYZ, XYZ_w, L_A, Y_b, correlates='JMhX')
+        except ValueError:
+            pass
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_CIECAM02(self):
         """
@@ -293,3 +378,188 @@ class TestCIECAM02ColourAppearanceModelInverse(ColourAppearanceModelTest):
             surround = InductionFactors_CIECAM02(case[0], case[0], case[0])
             CIECAM02_to_XYZ(
                 CAM_Specification_CIECAM02(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestViewingConditions_CIECAM02(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.ciecam02.ViewingConditions_CIECAM02`
+    class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._XYZ = np.array([
+            [19.01, 20.00, 21.78],
+            [57.06, 43.06, 31.96],
+            [3.53, 6.56, 2.14],
+            [19.01, 20.00, 21.78],
+        ])
+        self._XYZ_w = np.array([95.05, 100.00, 108.88])
+        self._L_A = 318.31
+        self._Y_b = 20.0
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('XYZ_w', 'L_A', 'Y_b', 'surround',
+                               'discount_illuminant', 'parameters', 'D',
+                               'A_w')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ViewingConditions_CIECAM02))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'forward', 'inverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ViewingConditions_CIECAM02))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.appearance.ciecam02.ViewingConditions_CIECAM02.\
+forward` method.
+        """
+
+        for surround in VIEWING_CONDITIONS_CIECAM02.values():
+            for discount_illuminant in (False, True):
+                viewing_conditions = ViewingConditions_CIECAM02(
+                    self._XYZ_w, self._L_A, self._Y_b, surround,
+                    discount_illuminant)
+                np.testing.assert_almost_equal(
+                    viewing_conditions.forward(self._XYZ)[:-1],
+                    XYZ_to_CIECAM02(self._XYZ, self._XYZ_w, self._L_A,
+                                    self._Y_b, surround,
+                                    discount_illuminant)[:-1],
+                    decimal=7)
+
+    def test_forward_structured_array(self):
+        """
+        Tests :meth:`colour.appearance.ciecam02.ViewingConditions_CIECAM02.\
+forward` method structured array support.
+        """
+
+        viewing_conditions = ViewingConditions_CIECAM02(
+            self._XYZ_w, self._L_A, self._Y_b)
+        specification = viewing_conditions.forward(
+            self._XYZ, correlates='JMh', structured_array=True)
+
+        self.assertTupleEqual(specification.dtype.names, ('J', 'M', 'h'))
+        np.testing.assert_almost_equal(
+            specification.M,
+            XYZ_to_CIECAM02(self._XYZ, self._XYZ_w, self._L_A, self._Y_b).M,
+            decimal=7)
+        np.testing.assert_almost_equal(
+            viewing_conditions.inverse(specification), self._XYZ, decimal=7)
+
+    def test_inverse(self):
+        """
+        Tests :meth:`colour.appearance.ciecam02.ViewingConditions_CIECAM02.\
+inverse` method.
+        """
+
+        viewing_conditions = ViewingConditions_CIECAM02(
+            self._XYZ_w, self._L_A, self._Y_b)
+        specification = viewing_conditions.forward(self._XYZ)
+
+        np.testing.assert_almost_equal(
+            viewing_conditions.inverse(specification), self._XYZ, decimal=7)
+
+        J, C, h, _s, _Q, M, _H, _HC = specification
+        np.testing.assert_almost_equal(
+            viewing_conditions.inverse(
+                CAM_Specification_CIECAM02(J=J, M=M, h=h)),
+            CIECAM02_to_XYZ(
+                CAM_Specification_CIECAM02(J=J, M=M, h=h), self._XYZ_w,
+                self._L_A, self._Y_b),
+            decimal=7)
+
+    def test_n_dimensional_viewing_conditions(self):
+        """
+        Tests :class:`colour.appearance.ciecam02.ViewingConditions_CIECAM02`
+        class n-dimensional viewing conditions support.
+        """
+
+        XYZ_w = np.tile(self._XYZ_w, (4, 1))
+        L_A = np.array([318.31, 31.83, 3.18, 318.31])
+        Y_b = np.array([20.0, 20.0, 10.0, 20.0])
+
+        viewing_conditions = ViewingConditions_CIECAM02(XYZ_w, L_A, Y_b)
+        specification = viewing_conditions.forward(self._XYZ)
+        np.testing.assert_almost_equal(
+            specification[:-1],
+            XYZ_to_CIECAM02(self._XYZ, XYZ_w, L_A, Y_b)[:-1],
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            viewing_conditions.inverse(specification), self._XYZ, decimal=7)
+
+    @ignore_numpy_errors
+    def test_domain_range_scale(self):
+        """
+        Tests :class:`colour.appearance.ciecam02.ViewingConditions_CIECAM02`
+        class domain and range scale support.
+        """
+
+        XYZ = self._XYZ[0]
+        specification = XYZ_to_CIECAM02(XYZ, self._XYZ_w, self._L_A,
+                                        self._Y_b)[:-1]
+
+        d_r = (
+            ('reference', 1, 1),
+            (1, 0.01,
+             np.array([
+                 1 / 100, 1 / 100, 1 / 360, 1 / 100, 1 / 100, 1 / 100, 1 / 400
+             ])),
+            (100, 1, np.array([1, 1, 100 / 360, 1, 1, 1, 100 / 400])),
+        )
+        for scale, factor_a, factor_b in d_r:
+            with domain_range_scale(scale):
+                viewing_conditions = ViewingConditions_CIECAM02(
+                    self._XYZ_w * factor_a, self._L_A, self._Y_b)
+                np.testing.assert_almost_equal(
+                    viewing_conditions.forward(XYZ * factor_a)[:-1],
+                    specification * factor_b,
+                    decimal=7)
+                np.testing.assert_almost_equal(
+                    viewing_conditions.inverse(specification * factor_b),
+                    XYZ * factor_a,
+                    decimal=7)
+
+    def test_raise_exception_inverse(self):
+        """
+        Tests :meth:`colour.appearance.ciecam02.ViewingConditions_CIECAM02.\
+inverse` method raised exception.
+        """
+
+        viewing_conditions = ViewingConditions_CIECAM02(
+            self._XYZ_w, self._L_A, self._Y_b)
+
+        self.assertRaises(ValueError, viewing_conditions.inverse,
+                          CAM_Specification_CIECAM02(41.731091132513917, None,
+                                                     219.04843265831178))
+
+    @ignore_numpy_errors
+    def test_nan_viewing_conditions(self):
+        """
+        Tests :class:`colour.appearance.ciecam02.ViewingConditions_CIECAM02`
+        class nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            surround = InductionFactors_CIECAM02(case[0], case[0], case[0])
+            viewing_conditions = ViewingConditions_CIECAM02(
+                np.array(case), case[0], case[0], surround)
+            viewing_conditions.forward(np.array(case))
+            viewing_conditions.inverse(
+                CAM_Specification_CIECAM02(case[0], case[0], case[0]))
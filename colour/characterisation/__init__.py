@@ -1,24 +1,41 @@
 # -*- coding: utf-8 -*-
 
-from .cameras import RGB_CameraSensitivities
-from .displays import RGB_DisplayPrimaries
-from .datasets import *  # noqa
+from colour.utilities import lazy_import_attributes
+
 from . import datasets
-from .aces_it import (
-    sd_to_aces_relative_exposure_values, read_training_data_rawtoaces_v1,
-    generate_illuminants_rawtoaces_v1, white_balance_multipliers,
-    best_illuminant, normalise_illuminant, training_data_sds_to_RGB,
-    training_data_sds_to_XYZ, optimisation_factory_rawtoaces_v1,
-    optimisation_factory_JzAzBz, matrix_idt)
-from .correction import (
-    matrix_augmented_Cheung2004, polynomial_expansion_Finlayson2015,
-    polynomial_expansion_Vandermonde, POLYNOMIAL_EXPANSION_METHODS,
-    polynomial_expansion, matrix_colour_correction_Cheung2004,
-    matrix_colour_correction_Finlayson2015,
-    matrix_colour_correction_Vandermonde, MATRIX_COLOUR_CORRECTION_METHODS,
-    matrix_colour_correction, colour_correction_Cheung2004,
-    colour_correction_Finlayson2015, colour_correction_Vandermonde,
-    COLOUR_CORRECTION_METHODS, colour_correction)
+
+_LAZY_ATTRIBUTES = {
+    '.cameras': (
+        'RGB_CameraSensitivities',
+    ),
+    '.displays': (
+        'RGB_DisplayPrimaries',
+    ),
+    '.aces_it': (
+        'sd_to_aces_relative_exposure_values',
+        'read_training_data_rawtoaces_v1', 'generate_illuminants_rawtoaces_v1',
+        'white_balance_multipliers', 'best_illuminant', 'normalise_illuminant',
+        'training_data_sds_to_RGB', 'training_data_sds_to_XYZ',
+        'optimisation_factory_rawtoaces_v1', 'optimisation_factory_JzAzBz',
+        'matrix_idt',
+    ),
+    '.correction': (
+        'matrix_augmented_Cheung2004', 'polynomial_expansion_Finlayson2015',
+        'polynomial_expansion_Vandermonde', 'POLYNOMIAL_EXPANSION_METHODS',
+        'polynomial_expansion', 'matrix_colour_correction_Cheung2004',
+        'matrix_colour_correction_Finlayson2015',
+        'matrix_colour_correction_Vandermonde',
+        'MATRIX_COLOUR_CORRECTION_METHODS', 'matrix_colour_correction',
+        'colour_correction_Cheung2004', 'colour_correction_Finlayson2015',
+        'colour_correction_Vandermonde', 'COLOUR_CORRECTION_METHODS',
+        'colour_correction',
+    ),
+    '.datasets': datasets.__all__,
+}
+
+__getattr__, __dir__ = lazy_import_attributes(
+    __name__, _LAZY_ATTRIBUTES,
+    ('aces_it', 'cameras', 'correction', 'displays'))
 
 __all__ = ['RGB_CameraSensitivities']
 __all__ += ['RGB_DisplayPrimaries']
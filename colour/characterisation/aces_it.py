@@ -49,7 +49,6 @@ References
 
 import numpy as np
 import os
-from scipy.optimize import minimize
 
 from colour.adaptation import matrix_chromatic_adaptation_VonKries
 from colour.algebra import euclidean_distance
@@ -772,6 +771,8 @@ def matrix_idt(sensitivities,
            [ 0.023, -0.225,  1.196]])
     """
 
+    from scipy.optimize import minimize
+
     if training_data is None:
         training_data = read_training_data_rawtoaces_v1()
 
@@ -1,12 +1,31 @@
 # -*- coding: utf-8 -*-
 
-from .aces_it import MSDS_ACES_RICD
-from .cameras import MSDS_CAMERA_SENSITIVITIES
-from .colour_checkers import (CCS_COLOURCHECKERS, ColourChecker,
-                              SDS_COLOURCHECKERS)
-from .displays import MSDS_DISPLAY_PRIMARIES
-from .filters import SDS_FILTERS
-from .lenses import SDS_LENSES
+from colour.utilities import lazy_import_attributes
+
+_LAZY_ATTRIBUTES = {
+    '.aces_it': (
+        'MSDS_ACES_RICD',
+    ),
+    '.cameras': (
+        'MSDS_CAMERA_SENSITIVITIES',
+    ),
+    '.colour_checkers': (
+        'CCS_COLOURCHECKERS', 'ColourChecker', 'SDS_COLOURCHECKERS',
+    ),
+    '.displays': (
+        'MSDS_DISPLAY_PRIMARIES',
+    ),
+    '.filters': (
+        'SDS_FILTERS',
+    ),
+    '.lenses': (
+        'SDS_LENSES',
+    ),
+}
+
+__getattr__, __dir__ = lazy_import_attributes(
+    __name__, _LAZY_ATTRIBUTES,
+    ('aces_it', 'cameras', 'colour_checkers', 'displays', 'filters', 'lenses'))
 
 __all__ = ['MSDS_ACES_RICD']
 __all__ += ['MSDS_CAMERA_SENSITIVITIES']
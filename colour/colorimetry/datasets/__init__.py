@@ -1,12 +1,24 @@
 # -*- coding: utf-8 -*-
 
-from .cmfs import (MSDS_CMFS, MSDS_CMFS_LMS, MSDS_CMFS_RGB,
-                   MSDS_CMFS_STANDARD_OBSERVER)
-from .illuminants import *  # noqa
+from colour.utilities import lazy_import_attributes
+
 from . import illuminants
-from .light_sources import *  # noqa
 from . import light_sources
-from .lefs import SDS_LEFS, SDS_LEFS_PHOTOPIC, SDS_LEFS_SCOTOPIC
+
+_LAZY_ATTRIBUTES = {
+    '.cmfs': (
+        'MSDS_CMFS', 'MSDS_CMFS_LMS', 'MSDS_CMFS_RGB',
+        'MSDS_CMFS_STANDARD_OBSERVER',
+    ),
+    '.lefs': (
+        'SDS_LEFS', 'SDS_LEFS_PHOTOPIC', 'SDS_LEFS_SCOTOPIC',
+    ),
+    '.illuminants': illuminants.__all__,
+    '.light_sources': light_sources.__all__,
+}
+
+__getattr__, __dir__ = lazy_import_attributes(
+    __name__, _LAZY_ATTRIBUTES, ('cmfs', 'lefs'))
 
 __all__ = [
     'MSDS_CMFS', 'MSDS_CMFS_LMS', 'MSDS_CMFS_RGB',
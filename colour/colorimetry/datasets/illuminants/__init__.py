@@ -1,10 +1,26 @@
 # -*- coding: utf-8 -*-
 
-from .chromaticity_coordinates import CCS_ILLUMINANTS
-from .sds_d_illuminant_series import (
-    SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES)
-from .hunterlab import TVS_ILLUMINANTS_HUNTERLAB
-from .sds import SDS_ILLUMINANTS
+from colour.utilities import lazy_import_attributes
+
+_LAZY_ATTRIBUTES = {
+    '.chromaticity_coordinates': (
+        'CCS_ILLUMINANTS',
+    ),
+    '.sds_d_illuminant_series': (
+        'SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES',
+    ),
+    '.hunterlab': (
+        'TVS_ILLUMINANTS_HUNTERLAB',
+    ),
+    '.sds': (
+        'SDS_ILLUMINANTS',
+    ),
+}
+
+__getattr__, __dir__ = lazy_import_attributes(
+    __name__, _LAZY_ATTRIBUTES,
+    ('chromaticity_coordinates', 'hunterlab', 'sds',
+     'sds_d_illuminant_series'))
 
 __all__ = [
     'CCS_ILLUMINANTS', 'SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES',
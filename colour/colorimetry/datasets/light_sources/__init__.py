@@ -1,6 +1,17 @@
 # -*- coding: utf-8 -*-
 
-from .chromaticity_coordinates import CCS_LIGHT_SOURCES
-from .sds import SDS_LIGHT_SOURCES
+from colour.utilities import lazy_import_attributes
+
+_LAZY_ATTRIBUTES = {
+    '.chromaticity_coordinates': (
+        'CCS_LIGHT_SOURCES',
+    ),
+    '.sds': (
+        'SDS_LIGHT_SOURCES',
+    ),
+}
+
+__getattr__, __dir__ = lazy_import_attributes(
+    __name__, _LAZY_ATTRIBUTES, ('chromaticity_coordinates', 'sds'))
 
 __all__ = ['CCS_LIGHT_SOURCES', 'SDS_LIGHT_SOURCES']
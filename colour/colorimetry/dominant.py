@@ -23,13 +23,13 @@ whitepaper_howtocalculateluminositywavelengthandpurity.pdf
 """
 
 import numpy as np
-import scipy.spatial.distance
+import scipy.spatial
 
 from colour.algebra import (euclidean_distance, extend_line_segment,
                             intersect_line_segments)
 from colour.colorimetry import MSDS_CMFS
 from colour.models import XYZ_to_xy
-from colour.utilities import as_float_array
+from colour.utilities import as_float_array, batch, ignore_numpy_errors
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -43,6 +43,97 @@ __all__ = [
     'complementary_wavelength', 'excitation_purity', 'colorimetric_purity'
 ]
 
+_CHUNK_SIZE_SPECTRAL_LOCUS_INTERSECTIONS = 2 ** 16
+"""
+Colour stimuli count processed at once by
+:func:`colour.colorimetry.closest_spectral_locus_wavelength` definition,
+bounding the size of its intermediate arrays.
+
+_CHUNK_SIZE_SPECTRAL_LOCUS_INTERSECTIONS : integer
+"""
+
+
+def _spectral_locus_hue_index(xy_s, xy_n):
+    """
+    Returns the index of the segments of the spectral locus, closed by the
+    line of purples, sorted by hue angle around given achromatic stimulus
+    :math:`xy_n` *CIE xy* chromaticity coordinates.
+
+    The hue angles of the spectral locus vertices are monotonic except at the
+    long wavelengths end where the measurement noise makes the spectral locus
+    fold back on itself: the vertices not increasing the hue angle are
+    skipped. The last vertex is always kept so that the line of purples is
+    unchanged.
+
+    Parameters
+    ----------
+    xy_s : ndarray
+        Spectral locus *CIE xy* chromaticity coordinates.
+    xy_n : ndarray
+        Achromatic stimulus *CIE xy* chromaticity coordinates.
+
+    Returns
+    -------
+    tuple or None
+        Spectral locus orientation around the achromatic stimulus, hue angle
+        of the first vertex, indexes of the vertices starting the segments
+        and their hue angles relative to the first vertex, in ascending order.
+        *None* is returned if the achromatic stimulus is not enclosed by the
+        spectral locus.
+    """
+
+    xy_d = xy_s - xy_n
+    h = np.unwrap(np.arctan2(xy_d[..., 1], xy_d[..., 0]))
+
+    # Winding number of the spectral locus, closed by the line of purples,
+    # around the achromatic stimulus.
+    winding = h[-1] - h[0] + ((h[0] - h[-1] + np.pi) % (2 * np.pi) - np.pi)
+    if np.abs(winding) < np.pi:
+        return None
+
+    orientation = np.sign(winding)
+    h_r = orientation * (h - h[0])
+
+    keep = np.hstack([True, h_r[1:] > np.maximum.accumulate(h_r)[:-1]])
+    keep &= h_r < min(h_r[-1], 2 * np.pi)
+    keep[0] = True
+    keep[-1] = h_r[-1] < 2 * np.pi
+
+    indexes = np.where(keep)[0]
+
+    return orientation, h[0], indexes, h_r[indexes]
+
+
+@ignore_numpy_errors
+def _intersect_spectral_locus(xy, xy_n, xy_s, index, inverse=False):
+    """
+    Returns the intersection points of the rays starting from given achromatic
+    stimulus :math:`xy_n` toward given colour stimuli :math:`xy` *CIE xy*
+    chromaticity coordinates, or away from them if inverse, with the spectral
+    locus indexed by :func:`colour.colorimetry.dominant.\
+_spectral_locus_hue_index` definition.
+
+    The intersected segment is found with a binary search on the hue angles
+    of the segments, non-existing intersections are set with `np.nan`.
+    """
+
+    orientation, h_0, indexes, h_i = index
+
+    xy_d = xy_n - xy if inverse else xy - xy_n
+    h = (orientation *
+         (np.arctan2(xy_d[..., 1], xy_d[..., 0]) - h_0)) % (2 * np.pi)
+
+    i = np.searchsorted(h_i, h, side='right') - 1
+
+    xy_a = xy_s[indexes[i]]
+    xy_e = xy_s[np.roll(indexes, -1)[i]] - xy_a
+    xy_w = xy_a - xy_n
+
+    t = ((xy_w[..., 0] * xy_e[..., 1] - xy_w[..., 1] * xy_e[..., 0]) /
+         (xy_d[..., 0] * xy_e[..., 1] - xy_d[..., 1] * xy_e[..., 0]))
+
+    return xy_n + t[..., np.newaxis] * xy_d
+
 
 def closest_spectral_locus_wavelength(xy, xy_n, xy_s, inverse=False):
     """
@@ -74,6 +165,17 @@ def closest_spectral_locus_wavelength(xy, xy_n, xy_s, inverse=False):
     ValueError
         If no closest spectral locus wavelength index and coordinates found.
 
+    Notes
+    -----
+    -   The spectral locus segments are sorted by hue angle around the
+        achromatic stimulus so that the segment intersected by each line is
+        found with a binary search, and the closest wavelength index with a
+        *k-d* tree query: the computational cost is
+        :math:`O(N \\log M)` for :math:`N` colour stimuli and :math:`M`
+        spectral locus wavelengths.
+    -   The colour stimuli are processed in chunks, bounding the size of the
+        intermediate arrays.
+
     Examples
     --------
     >>> cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
@@ -91,26 +193,41 @@ def closest_spectral_locus_wavelength(xy, xy_n, xy_s, inverse=False):
     xy_n = np.resize(xy_n, xy.shape)
     xy_s = as_float_array(xy_s)
 
-    xy_e = (extend_line_segment(xy, xy_n)
-            if inverse else extend_line_segment(xy_n, xy))
+    shape = xy.shape
+
+    xy_i = np.reshape(xy, (-1, 2))
+    xy_n_i = np.reshape(xy_n, (-1, 2))
+
+    # The spectral locus is indexed once per distinct achromatic stimulus.
+    if np.all(xy_n_i == xy_n_i[0]):
+        xy_a, i_a = xy_n_i[:1], np.zeros(xy_n_i.shape[0], dtype=np.int_)
+    else:
+        xy_a, i_a = np.unique(xy_n_i, axis=0, return_inverse=True)
 
-    # Closing horse-shoe shape to handle line of purples intersections.
-    xy_s = np.vstack([xy_s, xy_s[0, :]])
+    xy_wl = np.full(xy_i.shape, np.nan)
+    for i, xy_a_i in enumerate(xy_a):
+        index = _spectral_locus_hue_index(xy_s, xy_a_i)
+        if index is None:
+            continue
 
-    xy_wl = intersect_line_segments(
-        np.concatenate((xy_n, xy_e), -1),
-        np.hstack([xy_s, np.roll(xy_s, 1, axis=0)])).xy
-    xy_wl = xy_wl[~np.isnan(xy_wl).any(axis=-1)]
-    if not len(xy_wl):
+        for rows in batch(
+                np.where(np.reshape(i_a, -1) == i)[0],
+                _CHUNK_SIZE_SPECTRAL_LOCUS_INTERSECTIONS):
+            xy_wl[rows] = _intersect_spectral_locus(xy_i[rows], xy_a_i, xy_s,
+                                                    index, inverse)
+
+    if not np.all(np.isfinite(xy_wl)):
         raise ValueError(
             'No closest spectral locus wavelength index and coordinates found '
             'for "{0}" colour stimulus and "{1}" achromatic stimulus "xy" '
             'chromaticity coordinates!'.format(xy, xy_n))
 
-    i_wl = np.argmin(scipy.spatial.distance.cdist(xy_wl, xy_s), axis=-1)
+    # The first index of duplicate spectral locus coordinates is returned.
+    xy_s, i_s = np.unique(xy_s, axis=0, return_index=True)
+    i_wl = i_s[scipy.spatial.cKDTree(xy_s).query(xy_wl)[1]]
 
-    i_wl = np.reshape(i_wl, xy.shape[0:-1])
-    xy_wl = np.reshape(xy_wl, xy.shape)
+    i_wl = np.reshape(i_wl, shape[0:-1])
+    xy_wl = np.reshape(xy_wl, shape)
 
     return i_wl, xy_wl
 
@@ -186,8 +303,8 @@ def dominant_wavelength(xy,
     xy_s = XYZ_to_xy(cmfs.values)
 
     i_wl, xy_wl = closest_spectral_locus_wavelength(xy, xy_n, xy_s, inverse)
-    xy_cwl = xy_wl
-    wl = cmfs.wavelengths[i_wl]
+    xy_cwl = np.copy(xy_wl)
+    wl = as_float_array(cmfs.wavelengths[i_wl])
 
     xy_e = (extend_line_segment(xy, xy_n)
             if inverse else extend_line_segment(xy_n, xy))
@@ -196,12 +313,14 @@ def dominant_wavelength(xy,
                                                      xy_s[-1]])).intersect
     intersect = np.reshape(intersect, wl.shape)
 
-    i_wl_r, xy_cwl_r = closest_spectral_locus_wavelength(
-        xy, xy_n, xy_s, not inverse)
-    wl_r = -cmfs.wavelengths[i_wl_r]
+    # The second intersection is only computed for the colour stimuli whose
+    # first intersection is on the line of purples.
+    if np.any(intersect):
+        i_wl_r, xy_cwl_r = closest_spectral_locus_wavelength(
+            xy[intersect], xy_n[intersect], xy_s, not inverse)
 
-    wl = np.where(intersect, wl_r, wl)
-    xy_cwl = np.where(intersect[..., np.newaxis], xy_cwl_r, xy_cwl)
+        wl[intersect] = -cmfs.wavelengths[i_wl_r]
+        xy_cwl[intersect] = xy_cwl_r
 
     return wl, np.squeeze(xy_wl), np.squeeze(xy_cwl)
 
@@ -303,7 +422,8 @@ def excitation_purity(xy,
     0.6228856...
     """
 
-    _wl, xy_wl, _xy_cwl = dominant_wavelength(xy, xy_n, cmfs)
+    _i_wl, xy_wl = closest_spectral_locus_wavelength(
+        xy, xy_n, XYZ_to_xy(cmfs.values))
 
     P_e = euclidean_distance(xy_n, xy) / euclidean_distance(xy_n, xy_wl)
 
@@ -346,9 +466,10 @@ def colorimetric_purity(xy,
 
     xy = as_float_array(xy)
 
-    _wl, xy_wl, _xy_cwl = dominant_wavelength(xy, xy_n, cmfs)
-    P_e = excitation_purity(xy, xy_n, cmfs)
+    _i_wl, xy_wl = closest_spectral_locus_wavelength(
+        xy, xy_n, XYZ_to_xy(cmfs.values))
 
+    P_e = euclidean_distance(xy_n, xy) / euclidean_distance(xy_n, xy_wl)
     P_c = P_e * xy_wl[..., 1] / xy[..., 1]
 
     return P_c
@@ -67,6 +67,25 @@ closest_spectral_locus_wavelength` definition.
         np.testing.assert_almost_equal(
             xy_wl, np.array([0.45723147, 0.13628148]), decimal=7)
 
+        # The spectral locus folds back on itself at the long wavelengths end.
+        xy = np.array([0.66291911, 0.27614220])
+        i_wl, xy_wl = closest_spectral_locus_wavelength(xy, xy_n, self._xy_s)
+
+        self.assertEqual(i_wl, np.array(373))
+        np.testing.assert_almost_equal(
+            xy_wl, np.array([0.73468987, 0.26531000]), decimal=7)
+
+        xy_n = np.array([[0.31270000, 0.32900000], [0.34570000, 0.35850000]])
+        i_wl, xy_wl = closest_spectral_locus_wavelength(
+            np.tile(np.array([0.54369557, 0.32107944]), (2, 1)), xy_n,
+            self._xy_s)
+
+        np.testing.assert_equal(i_wl, np.array([256, 272]))
+        np.testing.assert_almost_equal(
+            xy_wl,
+            np.array([[0.68354746, 0.31628409], [0.71037553, 0.28957743]]),
+            decimal=7)
+
     def test_n_dimensional_closest_spectral_locus_wavelength(self):
         """
         Tests :func:`colour.colorimetry.dominant.\
@@ -96,6 +115,20 @@ closest_spectral_locus_wavelength` definition n-dimensional arrays support.
         np.testing.assert_almost_equal(i_wl, i_wl_r)
         np.testing.assert_almost_equal(xy_wl, xy_wl_r, decimal=7)
 
+    @ignore_numpy_errors
+    def test_raise_exception_closest_spectral_locus_wavelength(self):
+        """
+        Tests :func:`colour.colorimetry.dominant.\
+closest_spectral_locus_wavelength` definition raised exception.
+        """
+
+        self.assertRaises(ValueError, closest_spectral_locus_wavelength,
+                          CCS_D65, CCS_D65, self._xy_s)
+
+        self.assertRaises(ValueError, closest_spectral_locus_wavelength,
+                          np.array([0.5, 0.3]), np.array([0.5, -0.5]),
+                          self._xy_s)
+
     @ignore_numpy_errors
     def test_nan_closest_spectral_locus_wavelength(self):
         """
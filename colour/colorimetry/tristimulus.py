@@ -41,8 +41,9 @@ from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
                                 MultiSpectralDistributions, SpectralShape,
                                 MSDS_CMFS_STANDARD_OBSERVER, sd_ones)
 from colour.constants import DEFAULT_INT_DTYPE
-from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              filter_kwargs, from_range_100,
+from colour.utilities import (CACHE_REGISTRY, CaseInsensitiveMapping,
+                              as_float_array, content_digest, filter_kwargs,
+                              from_range_100,
                               get_domain_range_scale, runtime_warning, tsplit)
 
 __author__ = 'Colour Developers'
@@ -75,7 +76,9 @@ SPECTRAL_SHAPE_ASTME308 : SpectralShape
 
 _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = None
 
-_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = None
+_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TRISTIMULUS_WEIGHTING_FACTORS'.format(__name__),
+    persistent=True)
 
 _CACHE_SD_TO_XYZ = None
 
@@ -201,6 +204,9 @@ def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
         interpolating functions having a uniformly spaced independent variable
         and a *Cubic Spline* method for non-uniformly spaced independent
         variable.
+    -   The tables of tristimulus weighting factors are cached in memory and,
+        if the *COLOUR_SCIENCE__CACHE_DIR* environment variable is set, on
+        disk, see :class:`colour.utilities.PersistentCache` class.
 
     References
     ----------
@@ -250,16 +256,11 @@ def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
         raise ValueError(
             '"{0}" shape "interval" must be 1!'.format(illuminant))
 
-    global _CACHE_TRISTIMULUS_WEIGHTING_FACTORS
-    if _CACHE_TRISTIMULUS_WEIGHTING_FACTORS is None:
-        _CACHE_TRISTIMULUS_WEIGHTING_FACTORS = {}
-
-    hash_key = tuple([
-        hash(arg) for arg in (cmfs, illuminant, shape, k,
-                              get_domain_range_scale())
-    ])
-    if hash_key in _CACHE_TRISTIMULUS_WEIGHTING_FACTORS:
-        return _CACHE_TRISTIMULUS_WEIGHTING_FACTORS[hash_key]
+    key = content_digest(cmfs, illuminant, shape, k,
+                         get_domain_range_scale())
+    W = _CACHE_TRISTIMULUS_WEIGHTING_FACTORS.get(key)
+    if W is not None:
+        return W
 
     Y = cmfs.values
     S = illuminant.values
@@ -314,7 +315,7 @@ def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
 
     W *= 100 / np.sum(W, axis=0)[1] if k_n is None else k_n
 
-    _CACHE_TRISTIMULUS_WEIGHTING_FACTORS[hash_key] = W
+    _CACHE_TRISTIMULUS_WEIGHTING_FACTORS[key] = W
 
     return W
 
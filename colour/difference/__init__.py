@@ -160,3 +160,7 @@ def delta_E(a, b, method='CIE 2000', **kwargs):
 
 
 __all__ += ['DELTA_E_METHODS', 'delta_E']
+
+from .pairwise import delta_E_pairwise, delta_E_nearest  # noqa
+
+__all__ += ['delta_E_pairwise', 'delta_E_nearest']
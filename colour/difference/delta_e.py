@@ -36,7 +36,7 @@ Melgosa_CIEDE2000_Workshop-July4.pdf
 import numpy as np
 
 from colour.algebra import euclidean_distance
-from colour.utilities import to_domain_100, tsplit
+from colour.utilities import as_float, batch, to_domain_100, tsplit
 from colour.utilities.documentation import (DocstringFloat,
                                             is_documentation_building)
 __author__ = 'Colour Developers'
@@ -77,6 +77,14 @@ References
 JND_CIE1976 : numeric
 """
 
+_CHUNK_SIZE_DELTA_E_CIE2000 = 2 ** 16
+"""
+Elements count processed at once by :func:`colour.difference.delta_E_CIE2000`
+definition, bounding the size of its intermediate arrays.
+
+_CHUNK_SIZE_DELTA_E_CIE2000 : integer
+"""
+
 
 def delta_E_CIE1976(Lab_1, Lab_2):
     """
@@ -222,6 +230,160 @@ def delta_E_CIE1994(Lab_1, Lab_2, textiles=False):
     return d_E
 
 
+def _delta_E_CIE2000(L_1, a_1, b_1, L_2, a_2, b_2, k_L, d_E):
+    """
+    Computes the difference :math:`\\Delta E_{00}` between given
+    *CIE L\\*a\\*b\\** colourspace arrays components into given output array.
+
+    The intermediate arrays are reused with in-place operations so that only
+    a few of them are allocated.
+
+    Parameters
+    ----------
+    L_1 : ndarray
+        *CIE L\\*a\\*b\\** colourspace array 1 :math:`L^*` component.
+    a_1 : ndarray
+        *CIE L\\*a\\*b\\** colourspace array 1 :math:`a^*` component.
+    b_1 : ndarray
+        *CIE L\\*a\\*b\\** colourspace array 1 :math:`b^*` component.
+    L_2 : ndarray
+        *CIE L\\*a\\*b\\** colourspace array 2 :math:`L^*` component.
+    a_2 : ndarray
+        *CIE L\\*a\\*b\\** colourspace array 2 :math:`a^*` component.
+    b_2 : ndarray
+        *CIE L\\*a\\*b\\** colourspace array 2 :math:`b^*` component.
+    k_L : numeric
+        Lightness parametric factor :math:`k_L`, the :math:`k_C` and
+        :math:`k_H` parametric factors are equal to 1.
+    d_E : ndarray
+        Output colour difference :math:`\\Delta E_{00}` array.
+    """
+
+    # :math:`1 + G` factor.
+    x = np.hypot(a_1, b_1)
+    y = np.hypot(a_2, b_2)
+    x += y
+    x *= 0.5
+    np.power(x, 7, out=x)
+    np.add(x, 25 ** 7, out=y)
+    x /= y
+    np.sqrt(x, out=x)
+    x *= -0.5
+    x += 1.5
+
+    # :math:`a'`, :math:`C'` and :math:`h'`.
+    h_1_prime = np.multiply(a_1, x)
+    h_2_prime = np.multiply(a_2, x, out=x)
+    c_1_prime = np.hypot(h_1_prime, b_1)
+    c_2_prime = np.hypot(h_2_prime, b_2, out=y)
+
+    for h_prime, b in ((h_1_prime, b_1), (h_2_prime, b_2)):
+        np.arctan2(b, h_prime, out=h_prime)
+        np.degrees(h_prime, out=h_prime)
+        np.mod(h_prime, 360, out=h_prime)
+
+    # :math:`\Delta H'`, the hue difference :math:`\Delta h'` is wrapped to
+    # [-180, 180] which negates :math:`sin(\Delta h' / 2)`.
+    delta_H_prime = np.subtract(h_2_prime, h_1_prime)
+    wrap = np.abs(delta_H_prime) > 180
+
+    h_bar_prime = np.add(h_1_prime, h_2_prime, out=h_1_prime)
+    np.add(h_bar_prime, 360, out=h_bar_prime, where=wrap)
+    h_bar_prime *= 0.5
+
+    delta_H_prime *= 0.5
+    np.deg2rad(delta_H_prime, out=delta_H_prime)
+    np.sin(delta_H_prime, out=delta_H_prime)
+    np.negative(delta_H_prime, out=delta_H_prime, where=wrap)
+    np.multiply(c_1_prime, c_2_prime, out=x)
+    np.sqrt(x, out=x)
+    x *= 2
+    delta_H_prime *= x
+
+    # :math:`\Delta C'` and :math:`\bar{C}'`.
+    delta_C_prime = np.subtract(c_2_prime, c_1_prime, out=x)
+    c_bar_prime = np.add(c_1_prime, c_2_prime, out=c_1_prime)
+    c_bar_prime *= 0.5
+
+    # :math:`T`.
+    t = np.subtract(h_bar_prime, 30, out=y)
+    np.deg2rad(t, out=t)
+    np.cos(t, out=t)
+    t *= -0.17
+    t += 1
+    z = np.empty_like(t)
+    for factor, offset, weight in ((2, 0, 0.24), (3, 6, 0.32), (4, -63,
+                                                                -0.20)):
+        np.multiply(h_bar_prime, factor, out=z)
+        z += offset
+        np.deg2rad(z, out=z)
+        np.cos(z, out=z)
+        z *= weight
+        t += z
+
+    # :math:`\Delta H' / (k_H S_H)` with :math:`S_H = 1 + 0.015 \bar{C}' T`.
+    s_H = t
+    s_H *= c_bar_prime
+    s_H *= 0.015
+    s_H += 1
+    delta_H_prime /= s_H
+
+    # :math:`\Delta C' / (k_C S_C)` with :math:`S_C = 1 + 0.045 \bar{C}'`.
+    s_C = np.multiply(c_bar_prime, 0.045, out=z)
+    s_C += 1
+    delta_C_prime /= s_C
+
+    # :math:`R_T`.
+    delta_theta = h_bar_prime
+    delta_theta -= 275
+    delta_theta /= 25
+    delta_theta *= delta_theta
+    np.negative(delta_theta, out=delta_theta)
+    np.exp(delta_theta, out=delta_theta)
+    delta_theta *= 30
+
+    r_T = delta_theta
+    r_T *= 2
+    np.deg2rad(r_T, out=r_T)
+    np.sin(r_T, out=r_T)
+
+    r_C = np.power(c_bar_prime, 7, out=z)
+    np.add(r_C, 25 ** 7, out=y)
+    r_C /= y
+    np.sqrt(r_C, out=r_C)
+    r_T *= r_C
+    r_T *= -2
+
+    # Sum of the chroma, hue and rotation terms.
+    d_E_2 = r_T
+    d_E_2 *= delta_C_prime
+    d_E_2 *= delta_H_prime
+    delta_C_prime *= delta_C_prime
+    d_E_2 += delta_C_prime
+    delta_H_prime *= delta_H_prime
+    d_E_2 += delta_H_prime
+
+    # :math:`\Delta L' / (k_L S_L)`.
+    l_bar_prime_50 = np.add(L_1, L_2, out=z)
+    l_bar_prime_50 *= 0.5
+    l_bar_prime_50 -= 50
+    l_bar_prime_50 *= l_bar_prime_50
+    np.add(l_bar_prime_50, 20, out=y)
+    np.sqrt(y, out=y)
+    s_L = l_bar_prime_50
+    s_L *= 0.015
+    s_L /= y
+    s_L += 1
+    s_L *= k_L
+
+    delta_L_prime = np.subtract(L_2, L_1, out=y)
+    delta_L_prime /= s_L
+    delta_L_prime *= delta_L_prime
+    d_E_2 += delta_L_prime
+
+    np.sqrt(d_E_2, out=d_E)
+
+
 def delta_E_CIE2000(Lab_1, Lab_2, textiles=False):
     """
     Returns the difference :math:`\\Delta E_{00}` between two given
@@ -293,72 +455,28 @@ def delta_E_CIE2000(Lab_1, Lab_2, textiles=False):
     95.7920535...
     """
 
-    L_1, a_1, b_1 = tsplit(to_domain_100(Lab_1))
-    L_2, a_2, b_2 = tsplit(to_domain_100(Lab_2))
+    Lab_1, Lab_2 = np.broadcast_arrays(
+        to_domain_100(Lab_1), to_domain_100(Lab_2))
 
     k_L = 2 if textiles else 1
-    k_C = 1
-    k_H = 1
 
-    l_bar_prime = 0.5 * (L_1 + L_2)
+    shape = Lab_1.shape[:-1]
+    if Lab_1.ndim == 1:
+        Lab_1, Lab_2 = Lab_1[np.newaxis], Lab_2[np.newaxis]
 
-    c_1 = np.hypot(a_1, b_1)
-    c_2 = np.hypot(a_2, b_2)
-
-    c_bar = 0.5 * (c_1 + c_2)
-    c_bar7 = c_bar ** 7
-
-    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + 25 ** 7)))
-
-    a_1_prime = a_1 * (1 + g)
-    a_2_prime = a_2 * (1 + g)
-    c_1_prime = np.hypot(a_1_prime, b_1)
-    c_2_prime = np.hypot(a_2_prime, b_2)
-    c_bar_prime = 0.5 * (c_1_prime + c_2_prime)
-
-    h_1_prime = np.degrees(np.arctan2(b_1, a_1_prime)) % 360
-    h_2_prime = np.degrees(np.arctan2(b_2, a_2_prime)) % 360
-
-    h_bar_prime = np.where(
-        np.fabs(h_1_prime - h_2_prime) <= 180,
-        0.5 * (h_1_prime + h_2_prime),
-        (0.5 * (h_1_prime + h_2_prime + 360)),
-    )
+    d_E = np.empty(Lab_1.shape[:-1], dtype=np.result_type(Lab_1, Lab_2))
 
-    t = (1 - 0.17 * np.cos(np.deg2rad(h_bar_prime - 30)) +
-         0.24 * np.cos(np.deg2rad(2 * h_bar_prime)) +
-         0.32 * np.cos(np.deg2rad(3 * h_bar_prime + 6)) -
-         0.20 * np.cos(np.deg2rad(4 * h_bar_prime - 63)))
+    # The computations are performed in chunks along the first axis so that
+    # the intermediate arrays size is bounded irrespective of the inputs size.
+    rows_count = max(
+        1, _CHUNK_SIZE_DELTA_E_CIE2000 // int(np.prod(d_E.shape[1:])))
+    for rows in batch(range(d_E.shape[0]), rows_count):
+        s = slice(rows.start, rows.stop)
+        _delta_E_CIE2000(Lab_1[s, ..., 0], Lab_1[s, ..., 1], Lab_1[s, ..., 2],
+                         Lab_2[s, ..., 0], Lab_2[s, ..., 1], Lab_2[s, ..., 2],
+                         k_L, d_E[s])
 
-    h = h_2_prime - h_1_prime
-    delta_h_prime = np.where(h_2_prime <= h_1_prime, h - 360, h + 360)
-    delta_h_prime = np.where(np.fabs(h) <= 180, h, delta_h_prime)
-
-    delta_L_prime = L_2 - L_1
-    delta_C_prime = c_2_prime - c_1_prime
-    delta_H_prime = (2 * np.sqrt(c_1_prime * c_2_prime) * np.sin(
-        np.deg2rad(0.5 * delta_h_prime)))
-
-    s_L = 1 + ((0.015 * (l_bar_prime - 50) * (l_bar_prime - 50)) /
-               np.sqrt(20 + (l_bar_prime - 50) * (l_bar_prime - 50)))
-    s_C = 1 + 0.045 * c_bar_prime
-    s_H = 1 + 0.015 * c_bar_prime * t
-
-    delta_theta = (
-        30 * np.exp(-((h_bar_prime - 275) / 25) * ((h_bar_prime - 275) / 25)))
-
-    c_bar_prime7 = c_bar_prime ** 7
-
-    r_C = np.sqrt(c_bar_prime7 / (c_bar_prime7 + 25 ** 7))
-    r_T = -2 * r_C * np.sin(np.deg2rad(2 * delta_theta))
-
-    d_E = np.sqrt((delta_L_prime / (k_L * s_L)) ** 2 +
-                  (delta_C_prime / (k_C * s_C)) ** 2 +
-                  (delta_H_prime / (k_H * s_H)) ** 2 +
-                  (delta_C_prime / (k_C * s_C)) * (delta_H_prime /
-                                                   (k_H * s_H)) * r_T)
-
-    return d_E
+    return as_float(np.reshape(d_E, shape))
 
 
 def delta_E_CMC(Lab_1, Lab_2, l=2, c=1):  # noqa
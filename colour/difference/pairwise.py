@@ -0,0 +1,583 @@
+# -*- coding: utf-8 -*-
+"""
+Pairwise and Nearest Neighbours Colour Difference
+=================================================
+
+Defines the pairwise and nearest neighbours colour difference computation
+objects, e.g. to match a palette against a large colour library:
+
+-   :func:`colour.difference.delta_E_pairwise`
+-   :func:`colour.difference.delta_E_nearest`
+
+The computations are performed block-wise so that memory usage is bounded
+irrespective of the size of the colour library.
+
+The nearest neighbours are found with a *kd-tree* for the colour difference
+formulas that are *Euclidean* distances, i.e. *CIE 1976*, *CAM02-LCD*,
+*CAM02-SCD*, *CAM02-UCS*, *CAM16-LCD*, *CAM16-SCD* and *CAM16-UCS*. The
+*CIE 2000* and *CMC* colour difference formulas candidates are restricted to
+a *Lightness* band and pruned with a cheap lower bound of the colour
+difference so that the exact colour difference is only computed for the
+library colours that can be among the nearest neighbours.
+
+References
+----------
+-   :cite:`Lindbloom2009e` : Lindbloom, B. (2009). Delta E (CIE 2000).
+    Retrieved February 24, 2014, from
+    http://brucelindbloom.com/Eqn_DeltaE_CIE2000.html
+-   :cite:`Lindbloom2009f` : Lindbloom, B. (2009). Delta E (CMC). Retrieved
+    February 24, 2014, from http://brucelindbloom.com/Eqn_DeltaE_CMC.html
+"""
+
+import numpy as np
+from functools import partial
+from scipy.spatial import cKDTree
+
+from colour.difference.cam02_ucs import (delta_E_CAM02LCD, delta_E_CAM02SCD,
+                                         delta_E_CAM02UCS)
+from colour.difference.cam16_ucs import (delta_E_CAM16LCD, delta_E_CAM16SCD,
+                                         delta_E_CAM16UCS)
+from colour.difference.delta_e import (delta_E_CIE1976, delta_E_CIE2000,
+                                       delta_E_CMC)
+from colour.constants import DEFAULT_INT_DTYPE
+from colour.models.cam02_ucs import COEFFICIENTS_UCS_LUO2006
+from colour.utilities import (as_float_array, batch, filter_kwargs,
+                              to_domain_100, tsplit)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['delta_E_pairwise', 'delta_E_nearest']
+
+
+def _Jpapbp_to_Euclidean(Jpapbp, coefficients):
+    """
+    Converts given *Luo et al. (2006)* or *Li et al. (2017)* :math:`J'a'b'`
+    array to coordinates in which the colour difference is the *Euclidean*
+    distance.
+    """
+
+    return as_float_array(Jpapbp) / np.array([coefficients.K_L, 1, 1])
+
+
+_EUCLIDEAN_COORDINATES = {
+    delta_E_CIE1976:
+        to_domain_100,
+    delta_E_CAM02LCD:
+        partial(
+            _Jpapbp_to_Euclidean,
+            coefficients=COEFFICIENTS_UCS_LUO2006['CAM02-LCD']),
+    delta_E_CAM02SCD:
+        partial(
+            _Jpapbp_to_Euclidean,
+            coefficients=COEFFICIENTS_UCS_LUO2006['CAM02-SCD']),
+    delta_E_CAM02UCS:
+        partial(
+            _Jpapbp_to_Euclidean,
+            coefficients=COEFFICIENTS_UCS_LUO2006['CAM02-UCS']),
+    delta_E_CAM16LCD:
+        partial(
+            _Jpapbp_to_Euclidean,
+            coefficients=COEFFICIENTS_UCS_LUO2006['CAM02-LCD']),
+    delta_E_CAM16SCD:
+        partial(
+            _Jpapbp_to_Euclidean,
+            coefficients=COEFFICIENTS_UCS_LUO2006['CAM02-SCD']),
+    delta_E_CAM16UCS:
+        partial(
+            _Jpapbp_to_Euclidean,
+            coefficients=COEFFICIENTS_UCS_LUO2006['CAM02-UCS']),
+}
+"""
+Definitions converting the colourspace arrays of the colour difference
+formulas that are *Euclidean* distances to the coordinates in which the
+distance is computed.
+
+_EUCLIDEAN_COORDINATES : dict
+"""
+
+
+def _lightness_factor_delta_E_CIE2000(Lab_1, Lab_2, textiles=False):
+    """
+    Returns the factor :math:`f` such as
+    :math:`\\Delta E_{00} \\geq |\\Delta L| / f` between given
+    *CIE L\\*a\\*b\\** colourspace array 1 elements and any element of given
+    *CIE L\\*a\\*b\\** colourspace array 2.
+
+    Parameters
+    ----------
+    Lab_1 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 1.
+    Lab_2 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 2.
+    textiles : bool, optional
+        Textiles application specific parametric factors
+        :math:`k_L=2,\\ k_C=k_H=1` weights are used instead of
+        :math:`k_L=k_C=k_H=1`.
+
+    Returns
+    -------
+    numeric or ndarray
+        Lightness factor :math:`f`.
+    """
+
+    L_1 = to_domain_100(Lab_1)[..., 0]
+    L_2 = to_domain_100(Lab_2)[..., 0]
+
+    k_L = 2 if textiles else 1
+
+    # :math:`S_L` increases with the distance of :math:`\bar{L}'` to 50.
+    l_bar_prime_50 = 0.5 * (np.abs(L_1 - 50) + np.max(np.abs(L_2 - 50)))
+
+    s_L = 1 + ((0.015 * l_bar_prime_50 * l_bar_prime_50) /
+               np.sqrt(20 + l_bar_prime_50 * l_bar_prime_50))
+
+    return k_L * s_L
+
+
+def _lower_bound_delta_E_CIE2000(Lab_1, Lab_2, textiles=False):
+    """
+    Returns a lower bound of the difference :math:`\\Delta E_{00}` between two
+    given *CIE L\\*a\\*b\\** colourspace arrays.
+
+    Parameters
+    ----------
+    Lab_1 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 1.
+    Lab_2 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 2.
+    textiles : bool, optional
+        Textiles application specific parametric factors
+        :math:`k_L=2,\\ k_C=k_H=1` weights are used instead of
+        :math:`k_L=k_C=k_H=1`.
+
+    Returns
+    -------
+    numeric or ndarray
+        Lower bound of the colour difference :math:`\\Delta E_{00}`.
+
+    Notes
+    -----
+    -   The rotation term :math:`R_T` is bounded by
+        :math:`|R_T| \\leq 2 sin(60)`, thus the sum of the chroma and hue
+        terms and of the rotation term is greater than
+        :math:`(1 - sin(60))` times the sum of the chroma and hue terms.
+    -   :math:`\\Delta C'^2 + \\Delta H'^2` is the squared distance between
+        the :math:`a'b'` coordinates which is greater than the squared
+        distance between the :math:`ab` coordinates as :math:`G \\geq 0`.
+    -   :math:`S_H \\leq S_C \\leq 1 + 0.045 (1 + G) \\bar{C}`.
+    """
+
+    L_1, a_1, b_1 = tsplit(to_domain_100(Lab_1))
+    L_2, a_2, b_2 = tsplit(to_domain_100(Lab_2))
+
+    k_L = 2 if textiles else 1
+
+    l_bar_prime = 0.5 * (L_1 + L_2)
+
+    c_bar = 0.5 * (np.hypot(a_1, b_1) + np.hypot(a_2, b_2))
+    c_bar7 = c_bar ** 7
+
+    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + 25 ** 7)))
+
+    s_L = 1 + ((0.015 * (l_bar_prime - 50) * (l_bar_prime - 50)) /
+               np.sqrt(20 + (l_bar_prime - 50) * (l_bar_prime - 50)))
+    s_C = 1 + 0.045 * (1 + g) * c_bar
+
+    d_E = np.sqrt(((L_2 - L_1) / (k_L * s_L)) ** 2 +
+                  (1 - np.sin(np.radians(60))) *
+                  ((a_2 - a_1) ** 2 + (b_2 - b_1) ** 2) / (s_C * s_C))
+
+    return d_E
+
+
+def _lightness_factor_delta_E_CMC(Lab_1, Lab_2, l=2, c=1):  # noqa
+    """
+    Returns the factor :math:`f` such as
+    :math:`\\Delta E_{CMC} \\geq |\\Delta L| / f` between given
+    *CIE L\\*a\\*b\\** colourspace array 1 elements and any element of given
+    *CIE L\\*a\\*b\\** colourspace array 2.
+
+    Parameters
+    ----------
+    Lab_1 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 1.
+    Lab_2 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 2.
+    l : numeric, optional
+        Lightness weighting factor.
+    c : numeric, optional
+        Chroma weighting factor.
+
+    Returns
+    -------
+    numeric or ndarray
+        Lightness factor :math:`f`.
+    """
+
+    L_1 = to_domain_100(Lab_1)[..., 0]
+
+    s_l = np.where(L_1 < 16, 0.511, (0.040975 * L_1) / (1 + 0.01765 * L_1))
+
+    return l * s_l
+
+
+def _lower_bound_delta_E_CMC(Lab_1, Lab_2, l=2, c=1):  # noqa
+    """
+    Returns a lower bound of the difference :math:`\\Delta E_{CMC}` between
+    two given *CIE L\\*a\\*b\\** colourspace arrays.
+
+    Parameters
+    ----------
+    Lab_1 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 1.
+    Lab_2 : array_like
+        *CIE L\\*a\\*b\\** colourspace array 2.
+    l : numeric, optional
+        Lightness weighting factor.
+    c : numeric, optional
+        Chroma weighting factor.
+
+    Returns
+    -------
+    numeric or ndarray
+        Lower bound of the colour difference :math:`\\Delta E_{CMC}`.
+
+    Notes
+    -----
+    -   The weighting functions only depend on the reference colour
+        *CIE L\\*a\\*b\\** colourspace array 1 and
+        :math:`\\Delta C^2 + \\Delta H^2 = \\Delta a^2 + \\Delta b^2`.
+    """
+
+    L_1, a_1, b_1 = tsplit(to_domain_100(Lab_1))
+    L_2, a_2, b_2 = tsplit(to_domain_100(Lab_2))
+
+    c_1 = np.hypot(a_1, b_1)
+    s_l = np.where(L_1 < 16, 0.511, (0.040975 * L_1) / (1 + 0.01765 * L_1))
+    s_c = 0.0638 * c_1 / (1 + 0.0131 * c_1) + 0.638
+    h_1 = np.degrees(np.arctan2(b_1, a_1)) % 360
+
+    t = np.where(
+        np.logical_and(h_1 >= 164, h_1 <= 345),
+        0.56 + np.fabs(0.2 * np.cos(np.deg2rad(h_1 + 168))),
+        0.36 + np.fabs(0.4 * np.cos(np.deg2rad(h_1 + 35))),
+    )
+
+    c_4 = c_1 * c_1 * c_1 * c_1
+    f = np.sqrt(c_4 / (c_4 + 1900))
+    s_h = s_c * (f * t + 1 - f)
+
+    s_ch = np.maximum(c * s_c, s_h)
+
+    d_E = np.sqrt(((L_1 - L_2) / (l * s_l)) ** 2 +
+                  ((a_1 - a_2) ** 2 + (b_1 - b_2) ** 2) / (s_ch * s_ch))
+
+    return d_E
+
+
+_LOWER_BOUNDS = {
+    delta_E_CIE2000: (_lightness_factor_delta_E_CIE2000,
+                      _lower_bound_delta_E_CIE2000),
+    delta_E_CMC: (_lightness_factor_delta_E_CMC, _lower_bound_delta_E_CMC),
+}
+"""
+Lightness factors and lower bounds of the colour difference formulas used to
+prune the nearest neighbours candidates.
+
+_LOWER_BOUNDS : dict
+"""
+
+
+def _delta_E_function(method):
+    """
+    Returns the colour difference definition for given method.
+
+    Parameters
+    ----------
+    method : unicode
+        Computation method, one of :attr:`colour.DELTA_E_METHODS` attribute
+        keys.
+
+    Returns
+    -------
+    callable
+        Colour difference definition.
+    """
+
+    from colour.difference import DELTA_E_METHODS
+
+    return DELTA_E_METHODS[method]
+
+
+def _chunk_rows(a, b, chunk_size):
+    """
+    Returns the number of rows of :math:`a` processed per block so that each
+    block computes at most given number of colour differences.
+    """
+
+    return max(1, int(chunk_size // max(1, b.shape[0])))
+
+
+def delta_E_pairwise(a, b, method='CIE 2000', chunk_size=2 ** 20, **kwargs):
+    """
+    Returns the difference :math:`\\Delta E_{ab}` between each element of
+    given *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`a` and
+    each element of given array :math:`b` using given method.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`a`,
+        e.g. the query / reference colours.
+    b : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`b`,
+        e.g. the colour library.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+    chunk_size : integer, optional
+        Maximum number of colour differences computed at once, bounding the
+        size of the intermediate arrays.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.delta_E`},
+        Please refer to the documentation of the previously listed
+        definition.
+
+    Returns
+    -------
+    ndarray
+        Colour differences :math:`\\Delta E_{ab}` array of shape
+        (a.shape[:-1] + b.shape[:-1]).
+
+    Examples
+    --------
+    >>> a = np.array([
+    ...     [100.00000000, 21.57210357, 272.22819350],
+    ...     [50.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> b = np.array([
+    ...     [100.00000000, 426.67945353, 72.39590835],
+    ...     [74.05216981, 6.18911004, -12.71428305],
+    ...     [50.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> delta_E_pairwise(a, b)  # doctest: +ELLIPSIS
+    array([[ 94.0356490...,  52.0355158...,  52.8648618...],
+           [ 54.3890726...,  23.6249599...,   0.       ...]])
+    """
+
+    function = _delta_E_function(method)
+    kwargs = filter_kwargs(function, **kwargs)
+
+    a = as_float_array(a)
+    b = as_float_array(b)
+
+    shape = a.shape[:-1] + b.shape[:-1]
+
+    a = np.reshape(a, (-1, 3))
+    b = np.reshape(b, (-1, 3))
+
+    d_E = np.empty((a.shape[0], b.shape[0]), dtype=a.dtype)
+    for rows in batch(range(a.shape[0]), _chunk_rows(a, b, chunk_size)):
+        s = slice(rows.start, rows.stop)
+        d_E[s] = function(a[s, np.newaxis], b[np.newaxis], **kwargs)
+
+    return np.reshape(d_E, shape)
+
+
+def _delta_E_nearest_block(a, b, k, function, **kwargs):
+    """
+    Returns the colour differences :math:`\\Delta E_{ab}` between given
+    block of colourspace array :math:`a` and the :math:`k` nearest neighbours
+    in colourspace array :math:`b` and their indexes.
+    """
+
+    rows = np.arange(a.shape[0])[:, np.newaxis]
+
+    d_E = function(a[:, np.newaxis], b[np.newaxis], **kwargs)
+
+    indexes = np.argpartition(d_E, k - 1, axis=-1)[:, :k]
+    d_E = d_E[rows, indexes]
+
+    order = np.argsort(d_E, axis=-1)
+
+    return d_E[rows, order], indexes[rows, order]
+
+
+def _delta_E_nearest_pruned(a, b, k, function, bounds, **kwargs):
+    """
+    Returns the colour differences :math:`\\Delta E_{ab}` between given
+    colourspace array :math:`a` and the :math:`k` nearest neighbours in
+    colourspace array :math:`b` and their indexes.
+
+    The exact colour differences with the :math:`k` nearest neighbours
+    according to *CIE 1976* colour difference formula, found with a
+    *kd-tree*, give for each element of colourspace array :math:`a` a
+    threshold that the colour difference of the nearest neighbours cannot
+    exceed. The candidates are then restricted to the elements of colourspace
+    array :math:`b` sorted by *Lightness* whose *Lightness* difference is
+    compatible with the threshold and pruned with the lower bound of the
+    colour difference. The exact colour difference is only computed for the
+    remaining candidates.
+    """
+
+    lightness_factor, lower_bound = bounds
+
+    a_100 = to_domain_100(a)
+    b_100 = to_domain_100(b)
+
+    _d, indexes_k = cKDTree(b_100).query(a_100, k)
+    indexes_k = np.reshape(indexes_k, (-1, k))
+
+    # A small relative tolerance accounts for floating point rounding errors.
+    thresholds = np.max(
+        function(a[:, np.newaxis], b[indexes_k], **kwargs),
+        axis=-1) * (1 + 1e-12)
+    radii = thresholds * lightness_factor(a, b, **kwargs)
+
+    sorter = np.argsort(b_100[..., 0])
+    L_b = b_100[sorter, 0]
+    b = b[sorter]
+
+    starts = np.searchsorted(L_b, a_100[..., 0] - radii, side='left')
+    ends = np.searchsorted(L_b, a_100[..., 0] + radii, side='right')
+
+    d_E = np.empty((a.shape[0], k), dtype=a.dtype)
+    indexes = np.empty((a.shape[0], k), dtype=DEFAULT_INT_DTYPE)
+    for i in range(a.shape[0]):
+        candidates = np.arange(starts[i], ends[i])
+        candidates = candidates[lower_bound(a[i], b[candidates], **kwargs) <=
+                                thresholds[i]]
+
+        d_E_c = function(a[i], b[candidates], **kwargs)
+        order = np.argsort(d_E_c)[:k]
+
+        d_E[i] = d_E_c[order]
+        indexes[i] = sorter[candidates[order]]
+
+    return d_E, indexes
+
+
+def delta_E_nearest(a,
+                    b,
+                    k=1,
+                    method='CIE 2000',
+                    chunk_size=2 ** 20,
+                    **kwargs):
+    """
+    Returns the :math:`k` nearest neighbours in given *CIE L\\*a\\*b\\** or
+    :math:`J'a'b'` colourspace array :math:`b` of each element of given array
+    :math:`a` according to the difference :math:`\\Delta E_{ab}` computed with
+    given method.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`a`,
+        e.g. the query / reference colours.
+    b : array_like, (M, 3)
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`b`,
+        e.g. the colour library.
+    k : integer, optional
+        Number of nearest neighbours to return.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+    chunk_size : integer, optional
+        Maximum number of colour differences computed at once, bounding the
+        size of the intermediate arrays.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.delta_E`},
+        Please refer to the documentation of the previously listed
+        definition.
+
+    Returns
+    -------
+    tuple
+        Colour differences :math:`\\Delta E_{ab}` of the nearest neighbours
+        sorted in ascending order and their indexes in array :math:`b`, both
+        of shape (a.shape[:-1] + (k, )).
+
+    Raises
+    ------
+    ValueError
+        If the number of nearest neighbours is greater than the number of
+        elements of array :math:`b`.
+
+    Notes
+    -----
+    -   The colourspace array :math:`a` elements are the reference colours,
+        i.e. the first argument of the colour difference definition, which
+        matters for the non-symmetric colour difference formulas such as
+        *CMC*.
+    -   The nearest neighbours are exact: the *Euclidean* colour difference
+        formulas use a *kd-tree* while the *CIE 2000* and *CMC* colour
+        difference formulas candidates are restricted by *Lightness* and
+        pruned with a lower bound of the colour difference. The other colour
+        difference formulas are computed block-wise according to
+        ``chunk_size`` argument.
+
+    Examples
+    --------
+    >>> a = np.array([
+    ...     [100.00000000, 21.57210357, 272.22819350],
+    ...     [50.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> b = np.array([
+    ...     [100.00000000, 426.67945353, 72.39590835],
+    ...     [74.05216981, 6.18911004, -12.71428305],
+    ...     [50.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> delta_E_nearest(a, b, k=2)  # doctest: +ELLIPSIS
+    (array([[ 52.0355158...,  52.8648618...],
+           [  0.       ...,  23.6249599...]]), array([[1, 2],
+           [2, 1]]))
+    """
+
+    function = _delta_E_function(method)
+    kwargs = filter_kwargs(function, **kwargs)
+
+    a = as_float_array(a)
+    b = np.reshape(as_float_array(b), (-1, 3))
+
+    shape = a.shape[:-1] + (k, )
+
+    a = np.reshape(a, (-1, 3))
+
+    if k > b.shape[0]:
+        raise ValueError(
+            'The number of nearest neighbours "{0}" must be lower than or '
+            'equal to the number of elements "{1}" of array "b"!'.format(
+                k, b.shape[0]))
+
+    coordinates = _EUCLIDEAN_COORDINATES.get(function)
+    bounds = _LOWER_BOUNDS.get(function)
+    if coordinates is not None:
+        _d, indexes = cKDTree(coordinates(b)).query(coordinates(a), k)
+        indexes = np.reshape(indexes, (-1, k))
+
+        d_E = function(a[:, np.newaxis], b[indexes], **kwargs)
+    elif bounds is not None:
+        d_E, indexes = _delta_E_nearest_pruned(a, b, k, function, bounds,
+                                               **kwargs)
+    else:
+        d_E = np.empty((a.shape[0], k), dtype=a.dtype)
+        indexes = np.empty((a.shape[0], k), dtype=DEFAULT_INT_DTYPE)
+        for rows in batch(range(a.shape[0]), _chunk_rows(a, b, chunk_size)):
+            s = slice(rows.start, rows.stop)
+            d_E[s], indexes[s] = _delta_E_nearest_block(
+                a[s], b, k, function, **kwargs)
+
+    return np.reshape(d_E, shape), np.reshape(indexes, shape)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.difference.pairwise` module.
+"""
+
+import numpy as np
+import unittest
+
+from colour.difference import delta_E, delta_E_pairwise, delta_E_nearest
+from colour.utilities import domain_range_scale, ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['TestDelta_E_pairwise', 'TestDelta_E_nearest']
+
+METHODS = ('CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC', 'CAM02-LCD',
+           'CAM02-SCD', 'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS',
+           'DIN99')
+
+
+def _random_Lab(count, seed):
+    """
+    Returns given count of random *CIE L\\*a\\*b\\** colourspace array
+    elements.
+    """
+
+    random_state = np.random.RandomState(seed)
+
+    return np.column_stack([
+        random_state.uniform(0, 100, count),
+        random_state.uniform(-100, 100, count),
+        random_state.uniform(-100, 100, count),
+    ])
+
+
+class TestDelta_E_pairwise(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.pairwise.delta_E_pairwise` definition
+    unit tests methods.
+    """
+
+    def test_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_pairwise` definition.
+        """
+
+        a = _random_Lab(12, 1)
+        b = _random_Lab(25, 2)
+
+        for method in METHODS:
+            np.testing.assert_almost_equal(
+                delta_E_pairwise(a, b, method, chunk_size=64),
+                delta_E(a[:, np.newaxis], b[np.newaxis], method),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            delta_E_pairwise(a, b, 'CMC', l=1, c=1),
+            delta_E(a[:, np.newaxis], b[np.newaxis], 'CMC', l=1, c=1),
+            decimal=7)
+
+    def test_n_dimensional_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_pairwise` definition
+        n-dimensional arrays support.
+        """
+
+        a = _random_Lab(12, 1)
+        b = _random_Lab(24, 2)
+        d_E = delta_E_pairwise(a, b)
+
+        np.testing.assert_almost_equal(
+            delta_E_pairwise(
+                np.reshape(a, (3, 4, 3)), np.reshape(b, (2, 12, 3))),
+            np.reshape(d_E, (3, 4, 2, 12)),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            delta_E_pairwise(a[0], b), d_E[0], decimal=7)
+
+    def test_domain_range_scale_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_pairwise` definition
+        domain and range scale support.
+        """
+
+        a = _random_Lab(4, 1)
+        b = _random_Lab(6, 2)
+
+        d_r = (('reference', 1), (1, 0.01), (100, 1))
+        for method in ('CIE 1976', 'CIE 2000', 'CMC'):
+            d_E = delta_E_pairwise(a, b, method)
+            for scale, factor in d_r:
+                with domain_range_scale(scale):
+                    np.testing.assert_almost_equal(
+                        delta_E_pairwise(a * factor, b * factor, method),
+                        d_E,
+                        decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_pairwise` definition
+        nan support.
+        """
+
+        cases = np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan])
+        cases = np.transpose(np.tile(cases, (3, 1)))
+        for method in METHODS:
+            delta_E_pairwise(cases, cases, method)
+
+
+class TestDelta_E_nearest(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.pairwise.delta_E_nearest` definition
+    unit tests methods.
+    """
+
+    def test_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_nearest` definition.
+        """
+
+        a = np.vstack([_random_Lab(20, 3), _random_Lab(1000, 4)[:5]])
+        b = _random_Lab(1000, 4)
+
+        for method in METHODS:
+            d_E = delta_E_pairwise(a, b, method)
+            indexes = np.argsort(d_E, axis=-1)[:, :4]
+
+            d_E_n, indexes_n = delta_E_nearest(
+                a, b, 4, method, chunk_size=4096)
+            np.testing.assert_almost_equal(
+                d_E_n,
+                d_E[np.arange(a.shape[0])[:, np.newaxis], indexes],
+                decimal=7)
+            np.testing.assert_equal(indexes_n, indexes)
+
+        for kwargs in ({'textiles': True}, {'l': 1, 'c': 1}):
+            for method in ('CIE 2000', 'CMC'):
+                d_E = delta_E_pairwise(a, b, method, **kwargs)
+                d_E_n, indexes_n = delta_E_nearest(a, b, 3, method, **kwargs)
+                np.testing.assert_almost_equal(
+                    d_E_n, np.sort(d_E, axis=-1)[:, :3], decimal=7)
+
+    def test_n_dimensional_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_nearest` definition
+        n-dimensional arrays support.
+        """
+
+        a = _random_Lab(12, 1)
+        b = _random_Lab(100, 2)
+        d_E, indexes = delta_E_nearest(a, b, 2)
+
+        d_E_n, indexes_n = delta_E_nearest(np.reshape(a, (3, 4, 3)), b, 2)
+        np.testing.assert_almost_equal(
+            d_E_n, np.reshape(d_E, (3, 4, 2)), decimal=7)
+        np.testing.assert_equal(indexes_n, np.reshape(indexes, (3, 4, 2)))
+
+        d_E_n, indexes_n = delta_E_nearest(a[0], b, 2)
+        np.testing.assert_almost_equal(d_E_n, d_E[0], decimal=7)
+        np.testing.assert_equal(indexes_n, indexes[0])
+
+    def test_domain_range_scale_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_nearest` definition
+        domain and range scale support.
+        """
+
+        a = _random_Lab(4, 1)
+        b = _random_Lab(50, 2)
+
+        d_r = (('reference', 1), (1, 0.01), (100, 1))
+        for method in ('CIE 1976', 'CIE 2000', 'CMC'):
+            d_E, indexes = delta_E_nearest(a, b, 2, method)
+            for scale, factor in d_r:
+                with domain_range_scale(scale):
+                    d_E_n, indexes_n = delta_E_nearest(
+                        a * factor, b * factor, 2, method)
+                    np.testing.assert_almost_equal(d_E_n, d_E, decimal=7)
+                    np.testing.assert_equal(indexes_n, indexes)
+
+    def test_raise_exception_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_nearest` definition
+        raised exception.
+        """
+
+        self.assertRaises(ValueError, delta_E_nearest, _random_Lab(4, 1),
+                          _random_Lab(2, 2), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,7 @@ import textwrap
 from collections import namedtuple
 from copy import copy
 from functools import partial
+from numpy.lib.recfunctions import structured_to_unstructured
 from pprint import pformat
 
 from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
@@ -96,6 +97,33 @@ class Conversion_Specification(
             cls, source.lower(), target.lower(), conversion_function)
 
 
+def _specification_to_JMh(specification):
+    """
+    Returns the :math:`JMh` correlates of given colour appearance model
+    specification.
+
+    *Numpy* record arrays are converted without copy when they only store the
+    :math:`JMh` correlates, in that order.
+
+    Parameters
+    ----------
+    specification : namedtuple or recarray
+        Colour appearance model specification.
+
+    Returns
+    -------
+    ndarray
+        :math:`JMh` correlates.
+    """
+
+    if (isinstance(specification, np.ndarray) and
+            specification.dtype.names is not None):
+        return structured_to_unstructured(
+            np.asarray(specification)[['J', 'M', 'h']])
+
+    return tstack([specification.J, specification.M, specification.h])
+
+
 def CIECAM02_to_JMh_CIECAM02(CAM_Specification_CIECAM02):
     """
     Converts from *CIECAM02* specification to *CIECAM02* :math:`JMh`
@@ -103,8 +131,9 @@ def CIECAM02_to_JMh_CIECAM02(CAM_Specification_CIECAM02):
 
     Parameters
     ----------
-    CAM_Specification_CIECAM02 : CAM_Specification_CIECAM02
-        *CIECAM02* colour appearance model specification.
+    CAM_Specification_CIECAM02 : CAM_Specification_CIECAM02 or recarray
+        *CIECAM02* colour appearance model specification, *Numpy* record arrays
+        storing the :math:`JMh` correlates only are converted without copy.
 
     Returns
     -------
@@ -120,11 +149,7 @@ def CIECAM02_to_JMh_CIECAM02(CAM_Specification_CIECAM02):
     array([  4.1731091...e+01,   1.0884217...e-01,   2.1904843...e+02])
     """
 
-    return tstack([
-        CAM_Specification_CIECAM02.J,
-        CAM_Specification_CIECAM02.M,
-        CAM_Specification_CIECAM02.h,
-    ])
+    return _specification_to_JMh(CAM_Specification_CIECAM02)
 
 
 def JMh_CIECAM02_to_CIECAM02(JMh):
@@ -161,8 +186,9 @@ def CAM16_to_JMh_CAM16(CAM_Specification_CAM16):
 
     Parameters
     ----------
-    CAM_Specification_CAM16 : CAM_Specification_CAM16
-        *CAM16* colour appearance model specification.
+    CAM_Specification_CAM16 : CAM_Specification_CAM16 or recarray
+        *CAM16* colour appearance model specification, *Numpy* record arrays
+        storing the :math:`JMh` correlates only are converted without copy.
 
     Returns
     -------
@@ -178,11 +204,7 @@ def CAM16_to_JMh_CAM16(CAM_Specification_CAM16):
     array([  4.1731207...e+01,   1.0743677...e-01,   2.1706796...e+02])
     """
 
-    return tstack([
-        CAM_Specification_CAM16.J,
-        CAM_Specification_CAM16.M,
-        CAM_Specification_CAM16.h,
-    ])
+    return _specification_to_JMh(CAM_Specification_CAM16)
 
 
 def JMh_CAM16_to_CAM16(JMh):
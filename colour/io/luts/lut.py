@@ -21,7 +21,7 @@ from operator import (add, mul, pow, sub, truediv, iadd, imul, ipow, isub,
                       itruediv)
 
 from colour.algebra import LinearInterpolator, table_interpolation_trilinear
-from colour.constants import DEFAULT_INT_DTYPE
+from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.utilities import (as_float_array, is_numeric, is_iterable,
                               is_string, full, linear_conversion,
                               runtime_warning, tsplit, tstack, usage_warning)
@@ -937,7 +937,8 @@ class LUT1D(AbstractLUT):
         else:
             assert is_numeric(size), 'Linear table size must be a numeric!'
 
-            return np.linspace(domain[0], domain[1], size)
+            return np.linspace(
+                domain[0], domain[1], size, dtype=DEFAULT_FLOAT_DTYPE)
 
     def apply(self,
               RGB,
@@ -982,7 +983,11 @@ class LUT1D(AbstractLUT):
         else:
             domain_min, domain_max = self.domain
 
-            samples = np.linspace(domain_min, domain_max, self._table.size)
+            samples = np.linspace(
+                domain_min,
+                domain_max,
+                self._table.size,
+                dtype=DEFAULT_FLOAT_DTYPE)
 
         RGB_interpolator = interpolator(samples, self._table,
                                         **interpolator_kwargs)
@@ -1290,7 +1295,7 @@ class LUT3x1D(AbstractLUT):
             R, G, B = tsplit(domain)
 
             samples = [
-                np.linspace(a[0], a[1], size[i])
+                np.linspace(a[0], a[1], size[i], dtype=DEFAULT_FLOAT_DTYPE)
                 for i, a in enumerate([R, G, B])
             ]
 
@@ -1377,7 +1382,11 @@ class LUT3x1D(AbstractLUT):
             domain_min, domain_max = self.domain
             size = DEFAULT_INT_DTYPE(self._table.size / 3)
             samples = [
-                np.linspace(domain_min[i], domain_max[i], size)
+                np.linspace(
+                    domain_min[i],
+                    domain_max[i],
+                    size,
+                    dtype=DEFAULT_FLOAT_DTYPE)
                 for i in range(3)
             ]
 
@@ -1772,7 +1781,7 @@ class LUT3D(AbstractLUT):
 
             size = np.flip(size, -1)
             samples = [
-                np.linspace(a[0], a[1], size[i])
+                np.linspace(a[0], a[1], size[i], dtype=DEFAULT_FLOAT_DTYPE)
                 for i, a in enumerate([B, G, R])
             ]
 
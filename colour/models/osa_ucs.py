@@ -20,7 +20,6 @@ References
 """
 
 import numpy as np
-from scipy.optimize import fmin
 
 from colour.algebra import spow
 from colour.models import XYZ_to_xyY
@@ -191,6 +190,8 @@ def OSA_UCS_to_XYZ(Ljg, optimisation_kwargs=None, **kwargs):
     array([ 20.6540240...,  12.1972369...,   5.1369372...])
     """
 
+    from scipy.optimize import fmin
+
     Ljg = to_domain_100(Ljg)
     shape = Ljg.shape
     Ljg = np.atleast_1d(Ljg.reshape([-1, 3]))
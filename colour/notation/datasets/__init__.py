@@ -1,7 +1,15 @@
 # -*- coding: utf-8 -*-
 
-from .munsell import *  # noqa
+from colour.utilities import lazy_import_attributes
+
 from . import munsell
 
+_LAZY_ATTRIBUTES = {
+    '.munsell': munsell.__all__,
+}
+
+__getattr__, __dir__ = lazy_import_attributes(
+    __name__, _LAZY_ATTRIBUTES)
+
 __all__ = []
 __all__ += munsell.__all__
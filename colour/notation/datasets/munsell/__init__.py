@@ -1,23 +1,38 @@
 # -*- coding: utf-8 -*-
 
-from .all import MUNSELL_COLOURS_ALL
-from .experimental import MUNSELL_COLOURS_1929
-from .real import MUNSELL_COLOURS_REAL
-from colour.utilities import CaseInsensitiveMapping
+from functools import partial
+
+from colour.utilities import (LazyCaseInsensitiveMapping,
+                              lazy_import_attributes)
+
+_LAZY_ATTRIBUTES = {
+    '.all': (
+        'MUNSELL_COLOURS_ALL',
+    ),
+    '.experimental': (
+        'MUNSELL_COLOURS_1929',
+    ),
+    '.real': (
+        'MUNSELL_COLOURS_REAL',
+    ),
+}
+
+__getattr__, __dir__ = lazy_import_attributes(
+    __name__, _LAZY_ATTRIBUTES, ('all', 'experimental', 'real'))
 
 __all__ = ['MUNSELL_COLOURS_ALL']
 __all__ += ['MUNSELL_COLOURS_1929']
 __all__ += ['MUNSELL_COLOURS_REAL']
 
-MUNSELL_COLOURS = CaseInsensitiveMapping({
-    'Munsell Colours All': MUNSELL_COLOURS_ALL,
-    'Munsell Colours 1929': MUNSELL_COLOURS_1929,
-    'Munsell Colours Real': MUNSELL_COLOURS_REAL
+MUNSELL_COLOURS = LazyCaseInsensitiveMapping({
+    'Munsell Colours All': partial(__getattr__, 'MUNSELL_COLOURS_ALL'),
+    'Munsell Colours 1929': partial(__getattr__, 'MUNSELL_COLOURS_1929'),
+    'Munsell Colours Real': partial(__getattr__, 'MUNSELL_COLOURS_REAL')
 })
 MUNSELL_COLOURS.__doc__ = """
 Aggregated *Munsell* colours.
 
-MUNSELL_COLOURS : CaseInsensitiveMapping
+MUNSELL_COLOURS : LazyCaseInsensitiveMapping
 
 Aliases:
 
@@ -25,8 +40,8 @@ Aliases:
 -   '1929': 'Munsell Colours 1929'
 -   'real': 'Munsell Colours Real'
 """
-MUNSELL_COLOURS['all'] = MUNSELL_COLOURS['Munsell Colours All']
-MUNSELL_COLOURS['1929'] = MUNSELL_COLOURS['Munsell Colours 1929']
-MUNSELL_COLOURS['real'] = MUNSELL_COLOURS['Munsell Colours Real']
+MUNSELL_COLOURS['all'] = partial(__getattr__, 'MUNSELL_COLOURS_ALL')
+MUNSELL_COLOURS['1929'] = partial(__getattr__, 'MUNSELL_COLOURS_1929')
+MUNSELL_COLOURS['real'] = partial(__getattr__, 'MUNSELL_COLOURS_REAL')
 
 __all__ += ['MUNSELL_COLOURS']
@@ -126,9 +126,9 @@ from colour.constants import (DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE,
                               INTEGER_THRESHOLD, FLOATING_POINT_NUMBER_PATTERN)
 from colour.models import Lab_to_LCHab, XYZ_to_Lab, XYZ_to_xy, xyY_to_XYZ
 from colour.volume import is_within_macadam_limits
-from colour.notation import MUNSELL_COLOURS_ALL
 from colour.utilities import (
-    CaseInsensitiveMapping, Lookup, as_float_array, as_float, as_int,
+    CACHE_REGISTRY, CaseInsensitiveMapping, Lookup, as_float_array, as_float,
+    as_int,
     as_numeric, domain_range_scale, from_range_1, from_range_10,
     get_domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
     is_integer, is_numeric, tsplit, usage_warning)
@@ -194,7 +194,8 @@ ILLUMINANT_NAME_MUNSELL = 'C'
 CCS_ILLUMINANT_MUNSELL = (CCS_ILLUMINANTS[
     'CIE 1931 2 Degree Standard Observer'][ILLUMINANT_NAME_MUNSELL])
 
-_MUNSELL_SPECIFICATIONS_CACHE = None
+_CACHE_MUNSELL_RENOTATION = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_MUNSELL_RENOTATION'.format(__name__), persistent=True)
 _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
 _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
 
@@ -224,15 +225,18 @@ def _munsell_specifications():
         *Munsell Renotation System* specifications.
     """
 
-    global _MUNSELL_SPECIFICATIONS_CACHE
+    specifications = _CACHE_MUNSELL_RENOTATION.get('specifications')
 
-    if _MUNSELL_SPECIFICATIONS_CACHE is None:
-        _MUNSELL_SPECIFICATIONS_CACHE = np.array([
-            munsell_colour_to_munsell_specification(
-                MUNSELL_COLOUR_FORMAT.format(*colour[0]))
-            for colour in MUNSELL_COLOURS_ALL
-        ])
-    return _MUNSELL_SPECIFICATIONS_CACHE
+    if specifications is None:
+        from colour.notation import MUNSELL_COLOURS_ALL
+
+        specifications = _CACHE_MUNSELL_RENOTATION['specifications'] = (
+            np.array([
+                munsell_colour_to_munsell_specification(
+                    MUNSELL_COLOUR_FORMAT.format(*colour[0]))
+                for colour in MUNSELL_COLOURS_ALL
+            ]))
+    return specifications
 
 
 def _munsell_value_ASTMD1535_interpolator():
@@ -271,18 +275,26 @@ def _munsell_maximum_chromas_from_renotation():
     global _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
 
     if _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE is None:
-        chromas = OrderedDict()
-        for munsell_colour in MUNSELL_COLOURS_ALL:
-            hue, value, chroma, code = munsell_colour_to_munsell_specification(
-                MUNSELL_COLOUR_FORMAT.format(*munsell_colour[0]))
-            index = (hue, value, code)
-            if index in chromas:
-                chroma = max(chromas[index], chroma)
+        # The maximum chromas are cached as an array of "hue", "value",
+        # "code" and "chroma" rows, which can be stored on disk.
+        maximum_chromas = _CACHE_MUNSELL_RENOTATION.get('maximum_chromas')
+
+        if maximum_chromas is None:
+            chromas = OrderedDict()
+            for hue, value, chroma, code in _munsell_specifications():
+                index = (hue, value, code)
+                if index in chromas:
+                    chroma = max(chromas[index], chroma)
 
-            chromas[index] = chroma
+                chromas[index] = chroma
+
+            maximum_chromas = _CACHE_MUNSELL_RENOTATION[
+                'maximum_chromas'] = np.array(
+                    [index + (chroma, ) for index, chroma in chromas.items()])
 
         _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = tuple(
-            zip(chromas.keys(), chromas.values()))
+            ((hue, value, code), chroma)
+            for hue, value, code, chroma in maximum_chromas)
     return _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
 
 
@@ -1528,6 +1540,8 @@ def xyY_from_renotation(specification):
     array([ 0.71...,  1.41...,  0.23...])
     """
 
+    from colour.notation import MUNSELL_COLOURS_ALL
+
     specification = normalize_munsell_specification(specification)
 
     try:
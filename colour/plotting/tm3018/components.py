@@ -21,6 +21,7 @@ import matplotlib.pyplot as plt
 
 from colour.colorimetry import sd_to_XYZ
 from colour.io import read_image
+from colour.quality.tm3018 import hue_bin_averages, hue_bins
 from colour.utilities import as_float_array
 from colour.plotting import (CONSTANTS_COLOUR_STYLE, artist, override_style,
                              plot_image, render)
@@ -223,12 +224,9 @@ def plot_colour_vector_graphic(specification, **kwargs):
     axes.annotate('+20%', xy=(0, -1.2), va='top', **props)
 
     # Average "CAM02" h correlate for each bin, in radians.
-    average_hues = as_float_array([
-        np.mean([
-            specification.colorimetry_data[1][i].CAM.h
-            for i in specification.bins[j]
-        ]) for j in range(16)
-    ]) / 180 * np.pi
+    h = as_float_array(
+        [sample.CAM.h for sample in specification.colorimetry_data[1]])
+    average_hues = hue_bin_averages(hue_bins(h), h) / 180 * np.pi
     xy_reference = np.transpose(
         np.vstack([np.cos(average_hues),
                    np.sin(average_hues)]))
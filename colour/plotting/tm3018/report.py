@@ -516,7 +516,7 @@ Plot_Single_SD_Colour_Rendition_Report_Full.png
     axes_CRI.text(
         0.5,
         1 / 5,
-        '$R_9$ {:.0f}'.format(CRI_spec.Q_as[8].Q_a),
+        '$R_9$ {:.0f}'.format(CRI_spec.Q_as[9].Q_a),
         ha='center',
         va='center',
         size='medium',
@@ -3,30 +3,45 @@
 from .datasets import *  # noqa
 from . import datasets
 from .cfi2017 import (ColourRendering_Specification_CIE2017,
-                      colour_fidelity_index_CIE2017)
-from .cri import ColourRendering_Specification_CRI, colour_rendering_index
+                      colour_fidelity_index_CIE2017,
+                      colour_fidelity_index_CIE2017_msds)
+from .cri import (ColourRendering_Specification_CRI, colour_rendering_index,
+                  colour_rendering_index_msds)
 from .cqs import (COLOUR_QUALITY_SCALE_METHODS,
-                  ColourRendering_Specification_CQS, colour_quality_scale)
-from .ssi import spectral_similarity_index
+                  ColourRendering_Specification_CQS, colour_quality_scale,
+                  colour_quality_scale_msds)
+from .ssi import (spectral_similarity_index,
+                  spectral_similarity_index_matrix)
 from .tm3018 import (ColourQuality_Specification_ANSIIESTM3018,
-                     colour_fidelity_index_ANSIIESTM3018)
+                     colour_fidelity_index_ANSIIESTM3018,
+                     colour_fidelity_index_ANSIIESTM3018_msds,
+                     ColourRendition_ReportData_ANSIIESTM3018,
+                     tm3018_report_data)
 from colour.utilities import CaseInsensitiveMapping
 
 __all__ = []
 __all__ += datasets.__all__
 __all__ += [
-    'ColourRendering_Specification_CIE2017', 'colour_fidelity_index_CIE2017'
+    'ColourRendering_Specification_CIE2017', 'colour_fidelity_index_CIE2017',
+    'colour_fidelity_index_CIE2017_msds'
 ]
 __all__ += [
     'ColourQuality_Specification_ANSIIESTM3018',
-    'colour_fidelity_index_ANSIIESTM3018'
+    'colour_fidelity_index_ANSIIESTM3018',
+    'colour_fidelity_index_ANSIIESTM3018_msds',
+    'ColourRendition_ReportData_ANSIIESTM3018', 'tm3018_report_data'
+]
+__all__ += [
+    'ColourRendering_Specification_CRI', 'colour_rendering_index',
+    'colour_rendering_index_msds'
 ]
-__all__ += ['ColourRendering_Specification_CRI', 'colour_rendering_index']
 __all__ += [
     'ColourRendering_Specification_CQS', 'COLOUR_QUALITY_SCALE_METHODS',
-    'colour_quality_scale'
+    'colour_quality_scale', 'colour_quality_scale_msds'
+]
+__all__ += [
+    'spectral_similarity_index', 'spectral_similarity_index_matrix'
 ]
-__all__ += ['spectral_similarity_index']
 
 COLOUR_FIDELITY_INDEX_METHODS = CaseInsensitiveMapping({
     'CIE 2017': colour_fidelity_index_CIE2017,
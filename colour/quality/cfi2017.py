@@ -7,6 +7,7 @@ Defines the *CIE 2017 Colour Fidelity Index* (CFI) computation objects:
 
 - :class:`colour.quality.ColourRendering_Specification_CIE2017`
 - :func:`colour.quality.colour_fidelity_index_CIE2017`
+- :func:`colour.quality.colour_fidelity_index_CIE2017_msds`
 
 References
 ----------
@@ -17,15 +18,24 @@ References
 import numpy as np
 import os
 from collections import namedtuple
+from functools import partial
 
 from colour.algebra import euclidean_distance, Extrapolator
-from colour.appearance import XYZ_to_CIECAM02, VIEWING_CONDITIONS_CIECAM02
+from colour.appearance import (CAM_Specification_CIECAM02, XYZ_to_CIECAM02,
+                               VIEWING_CONDITIONS_CIECAM02)
 from colour.colorimetry import (
-    SpectralShape, SpectralDistribution, MultiSpectralDistributions, sd_to_XYZ,
-    sd_blackbody, MSDS_CMFS, sd_ones, sd_CIE_illuminant_D_series)
-from colour.models import XYZ_to_UCS, UCS_to_uv, JMh_CIECAM02_to_CAM02UCS
+    SPECTRAL_SHAPE_DEFAULT, SpectralShape, SpectralDistribution,
+    MultiSpectralDistributions, sd_to_XYZ, sd_blackbody, MSDS_CMFS,
+    MSDS_CMFS_STANDARD_OBSERVER, sd_ones, sd_CIE_illuminant_D_series)
+from colour.models import (XYZ_to_UCS, UCS_to_uv, CAM02UCS_to_JMh_CIECAM02,
+                           JMh_CIECAM02_to_CAM02UCS)
+from colour.quality.common import (
+    ReferenceIlluminantBank, align_spectral_array, spectral_array,
+    spectral_array_interpolator, spectral_array_blackbody,
+    spectral_array_CIE_illuminant_D_series, spectral_array_to_XYZ_tcs)
 from colour.temperature import uv_to_CCT_Ohno2013, CCT_to_xy_CIE_D
-from colour.utilities import as_int, lerp, usage_warning
+from colour.utilities import (CACHE_REGISTRY, as_float_array, as_int, lerp,
+                              tsplit, tstack, usage_warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -37,9 +47,10 @@ __status__ = 'Production'
 __all__ = [
     'SPECTRAL_SHAPE_CIE2017', 'RESOURCES_DIRECTORY_CIE2017',
     'TCS_ColorimetryData_CIE2017', 'ColourRendering_Specification_CIE2017',
-    'colour_fidelity_index_CIE2017', 'load_TCS_CIE2017',
-    'CCT_reference_illuminant', 'sd_reference_illuminant',
-    'tcs_colorimetry_data', 'delta_E_to_R_f'
+    'colour_fidelity_index_CIE2017', 'colour_fidelity_index_CIE2017_msds',
+    'load_TCS_CIE2017', 'CCT_reference_illuminant', 'sd_reference_illuminant',
+    'spectral_array_reference_illuminant_CIE2017', 'tcs_colorimetry_data',
+    'delta_E_to_R_f'
 ]
 
 SPECTRAL_SHAPE_CIE2017 = SpectralShape(380, 780, 1)
@@ -58,7 +69,14 @@ RESOURCES_DIRECTORY_CIE2017 = os.path.join(
 RESOURCES_DIRECTORY_CIE2017 : unicode
 """
 
-_CACHE_TCS_CIE2017 = {}
+_CACHE_TCS_CIE2017 = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TCS_CIE2017'.format(__name__))
+
+_CACHE_TCS_DATA_CIE2017 = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_TCS_DATA_CIE2017'.format(__name__), persistent=True)
+
+_CACHE_REFERENCE_ILLUMINANT_BANKS_CIE2017 = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_REFERENCE_ILLUMINANT_BANKS_CIE2017'.format(__name__), 8)
 
 
 class TCS_ColorimetryData_CIE2017(
@@ -182,13 +200,158 @@ def colour_fidelity_index_CIE2017(sd_test, additional_data=False):
         return R_f
 
 
+def colour_fidelity_index_CIE2017_msds(msds,
+                                       additional_data=False,
+                                       shape=SPECTRAL_SHAPE_CIE2017,
+                                       exact=False):
+    """
+    Returns the *CIE 2017 Colour Fidelity Index* (CFI) :math:`R_f` of given
+    multi-spectral distributions.
+
+    The *test colour samples* tristimulus values under all the test spectral
+    distributions are computed at once as tensor contractions and converted to
+    *CAM02-UCS* colourspace together. The reference illuminants colorimetry is
+    interpolated from a bank sampled on a correlated colour temperature grid
+    unless exact computations are requested.
+
+    Parameters
+    ----------
+    msds : MultiSpectralDistributions or array_like
+        Test multi-spectral distributions, if an *array_like* of shape (n, w)
+        the wavelengths are expected to be in the last axis.
+    additional_data : bool, optional
+        Whether to output additional data.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral distributions *array_like*,
+        ignored if ``msds`` is a :class:`colour.MultiSpectralDistributions`
+        class instance.
+    exact : bool, optional
+        Whether to compute the reference illuminants colorimetry from their
+        spectral distributions rather than interpolating it from the
+        reference illuminants bank.
+
+    Returns
+    -------
+    ndarray or ColourRendering_Specification_CIE2017
+        *CIE 2017 Colour Fidelity Index* (CFI) :math:`R_f` of shape (n, ). The
+        additional data specification stores the reference illuminants as a
+        spectral array of shape (n, w), the other quantities as *ndarray* of
+        shape (n, ...) and the colorimetry data as
+        :class:`colour.quality.cfi2017.TCS_ColorimetryData_CIE2017` class
+        instances storing *ndarray* of shape (n, 99, ...).
+
+    Notes
+    -----
+    -   Only the :math:`J`, :math:`M` and :math:`h` correlates of the
+        *CIECAM02* colour appearance model specifications of the colorimetry
+        data are computed.
+    -   The reference illuminants colorimetry data :math:`J`, :math:`M` and
+        :math:`h` correlates are computed from their *CAM02-UCS* colourspace
+        :math:`J'a'b'` values.
+    -   The reference illuminants bank interpolation error on the
+        *CIE 2017 Colour Fidelity Index* (CFI) :math:`R_f` is typically lower
+        than 0.01.
+
+    References
+    ----------
+    :cite:`CIETC1-902017`
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SDS_ILLUMINANTS, sds_and_msds_to_msds
+    >>> msds = sds_and_msds_to_msds(
+    ...     [SDS_ILLUMINANTS['FL2'], SDS_ILLUMINANTS['FL9']])
+    >>> colour_fidelity_index_CIE2017_msds(  # doctest: +ELLIPSIS
+    ...     msds, exact=True)
+    array([ 70.1208254...,  91.0012183...])
+    """
+
+    values, wavelengths = spectral_array(msds, shape)
+    interpolator, interpolator_kwargs = spectral_array_interpolator(msds)
+
+    if isinstance(msds, MultiSpectralDistributions):
+        shape = msds.shape
+
+    extrapolator_kwargs = None
+    if shape.start > 380 or shape.end < 780:
+        usage_warning('Test spectral distributions shape does not span the'
+                      'recommended 380-780nm range, missing values will be'
+                      'filled with zeros!')
+
+        # NOTE: "CIE 2017 Colour Fidelity Index" standard recommends filling
+        # missing values with zeros.
+        extrapolator_kwargs = {'method': 'constant', 'left': 0, 'right': 0}
+
+    if shape.interval > 5:
+        raise ValueError('Test spectral distributions interval is greater '
+                         'than 5nm which is the maximum recommended value '
+                         'for computing the "CIE 2017 Colour Fidelity Index"!')
+
+    shape = SpectralShape(SPECTRAL_SHAPE_CIE2017.start,
+                          SPECTRAL_SHAPE_CIE2017.end, shape.interval)
+
+    # NOTE: The correlated colour temperature is computed with the
+    # "CIE 1931 2 Degree Standard Observer" over the practice range, i.e. as
+    # "colour.quality.cfi2017.CCT_reference_illuminant" definition does.
+    shape_CCT = SpectralShape(SPECTRAL_SHAPE_DEFAULT.start,
+                              SPECTRAL_SHAPE_DEFAULT.end, shape.interval)
+    cmfs_2 = MSDS_CMFS_STANDARD_OBSERVER[
+        'CIE 1931 2 Degree Standard Observer'].copy().trim(
+            SPECTRAL_SHAPE_DEFAULT).align(shape_CCT)
+    uv = UCS_to_uv(
+        XYZ_to_UCS(
+            np.dot(
+                align_spectral_array(values, wavelengths, shape_CCT,
+                                     extrapolator_kwargs, interpolator,
+                                     interpolator_kwargs), cmfs_2.values)))
+    CCT, D_uv = tsplit(uv_to_CCT_Ohno2013(uv))
+
+    S_t = align_spectral_array(values, wavelengths, shape, extrapolator_kwargs,
+                               interpolator, interpolator_kwargs)
+
+    cmfs_10, R_tcs, names_tcs = _tcs_spectral_arrays(shape)
+
+    test_tcs_colorimetry_data = _tcs_colorimetry_data_spectral_array(
+        S_t, R_tcs, names_tcs, cmfs_10)
+
+    if exact:
+        XYZ_r, Jpapbp_r = _reference_tcs_colorimetry(CCT, shape)
+    else:
+        XYZ_r, Jpapbp_r = _reference_illuminant_bank(shape)(CCT)
+
+    JMh_r = CAM02UCS_to_JMh_CIECAM02(Jpapbp_r)
+    J_r, M_r, h_r = tsplit(JMh_r)
+    reference_tcs_colorimetry_data = TCS_ColorimetryData_CIE2017(
+        names_tcs, XYZ_r, CAM_Specification_CIECAM02(J=J_r, M=M_r, h=h_r),
+        JMh_r, Jpapbp_r)
+
+    delta_E_s = np.linalg.norm(
+        test_tcs_colorimetry_data.Jpapbp -
+        reference_tcs_colorimetry_data.Jpapbp,
+        axis=-1)
+
+    R_s = delta_E_to_R_f(delta_E_s)
+    R_f = delta_E_to_R_f(np.average(delta_E_s, axis=-1))
+
+    if additional_data:
+        S_r = spectral_array_reference_illuminant_CIE2017(CCT, shape)
+
+        return ColourRendering_Specification_CIE2017(
+            getattr(msds, 'labels', None), S_r, R_f, R_s, CCT, D_uv,
+            (test_tcs_colorimetry_data, reference_tcs_colorimetry_data),
+            delta_E_s)
+    else:
+        return R_f
+
+
 def load_TCS_CIE2017(shape):
     """
     Loads the *CIE 2017 Test Colour Samples* dataset appropriate for the given
     spectral shape.
 
     The datasets are cached and won't be loaded again on subsequent calls to
-    this definition.
+    this definition, a copy of the cached dataset is returned so that it can
+    be modified.
 
     Parameters
     ----------
@@ -207,7 +370,40 @@ def load_TCS_CIE2017(shape):
     99
     """
 
-    global _CACHE_TCS_CIE2017
+    interval = shape.interval
+
+    sds_tcs = _CACHE_TCS_CIE2017.get(interval)
+    if sds_tcs is not None:
+        return sds_tcs.copy()
+
+    data = _load_TCS_data_CIE2017(shape)
+    labels = ['TCS{0} (CIE 2017)'.format(i) for i in range(99)]
+
+    sds_tcs = MultiSpectralDistributions(data[:, 1:], data[:, 0], labels)
+    _CACHE_TCS_CIE2017[interval] = sds_tcs
+
+    return sds_tcs.copy()
+
+
+def _load_TCS_data_CIE2017(shape):
+    """
+    Loads the *CIE 2017 Test Colour Samples* dataset appropriate for the given
+    spectral shape as an array of wavelengths and values rows.
+
+    The datasets are cached in memory and, if the *COLOUR_SCIENCE__CACHE_DIR*
+    environment variable is set, on disk, see
+    :class:`colour.utilities.PersistentCache` class.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape of the tested illuminant.
+
+    Returns
+    -------
+    ndarray
+        *CIE 2017 Test Colour Samples* dataset of shape (w, 100).
+    """
 
     interval = shape.interval
 
@@ -216,15 +412,13 @@ def load_TCS_CIE2017(shape):
 
     filename = 'tcs_cfi2017_{0}_nm.csv.gz'.format(as_int(interval))
 
-    if filename in _CACHE_TCS_CIE2017:
-        return _CACHE_TCS_CIE2017[filename]
-
-    data = np.genfromtxt(
-        str(os.path.join(RESOURCES_DIRECTORY_CIE2017, filename)),
-        delimiter=',')
-    labels = ['TCS{0} (CIE 2017)'.format(i) for i in range(99)]
+    data = _CACHE_TCS_DATA_CIE2017.get(filename)
+    if data is None:
+        data = _CACHE_TCS_DATA_CIE2017[filename] = np.genfromtxt(
+            str(os.path.join(RESOURCES_DIRECTORY_CIE2017, filename)),
+            delimiter=',')
 
-    return MultiSpectralDistributions(data[:, 1:], data[:, 0], labels)
+    return data
 
 
 def CCT_reference_illuminant(sd):
@@ -337,6 +531,78 @@ def sd_reference_illuminant(CCT, shape):
     return sd_reference
 
 
+def spectral_array_reference_illuminant_CIE2017(CCT, shape):
+    """
+    Computes the spectral array of the reference illuminants for given
+    correlated colour temperatures :math:`T_{cp}` for use in
+    *CIE 2017 Colour Fidelity Index* (CFI) computation, i.e. the values of
+    :func:`colour.quality.cfi2017.sd_reference_illuminant` definition.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Spectral shape used to create the spectral array.
+
+    Returns
+    -------
+    ndarray
+        Reference illuminants spectral array.
+
+    Examples
+    --------
+    >>> S = spectral_array_reference_illuminant_CIE2017(
+    ...     np.array([3000, 4500, 6500]), SPECTRAL_SHAPE_CIE2017)
+    >>> S[..., ::200]  # doctest: +ELLIPSIS
+    array([[  4.9631484...e+01,   4.6529953...e+02,   8.8313842...e+02],
+           [  3.2580453...e-03,   1.0281443...e-02,   9.3418153...e-03],
+           [  4.9940000...e+01,   9.5792000...e+01,   6.3400000...e+01]])
+    """
+
+    CCT = as_float_array(CCT)
+
+    planckian = CCT <= 5000
+    daylight = CCT >= 4000
+
+    values = np.empty(CCT.shape + (len(shape.range()), ))
+    values[planckian] = spectral_array_blackbody(CCT[planckian], shape)
+    values[daylight] = spectral_array_CIE_illuminant_D_series(
+        CCT_to_xy_CIE_D(CCT[daylight]), shape)
+
+    mixture = np.logical_and(planckian, daylight)
+    if np.any(mixture):
+        # Planckian and daylight illuminant must be normalised so that the
+        # mixture isn't biased, the luminance is computed over the practice
+        # range as "colour.sd_to_XYZ" definition does.
+        shape_Y = SpectralShape(SPECTRAL_SHAPE_DEFAULT.start,
+                                SPECTRAL_SHAPE_DEFAULT.end, shape.interval)
+        y_bar = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().trim(
+                SPECTRAL_SHAPE_DEFAULT).align(shape_Y).values[..., 1]
+
+        def normalise(values):
+            """
+            Normalises given spectral array to unit luminance.
+            """
+
+            Y = 100 * np.dot(
+                align_spectral_array(values, shape.range(), shape_Y),
+                y_bar) / np.sum(y_bar)
+
+            return values / Y[..., np.newaxis]
+
+        sd_planckian = normalise(spectral_array_blackbody(
+            CCT[mixture], shape))
+        sd_daylight = normalise(values[mixture])
+
+        # Mixture: 4200K should be 80% Planckian, 20% CIE Illuminant D Series.
+        m = (CCT[mixture] - 4000) / 1000
+        values[mixture] = lerp(sd_planckian, sd_daylight, m[..., np.newaxis])
+
+    return values
+
+
 def tcs_colorimetry_data(sd_irradiance, sds_tcs, cmfs):
     """
     Returns the *test colour samples* colorimetry data under given test light
@@ -383,6 +649,147 @@ def tcs_colorimetry_data(sd_irradiance, sds_tcs, cmfs):
     return tcs_data
 
 
+def _tcs_spectral_arrays(shape):
+    """
+    Returns the standard observer colour matching functions, the
+    *test colour samples* spectral array and their names used by the
+    *CIE 2017 Colour Fidelity Index* (CFI) batch computations for given
+    spectral shape.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape of the computations.
+
+    Returns
+    -------
+    tuple
+        *CIE 1964 10 Degree Standard Observer* colour matching functions values
+        of shape (w, 3), *test colour samples* spectral array of shape (99, w)
+        and names.
+    """
+
+    # NOTE: All computations except CCT calculation use the
+    # "CIE 1964 10 Degree Standard Observer".
+    cmfs_10 = MSDS_CMFS['CIE 1964 10 Degree Standard Observer'].copy().align(
+        shape)
+
+    data = _load_TCS_data_CIE2017(shape)
+    R_tcs = align_spectral_array(
+        np.transpose(data[:, 1:]), data[:, 0], shape)
+
+    return cmfs_10.values, R_tcs, [
+        'TCS{0} (CIE 2017)'.format(i) for i in range(99)
+    ]
+
+
+def _reference_tcs_colorimetry(CCT, shape):
+    """
+    Returns the reference illuminants colorimetry for given correlated colour
+    temperatures :math:`T_{cp}` and spectral shape.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}` of shape (n, ).
+    shape : SpectralShape
+        Spectral shape of the computations.
+
+    Returns
+    -------
+    tuple
+        *Test colour samples* *CIE XYZ* tristimulus values and *CAM02-UCS*
+        colourspace :math:`J'a'b'` values of shape (n, 99, 3).
+    """
+
+    cmfs_10, R_tcs, names_tcs = _tcs_spectral_arrays(shape)
+
+    data = _tcs_colorimetry_data_spectral_array(
+        spectral_array_reference_illuminant_CIE2017(CCT, shape), R_tcs,
+        names_tcs, cmfs_10)
+
+    return data.XYZ, data.Jpapbp
+
+
+def _reference_illuminant_bank(shape):
+    """
+    Returns the reference illuminants bank of the
+    *CIE 2017 Colour Fidelity Index* (CFI) batch computations for given
+    spectral shape.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape of the computations.
+
+    Returns
+    -------
+    ReferenceIlluminantBank
+        Reference illuminants bank.
+
+    Notes
+    -----
+    -   The reference illuminant is a mixture of the planckian radiator and
+        the *CIE Illuminant D Series* between 4000K and 5000K.
+    -   The banks are cached and won't be built again on subsequent calls to
+        this definition.
+    """
+
+    key = (shape.start, shape.end, shape.interval)
+
+    bank = _CACHE_REFERENCE_ILLUMINANT_BANKS_CIE2017.get(key)
+    if bank is None:
+        bank = ReferenceIlluminantBank(
+            partial(_reference_tcs_colorimetry, shape=shape),
+            (1000, 4000, 5000, 25000))
+        _CACHE_REFERENCE_ILLUMINANT_BANKS_CIE2017[key] = bank
+
+    return bank
+
+
+def _tcs_colorimetry_data_spectral_array(S, R_tcs, names_tcs, cmfs):
+    """
+    Returns the *test colour samples* colorimetry data under given test light
+    sources or reference illuminants spectral array for the
+    *CIE 2017 Colour Fidelity Index* (CFI) computations.
+
+    Parameters
+    ----------
+    S : array_like
+        Test light sources or reference illuminants spectral array of shape
+        (n, w), i.e. the irradiance emitters.
+    R_tcs : array_like
+        *Test colour samples* spectral array of shape (m, w).
+    names_tcs : array_like
+        *Test colour samples* names.
+    cmfs : array_like
+        Standard observer colour matching functions values of shape (w, 3).
+
+    Returns
+    -------
+    TCS_ColorimetryData_CIE2017
+        *Test colour samples* colorimetry data storing *ndarray* of shape
+        (n, m, ...).
+    """
+
+    XYZ = spectral_array_to_XYZ_tcs(S, R_tcs, cmfs)
+    XYZ_w = spectral_array_to_XYZ_tcs(S, np.ones([1, S.shape[-1]]), cmfs)
+
+    shape = XYZ.shape[:-1]
+    CAM = XYZ_to_CIECAM02(
+        XYZ,
+        np.broadcast_to(XYZ_w, XYZ.shape),
+        np.full(shape, 100.0),
+        np.full(shape, 20.0),
+        VIEWING_CONDITIONS_CIECAM02['Average'],
+        True,
+        correlates='JMh')
+    JMh = tstack([CAM.J, CAM.M, CAM.h])
+    Jpapbp = JMh_CIECAM02_to_CAM02UCS(JMh)
+
+    return TCS_ColorimetryData_CIE2017(names_tcs, XYZ, CAM, JMh, Jpapbp)
+
+
 def delta_E_to_R_f(delta_E):
     """
     Converts from colour-appearance difference to
@@ -0,0 +1,682 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Quality Common Utilities
+===============================
+
+Defines the common utilities objects used by the batch colour quality
+computations, i.e. the computations performed on many test spectral
+distributions at once:
+
+-   :func:`colour.quality.common.spectral_array`
+-   :func:`colour.quality.common.spectral_array_interpolator`
+-   :func:`colour.quality.common.matrix_spectral_alignment`
+-   :func:`colour.quality.common.align_spectral_array`
+-   :func:`colour.quality.common.sds_to_spectral_array`
+-   :func:`colour.quality.common.spectral_array_blackbody`
+-   :func:`colour.quality.common.spectral_array_CIE_illuminant_D_series`
+-   :func:`colour.quality.common.spectral_array_reference_illuminant`
+-   :func:`colour.quality.common.spectral_array_to_XYZ_tcs`
+-   :class:`colour.quality.common.ReferenceIlluminantBank`
+
+The spectral distributions are represented by *spectral arrays*, i.e.
+*ndarray* with the wavelengths in the last axis, so that the tristimulus values
+of all the test colour samples under all the test spectral distributions are
+computed as tensor contractions.
+"""
+
+import hashlib
+import numpy as np
+
+from colour.algebra import LinearInterpolator
+from colour.colorimetry import (
+    SPECTRAL_SHAPE_DEFAULT, SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES,
+    MultiSpectralDistributions, SpectralDistribution, planck_law)
+from colour.temperature import CCT_to_xy_CIE_D
+from colour.utilities import CACHE_REGISTRY, as_float_array, lerp, tsplit
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'spectral_array', 'spectral_array_interpolator',
+    'matrix_spectral_alignment', 'align_spectral_array',
+    'sds_to_spectral_array', 'spectral_array_blackbody',
+    'spectral_array_CIE_illuminant_D_series',
+    'spectral_array_reference_illuminant', 'spectral_array_to_XYZ_tcs',
+    'ReferenceIlluminantBank'
+]
+
+_CACHE_SPECTRAL_ARRAYS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_SPECTRAL_ARRAYS'.format(__name__), 128)
+
+
+def _shape_key(shape):
+    """
+    Returns a hashable key for given spectral shape.
+    """
+
+    return shape.start, shape.end, shape.interval
+
+
+def spectral_array(msds, shape=SPECTRAL_SHAPE_DEFAULT):
+    """
+    Returns the values and wavelengths of given multi-spectral distributions as
+    a spectral array of shape (n, w).
+
+    Parameters
+    ----------
+    msds : MultiSpectralDistributions or array_like
+        Multi-spectral distributions, if an *array_like* the wavelengths are
+        expected to be in the last axis.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral distributions *array_like*,
+        ignored if ``msds`` is a :class:`colour.MultiSpectralDistributions`
+        class instance.
+
+    Returns
+    -------
+    tuple
+        Spectral array of shape (n, w) and wavelengths of shape (w, ).
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> values, wavelengths = spectral_array(
+    ...     np.ones(9), SpectralShape(400, 800, 50))
+    >>> values.shape
+    (1, 9)
+    >>> wavelengths
+    array([ 400.,  450.,  500.,  550.,  600.,  650.,  700.,  750.,  800.])
+    """
+
+    if isinstance(msds, MultiSpectralDistributions):
+        return np.transpose(msds.values), msds.wavelengths
+
+    values = as_float_array(msds)
+    wavelengths = shape.range()
+
+    assert values.shape[-1] == len(wavelengths), (
+        'Multi-spectral distributions array with {0} wavelengths '
+        'is not compatible with spectral shape with {1} wavelengths!'.format(
+            values.shape[-1], len(wavelengths)))
+
+    return np.reshape(values, (-1, len(wavelengths))), wavelengths
+
+
+def spectral_array_interpolator(msds):
+    """
+    Returns the interpolator class and its keyword arguments used to align the
+    spectral array of given multi-spectral distributions.
+
+    Parameters
+    ----------
+    msds : MultiSpectralDistributions or array_like
+        Multi-spectral distributions.
+
+    Returns
+    -------
+    tuple
+        Interpolator class and its keyword arguments, *None* if ``msds`` is
+        an *array_like*, in which case the
+        :class:`colour.SpectralDistribution` class default interpolator is
+        used.
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SDS_ILLUMINANTS, sds_and_msds_to_msds
+    >>> msds = sds_and_msds_to_msds([SDS_ILLUMINANTS['FL2']])
+    >>> spectral_array_interpolator(msds)  # doctest: +ELLIPSIS
+    (<class '...SpragueInterpolator'>, {})
+    >>> spectral_array_interpolator(np.ones(9))
+    (None, None)
+    """
+
+    if isinstance(msds, MultiSpectralDistributions):
+        return msds.interpolator, msds.interpolator_kwargs
+
+    return None, None
+
+
+def matrix_spectral_alignment(wavelengths,
+                              shape,
+                              extrapolator_kwargs=None,
+                              interpolator=None,
+                              interpolator_kwargs=None):
+    """
+    Returns the matrix aligning spectral arrays sampled at given wavelengths
+    to given spectral shape.
+
+    The spectral distributions interpolation and extrapolation being linear in
+    their values, the matrix columns are the aligned unit impulses, i.e. the
+    product of the matrix with a spectral array yields the same values than
+    :meth:`colour.SpectralDistribution.align` method.
+
+    Parameters
+    ----------
+    wavelengths : array_like
+        Wavelengths of the spectral arrays to align.
+    shape : SpectralShape
+        Spectral shape to align the spectral arrays to.
+    extrapolator_kwargs : dict_like, optional
+        Arguments to use when instantiating the extrapolating function.
+    interpolator : object, optional
+        Interpolator class type to use as interpolating function, the
+        :class:`colour.SpectralDistribution` class default interpolator is
+        used if not given.
+    interpolator_kwargs : dict_like, optional
+        Arguments to use when instantiating the interpolating function.
+
+    Returns
+    -------
+    ndarray
+        Spectral alignment matrix of shape (w_s, w) where :math:`w_s` is the
+        wavelengths count of given spectral shape.
+
+    Notes
+    -----
+    -   The matrices are cached and won't be computed again on subsequent
+        calls to this definition.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> M = matrix_spectral_alignment(
+    ...     SpectralShape(400, 700, 50).range(), SpectralShape(350, 700, 50))
+    >>> M.shape
+    (8, 7)
+    >>> M[:2, 0]
+    array([ 1.,  1.])
+    """
+
+    wavelengths = as_float_array(wavelengths)
+
+    key = (hashlib.sha1(wavelengths.tobytes()).hexdigest(), _shape_key(shape),
+           repr(sorted((extrapolator_kwargs or {}).items())),
+           repr(interpolator),
+           repr(sorted((interpolator_kwargs or {}).items())))
+    M = _CACHE_SPECTRAL_ARRAYS.get(key)
+    if M is not None:
+        return M
+
+    M = []
+    for impulse in np.identity(len(wavelengths)):
+        sd = SpectralDistribution(impulse, wavelengths)
+        if interpolator is not None:
+            sd.interpolator = interpolator
+        if interpolator_kwargs is not None:
+            sd.interpolator_kwargs = interpolator_kwargs
+        if extrapolator_kwargs is not None:
+            sd.extrapolator_kwargs = extrapolator_kwargs
+        M.append(sd.align(shape).values)
+
+    M = np.transpose(M)
+    _CACHE_SPECTRAL_ARRAYS[key] = M
+
+    return M
+
+
+def align_spectral_array(values,
+                         wavelengths,
+                         shape,
+                         extrapolator_kwargs=None,
+                         interpolator=None,
+                         interpolator_kwargs=None):
+    """
+    Aligns given spectral array sampled at given wavelengths to given spectral
+    shape.
+
+    Parameters
+    ----------
+    values : array_like
+        Spectral array to align.
+    wavelengths : array_like
+        Wavelengths of the spectral array.
+    shape : SpectralShape
+        Spectral shape to align the spectral array to.
+    extrapolator_kwargs : dict_like, optional
+        Arguments to use when instantiating the extrapolating function.
+    interpolator : object, optional
+        Interpolator class type to use as interpolating function, the
+        :class:`colour.SpectralDistribution` class default interpolator is
+        used if not given.
+    interpolator_kwargs : dict_like, optional
+        Arguments to use when instantiating the interpolating function.
+
+    Returns
+    -------
+    ndarray
+        Aligned spectral array.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> align_spectral_array(
+    ...     np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]),
+    ...     SpectralShape(400, 700, 50).range(),
+    ...     SpectralShape(400, 550, 25))
+    array([ 1. ,  1.5,  2. ,  2.5,  3. ,  3.5,  4. ])
+    """
+
+    values = as_float_array(values)
+    wavelengths = as_float_array(wavelengths)
+
+    if (np.array_equal(wavelengths, shape.range()) and
+            extrapolator_kwargs is None):
+        return values
+
+    return np.dot(
+        values,
+        np.transpose(
+            matrix_spectral_alignment(wavelengths, shape, extrapolator_kwargs,
+                                      interpolator, interpolator_kwargs)))
+
+
+def sds_to_spectral_array(sds, shape):
+    """
+    Returns given spectral distributions aligned to given spectral shape as a
+    spectral array.
+
+    Parameters
+    ----------
+    sds : array_like
+        Spectral distributions, e.g. *test colour samples*.
+    shape : SpectralShape
+        Spectral shape to align the spectral distributions to.
+
+    Returns
+    -------
+    ndarray
+        Spectral array of shape (n, w).
+
+    Notes
+    -----
+    -   The spectral arrays are cached using the spectral distributions content
+        and won't be computed again on subsequent calls to this definition.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> from colour.quality.datasets import SDS_TCS
+    >>> sds_to_spectral_array(
+    ...     SDS_TCS.values(), SpectralShape(360, 780, 1)).shape
+    (14, 421)
+    """
+
+    sds = list(sds)
+
+    digest = hashlib.sha1()
+    for sd in sds:
+        digest.update(sd.wavelengths.tobytes())
+        digest.update(sd.values.tobytes())
+
+    key = (digest.hexdigest(), _shape_key(shape))
+    values = _CACHE_SPECTRAL_ARRAYS.get(key)
+    if values is not None:
+        return values
+
+    values = np.array([sd.copy().align(shape).values for sd in sds])
+    _CACHE_SPECTRAL_ARRAYS[key] = values
+
+    return values
+
+
+def spectral_array_blackbody(CCT, shape=SPECTRAL_SHAPE_DEFAULT):
+    """
+    Returns the spectral array of the planckian radiators for given
+    temperatures, i.e. the values of :func:`colour.sd_blackbody` definition.
+
+    Parameters
+    ----------
+    CCT : numeric or array_like
+        Temperatures in kelvins.
+    shape : SpectralShape, optional
+        Spectral shape used to create the spectral array.
+
+    Returns
+    -------
+    ndarray
+        Planckian radiators spectral array.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> spectral_array_blackbody(
+    ...     np.array([4000, 6500]), SpectralShape(400, 700, 150))
+    ... # doctest: +ELLIPSIS
+    array([[  1446.3994564...,   3423.3851293...,   4181.5665822...],
+           [ 46134.7021007...,  43060.2736054...,  31325.4538593...]])
+    """
+
+    CCT = as_float_array(CCT)
+
+    return planck_law(shape.range() * 1e-9, CCT[..., np.newaxis]) * 1e-9
+
+
+def spectral_array_CIE_illuminant_D_series(xy, shape=SPECTRAL_SHAPE_DEFAULT):
+    """
+    Returns the spectral array of given *CIE Illuminant D Series* aligned to
+    given spectral shape, i.e. the values of
+    :func:`colour.sd_CIE_illuminant_D_series` definition.
+
+    Parameters
+    ----------
+    xy : array_like
+        *CIE xy* chromaticity coordinates.
+    shape : SpectralShape, optional
+        Spectral shape to align the *CIE Illuminant D Series* to.
+
+    Returns
+    -------
+    ndarray
+        *CIE Illuminant D Series* spectral array.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> spectral_array_CIE_illuminant_D_series(
+    ...     np.array([0.31270, 0.32900]), SpectralShape(400, 700, 150))
+    ... # doctest: +ELLIPSIS
+    array([  82.9477,  104.0491,   71.7538])
+    """
+
+    x, y = tsplit(xy)
+
+    M = 0.0241 + 0.2562 * x - 0.7341 * y
+    M1 = np.around((-1.3515 - 1.7703 * x + 5.9114 * y) / M, 3)
+    M2 = np.around((0.0300 - 31.4424 * x + 30.0717 * y) / M, 3)
+
+    key = ('CIE Illuminant D Series', _shape_key(shape))
+    S = _CACHE_SPECTRAL_ARRAYS.get(key)
+    if S is None:
+        S = np.array([
+            SpectralDistribution(
+                SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES[basis].values,
+                SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES[basis]
+                .wavelengths,
+                interpolator=LinearInterpolator).align(shape).values
+            for basis in ('S0', 'S1', 'S2')
+        ])
+        _CACHE_SPECTRAL_ARRAYS[key] = S
+
+    return (S[0] + M1[..., np.newaxis] * S[1] + M2[..., np.newaxis] * S[2])
+
+
+def spectral_array_reference_illuminant(CCT, shape=SPECTRAL_SHAPE_DEFAULT):
+    """
+    Returns the spectral array of the reference illuminants for given
+    correlated colour temperatures as used by the *Colour Rendering Index*
+    (CRI) and *Colour Quality Scale* (CQS) computations, i.e. a planckian
+    radiator below 5000K and a *CIE Illuminant D Series* otherwise.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape, optional
+        Spectral shape used to create the spectral array.
+
+    Returns
+    -------
+    ndarray
+        Reference illuminants spectral array.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> spectral_array_reference_illuminant(
+    ...     np.array([4000, 6500]), SpectralShape(400, 700, 150))
+    ... # doctest: +ELLIPSIS
+    array([[ 1446.3994564...,  3423.3851293...,  4181.5665822...],
+           [   82.7104    ,   104.044     ,    71.632     ]])
+    """
+
+    CCT = as_float_array(CCT)
+
+    values = np.empty(CCT.shape + (len(shape.range()), ))
+
+    planckian = CCT < 5000
+    values[planckian] = spectral_array_blackbody(CCT[planckian], shape)
+    values[~planckian] = spectral_array_CIE_illuminant_D_series(
+        CCT_to_xy_CIE_D(CCT[~planckian]), shape)
+
+    return values
+
+
+def spectral_array_to_XYZ_tcs(irradiance, reflectances, cmfs):
+    """
+    Returns the *CIE XYZ* tristimulus values of given *test colour samples*
+    reflectances under given irradiance spectral arrays.
+
+    The tristimulus values are computed with the integration method of
+    :func:`colour.sd_to_XYZ` definition, i.e. the perfect reflecting diffuser
+    has :math:`Y = 100`, for all the irradiances and reflectances at once.
+
+    Parameters
+    ----------
+    irradiance : array_like
+        Test light sources or reference illuminants spectral array of shape
+        (n, w), i.e. the irradiance emitters.
+    reflectances : array_like
+        *Test colour samples* spectral array of shape (m, w).
+    cmfs : array_like
+        Standard observer colour matching functions values of shape (w, 3).
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values of shape (n, m, 3).
+
+    Examples
+    --------
+    >>> from colour import MSDS_CMFS, SpectralShape
+    >>> shape = SpectralShape(400, 700, 10)
+    >>> cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer'].copy().align(
+    ...     shape)
+    >>> irradiance = spectral_array_blackbody(np.array([6500]), shape)
+    >>> spectral_array_to_XYZ_tcs(
+    ...     irradiance, np.ones([1, 31]), cmfs.values)  # doctest: +ELLIPSIS
+    array([[[  96.7450794...,  100.        ,  111.7534629...]]])
+    """
+
+    irradiance = as_float_array(irradiance)
+    reflectances = as_float_array(reflectances)
+    cmfs = as_float_array(cmfs)
+
+    k = 100 / np.dot(irradiance, cmfs[..., 1])
+
+    XYZ = np.tensordot(
+        irradiance,
+        reflectances[..., np.newaxis] * cmfs[np.newaxis],
+        axes=(-1, -2))
+
+    return XYZ * k[..., np.newaxis, np.newaxis]
+
+
+class ReferenceIlluminantBank(object):
+    """
+    Defines a bank of reference illuminants colorimetry, i.e. the colorimetry
+    of the *test colour samples* under the reference illuminants sampled on a
+    correlated colour temperature :math:`T_{cp}` grid, for repeated colour
+    quality computations.
+
+    The grid is uniform in reciprocal megakelvin and the colorimetry is
+    linearly interpolated on it, thus no spectral computations are performed
+    for the reference illuminants once the bank is built. Each segment of the
+    grid has its own nodes so that the reference illuminants discontinuities,
+    e.g. the transition from the planckian radiator to the
+    *CIE Illuminant D Series* at 5000K, are not interpolated over.
+
+    Parameters
+    ----------
+    colorimetry : callable
+        Definition computing the reference colorimetry for given correlated
+        colour temperatures :math:`T_{cp}` array of shape (g, ), returning a
+        tuple of *ndarray* of shape (g, ...).
+    segments : array_like, optional
+        Correlated colour temperatures :math:`T_{cp}` segments boundaries,
+        a segment includes its lower boundary but excludes its upper boundary,
+        except for the last one.
+    interval : numeric, optional
+        Grid interval in reciprocal megakelvin.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.quality.common.ReferenceIlluminantBank.colorimetry`
+    -   :attr:`~colour.quality.common.ReferenceIlluminantBank.segments`
+    -   :attr:`~colour.quality.common.ReferenceIlluminantBank.interval`
+    -   :attr:`~colour.quality.common.ReferenceIlluminantBank.domain`
+
+    Methods
+    -------
+    -   :meth:`~colour.quality.common.ReferenceIlluminantBank.__init__`
+    -   :meth:`~colour.quality.common.ReferenceIlluminantBank.__call__`
+
+    Notes
+    -----
+    -   The correlated colour temperatures :math:`T_{cp}` outside the bank
+        domain are given to the colorimetry definition, thus their colorimetry
+        is exact.
+
+    Examples
+    --------
+    >>> def colorimetry(CCT):
+    ...     return (planck_law(550 * 1e-9, CCT) * 1e-9, )
+    >>> bank = ReferenceIlluminantBank(colorimetry, (1000, 5000), 1)
+    >>> bank.domain
+    (1000.0, 5000.0)
+    >>> bank(np.array([2000, 3500, 10000]))  # doctest: +ELLIPSIS
+    (array([  4.9379077...e+00,   1.3438471...e+03,   1.8662255...e+05]),)
+    """
+
+    def __init__(self, colorimetry, segments=(1000, 5000, 25000),
+                 interval=0.5):
+        self._colorimetry = colorimetry
+        self._segments = as_float_array(segments)
+        self._interval = interval
+
+        self._nodes = []
+        self._tables = []
+        for i in range(len(self._segments) - 1):
+            start, end = self._segments[i], self._segments[i + 1]
+
+            count = int(np.ceil((1e6 / start - 1e6 / end) / interval)) + 1
+            nodes = 1e6 / np.linspace(1e6 / start, 1e6 / end, count)
+            nodes[0] = start
+            # The upper boundary is excluded from the segment, except for the
+            # last one, thus the colorimetry is evaluated just below it.
+            nodes[-1] = (end if i == len(self._segments) - 2 else np.nextafter(
+                end, start))
+
+            self._nodes.append(nodes)
+            self._tables.append(self._colorimetry(nodes))
+
+    @property
+    def colorimetry(self):
+        """
+        Getter property for the colorimetry definition.
+
+        Returns
+        -------
+        callable
+            Colorimetry definition.
+        """
+
+        return self._colorimetry
+
+    @property
+    def segments(self):
+        """
+        Getter property for the correlated colour temperatures :math:`T_{cp}`
+        segments boundaries.
+
+        Returns
+        -------
+        ndarray
+            Segments boundaries.
+        """
+
+        return self._segments
+
+    @property
+    def interval(self):
+        """
+        Getter property for the grid interval in reciprocal megakelvin.
+
+        Returns
+        -------
+        numeric
+            Grid interval.
+        """
+
+        return self._interval
+
+    @property
+    def domain(self):
+        """
+        Getter property for the bank domain.
+
+        Returns
+        -------
+        tuple
+            Correlated colour temperatures :math:`T_{cp}` interpolated by the
+            bank.
+        """
+
+        return self._segments[0], self._segments[-1]
+
+    def __call__(self, CCT):
+        """
+        Returns the reference colorimetry for given correlated colour
+        temperatures :math:`T_{cp}`.
+
+        Parameters
+        ----------
+        CCT : array_like
+            Correlated colour temperatures :math:`T_{cp}` of shape (n, ).
+
+        Returns
+        -------
+        tuple
+            Reference colorimetry, i.e. *ndarray* of shape (n, ...).
+        """
+
+        CCT = np.ravel(as_float_array(CCT))
+
+        values = [
+            np.empty(CCT.shape + table.shape[1:]) for table in self._tables[0]
+        ]
+
+        remaining = np.ones(CCT.shape, dtype=np.bool_)
+        for i, (nodes, table) in enumerate(zip(self._nodes, self._tables)):
+            start, end = self._segments[i], self._segments[i + 1]
+            within = np.logical_and(CCT >= start, CCT < end)
+            if i == len(self._nodes) - 1:
+                within = np.logical_or(within, CCT == end)
+
+            within = np.logical_and(within, remaining)
+            if not np.any(within):
+                continue
+
+            remaining[within] = False
+
+            T = CCT[within]
+            j = np.clip(np.searchsorted(nodes, T, side='right'), 1,
+                        len(nodes) - 1)
+            # Interpolation weights in reciprocal megakelvin.
+            t = (1 / T - 1 / nodes[j - 1]) / (1 / nodes[j] - 1 / nodes[j - 1])
+
+            for value, table_values in zip(values, table):
+                value[within] = lerp(
+                    table_values[j - 1], table_values[j],
+                    np.reshape(t, t.shape + (1, ) * (table_values.ndim - 1)))
+
+        if np.any(remaining):
+            for value, exact in zip(values,
+                                    self._colorimetry(CCT[remaining])):
+                value[remaining] = exact
+
+        return tuple(values)
@@ -7,6 +7,7 @@ Defines *Colour Quality Scale* (CQS) computation objects:
 
 -   :class:`colour.quality.ColourRendering_Specification_CQS`
 -   :func:`colour.colour_quality_scale`
+-   :func:`colour.quality.colour_quality_scale_msds`
 
 References
 ----------
@@ -24,17 +25,23 @@ usp=sharing
 
 import numpy as np
 from collections import namedtuple
+from functools import partial
 
 from colour.algebra import euclidean_distance
 from colour.colorimetry import (
     SPECTRAL_SHAPE_DEFAULT, sd_CIE_illuminant_D_series, CCS_ILLUMINANTS,
     MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody, sd_to_XYZ)
+from colour.quality.common import (
+    ReferenceIlluminantBank, align_spectral_array, sds_to_spectral_array,
+    spectral_array, spectral_array_interpolator,
+    spectral_array_reference_illuminant, spectral_array_to_XYZ_tcs)
 from colour.quality.datasets.vs import INDEXES_TO_NAMES_VS, SDS_VS
 from colour.models import (Lab_to_LCHab, UCS_to_uv, XYZ_to_Lab, XYZ_to_UCS,
                            XYZ_to_xy, xy_to_XYZ)
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Ohno2013
 from colour.adaptation import chromatic_adaptation_VonKries
-from colour.utilities import as_float_array, domain_range_scale, tsplit
+from colour.utilities import (CACHE_REGISTRY, as_float_array,
+                              domain_range_scale, tsplit, tstack)
 from colour.utilities.documentation import (DocstringTuple,
                                             is_documentation_building)
 
@@ -48,8 +55,9 @@ __status__ = 'Production'
 __all__ = [
     'GAMUT_AREA_D65', 'VS_ColorimetryData', 'VS_ColourQualityScaleData',
     'ColourRendering_Specification_CQS', 'COLOUR_QUALITY_SCALE_METHODS',
-    'colour_quality_scale', 'gamut_area', 'vs_colorimetry_data', 'CCT_factor',
-    'scale_conversion', 'delta_E_RMS', 'colour_quality_scales'
+    'colour_quality_scale', 'colour_quality_scale_msds', 'gamut_area',
+    'vs_colorimetry_data', 'CCT_factor', 'scale_conversion', 'delta_E_RMS',
+    'colour_quality_scales'
 ]
 
 GAMUT_AREA_D65 = 8210
@@ -59,6 +67,9 @@ Gamut area for *CIE Illuminant D Series D65*.
 GAMUT_AREA_D65 : int
 """
 
+_CACHE_REFERENCE_ILLUMINANT_BANKS_CQS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_REFERENCE_ILLUMINANT_BANKS_CQS'.format(__name__))
+
 
 class VS_ColorimetryData(
         namedtuple('VS_ColorimetryData', ('name', 'XYZ', 'Lab', 'C'))):
@@ -253,6 +264,155 @@ def colour_quality_scale(sd_test, additional_data=False,
         return Q_a
 
 
+def colour_quality_scale_msds(msds,
+                              additional_data=False,
+                              method='NIST CQS 9.0',
+                              shape=SPECTRAL_SHAPE_DEFAULT,
+                              exact=False):
+    """
+    Returns the *Colour Quality Scale* (CQS) of given multi-spectral
+    distributions using given method.
+
+    The *VS test colour samples* tristimulus values under all the test
+    spectral distributions are computed at once as tensor contractions. The
+    reference illuminants colorimetry is interpolated from a bank sampled on a
+    correlated colour temperature grid unless exact computations are
+    requested.
+
+    Parameters
+    ----------
+    msds : MultiSpectralDistributions or array_like
+        Test multi-spectral distributions, if an *array_like* of shape (n, w)
+        the wavelengths are expected to be in the last axis.
+    additional_data : bool, optional
+        Whether to output additional data.
+    method : unicode, optional
+        **{'NIST CQS 9.0', 'NIST CQS 7.4'}**,
+        Computation method.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral distributions *array_like*,
+        ignored if ``msds`` is a :class:`colour.MultiSpectralDistributions`
+        class instance.
+    exact : bool, optional
+        Whether to compute the reference illuminants colorimetry from their
+        spectral distributions rather than interpolating it from the
+        reference illuminants bank.
+
+    Returns
+    -------
+    ndarray or ColourRendering_Specification_CQS
+        Color quality scale of shape (n, ). The additional data specification
+        stores the scales as *ndarray* of shape (n, ), the individual
+        *Colour Quality Scale* (CQS) data as a
+        :class:`colour.quality.cqs.VS_ColourQualityScaleData` class instance
+        and the colorimetry data as
+        :class:`colour.quality.cqs.VS_ColorimetryData` class instances, both
+        storing *ndarray* of shape (n, 15, ...).
+
+    Notes
+    -----
+    -   The reference illuminants bank interpolation error on the
+        *Colour Quality Scale* (CQS) :math:`Q_a` is typically lower than 0.01.
+    -   The test multi-spectral distributions are aligned with their own
+        interpolator, it should be the test spectral distributions one, e.g.
+        :class:`colour.LinearInterpolator` class for the illuminants
+        datasets, for the results to agree with
+        :func:`colour.colour_quality_scale` definition.
+
+    References
+    ----------
+    :cite:`Davis2010a`, :cite:`Ohno2008a`, :cite:`Ohno2013`
+
+    Examples
+    --------
+    >>> from colour.algebra import LinearInterpolator
+    >>> from colour.colorimetry import SDS_ILLUMINANTS, sds_and_msds_to_msds
+    >>> msds = sds_and_msds_to_msds(
+    ...     [SDS_ILLUMINANTS['FL2'], SDS_ILLUMINANTS['FL9']])
+    >>> msds.interpolator = LinearInterpolator
+    >>> colour_quality_scale_msds(msds, exact=True)  # doctest: +ELLIPSIS
+    array([ 64.1117031...,  90.6873929...])
+    """
+
+    method = method.lower()
+    assert method.lower() in [
+        m.lower() for m in COLOUR_QUALITY_SCALE_METHODS
+    ], ('"{0}" method is invalid, must be one of {1}!'.format(
+        method, COLOUR_QUALITY_SCALE_METHODS))
+
+    cmfs, R_vs, names_vs = _vs_spectral_arrays(method)
+
+    values, wavelengths = spectral_array(msds, shape)
+    interpolator, interpolator_kwargs = spectral_array_interpolator(msds)
+
+    S_t = align_spectral_array(values, wavelengths, cmfs.shape, None,
+                               interpolator, interpolator_kwargs)
+
+    uv = UCS_to_uv(XYZ_to_UCS(np.dot(S_t, cmfs.values)))
+    CCT, _D_uv = tsplit(uv_to_CCT_Ohno2013(uv))
+
+    if exact:
+        XYZ_r, XYZ_vs_r, Lab_vs_r, C_vs_r = _reference_vs_colorimetry(
+            CCT, method)
+    else:
+        XYZ_r, XYZ_vs_r, Lab_vs_r, C_vs_r = _reference_illuminant_bank(
+            method)(CCT)
+
+    test_vs_colorimetry_data = _vs_colorimetry_data_spectral_array(
+        S_t, XYZ_r, R_vs, names_vs, cmfs.values, chromatic_adaptation=True)
+    reference_vs_colorimetry_data = VS_ColorimetryData(
+        names_vs, XYZ_vs_r, Lab_vs_r, C_vs_r)
+
+    if method == 'nist cqs 9.0':
+        CCT_f = np.ones(CCT.shape)
+        scaling_f = 3.2
+    else:
+        CCT_f = _CCT_factor_spectral_array(reference_vs_colorimetry_data.XYZ,
+                                           XYZ_r)
+        scaling_f = 3.104
+
+    D_C_ab = test_vs_colorimetry_data.C - reference_vs_colorimetry_data.C
+    D_E_ab = np.linalg.norm(
+        test_vs_colorimetry_data.Lab - reference_vs_colorimetry_data.Lab,
+        axis=-1)
+    D_Ep_ab = np.where(D_C_ab > 0, np.sqrt(D_E_ab ** 2 - D_C_ab ** 2), D_E_ab)
+
+    Q_as = VS_ColourQualityScaleData(
+        names_vs, scale_conversion(D_Ep_ab, CCT_f[..., np.newaxis],
+                                   scaling_f), D_C_ab, D_E_ab, D_Ep_ab)
+
+    D_E_RMS = np.sqrt(np.mean(D_E_ab ** 2, axis=-1))
+    D_Ep_RMS = np.sqrt(np.mean(D_Ep_ab ** 2, axis=-1))
+
+    Q_a = scale_conversion(D_Ep_RMS, CCT_f, scaling_f)
+
+    if method == 'nist cqs 9.0':
+        scaling_f = 2.93 * 1.0343
+    else:
+        scaling_f = 2.928
+
+    Q_f = scale_conversion(D_E_RMS, CCT_f, scaling_f)
+
+    G_t = gamut_area(test_vs_colorimetry_data.Lab)
+    G_r = gamut_area(reference_vs_colorimetry_data.Lab)
+
+    Q_g = G_t / GAMUT_AREA_D65 * 100
+
+    if method == 'nist cqs 9.0':
+        Q_d = Q_p = None
+    else:
+        p_delta_C = np.average(np.maximum(D_C_ab, 0), axis=-1)
+        Q_p = 100 - 3.6 * (D_Ep_RMS - p_delta_C)
+        Q_d = G_t / G_r * CCT_f * 100
+
+    if additional_data:
+        return ColourRendering_Specification_CQS(
+            getattr(msds, 'labels', None), Q_a, Q_f, Q_p, Q_g, Q_d, Q_as,
+            (test_vs_colorimetry_data, reference_vs_colorimetry_data))
+    else:
+        return Q_a
+
+
 def gamut_area(Lab):
     """
     Returns the gamut area :math:`G` covered by given *CIE L\\*a\\*b\\**
@@ -261,11 +421,12 @@ def gamut_area(Lab):
     Parameters
     ----------
     Lab : array_like
-        *CIE L\\*a\\*b\\** colourspace matrices.
+        *CIE L\\*a\\*b\\** colourspace matrices, the samples are expected to
+        be in the penultimate axis.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Gamut area :math:`G`.
 
     Examples
@@ -292,18 +453,18 @@ def gamut_area(Lab):
     """
 
     Lab = as_float_array(Lab)
-    Lab_s = np.roll(np.copy(Lab), -3)
+    Lab_s = np.roll(Lab, -1, axis=-2)
 
     _L, a, b = tsplit(Lab)
     _L_s, a_s, b_s = tsplit(Lab_s)
 
     A = np.linalg.norm(Lab[..., 1:3], axis=-1)
     B = np.linalg.norm(Lab_s[..., 1:3], axis=-1)
-    C = np.linalg.norm(np.dstack([a_s - a, b_s - b]), axis=-1)
+    C = np.linalg.norm(tstack([a_s - a, b_s - b]), axis=-1)
     t = (A + B + C) / 2
     S = np.sqrt(t * (t - A) * (t - B) * (t - C))
 
-    return np.sum(S)
+    return np.sum(S, axis=-1)
 
 
 def vs_colorimetry_data(sd_test,
@@ -358,6 +519,160 @@ def vs_colorimetry_data(sd_test,
     return vs_data
 
 
+def _vs_spectral_arrays(method):
+    """
+    Returns the standard observer colour matching functions, the
+    *VS test colour samples* spectral array and their names used by the
+    *Colour Quality Scale* (CQS) batch computations with given method.
+
+    Parameters
+    ----------
+    method : unicode
+        **{'NIST CQS 9.0', 'NIST CQS 7.4'}**,
+        Computation method.
+
+    Returns
+    -------
+    tuple
+        Standard observer colour matching functions, *VS test colour samples*
+        spectral array of shape (15, w) and names.
+    """
+
+    cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+        'CIE 1931 2 Degree Standard Observer'].copy().trim(
+            SPECTRAL_SHAPE_DEFAULT)
+
+    sds_vs = [
+        SDS_VS[method][name]
+        for _index, name in sorted(INDEXES_TO_NAMES_VS.items())
+    ]
+
+    return (cmfs, sds_to_spectral_array(sds_vs, cmfs.shape),
+            [sd.name for sd in sds_vs])
+
+
+def _reference_vs_colorimetry(CCT, method):
+    """
+    Returns the reference illuminants colorimetry for given correlated colour
+    temperatures :math:`T_{cp}` and method.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}` of shape (n, ).
+    method : unicode
+        **{'NIST CQS 9.0', 'NIST CQS 7.4'}**,
+        Computation method.
+
+    Returns
+    -------
+    tuple
+        Reference illuminants normalised *CIE XYZ* tristimulus values of shape
+        (n, 3) and *VS test colour samples* *CIE XYZ* tristimulus values,
+        *CIE L\\*a\\*b\\** colourspace values and chroma of shape (n, 15, ...).
+    """
+
+    cmfs, R_vs, names_vs = _vs_spectral_arrays(method)
+
+    S_r = spectral_array_reference_illuminant(CCT, cmfs.shape)
+    XYZ_r = np.dot(S_r, cmfs.values)
+    XYZ_r /= XYZ_r[..., 1, np.newaxis]
+
+    data = _vs_colorimetry_data_spectral_array(S_r, XYZ_r, R_vs, names_vs,
+                                               cmfs.values)
+
+    return XYZ_r, data.XYZ, data.Lab, data.C
+
+
+def _reference_illuminant_bank(method):
+    """
+    Returns the reference illuminants bank of the *Colour Quality Scale* (CQS)
+    batch computations with given method.
+
+    Parameters
+    ----------
+    method : unicode
+        **{'NIST CQS 9.0', 'NIST CQS 7.4'}**,
+        Computation method.
+
+    Returns
+    -------
+    ReferenceIlluminantBank
+        Reference illuminants bank.
+
+    Notes
+    -----
+    -   The reference illuminant transitions from the planckian radiator to
+        the *CIE Illuminant D Series* at 5000K.
+    -   The banks are cached and won't be built again on subsequent calls to
+        this definition.
+    """
+
+    method = method.lower()
+
+    bank = _CACHE_REFERENCE_ILLUMINANT_BANKS_CQS.get(method)
+    if bank is None:
+        bank = ReferenceIlluminantBank(
+            partial(_reference_vs_colorimetry, method=method),
+            (1000, 5000, 25000))
+        _CACHE_REFERENCE_ILLUMINANT_BANKS_CQS[method] = bank
+
+    return bank
+
+
+def _vs_colorimetry_data_spectral_array(S_t,
+                                        XYZ_r,
+                                        R_vs,
+                                        names_vs,
+                                        cmfs,
+                                        chromatic_adaptation=False):
+    """
+    Returns the *VS test colour samples* colorimetry data for given test
+    spectral array and reference illuminants tristimulus values.
+
+    Parameters
+    ----------
+    S_t : array_like
+        Test spectral array of shape (n, w).
+    XYZ_r : array_like
+        Reference illuminants *CIE XYZ* tristimulus values normalised to
+        :math:`Y = 1` of shape (n, 3).
+    R_vs : array_like
+        *VS test colour samples* spectral array of shape (m, w).
+    names_vs : array_like
+        *VS test colour samples* names.
+    cmfs : array_like
+        Standard observer colour matching functions values of shape (w, 3).
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    VS_ColorimetryData
+        *VS test colour samples* colorimetry data storing *ndarray* of shape
+        (n, m, ...).
+    """
+
+    XYZ_t = np.dot(S_t, cmfs)
+    XYZ_t /= XYZ_t[..., 1, np.newaxis]
+
+    xy_r = XYZ_to_xy(XYZ_r)
+
+    XYZ_vs = spectral_array_to_XYZ_tcs(S_t, R_vs, cmfs) / 100
+
+    if chromatic_adaptation:
+        XYZ_vs = chromatic_adaptation_VonKries(
+            XYZ_vs,
+            XYZ_t[..., np.newaxis, :],
+            XYZ_r[..., np.newaxis, :],
+            transform='CMCCAT2000')
+
+    Lab_vs = XYZ_to_Lab(XYZ_vs, illuminant=xy_r[..., np.newaxis, :])
+    _L_vs, C_vs, _Hab = tsplit(Lab_to_LCHab(Lab_vs))
+
+    return VS_ColorimetryData(names_vs, XYZ_vs, Lab_vs, C_vs)
+
+
 def CCT_factor(reference_data, XYZ_r):
     """
     Returns the correlated colour temperature factor penalizing lamps with
@@ -394,6 +709,37 @@ def CCT_factor(reference_data, XYZ_r):
     return CCT_f
 
 
+def _CCT_factor_spectral_array(XYZ_vs_r, XYZ_r):
+    """
+    Returns the correlated colour temperature factors penalizing lamps with
+    extremely low correlated colour temperatures for given *VS test colour
+    samples* reference *CIE XYZ* tristimulus values.
+
+    Parameters
+    ----------
+    XYZ_vs_r : array_like
+        *VS test colour samples* *CIE XYZ* tristimulus values under the
+        reference illuminants of shape (n, m, 3).
+    XYZ_r : array_like
+        *CIE XYZ* tristimulus values for reference of shape (n, 3).
+
+    Returns
+    -------
+    ndarray
+        Correlated colour temperature factors of shape (n, ).
+    """
+
+    xy_w = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
+    XYZ_w = xy_to_XYZ(xy_w)
+
+    XYZ_a = chromatic_adaptation_VonKries(
+        XYZ_vs_r, XYZ_r[..., np.newaxis, :], XYZ_w, transform='CMCCAT2000')
+
+    G_r = gamut_area(XYZ_to_Lab(XYZ_a, illuminant=xy_w)) / GAMUT_AREA_D65
+
+    return np.where(G_r > 1, 1, G_r)
+
+
 def scale_conversion(D_E_ab, CCT_f, scaling_f):
     """
     Returns the *Colour Quality Scale* (CQS) for given :math:`\\Delta E_{ab}`
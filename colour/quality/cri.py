@@ -7,6 +7,7 @@ Defines *Colour Rendering Index* (CRI) computation objects:
 
 -   :class:`colour.quality.ColourRendering_Specification_CRI`
 -   :func:`colour.colour_rendering_index`
+-   :func:`colour.quality.colour_rendering_index_msds`
 
 References
 ----------
@@ -23,10 +24,15 @@ from colour.algebra import euclidean_distance, spow
 from colour.colorimetry import (
     SPECTRAL_SHAPE_DEFAULT, sd_CIE_illuminant_D_series,
     MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody, sd_to_XYZ)
+from colour.quality.common import (
+    ReferenceIlluminantBank, align_spectral_array, sds_to_spectral_array,
+    spectral_array, spectral_array_interpolator,
+    spectral_array_reference_illuminant, spectral_array_to_XYZ_tcs)
 from colour.quality.datasets.tcs import INDEXES_TO_NAMES_TCS, SDS_TCS
 from colour.models import UCS_to_uv, XYZ_to_UCS, XYZ_to_xyY
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Robertson1968
-from colour.utilities import domain_range_scale
+from colour.utilities import (CACHE_REGISTRY, domain_range_scale, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -38,9 +44,13 @@ __status__ = 'Production'
 __all__ = [
     'TCS_ColorimetryData', 'TCS_ColourQualityScaleData',
     'ColourRendering_Specification_CRI', 'colour_rendering_index',
-    'tcs_colorimetry_data', 'colour_rendering_indexes'
+    'colour_rendering_index_msds', 'tcs_colorimetry_data',
+    'colour_rendering_indexes'
 ]
 
+_CACHE_REFERENCE_ILLUMINANT_BANK_CRI = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_REFERENCE_ILLUMINANT_BANK_CRI'.format(__name__), 1)
+
 
 class TCS_ColorimetryData(
         namedtuple('TCS_ColorimetryData', ('name', 'XYZ', 'uv', 'UVW'))):
@@ -150,6 +160,106 @@ def colour_rendering_index(sd_test, additional_data=False):
         return Q_a
 
 
+def colour_rendering_index_msds(msds,
+                                additional_data=False,
+                                shape=SPECTRAL_SHAPE_DEFAULT,
+                                exact=False):
+    """
+    Returns the *Colour Rendering Index* (CRI) :math:`Q_a` of given
+    multi-spectral distributions.
+
+    The *test colour samples* tristimulus values under all the test spectral
+    distributions are computed at once as tensor contractions. The reference
+    illuminants colorimetry is interpolated from a bank sampled on a
+    correlated colour temperature grid unless exact computations are
+    requested.
+
+    Parameters
+    ----------
+    msds : MultiSpectralDistributions or array_like
+        Test multi-spectral distributions, if an *array_like* of shape (n, w)
+        the wavelengths are expected to be in the last axis.
+    additional_data : bool, optional
+        Whether to output additional data.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral distributions *array_like*,
+        ignored if ``msds`` is a :class:`colour.MultiSpectralDistributions`
+        class instance.
+    exact : bool, optional
+        Whether to compute the reference illuminants colorimetry from their
+        spectral distributions rather than interpolating it from the
+        reference illuminants bank.
+
+    Returns
+    -------
+    ndarray or ColourRendering_Specification_CRI
+        *Colour Rendering Index* (CRI) of shape (n, ). The additional data
+        specification stores the individual *colour rendering indexes* as an
+        *ndarray* of shape (n, 14) and the colorimetry data as
+        :class:`colour.quality.cri.TCS_ColorimetryData` class instances storing
+        *ndarray* of shape (n, 14, ...).
+
+    Notes
+    -----
+    -   The reference illuminants bank interpolation error on the
+        *Colour Rendering Index* (CRI) :math:`Q_a` is typically lower than
+        0.01.
+    -   The test multi-spectral distributions are aligned with their own
+        interpolator, it should be the test spectral distributions one, e.g.
+        :class:`colour.LinearInterpolator` class for the illuminants
+        datasets, for the results to agree with
+        :func:`colour.colour_rendering_index` definition.
+
+    References
+    ----------
+    :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> from colour.algebra import LinearInterpolator
+    >>> from colour.colorimetry import SDS_ILLUMINANTS, sds_and_msds_to_msds
+    >>> msds = sds_and_msds_to_msds(
+    ...     [SDS_ILLUMINANTS['FL2'], SDS_ILLUMINANTS['FL9']])
+    >>> msds.interpolator = LinearInterpolator
+    >>> colour_rendering_index_msds(msds, exact=True)  # doctest: +ELLIPSIS
+    array([ 64.2337241...,  90.3198293...])
+    """
+
+    cmfs, R_tcs, names_tcs = _tcs_spectral_arrays()
+
+    values, wavelengths = spectral_array(msds, shape)
+    interpolator, interpolator_kwargs = spectral_array_interpolator(msds)
+
+    S_t = align_spectral_array(values, wavelengths, cmfs.shape, None,
+                               interpolator, interpolator_kwargs)
+
+    uv = UCS_to_uv(XYZ_to_UCS(np.dot(S_t, cmfs.values)))
+    CCT, _D_uv = tsplit(uv_to_CCT_Robertson1968(uv))
+
+    if exact:
+        uv_r, XYZ_r, uv_tcs_r, UVW_r = _reference_tcs_colorimetry(CCT)
+    else:
+        uv_r, XYZ_r, uv_tcs_r, UVW_r = _reference_illuminant_bank()(CCT)
+
+    test_tcs_colorimetry_data = _tcs_colorimetry_data_spectral_array(
+        S_t, uv_r, R_tcs, names_tcs, cmfs.values, chromatic_adaptation=True)
+    reference_tcs_colorimetry_data = TCS_ColorimetryData(
+        names_tcs, XYZ_r, uv_tcs_r, UVW_r)
+
+    Q_as = 100 - 4.6 * np.linalg.norm(
+        reference_tcs_colorimetry_data.UVW - test_tcs_colorimetry_data.UVW,
+        axis=-1)
+
+    Q_a = np.average(Q_as[..., :8], axis=-1)
+
+    if additional_data:
+        return ColourRendering_Specification_CRI(
+            getattr(msds, 'labels', None), Q_a, Q_as,
+            (test_tcs_colorimetry_data, reference_tcs_colorimetry_data))
+    else:
+        return Q_a
+
+
 def tcs_colorimetry_data(sd_t, sd_r, sds_tcs, cmfs,
                          chromatic_adaptation=False):
     """
@@ -226,6 +336,164 @@ def tcs_colorimetry_data(sd_t, sd_r, sds_tcs, cmfs,
     return tcs_data
 
 
+def _tcs_spectral_arrays():
+    """
+    Returns the standard observer colour matching functions, the
+    *test colour samples* spectral array and their names used by the
+    *Colour Rendering Index* (CRI) batch computations.
+
+    Returns
+    -------
+    tuple
+        Standard observer colour matching functions, *test colour samples*
+        spectral array of shape (14, w) and names.
+    """
+
+    cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+        'CIE 1931 2 Degree Standard Observer'].copy().trim(
+            SPECTRAL_SHAPE_DEFAULT)
+
+    sds_tcs = [
+        SDS_TCS[name] for _index, name in sorted(INDEXES_TO_NAMES_TCS.items())
+    ]
+
+    return (cmfs, sds_to_spectral_array(sds_tcs, cmfs.shape),
+            [sd.name for sd in sds_tcs])
+
+
+def _reference_tcs_colorimetry(CCT):
+    """
+    Returns the reference illuminants colorimetry for given correlated colour
+    temperatures :math:`T_{cp}`.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}` of shape (n, ).
+
+    Returns
+    -------
+    tuple
+        Reference illuminants *CIE UCS* colourspace *uv* chromaticity
+        coordinates of shape (n, 2) and *test colour samples* *CIE XYZ*
+        tristimulus values, *CIE UCS* colourspace *uv* chromaticity coordinates
+        and *CIE 1964 U\\*V\\*W\\** colourspace values of shape (n, 14, ...).
+    """
+
+    cmfs, R_tcs, names_tcs = _tcs_spectral_arrays()
+
+    S_r = spectral_array_reference_illuminant(CCT, cmfs.shape)
+    uv_r = UCS_to_uv(XYZ_to_UCS(np.dot(S_r, cmfs.values)))
+
+    data = _tcs_colorimetry_data_spectral_array(S_r, uv_r, R_tcs, names_tcs,
+                                                cmfs.values)
+
+    return uv_r, data.XYZ, data.uv, data.UVW
+
+
+def _reference_illuminant_bank():
+    """
+    Returns the reference illuminants bank of the *Colour Rendering Index*
+    (CRI) batch computations.
+
+    Returns
+    -------
+    ReferenceIlluminantBank
+        Reference illuminants bank.
+
+    Notes
+    -----
+    -   The reference illuminant transitions from the planckian radiator to
+        the *CIE Illuminant D Series* at 5000K.
+    -   The bank is cached and won't be built again on subsequent calls to
+        this definition.
+    """
+
+    bank = _CACHE_REFERENCE_ILLUMINANT_BANK_CRI.get('bank')
+    if bank is None:
+        bank = ReferenceIlluminantBank(_reference_tcs_colorimetry,
+                                       (1000, 5000, 25000))
+        _CACHE_REFERENCE_ILLUMINANT_BANK_CRI['bank'] = bank
+
+    return bank
+
+
+def _tcs_colorimetry_data_spectral_array(S_t,
+                                         uv_r,
+                                         R_tcs,
+                                         names_tcs,
+                                         cmfs,
+                                         chromatic_adaptation=False):
+    """
+    Returns the *test colour samples* colorimetry data for given test spectral
+    array and reference illuminants chromaticity coordinates.
+
+    Parameters
+    ----------
+    S_t : array_like
+        Test spectral array of shape (n, w).
+    uv_r : array_like
+        Reference illuminants *CIE UCS* colourspace *uv* chromaticity
+        coordinates of shape (n, 2).
+    R_tcs : array_like
+        *Test colour samples* spectral array of shape (m, w).
+    names_tcs : array_like
+        *Test colour samples* names.
+    cmfs : array_like
+        Standard observer colour matching functions values of shape (w, 3).
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    TCS_ColorimetryData
+        *Test colour samples* colorimetry data storing *ndarray* of shape
+        (n, m, ...).
+    """
+
+    u_t, v_t = tsplit(UCS_to_uv(XYZ_to_UCS(np.dot(S_t, cmfs))))
+    u_r, v_r = tsplit(uv_r)
+    u_t, v_t, u_r, v_r = [
+        x[..., np.newaxis] for x in (u_t, v_t, u_r, v_r)
+    ]
+
+    XYZ_tcs = spectral_array_to_XYZ_tcs(S_t, R_tcs, cmfs)
+    uv_tcs = UCS_to_uv(XYZ_to_UCS(XYZ_tcs))
+    u_tcs, v_tcs = tsplit(uv_tcs)
+
+    if chromatic_adaptation:
+
+        def c(x, y):
+            """
+            Computes the :math:`c` term.
+            """
+
+            return (4 - x - 10 * y) / y
+
+        def d(x, y):
+            """
+            Computes the :math:`d` term.
+            """
+
+            return (1.708 * y + 0.404 - 1.481 * x) / y
+
+        c_t, d_t = c(u_t, v_t), d(u_t, v_t)
+        c_r, d_r = c(u_r, v_r), d(u_r, v_r)
+        tcs_c, tcs_d = c(u_tcs, v_tcs), d(u_tcs, v_tcs)
+        u_tcs = (
+            (10.872 + 0.404 * c_r / c_t * tcs_c - 4 * d_r / d_t * tcs_d) /
+            (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+        v_tcs = (5.52 /
+                 (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+
+    W_tcs = 25 * spow(XYZ_tcs[..., 1], 1 / 3) - 17
+    U_tcs = 13 * W_tcs * (u_tcs - u_r)
+    V_tcs = 13 * W_tcs * (v_tcs - v_r)
+
+    return TCS_ColorimetryData(names_tcs, XYZ_tcs, uv_tcs,
+                               tstack([U_tcs, V_tcs, W_tcs]))
+
+
 def colour_rendering_indexes(test_data, reference_data):
     """
     Returns the *test colour samples* rendering indexes :math:`Q_a`.
@@ -6,6 +6,7 @@ Academy Spectral Similarity Index (SSI)
 Defines the *Academy Spectral Similarity Index* (SSI) computation objects:
 
 -   :func:`colour.spectral_similarity_index`
+-   :func:`colour.quality.spectral_similarity_index_matrix`
 
 References
 ----------
@@ -14,12 +15,13 @@ References
     (SSI): Overview (pp. 1-7).
 """
 
+import hashlib
 import numpy as np
-from scipy.ndimage.filters import convolve1d
 
 from colour.algebra import LinearInterpolator
-from colour.colorimetry import SpectralShape
-from colour.utilities import zeros
+from colour.colorimetry import SPECTRAL_SHAPE_DEFAULT, SpectralShape
+from colour.quality.common import spectral_array
+from colour.utilities import CACHE_REGISTRY, as_float_array, batch, zeros
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -28,7 +30,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['SPECTRAL_SHAPE_SSI', 'spectral_similarity_index']
+__all__ = [
+    'SPECTRAL_SHAPE_SSI', 'spectral_similarity_index',
+    'spectral_similarity_index_matrix'
+]
 
 SPECTRAL_SHAPE_SSI = SpectralShape(375, 675, 1)
 """
@@ -41,6 +46,11 @@ _SPECTRAL_SHAPE_SSI_LARGE = SpectralShape(380, 670, 10)
 
 _MATRIX_INTEGRATION = None
 
+_MATRIX_WEIGHTING = None
+
+_CACHE_MATRICES_ALIGNMENT_SSI = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_MATRICES_ALIGNMENT_SSI'.format(__name__), 32)
+
 
 def spectral_similarity_index(sd_test, sd_reference):
     """
@@ -72,6 +82,99 @@ def spectral_similarity_index(sd_test, sd_reference):
     94.0
     """
 
+    settings = {
+        'interpolator': LinearInterpolator,
+        'extrapolator_kwargs': {
+            'left': 0,
+            'right': 0
+        }
+    }
+
+    sd_test = sd_test.copy().align(SPECTRAL_SHAPE_SSI, **settings)
+    sd_reference = sd_reference.copy().align(SPECTRAL_SHAPE_SSI, **settings)
+
+    return _spectral_similarity_index(
+        _integrate(sd_test.values), _integrate(sd_reference.values))
+
+
+def spectral_similarity_index_matrix(msds_test,
+                                     msds_reference,
+                                     shape=SPECTRAL_SHAPE_DEFAULT,
+                                     chunk_size=2 ** 16):
+    """
+    Returns the *Academy Spectral Similarity Index* (SSI) of each given test
+    multi-spectral distribution with each given reference multi-spectral
+    distribution.
+
+    The multi-spectral distributions are aligned to
+    :attr:`colour.quality.SPECTRAL_SHAPE_SSI` attribute with a single matrix
+    product each, the integration and weighting are applied as matrix
+    products and the pairs of test and reference spectral distributions are
+    processed in blocks.
+
+    Parameters
+    ----------
+    msds_test : MultiSpectralDistributions or array_like
+        Test multi-spectral distributions, if an *array_like* of shape (n, w)
+        the wavelengths are expected to be in the last axis.
+    msds_reference : MultiSpectralDistributions or array_like
+        Reference multi-spectral distributions, if an *array_like* of shape
+        (m, w) the wavelengths are expected to be in the last axis.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral distributions *array_like*,
+        ignored for :class:`colour.MultiSpectralDistributions` class
+        instances.
+    chunk_size : integer, optional
+        Maximum number of test and reference pairs processed at once,
+        bounding the size of the intermediate arrays.
+
+    Returns
+    -------
+    ndarray
+        *Academy Spectral Similarity Index* (SSI) array of shape (n, m).
+
+    References
+    ----------
+    :cite:`TheAcademyofMotionPictureArtsandSciences2019`
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SDS_ILLUMINANTS, sds_and_msds_to_msds
+    >>> msds_test = sds_and_msds_to_msds(
+    ...     [SDS_ILLUMINANTS['C'], SDS_ILLUMINANTS['D50']])
+    >>> msds_reference = sds_and_msds_to_msds(
+    ...     [SDS_ILLUMINANTS['D65'], SDS_ILLUMINANTS['D55']])
+    >>> spectral_similarity_index_matrix(msds_test, msds_reference)
+    array([[ 94.,  88.],
+           [ 85.,  94.]])
+    """
+
+    test_i = _integrate(
+        _align_spectral_array_SSI(*spectral_array(msds_test, shape)))
+    reference_i = _integrate(
+        _align_spectral_array_SSI(*spectral_array(msds_reference, shape)))
+
+    SSI = np.empty((test_i.shape[0], reference_i.shape[0]))
+    rows_count = max(1, int(chunk_size // max(1, reference_i.shape[0])))
+    for rows in batch(range(test_i.shape[0]), rows_count):
+        s = slice(rows.start, rows.stop)
+        SSI[s] = _spectral_similarity_index(test_i[s, np.newaxis],
+                                            reference_i[np.newaxis])
+
+    return SSI
+
+
+def _matrix_integration():
+    """
+    Returns the matrix integrating the spectral distributions aligned to
+    :attr:`colour.quality.SPECTRAL_SHAPE_SSI` attribute over 10nm wide bins.
+
+    Returns
+    -------
+    ndarray
+        Integration matrix.
+    """
+
     global _MATRIX_INTEGRATION
 
     if _MATRIX_INTEGRATION is None:
@@ -82,34 +185,136 @@ def spectral_similarity_index(sd_test, sd_reference):
 
         weights = np.array([0.5, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0.5])
 
-        for i in range(_MATRIX_INTEGRATION.shape[0]):
-            _MATRIX_INTEGRATION[i, (10 * i):(10 * i + 11)] = weights
+        rows = np.arange(_MATRIX_INTEGRATION.shape[0])[..., np.newaxis]
+        _MATRIX_INTEGRATION[rows, 10 * rows + np.arange(11)] = weights
 
-    settings = {
-        'interpolator': LinearInterpolator,
-        'extrapolator_kwargs': {
-            'left': 0,
-            'right': 0
-        }
-    }
+    return _MATRIX_INTEGRATION
 
-    sd_test = sd_test.copy().align(SPECTRAL_SHAPE_SSI, **settings)
-    sd_reference = sd_reference.copy().align(SPECTRAL_SHAPE_SSI, **settings)
 
-    test_i = np.dot(_MATRIX_INTEGRATION, sd_test.values)
-    reference_i = np.dot(_MATRIX_INTEGRATION, sd_reference.values)
+def _matrix_weighting():
+    """
+    Returns the matrix weighting the relative differences of the integrated
+    spectral distributions and smoothing them with a [0.22, 0.56, 0.22]
+    kernel, the spectral distributions being padded with a zero on both
+    ends.
+
+    Returns
+    -------
+    ndarray
+        Weighting matrix.
+    """
+
+    global _MATRIX_WEIGHTING
+
+    if _MATRIX_WEIGHTING is None:
+        count = len(_SPECTRAL_SHAPE_SSI_LARGE.range())
+
+        weights = np.array([
+            12 / 45, 22 / 45, 32 / 45, 40 / 45, 44 / 45, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 11 / 15, 3 / 15
+        ])
+
+        kernel = (0.22 * np.eye(count + 2, count) +
+                  0.56 * np.eye(count + 2, count, -1) +
+                  0.22 * np.eye(count + 2, count, -2))
+
+        _MATRIX_WEIGHTING = kernel * weights
+
+    return _MATRIX_WEIGHTING
+
+
+def _align_spectral_array_SSI(values, wavelengths):
+    """
+    Aligns given spectral array sampled at given wavelengths to
+    :attr:`colour.quality.SPECTRAL_SHAPE_SSI` attribute using linear
+    interpolation and zero extrapolation.
+
+    Parameters
+    ----------
+    values : array_like
+        Spectral array to align.
+    wavelengths : array_like
+        Wavelengths of the spectral array.
+
+    Returns
+    -------
+    ndarray
+        Aligned spectral array.
+
+    Notes
+    -----
+    -   The alignment matrices are cached and won't be computed again on
+        subsequent calls to this definition.
+    """
+
+    wavelengths = as_float_array(wavelengths)
+
+    key = hashlib.sha1(wavelengths.tobytes()).hexdigest()
+    M = _CACHE_MATRICES_ALIGNMENT_SSI.get(key)
+    if M is None:
+        x = SPECTRAL_SHAPE_SSI.range()
+
+        i = np.clip(
+            np.searchsorted(wavelengths, x) - 1, 0, len(wavelengths) - 2)
+        t = (x - wavelengths[i]) / (wavelengths[i + 1] - wavelengths[i])
+        within = np.logical_and(x >= wavelengths[0], x <= wavelengths[-1])
 
-    test_i /= np.sum(test_i)
-    reference_i /= np.sum(reference_i)
+        rows = np.arange(len(x))
+        M = zeros([len(x), len(wavelengths)])
+        M[rows, i] = np.where(within, 1 - t, 0)
+        M[rows, i + 1] += np.where(within, t, 0)
+
+        _CACHE_MATRICES_ALIGNMENT_SSI[key] = M
+
+    return np.dot(values, np.transpose(M))
+
+
+def _integrate(values):
+    """
+    Integrates given spectral array aligned to
+    :attr:`colour.quality.SPECTRAL_SHAPE_SSI` attribute over 10nm wide bins
+    and normalises it.
+
+    Parameters
+    ----------
+    values : array_like
+        Spectral array to integrate.
+
+    Returns
+    -------
+    ndarray
+        Integrated and normalised spectral array.
+    """
+
+    values_i = np.dot(values, np.transpose(_matrix_integration()))
+
+    return values_i / np.sum(values_i, axis=-1)[..., np.newaxis]
+
+
+def _spectral_similarity_index(test_i, reference_i):
+    """
+    Returns the *Academy Spectral Similarity Index* (SSI) of given integrated
+    test and reference spectral arrays.
+
+    Parameters
+    ----------
+    test_i : array_like
+        Integrated and normalised test spectral array.
+    reference_i : array_like
+        Integrated and normalised reference spectral array, broadcasting
+        against the test spectral array.
+
+    Returns
+    -------
+    numeric or ndarray
+        *Academy Spectral Similarity Index* (SSI).
+    """
 
     d_i = test_i - reference_i
-    dr_i = d_i / (reference_i + np.mean(reference_i))
-    wdr_i = dr_i * [
-        12 / 45, 22 / 45, 32 / 45, 40 / 45, 44 / 45, 1, 1, 1, 1, 1, 1, 1, 1, 1,
-        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 11 / 15, 3 / 15
-    ]
-    c_wdr_i = convolve1d(np.hstack([0, wdr_i, 0]), [0.22, 0.56, 0.22])
-    m_v = np.sum(c_wdr_i ** 2)
+    dr_i = d_i / (
+        reference_i + np.mean(reference_i, axis=-1)[..., np.newaxis])
+    c_wdr_i = np.dot(dr_i, np.transpose(_matrix_weighting()))
+    m_v = np.sum(c_wdr_i ** 2, axis=-1)
 
     SSI = np.around(100 - 32 * np.sqrt(m_v))
 
@@ -13,9 +13,10 @@ import unittest
 
 from colour.colorimetry import (SpectralShape, SpectralDistribution,
                                 sd_blackbody, SDS_ILLUMINANTS)
-from colour.quality.cfi2017 import (CCT_reference_illuminant,
-                                    sd_reference_illuminant,
-                                    colour_fidelity_index_CIE2017)
+from colour.quality.cfi2017 import (
+    load_TCS_CIE2017, CCT_reference_illuminant, sd_reference_illuminant,
+    spectral_array_reference_illuminant_CIE2017, colour_fidelity_index_CIE2017,
+    colour_fidelity_index_CIE2017_msds)
 from colour.utilities import ColourUsageWarning
 
 __author__ = 'Colour Developers'
@@ -28,7 +29,9 @@ __status__ = 'Production'
 __all__ = [
     'DATA_SD_SAMPLE_5NM', 'SD_SAMPLE_5NM', 'DATA_SD_SAMPLE_1NM',
     'SD_SAMPLE_1NM', 'TestColourFidelityIndexCIE2017',
-    'TestCctReferenceIlluminant', 'TestSdReferenceIlluminant'
+    'TestColourFidelityIndexCIE2017Msds', 'TestLoadTCSCIE2017',
+    'TestCctReferenceIlluminant',
+    'TestSdReferenceIlluminant', 'TestSpectralArrayReferenceIlluminantCIE2017'
 ]
 
 DATA_SD_SAMPLE_5NM = {
@@ -596,6 +599,99 @@ class TestColourFidelityIndexCIE2017(unittest.TestCase):
         self.assertRaises(ValueError, colour_fidelity_index_CIE2017, sd)
 
 
+class TestColourFidelityIndexCIE2017Msds(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.CIE2017.colour_fidelity_index_CIE2017_msds`
+    definition unit tests methods.
+    """
+
+    def test_colour_fidelity_index_CIE2017_msds(self):
+        """
+        Tests :func:`colour.quality.CIE2017.colour_fidelity_index_CIE2017_msds`
+        definition.
+        """
+
+        shape = SpectralShape(380, 780, 5)
+        sds = [
+            SpectralDistribution(
+                SDS_ILLUMINANTS[illuminant].copy().align(shape).values,
+                shape.range()) for illuminant in ('FL1', 'FL2', 'D65')
+        ]
+        sds.append(SD_SAMPLE_5NM)
+
+        values = np.array([sd.values for sd in sds])
+
+        specification = colour_fidelity_index_CIE2017_msds(
+            values, additional_data=True, shape=shape, exact=True)
+        for i, sd in enumerate(sds):
+            specification_r = colour_fidelity_index_CIE2017(sd, True)
+
+            for attribute in ('R_f', 'R_s', 'CCT', 'D_uv'):
+                np.testing.assert_almost_equal(
+                    getattr(specification, attribute)[i],
+                    getattr(specification_r, attribute),
+                    decimal=7)
+
+            np.testing.assert_almost_equal(
+                specification.sd_reference[i],
+                specification_r.sd_reference.values,
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            colour_fidelity_index_CIE2017_msds(
+                np.atleast_2d(SD_SAMPLE_1NM.values),
+                shape=SD_SAMPLE_1NM.shape,
+                exact=True),
+            [colour_fidelity_index_CIE2017(SD_SAMPLE_1NM)],
+            decimal=7)
+
+        np.testing.assert_allclose(
+            colour_fidelity_index_CIE2017_msds(values, shape=shape),
+            specification.R_f,
+            atol=0.01)
+
+    def test_raise_exception_colour_fidelity_index_CIE2017_msds(self):
+        """
+        Tests :func:`colour.quality.CIE2017.colour_fidelity_index_CIE2017_msds`
+        definition raised exception.
+        """
+
+        values = np.atleast_2d(SDS_ILLUMINANTS['FL2'].copy().align(
+            SpectralShape(400, 700, 5)).values)
+        self.assertWarns(ColourUsageWarning,
+                         colour_fidelity_index_CIE2017_msds, values,
+                         shape=SpectralShape(400, 700, 5))
+
+        values = np.atleast_2d(SDS_ILLUMINANTS['FL2'].copy().align(
+            SpectralShape(380, 780, 10)).values)
+        self.assertRaises(
+            ValueError,
+            colour_fidelity_index_CIE2017_msds,
+            values,
+            shape=SpectralShape(380, 780, 10))
+
+
+class TestLoadTCSCIE2017(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.CIE2017.load_TCS_CIE2017` definition unit
+    tests methods.
+    """
+
+    def test_load_TCS_CIE2017(self):
+        """
+        Tests :func:`colour.quality.CIE2017.load_TCS_CIE2017` definition.
+        """
+
+        shape = SpectralShape(interval=5)
+        sds_tcs = load_TCS_CIE2017(shape)
+        self.assertEqual(len(sds_tcs.labels), 99)
+        self.assertEqual(sds_tcs.shape.interval, 5)
+
+        sds_tcs.align(SpectralShape(400, 700, 10))
+        self.assertEqual(load_TCS_CIE2017(shape).shape.interval, 5)
+        self.assertIsNot(load_TCS_CIE2017(shape), load_TCS_CIE2017(shape))
+
+
 class TestCctReferenceIlluminant(unittest.TestCase):
     """
     Defines :func:`colour.quality.CIE2017.CCT_reference_illuminant`
@@ -639,5 +735,25 @@ class TestSdReferenceIlluminant(unittest.TestCase):
                 rtol=0.005)
 
 
+class TestSpectralArrayReferenceIlluminantCIE2017(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.CIE2017.\
+spectral_array_reference_illuminant_CIE2017` definition unit tests methods.
+    """
+
+    def test_spectral_array_reference_illuminant_CIE2017(self):
+        """
+        Tests :func:`colour.quality.CIE2017.\
+spectral_array_reference_illuminant_CIE2017` definition.
+        """
+
+        for shape in (SpectralShape(380, 780, 5), SpectralShape(380, 780, 1)):
+            CCT = np.array([3000, 4000, 4500, 5000, 6500])
+            np.testing.assert_almost_equal(
+                spectral_array_reference_illuminant_CIE2017(CCT, shape),
+                [sd_reference_illuminant(T, shape).values for T in CCT],
+                decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
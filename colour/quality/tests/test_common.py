@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.quality.common` module.
+"""
+
+import numpy as np
+import unittest
+
+from colour.algebra import LinearInterpolator
+from colour.colorimetry import (
+    MSDS_CMFS, SDS_ILLUMINANTS, SpectralDistribution, SpectralShape,
+    planck_law, sd_blackbody, sd_CIE_illuminant_D_series, sd_to_XYZ,
+    sds_and_msds_to_msds)
+from colour.quality.common import (
+    spectral_array, spectral_array_interpolator, matrix_spectral_alignment,
+    align_spectral_array, sds_to_spectral_array, spectral_array_blackbody,
+    spectral_array_CIE_illuminant_D_series,
+    spectral_array_reference_illuminant, spectral_array_to_XYZ_tcs,
+    ReferenceIlluminantBank)
+from colour.quality.datasets import SDS_TCS
+from colour.temperature import CCT_to_xy_CIE_D
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'TestSpectralArray', 'TestSpectralArrayInterpolator',
+    'TestMatrixSpectralAlignment',
+    'TestAlignSpectralArray', 'TestSdsToSpectralArray',
+    'TestSpectralArrayBlackbody', 'TestSpectralArrayCIEIlluminantDSeries',
+    'TestSpectralArrayReferenceIlluminant', 'TestSpectralArrayToXYZTcs',
+    'TestReferenceIlluminantBank'
+]
+
+
+class TestSpectralArray(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.spectral_array` definition unit tests
+    methods.
+    """
+
+    def test_spectral_array(self):
+        """
+        Tests :func:`colour.quality.common.spectral_array` definition.
+        """
+
+        msds = sds_and_msds_to_msds(
+            [SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2']])
+        values, wavelengths = spectral_array(msds, SpectralShape(0, 1, 1))
+        np.testing.assert_equal(values, np.transpose(msds.values))
+        np.testing.assert_equal(wavelengths, msds.wavelengths)
+
+        shape = SpectralShape(400, 700, 10)
+        values, wavelengths = spectral_array(np.ones([2, 3, 31]), shape)
+        self.assertEqual(values.shape, (6, 31))
+        np.testing.assert_equal(wavelengths, shape.range())
+
+    def test_raise_exception_spectral_array(self):
+        """
+        Tests :func:`colour.quality.common.spectral_array` definition raised
+        exception.
+        """
+
+        self.assertRaises(AssertionError, spectral_array, np.ones([2, 30]),
+                          SpectralShape(400, 700, 10))
+
+
+class TestSpectralArrayInterpolator(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.spectral_array_interpolator`
+    definition unit tests methods.
+    """
+
+    def test_spectral_array_interpolator(self):
+        """
+        Tests :func:`colour.quality.common.spectral_array_interpolator`
+        definition.
+        """
+
+        msds = sds_and_msds_to_msds([SDS_ILLUMINANTS['FL1']])
+        msds.interpolator = LinearInterpolator
+        msds.interpolator_kwargs = {'dtype': np.float64}
+        self.assertTupleEqual(
+            spectral_array_interpolator(msds),
+            (LinearInterpolator, {
+                'dtype': np.float64
+            }))
+
+        self.assertTupleEqual(
+            spectral_array_interpolator(np.ones([2, 31])), (None, None))
+
+
+class TestMatrixSpectralAlignment(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.matrix_spectral_alignment`
+    definition unit tests methods.
+    """
+
+    def test_matrix_spectral_alignment(self):
+        """
+        Tests :func:`colour.quality.common.matrix_spectral_alignment`
+        definition.
+        """
+
+        sd = SDS_TCS['TCS01']
+        shape = SpectralShape(360, 830, 1)
+
+        M = matrix_spectral_alignment(sd.wavelengths, shape)
+        self.assertEqual(M.shape, (471, len(sd.wavelengths)))
+        np.testing.assert_almost_equal(
+            np.dot(M, sd.values),
+            SpectralDistribution(sd.values, sd.wavelengths).align(
+                shape).values,
+            decimal=7)
+
+        self.assertIs(M, matrix_spectral_alignment(sd.wavelengths, shape))
+
+        extrapolator_kwargs = {
+            'method': 'Constant',
+            'left': 0,
+            'right': 0,
+        }
+        M = matrix_spectral_alignment(sd.wavelengths, shape,
+                                      extrapolator_kwargs)
+        np.testing.assert_almost_equal(
+            np.dot(M, sd.values),
+            SpectralDistribution(
+                sd.values,
+                sd.wavelengths,
+                extrapolator_kwargs=extrapolator_kwargs).align(shape).values,
+            decimal=7)
+
+        M_l = matrix_spectral_alignment(sd.wavelengths, shape, None,
+                                        LinearInterpolator)
+        self.assertIsNot(M_l, matrix_spectral_alignment(sd.wavelengths, shape))
+        np.testing.assert_almost_equal(
+            np.dot(M_l, sd.values),
+            SpectralDistribution(
+                sd.values, sd.wavelengths,
+                interpolator=LinearInterpolator).align(shape).values,
+            decimal=7)
+
+
+class TestAlignSpectralArray(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.align_spectral_array` definition unit
+    tests methods.
+    """
+
+    def test_align_spectral_array(self):
+        """
+        Tests :func:`colour.quality.common.align_spectral_array` definition.
+        """
+
+        sds = [SDS_TCS['TCS01'], SDS_TCS['TCS02']]
+        values = np.array([sd.values for sd in sds])
+        wavelengths = sds[0].wavelengths
+        shape = SpectralShape(380, 780, 5)
+
+        np.testing.assert_almost_equal(
+            align_spectral_array(values, wavelengths, shape),
+            [
+                SpectralDistribution(sd.values, wavelengths).align(
+                    shape).values for sd in sds
+            ],
+            decimal=7)
+
+        self.assertIs(
+            align_spectral_array(values, wavelengths,
+                                 SpectralShape(360, 830, 5)), values)
+
+
+class TestSdsToSpectralArray(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.sds_to_spectral_array` definition
+    unit tests methods.
+    """
+
+    def test_sds_to_spectral_array(self):
+        """
+        Tests :func:`colour.quality.common.sds_to_spectral_array` definition.
+        """
+
+        shape = SpectralShape(380, 780, 1)
+        sds = list(SDS_TCS.values())
+
+        values = sds_to_spectral_array(sds, shape)
+        np.testing.assert_almost_equal(
+            values, [sd.copy().align(shape).values for sd in sds], decimal=7)
+
+        self.assertIs(values, sds_to_spectral_array(sds, shape))
+
+
+class TestSpectralArrayBlackbody(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.spectral_array_blackbody` definition
+    unit tests methods.
+    """
+
+    def test_spectral_array_blackbody(self):
+        """
+        Tests :func:`colour.quality.common.spectral_array_blackbody`
+        definition.
+        """
+
+        shape = SpectralShape(360, 830, 5)
+        CCT = np.array([1000, 4000, 6500])
+
+        np.testing.assert_almost_equal(
+            spectral_array_blackbody(CCT, shape),
+            [sd_blackbody(T, shape).values for T in CCT],
+            decimal=7)
+
+
+class TestSpectralArrayCIEIlluminantDSeries(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.\
+spectral_array_CIE_illuminant_D_series` definition unit tests methods.
+    """
+
+    def test_spectral_array_CIE_illuminant_D_series(self):
+        """
+        Tests :func:`colour.quality.common.\
+spectral_array_CIE_illuminant_D_series` definition.
+        """
+
+        for shape in (SpectralShape(360, 830, 1), SpectralShape(380, 780, 5)):
+            xy = CCT_to_xy_CIE_D(np.array([5000, 6504, 10000]))
+
+            np.testing.assert_almost_equal(
+                spectral_array_CIE_illuminant_D_series(xy, shape),
+                [
+                    sd_CIE_illuminant_D_series(xy_i).align(shape).values
+                    for xy_i in xy
+                ],
+                decimal=7)
+
+
+class TestSpectralArrayReferenceIlluminant(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.spectral_array_reference_illuminant`
+    definition unit tests methods.
+    """
+
+    def test_spectral_array_reference_illuminant(self):
+        """
+        Tests :func:`colour.quality.common.\
+spectral_array_reference_illuminant` definition.
+        """
+
+        shape = SpectralShape(360, 830, 5)
+        CCT = np.array([[4000, 4999], [5000, 6504]])
+
+        S = spectral_array_reference_illuminant(CCT, shape)
+        self.assertEqual(S.shape, (2, 2, 95))
+        np.testing.assert_almost_equal(
+            S[0], [sd_blackbody(T, shape).values for T in CCT[0]], decimal=7)
+        np.testing.assert_almost_equal(
+            S[1],
+            spectral_array_CIE_illuminant_D_series(
+                CCT_to_xy_CIE_D(CCT[1]), shape),
+            decimal=7)
+
+
+class TestSpectralArrayToXYZTcs(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.spectral_array_to_XYZ_tcs`
+    definition unit tests methods.
+    """
+
+    def test_spectral_array_to_XYZ_tcs(self):
+        """
+        Tests :func:`colour.quality.common.spectral_array_to_XYZ_tcs`
+        definition.
+        """
+
+        shape = SpectralShape(360, 780, 5)
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer'].copy().align(
+            shape)
+        sds_t = [
+            SDS_ILLUMINANTS[illuminant].copy().align(shape)
+            for illuminant in ('A', 'FL2')
+        ]
+        sds_r = [
+            SDS_TCS[name].copy().align(shape) for name in ('TCS01', 'TCS08')
+        ]
+
+        XYZ = spectral_array_to_XYZ_tcs(
+            np.array([sd.values for sd in sds_t]),
+            np.array([sd.values for sd in sds_r]), cmfs.values)
+        self.assertEqual(XYZ.shape, (2, 2, 3))
+
+        for i, sd_t in enumerate(sds_t):
+            for j, sd_r in enumerate(sds_r):
+                np.testing.assert_almost_equal(
+                    XYZ[i, j],
+                    sd_to_XYZ(sd_r, cmfs, sd_t, method='Integration'),
+                    decimal=7)
+
+
+class TestReferenceIlluminantBank(unittest.TestCase):
+    """
+    Defines :class:`colour.quality.common.ReferenceIlluminantBank` class unit
+    tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('colorimetry', 'segments', 'interval',
+                               'domain')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ReferenceIlluminantBank))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ReferenceIlluminantBank))
+
+    def test__call__(self):
+        """
+        Tests :meth:`colour.quality.common.ReferenceIlluminantBank.__call__`
+        method.
+        """
+
+        def colorimetry(CCT):
+            """
+            Returns a step function of the correlated colour temperature and
+            the planckian radiator spectral radiance at 550nm.
+            """
+
+            return (np.where(CCT < 5000, 0.0, 1.0)[..., np.newaxis],
+                    planck_law(550 * 1e-9, CCT) * 1e-9)
+
+        bank = ReferenceIlluminantBank(colorimetry, (1000, 5000, 25000), 0.5)
+        self.assertTupleEqual(bank.domain, (1000, 25000))
+
+        CCT = np.array([1000, 2500, 4999.99, 5000, 6504, 25000])
+        values = bank(CCT)
+        self.assertEqual(values[0].shape, (6, 1))
+
+        # The discontinuity at 5000K is not interpolated over.
+        np.testing.assert_equal(values[0][..., 0], [0, 0, 0, 1, 1, 1])
+        np.testing.assert_allclose(values[1], colorimetry(CCT)[1], rtol=1e-4)
+
+        # Outside the bank domain, the colorimetry is exact.
+        CCT = np.array([500, 50000])
+        np.testing.assert_equal(bank(CCT)[1], colorimetry(CCT)[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
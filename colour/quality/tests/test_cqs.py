@@ -6,9 +6,12 @@ Defines unit tests for :mod:`colour.quality.cqs` module.
 import numpy as np
 import unittest
 
+from colour.algebra import LinearInterpolator
 from colour.quality import (ColourRendering_Specification_CQS,
-                            colour_quality_scale)
-from colour.colorimetry import SDS_ILLUMINANTS, SDS_LIGHT_SOURCES
+                            colour_quality_scale, colour_quality_scale_msds)
+from colour.colorimetry import (SDS_ILLUMINANTS, SDS_LIGHT_SOURCES,
+                                SpectralDistribution, SpectralShape,
+                                sds_and_msds_to_msds)
 from colour.quality.cqs import VS_ColorimetryData, VS_ColourQualityScaleData
 
 __author__ = 'Colour Developers'
@@ -18,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestColourQualityScale']
+__all__ = ['TestColourQualityScale', 'TestColourQualityScaleMsds']
 
 
 class TestColourQualityScale(unittest.TestCase):
@@ -673,5 +676,79 @@ class TestColourQualityScale(unittest.TestCase):
         )
 
 
+class TestColourQualityScaleMsds(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cqs.colour_quality_scale_msds` definition
+    unit tests methods.
+    """
+
+    def test_colour_quality_scale_msds(self):
+        """
+        Tests :func:`colour.quality.cqs.colour_quality_scale_msds` definition.
+        """
+
+        sds = [
+            SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2'],
+            SDS_ILLUMINANTS['FL9'], SDS_LIGHT_SOURCES['Neodimium Incandescent']
+        ]
+        msds = sds_and_msds_to_msds(sds)
+        msds.interpolator = LinearInterpolator
+
+        for method in ('NIST CQS 9.0', 'NIST CQS 7.4'):
+            np.testing.assert_almost_equal(
+                colour_quality_scale_msds(msds, method=method, exact=True),
+                [colour_quality_scale(sd, method=method) for sd in sds],
+                decimal=7)
+
+        shape = SpectralShape(380, 780, 5)
+        sds = [
+            SpectralDistribution(sd.copy().align(shape).values, shape.range())
+            for sd in (SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2'],
+                       SDS_LIGHT_SOURCES['Neodimium Incandescent'])
+        ]
+
+        for method in ('NIST CQS 9.0', 'NIST CQS 7.4'):
+            np.testing.assert_almost_equal(
+                colour_quality_scale_msds(
+                    sds_and_msds_to_msds(sds), method=method, exact=True),
+                [colour_quality_scale(sd, method=method) for sd in sds],
+                decimal=7)
+
+            np.testing.assert_allclose(
+                colour_quality_scale_msds(
+                    sds_and_msds_to_msds(sds), method=method),
+                [colour_quality_scale(sd, method=method) for sd in sds],
+                atol=0.01)
+
+            specification = colour_quality_scale_msds(
+                np.array([sd.values for sd in sds]),
+                additional_data=True,
+                method=method,
+                shape=shape,
+                exact=True)
+            for i, sd in enumerate(sds):
+                specification_r = colour_quality_scale(sd, True, method)
+
+                for attribute in ('Q_a', 'Q_f', 'Q_g'):
+                    np.testing.assert_almost_equal(
+                        getattr(specification, attribute)[i],
+                        getattr(specification_r, attribute),
+                        decimal=7)
+
+                np.testing.assert_almost_equal(
+                    specification.Q_as.Q_a[i],
+                    [data.Q_a for data in specification_r.Q_as.values()],
+                    decimal=7)
+
+                for j in range(2):
+                    np.testing.assert_almost_equal(
+                        specification.colorimetry_data[j].Lab[i],
+                        [
+                            data.Lab
+                            for data in specification_r.colorimetry_data[j]
+                        ],
+                        decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
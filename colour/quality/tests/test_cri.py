@@ -6,9 +6,12 @@ Defines unit tests for :mod:`colour.quality.cri` module.
 import numpy as np
 import unittest
 
+from colour.algebra import LinearInterpolator
 from colour.quality import (ColourRendering_Specification_CRI,
-                            colour_rendering_index)
-from colour.colorimetry import SDS_ILLUMINANTS, SpectralDistribution
+                            colour_rendering_index,
+                            colour_rendering_index_msds)
+from colour.colorimetry import (SDS_ILLUMINANTS, SpectralDistribution,
+                                SpectralShape, sds_and_msds_to_msds)
 from colour.quality.cri import TCS_ColorimetryData, TCS_ColourQualityScaleData
 
 __author__ = 'Colour Developers'
@@ -18,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestColourRenderingIndex']
+__all__ = ['TestColourRenderingIndex', 'TestColourRenderingIndexMsds']
 
 DATA_SAMPLE = {
     380: 0.00588346,
@@ -343,5 +346,79 @@ class TestColourRenderingIndex(unittest.TestCase):
         )
 
 
+class TestColourRenderingIndexMsds(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cri.colour_rendering_index_msds`
+    definition unit tests methods.
+    """
+
+    def test_colour_rendering_index_msds(self):
+        """
+        Tests :func:`colour.quality.cri.colour_rendering_index_msds`
+        definition.
+        """
+
+        sds = [
+            SDS_ILLUMINANTS[illuminant]
+            for illuminant in ('FL1', 'FL2', 'FL9', 'FL3.15')
+        ]
+        msds = sds_and_msds_to_msds(sds)
+        msds.interpolator = LinearInterpolator
+
+        np.testing.assert_almost_equal(
+            colour_rendering_index_msds(msds, exact=True),
+            [colour_rendering_index(sd) for sd in sds],
+            decimal=7)
+
+        shape = SpectralShape(380, 780, 5)
+        sds = [
+            SpectralDistribution(
+                SDS_ILLUMINANTS[illuminant].copy().align(shape).values,
+                shape.range()) for illuminant in ('FL1', 'FL2', 'A')
+        ]
+        sds.append(SpectralDistribution(DATA_SAMPLE))
+
+        np.testing.assert_almost_equal(
+            colour_rendering_index_msds(
+                sds_and_msds_to_msds(sds), exact=True),
+            [colour_rendering_index(sd) for sd in sds],
+            decimal=7)
+
+        values = np.array([sd.values for sd in sds])
+        np.testing.assert_almost_equal(
+            colour_rendering_index_msds(
+                np.reshape(values, (2, 2, -1)), shape=shape, exact=True),
+            [colour_rendering_index(sd) for sd in sds],
+            decimal=7)
+
+        np.testing.assert_allclose(
+            colour_rendering_index_msds(values, shape=shape),
+            [colour_rendering_index(sd) for sd in sds],
+            atol=0.01)
+
+        specification = colour_rendering_index_msds(
+            values, additional_data=True, shape=shape, exact=True)
+        for i, sd in enumerate(sds):
+            specification_r = colour_rendering_index(sd, True)
+
+            np.testing.assert_almost_equal(
+                specification.Q_a[i], specification_r.Q_a, decimal=7)
+            np.testing.assert_almost_equal(
+                specification.Q_as[i],
+                [data.Q_a for data in specification_r.Q_as.values()],
+                decimal=7)
+
+            for j in range(2):
+                for attribute in ('XYZ', 'uv', 'UVW'):
+                    np.testing.assert_almost_equal(
+                        getattr(specification.colorimetry_data[j],
+                                attribute)[i],
+                        [
+                            getattr(data, attribute)
+                            for data in specification_r.colorimetry_data[j]
+                        ],
+                        decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
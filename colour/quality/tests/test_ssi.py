@@ -3,10 +3,13 @@
 Defines unit tests for :mod:`colour.quality.ssi` module.
 """
 
+import numpy as np
 import unittest
 
-from colour.quality import spectral_similarity_index
-from colour.colorimetry import SDS_ILLUMINANTS, SpectralDistribution
+from colour.quality import (spectral_similarity_index,
+                            spectral_similarity_index_matrix)
+from colour.colorimetry import (SDS_ILLUMINANTS, SpectralDistribution,
+                                SpectralShape, sds_and_msds_to_msds)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -15,7 +18,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestSpectralSimilarityIndex']
+__all__ = [
+    'TestSpectralSimilarityIndex', 'TestSpectralSimilarityIndexMatrix'
+]
 
 DATA_HMI = {
     300: 0.000000000000000,
@@ -571,5 +576,56 @@ class TestSpectralSimilarityIndex(unittest.TestCase):
                 SpectralDistribution(DATA_HMI), SDS_ILLUMINANTS['D50']), 72.0)
 
 
+class TestSpectralSimilarityIndexMatrix(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.ssi.spectral_similarity_index_matrix`
+    definition unit tests methods.
+    """
+
+    def test_spectral_similarity_index_matrix(self):
+        """
+        Tests :func:`colour.quality.ssi.spectral_similarity_index_matrix`
+        definition.
+        """
+
+        sds_test = [
+            SDS_ILLUMINANTS[illuminant].copy()
+            for illuminant in ('A', 'C', 'D50', 'D65', 'E', 'FL2')
+        ]
+        sds_reference = [
+            SpectralDistribution(DATA_HMI), SDS_ILLUMINANTS['D65'].copy()
+        ]
+
+        SSI = spectral_similarity_index_matrix(
+            sds_and_msds_to_msds(sds_test),
+            sds_and_msds_to_msds(sds_reference))
+        self.assertEqual(SSI.shape, (6, 2))
+
+        SSI_s = [[
+            spectral_similarity_index(sd_test, sd_reference)
+            for sd_reference in sds_reference
+        ] for sd_test in sds_test]
+
+        np.testing.assert_equal(SSI, SSI_s)
+
+        np.testing.assert_equal(
+            spectral_similarity_index_matrix(
+                sds_and_msds_to_msds(sds_test),
+                sds_and_msds_to_msds(sds_reference),
+                chunk_size=1), SSI)
+
+        shape = SpectralShape(380, 780, 5)
+        values = np.array(
+            [sd.copy().align(shape).values for sd in sds_test])
+        np.testing.assert_equal(
+            spectral_similarity_index_matrix(values, values[:3], shape),
+            [[
+                spectral_similarity_index(
+                    SpectralDistribution(value_t, shape.range()),
+                    SpectralDistribution(value_r, shape.range()))
+                for value_r in values[:3]
+            ] for value_t in values])
+
+
 if __name__ == '__main__':
     unittest.main()
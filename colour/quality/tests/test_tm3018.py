@@ -12,9 +12,14 @@ Notes
 import numpy as np
 import unittest
 
-from colour.colorimetry import SDS_ILLUMINANTS
-from colour.quality.tm3018 import (averages_area,
-                                   colour_fidelity_index_ANSIIESTM3018)
+from colour.colorimetry import (SDS_ILLUMINANTS, SpectralDistribution,
+                                SpectralShape, sd_to_XYZ)
+from colour.models import XYZ_to_xy, xy_to_Luv_uv
+from colour.quality import colour_rendering_index_msds
+from colour.quality.tm3018 import (
+    averages_area, colour_fidelity_index_ANSIIESTM3018,
+    colour_fidelity_index_ANSIIESTM3018_msds, hue_bins, hue_bin_averages,
+    tm3018_report_data)
 from colour.utilities import as_float_array
 
 __author__ = 'Colour Developers'
@@ -24,7 +29,11 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestColourFidelityIndexANSIIESTM3018', 'TestAveragesArea']
+__all__ = [
+    'TestColourFidelityIndexANSIIESTM3018',
+    'TestColourFidelityIndexANSIIESTM3018Msds', 'TestTm3018ReportData',
+    'TestHueBins', 'TestHueBinAverages', 'TestAveragesArea'
+]
 
 
 class TestColourFidelityIndexANSIIESTM3018(unittest.TestCase):
@@ -70,6 +79,146 @@ class TestColourFidelityIndexANSIIESTM3018(unittest.TestCase):
         ], 2)
 
 
+class TestColourFidelityIndexANSIIESTM3018Msds(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.tm3018.\
+colour_fidelity_index_ANSIIESTM3018_msds` definition unit tests methods.
+    """
+
+    def test_colour_fidelity_index_ANSIIESTM3018_msds(self):
+        """
+        Tests :func:`colour.quality.tm3018.\
+colour_fidelity_index_ANSIIESTM3018_msds` definition.
+        """
+
+        shape = SpectralShape(380, 780, 5)
+        sds = [
+            SpectralDistribution(
+                SDS_ILLUMINANTS[illuminant].copy().align(shape).values,
+                shape.range()) for illuminant in ('FL1', 'FL2', 'FL11')
+        ]
+        values = np.array([sd.values for sd in sds])
+
+        np.testing.assert_almost_equal(
+            colour_fidelity_index_ANSIIESTM3018_msds(
+                values, shape=shape, exact=True),
+            [colour_fidelity_index_ANSIIESTM3018(sd) for sd in sds],
+            decimal=7)
+
+        specification = colour_fidelity_index_ANSIIESTM3018_msds(
+            values, additional_data=True, shape=shape, exact=True)
+        for i, sd in enumerate(sds):
+            specification_r = colour_fidelity_index_ANSIIESTM3018(sd, True)
+
+            for attribute in ('R_f', 'R_s', 'R_g', 'CCT', 'D_uv',
+                              'averages_test', 'averages_reference',
+                              'average_norms', 'R_fs', 'R_cs', 'R_hs'):
+                np.testing.assert_almost_equal(
+                    getattr(specification, attribute)[i],
+                    getattr(specification_r, attribute),
+                    decimal=7)
+
+            for j in range(16):
+                np.testing.assert_equal(
+                    np.where(specification.bins[i] == j)[0],
+                    specification_r.bins[j])
+
+
+class TestTm3018ReportData(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.tm3018.tm3018_report_data` definition unit
+    tests methods.
+    """
+
+    def test_tm3018_report_data(self):
+        """
+        Tests :func:`colour.quality.tm3018.tm3018_report_data` definition.
+        """
+
+        shape = SpectralShape(380, 780, 5)
+        sds = [
+            SpectralDistribution(
+                SDS_ILLUMINANTS[illuminant].copy().align(shape).values,
+                shape.range()) for illuminant in ('FL1', 'FL2', 'FL11')
+        ]
+        values = np.array([sd.values for sd in sds])
+
+        report_data = tm3018_report_data(values, shape, exact=True)
+        specification = colour_fidelity_index_ANSIIESTM3018_msds(
+            values, True, shape, exact=True)
+
+        for attribute in ('R_f', 'R_s', 'R_g', 'CCT', 'D_uv',
+                          'averages_test', 'averages_reference',
+                          'average_norms', 'R_fs', 'R_cs', 'R_hs'):
+            np.testing.assert_equal(
+                getattr(report_data, attribute),
+                getattr(specification, attribute))
+
+        specification_CRI = colour_rendering_index_msds(
+            values, True, shape, exact=True)
+        np.testing.assert_equal(report_data.R_a, specification_CRI.Q_a)
+        np.testing.assert_equal(report_data.R_9, specification_CRI.Q_as[:, 8])
+
+        for i, sd in enumerate(sds):
+            xy = XYZ_to_xy(sd_to_XYZ(sd))
+            np.testing.assert_almost_equal(report_data.xy[i], xy, decimal=4)
+            np.testing.assert_almost_equal(
+                report_data.uv_p[i], xy_to_Luv_uv(xy), decimal=4)
+
+            specification_r = colour_fidelity_index_ANSIIESTM3018(sd, True)
+            h = as_float_array([
+                sample.CAM.h for sample in specification_r.colorimetry_data[1]
+            ])
+            np.testing.assert_almost_equal(
+                report_data.average_hues[i],
+                [np.mean(h[indexes]) for indexes in specification_r.bins],
+                decimal=7)
+
+
+class TestHueBins(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.tm3018.hue_bins` definition unit tests
+    methods.
+    """
+
+    def test_hue_bins(self):
+        """
+        Tests :func:`colour.quality.tm3018.hue_bins` definition.
+        """
+
+        np.testing.assert_equal(
+            hue_bins([0, 11.25, 22.5, 180, 359.99, 360]), [0, 0, 1, 8, 15, 0])
+
+        np.testing.assert_equal(
+            hue_bins([[0, 90], [180, 270]], 4), [[0, 1], [2, 3]])
+
+
+class TestHueBinAverages(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.tm3018.hue_bin_averages` definition unit
+    tests methods.
+    """
+
+    def test_hue_bin_averages(self):
+        """
+        Tests :func:`colour.quality.tm3018.hue_bin_averages` definition.
+        """
+
+        bins = np.array([[0, 0, 1, 3], [3, 2, 2, 1]])
+        values = np.array([[1, 2, 3, 4], [5, 6, 7, 8]])
+
+        np.testing.assert_equal(
+            hue_bin_averages(bins, values, 4),
+            [[1.5, 3, np.nan, 4], [np.nan, 8, 6.5, 5]])
+
+        np.testing.assert_equal(
+            hue_bin_averages(bins[0], values[0], 4), [1.5, 3, np.nan, 4])
+
+        np.testing.assert_equal(
+            hue_bin_averages(bins, np.stack([values, -values], -1), 4)[..., 1],
+            -hue_bin_averages(bins, values, 4))
+
+
 class TestAveragesArea(unittest.TestCase):
     """
     Defines :func:`colour.quality.tm3018.averages_area` definition unit tests
@@ -89,6 +238,10 @@ class TestAveragesArea(unittest.TestCase):
         poly = np.array([[1., -1], [1, 1], [3, 1], [3, 3], [-1, 3], [-1, -1]])
         np.allclose(averages_area(poly), 12)
 
+        np.testing.assert_almost_equal(
+            averages_area(np.array([rectangle, rectangle * 2])), [6, 24],
+            decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,9 @@ objects:
 
 - :class:`colour.quality.ColourQuality_Specification_ANSIIESTM3018`
 - :func:`colour.quality.colour_fidelity_index_ANSIIESTM3018`
+- :func:`colour.quality.colour_fidelity_index_ANSIIESTM3018_msds`
+- :class:`colour.quality.ColourRendition_ReportData_ANSIIESTM3018`
+- :func:`colour.quality.tm3018_report_data`
 
 References
 ----------
@@ -19,9 +22,16 @@ References
 import numpy as np
 from collections import namedtuple
 
-from colour.quality import colour_fidelity_index_CIE2017
-from colour.quality.cfi2017 import delta_E_to_R_f
-from colour.utilities import as_float_array, as_int
+from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER,
+                                SPECTRAL_SHAPE_DEFAULT)
+from colour.models import XYZ_to_xy, xy_to_Luv_uv
+from colour.quality import (colour_fidelity_index_CIE2017,
+                            colour_fidelity_index_CIE2017_msds,
+                            colour_rendering_index_msds)
+from colour.quality.cfi2017 import SPECTRAL_SHAPE_CIE2017, delta_E_to_R_f
+from colour.quality.common import (align_spectral_array, spectral_array,
+                                   spectral_array_interpolator)
+from colour.utilities import as_float_array, as_int_array
 
 
 class ColourQuality_Specification_ANSIIESTM3018(
@@ -104,46 +114,355 @@ def colour_fidelity_index_ANSIIESTM3018(sd_test, additional_data=False):
         return colour_fidelity_index_CIE2017(sd_test, False)
 
     specification = colour_fidelity_index_CIE2017(sd_test, True)
+    test_data, reference_data = specification.colorimetry_data
 
     # Setup bins based on where the reference a'b' points are located.
-    bins = [[] for _i in range(16)]
-    for i, sample in enumerate(specification.colorimetry_data[1]):
-        bin_index = as_int(np.floor(sample.CAM.h / 22.5))
-        bins[bin_index].append(i)
+    bins = hue_bins([sample.CAM.h for sample in reference_data])
+
+    (averages_test, averages_reference, average_norms, R_g, R_fs, R_cs,
+     R_hs) = _hue_bin_statistics(
+         bins, [sample.Jpapbp for sample in test_data],
+         [sample.Jpapbp for sample in reference_data],
+         specification.delta_E_s)
+
+    # Indexes of the colour samples in each bin.
+    bins = [
+        indexes.tolist() for indexes in np.split(
+            np.argsort(bins, kind='stable'),
+            np.cumsum(np.bincount(bins, minlength=16))[:-1])
+    ]
+
+    return ColourQuality_Specification_ANSIIESTM3018(
+        specification.name, sd_test, specification.sd_reference,
+        specification.R_f, specification.R_s, specification.CCT,
+        specification.D_uv, specification.colorimetry_data, R_g, bins,
+        averages_test, averages_reference, average_norms, R_fs, R_cs, R_hs)
+
+
+def colour_fidelity_index_ANSIIESTM3018_msds(msds,
+                                             additional_data=False,
+                                             shape=SPECTRAL_SHAPE_CIE2017,
+                                             exact=False):
+    """
+    Returns the *ANSI/IES TM-30-18 Colour Fidelity Index* (CFI) :math:`R_f`
+    of given multi-spectral distributions.
+
+    The hue bins statistics of all the test spectral distributions are
+    computed at once with segment reductions.
+
+    Parameters
+    ----------
+    msds : MultiSpectralDistributions or array_like
+        Test multi-spectral distributions, if an *array_like* of shape (n, w)
+        the wavelengths are expected to be in the last axis.
+    additional_data : bool, optional
+        Whether to output additional data.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral distributions *array_like*,
+        ignored if ``msds`` is a :class:`colour.MultiSpectralDistributions`
+        class instance.
+    exact : bool, optional
+        Whether to compute the reference illuminants colorimetry from their
+        spectral distributions rather than interpolating it from the
+        reference illuminants bank, see
+        :func:`colour.quality.colour_fidelity_index_CIE2017_msds` definition.
+
+    Returns
+    -------
+    ndarray or ColourQuality_Specification_ANSIIESTM3018
+        *ANSI/IES TM-30-18 Colour Fidelity Index* (CFI) of shape (n, ). The
+        additional data specification stores the quantities as *ndarray* of
+        shape (n, ...), the ``bins`` attribute being the hue bin index of each
+        colour sample, i.e. an *ndarray* of shape (n, 99).
+
+    References
+    ----------
+    :cite:`ANSI2018`
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SDS_ILLUMINANTS, sds_and_msds_to_msds
+    >>> msds = sds_and_msds_to_msds(
+    ...     [SDS_ILLUMINANTS['FL2'], SDS_ILLUMINANTS['FL9']])
+    >>> specification = colour_fidelity_index_ANSIIESTM3018_msds(
+    ...     msds, True, exact=True)
+    >>> specification.R_f  # doctest: +ELLIPSIS
+    array([ 70.1208254...,  91.0012183...])
+    >>> specification.R_g  # doctest: +ELLIPSIS
+    array([ 86.4163418...,  99.7308650...])
+    """
+
+    if not additional_data:
+        return colour_fidelity_index_CIE2017_msds(msds, False, shape, exact)
+
+    specification = colour_fidelity_index_CIE2017_msds(msds, True, shape,
+                                                       exact)
+    test_data, reference_data = specification.colorimetry_data
+
+    # Setup bins based on where the reference a'b' points are located.
+    bins = hue_bins(reference_data.CAM.h)
+
+    (averages_test, averages_reference, average_norms, R_g, R_fs, R_cs,
+     R_hs) = _hue_bin_statistics(bins, test_data.Jpapbp,
+                                 reference_data.Jpapbp,
+                                 specification.delta_E_s)
+
+    return ColourQuality_Specification_ANSIIESTM3018(
+        specification.name, msds, specification.sd_reference,
+        specification.R_f, specification.R_s, specification.CCT,
+        specification.D_uv, specification.colorimetry_data, R_g, bins,
+        averages_test, averages_reference, average_norms, R_fs, R_cs, R_hs)
+
+
+class ColourRendition_ReportData_ANSIIESTM3018(
+        namedtuple('ColourRendition_ReportData_ANSIIESTM3018',
+                   ('name', 'sd_reference', 'R_f', 'R_s', 'R_g', 'CCT', 'D_uv',
+                    'xy', 'uv_p', 'R_a', 'R_9', 'averages_test',
+                    'averages_reference', 'average_norms', 'average_hues',
+                    'R_fs', 'R_cs', 'R_hs'))):
+    """
+    Defines the *ANSI/IES TM-30-18 Colour Rendition Report* data of
+    multi-spectral distributions.
+
+    Parameters
+    ----------
+    name : list
+        Names of the test spectral distributions.
+    sd_reference : ndarray, (n, w)
+        Spectral distributions of the reference illuminants.
+    R_f : ndarray, (n, )
+        *Colour Fidelity Index* (CFI) :math:`R_f`.
+    R_s : ndarray, (n, 99)
+        Individual *colour fidelity indexes* data for each sample.
+    R_g : ndarray, (n, )
+        *Gamut Index* :math:`R_g`.
+    CCT : ndarray, (n, )
+        Correlated colour temperature :math:`T_{cp}`.
+    D_uv : ndarray, (n, )
+        Distance from the Planckian locus :math:`\\Delta_{uv}`.
+    xy : ndarray, (n, 2)
+        *CIE xy* chromaticity coordinates.
+    uv_p : ndarray, (n, 2)
+        *CIE 1976 UCS* :math:`u'v'` chromaticity coordinates.
+    R_a : ndarray, (n, )
+        *CIE 13.3-1995* *Colour Rendering Index* (CRI) :math:`R_a`.
+    R_9 : ndarray, (n, )
+        *CIE 13.3-1995* special *Colour Rendering Index* (CRI) :math:`R_9`.
+    averages_test : ndarray, (n, 16, 2)
+        Averages of *CAM02-UCS* a', b' coordinates for each hue bin for test
+        samples.
+    averages_reference : ndarray, (n, 16, 2)
+        Averages for reference samples.
+    average_norms : ndarray, (n, 16)
+        Distance of averages for reference samples from the origin.
+    average_hues : ndarray, (n, 16)
+        Averages of *CIECAM02* :math:`h` correlate for each hue bin for
+        reference samples, in degrees.
+    R_fs : ndarray, (n, 16)
+        Local colour fidelities for each hue bin.
+    R_cs : ndarray, (n, 16)
+        Local chromaticity shifts for each hue bin, in percents.
+    R_hs : ndarray, (n, 16)
+        Local hue shifts for each hue bin.
+    """
+
+
+def tm3018_report_data(sds, shape=SPECTRAL_SHAPE_CIE2017, exact=False):
+    """
+    Returns the *ANSI/IES TM-30-18 Colour Rendition Report* data of given
+    multi-spectral distributions.
+
+    Parameters
+    ----------
+    sds : MultiSpectralDistributions or array_like
+        Test multi-spectral distributions, if an *array_like* of shape (n, w)
+        the wavelengths are expected to be in the last axis.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral distributions *array_like*,
+        ignored if ``sds`` is a :class:`colour.MultiSpectralDistributions`
+        class instance.
+    exact : bool, optional
+        Whether to compute the reference illuminants colorimetry from their
+        spectral distributions rather than interpolating it from the
+        reference illuminants banks.
+
+    Returns
+    -------
+    ColourRendition_ReportData_ANSIIESTM3018
+        *ANSI/IES TM-30-18 Colour Rendition Report* data.
+
+    Notes
+    -----
+    -   The chromaticity coordinates are computed by integration with the
+        *CIE 1931 2 Degree Standard Observer*, thus they might slightly differ
+        from the values returned by :func:`colour.sd_to_XYZ` definition using
+        the *ASTM E308-15* method.
+
+    References
+    ----------
+    :cite:`ANSI2018`
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SDS_ILLUMINANTS, sds_and_msds_to_msds
+    >>> msds = sds_and_msds_to_msds(
+    ...     [SDS_ILLUMINANTS['FL2'], SDS_ILLUMINANTS['FL9']])
+    >>> report_data = tm3018_report_data(msds, exact=True)
+    >>> report_data.R_g  # doctest: +ELLIPSIS
+    array([ 86.4163418...,  99.7308650...])
+    >>> report_data.R_9  # doctest: +ELLIPSIS
+    array([-83.9111970...,  69.6120610...])
+    """
+
+    specification = colour_fidelity_index_ANSIIESTM3018_msds(
+        sds, True, shape, exact)
+    specification_CRI = colour_rendering_index_msds(sds, True, shape, exact)
+
+    values, wavelengths = spectral_array(sds, shape)
+    interpolator, interpolator_kwargs = spectral_array_interpolator(sds)
+    cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+        'CIE 1931 2 Degree Standard Observer'].copy().trim(
+            SPECTRAL_SHAPE_DEFAULT)
+    xy = XYZ_to_xy(
+        np.dot(
+            align_spectral_array(values, wavelengths, cmfs.shape, None,
+                                 interpolator, interpolator_kwargs),
+            cmfs.values))
+
+    average_hues = hue_bin_averages(specification.bins,
+                                    specification.colorimetry_data[1].CAM.h)
+
+    return ColourRendition_ReportData_ANSIIESTM3018(
+        specification.name, specification.sd_reference, specification.R_f,
+        specification.R_s, specification.R_g, specification.CCT,
+        specification.D_uv, xy, xy_to_Luv_uv(xy), specification_CRI.Q_a,
+        specification_CRI.Q_as[..., 8], specification.averages_test,
+        specification.averages_reference, specification.average_norms,
+        average_hues, specification.R_fs, specification.R_cs,
+        specification.R_hs)
+
+
+def hue_bins(h, count=16):
+    """
+    Returns the hue bin index of given *CIECAM02* hue angles.
+
+    Parameters
+    ----------
+    h : array_like
+        *CIECAM02* hue angles :math:`h` in degrees.
+    count : int, optional
+        Hue bins count.
+
+    Returns
+    -------
+    ndarray
+        Hue bin indexes.
+
+    Examples
+    --------
+    >>> hue_bins([0, 22.5, 100, 359.9])
+    array([ 0,  1,  4, 15])
+    """
+
+    return as_int_array(np.floor(as_float_array(h) / (360 / count)) % count)
+
+
+def hue_bin_averages(bins, values, count=16):
+    """
+    Computes the per hue bin averages of given values.
+
+    The averages are computed with a single weighted :func:`numpy.bincount`
+    call per value component, the hue bins of each batch item being offset so
+    that they do not overlap.
+
+    Parameters
+    ----------
+    bins : array_like, (..., m)
+        Hue bin index of each colour sample.
+    values : array_like, (..., m) or (..., m, k)
+        Values of each colour sample.
+    count : int, optional
+        Hue bins count.
+
+    Returns
+    -------
+    ndarray, (..., count) or (..., count, k)
+        Per hue bin averages, *nan* for empty hue bins.
+
+    Examples
+    --------
+    >>> hue_bin_averages([0, 0, 1, 3], [1, 2, 3, 4], 4)
+    array([ 1.5,  3. ,  nan,  4. ])
+    """
+
+    bins = as_int_array(bins)
+    values = as_float_array(values)
+
+    batch = bins.shape[:-1]
+    size = int(np.prod(batch))
+    indexes = np.ravel(
+        np.reshape(bins, (size, -1)) + np.arange(size)[..., np.newaxis] *
+        count)
+    counts = np.bincount(indexes, minlength=size * count)
+
+    samples = np.reshape(values, (indexes.size, -1))
+    sums = np.transpose([
+        np.bincount(indexes, samples[..., i], minlength=size * count)
+        for i in range(samples.shape[-1])
+    ])
+
+    with np.errstate(invalid='ignore'):
+        averages = sums / counts[..., np.newaxis]
+
+    return np.reshape(averages, batch + (count, ) + values.shape[bins.ndim:])
+
+
+def _hue_bin_statistics(bins, Jpapbp_t, Jpapbp_r, delta_E_s):
+    """
+    Computes the hue bin statistics of given test and reference colour
+    samples.
+
+    Parameters
+    ----------
+    bins : array_like, (..., m)
+        Hue bin index of each colour sample.
+    Jpapbp_t : array_like, (..., m, 3)
+        *CAM02-UCS* colourspace :math:`J'a'b'` values of the test colour
+        samples.
+    Jpapbp_r : array_like, (..., m, 3)
+        *CAM02-UCS* colourspace :math:`J'a'b'` values of the reference colour
+        samples.
+    delta_E_s : array_like, (..., m)
+        Colour differences of the colour samples.
+
+    Returns
+    -------
+    tuple
+        Per hue bin test and reference a'b' averages, reference averages
+        norms, gamut index :math:`R_g`, local colour fidelities, local
+        chromaticity shifts and local hue shifts.
+    """
 
     # Per-bin a'b' averages.
-    averages_test = np.empty([16, 2])
-    averages_reference = np.empty([16, 2])
-    for i in range(16):
-        apbp_s = [
-            specification.colorimetry_data[0][j].Jpapbp[[1, 2]]
-            for j in bins[i]
-        ]
-        averages_test[i, :] = np.mean(apbp_s, axis=0)
-        apbp_s = [
-            specification.colorimetry_data[1][j].Jpapbp[[1, 2]]
-            for j in bins[i]
-        ]
-        averages_reference[i, :] = np.mean(apbp_s, axis=0)
+    averages_test = hue_bin_averages(bins, as_float_array(Jpapbp_t)[..., 1:])
+    averages_reference = hue_bin_averages(bins,
+                                          as_float_array(Jpapbp_r)[..., 1:])
 
     # Gamut Index.
     R_g = 100 * (
         averages_area(averages_test) / averages_area(averages_reference))
 
     # Local colour fidelity indexes, i.e. 16 CFIs for each bin.
-    bin_delta_E_s = [
-        np.mean([specification.delta_E_s[bins[i]]]) for i in range(16)
-    ]
-    R_fs = delta_E_to_R_f(as_float_array(bin_delta_E_s))
+    R_fs = delta_E_to_R_f(hue_bin_averages(bins, delta_E_s))
 
     # Angles bisecting the hue bins.
     angles = (22.5 * np.arange(16) + 11.25) / 180 * np.pi
     cosines = np.cos(angles)
     sines = np.sin(angles)
 
-    average_norms = np.linalg.norm(averages_reference, axis=1)
-    a_deltas = averages_test[:, 0] - averages_reference[:, 0]
-    b_deltas = averages_test[:, 1] - averages_reference[:, 1]
+    average_norms = np.linalg.norm(averages_reference, axis=-1)
+    a_deltas = averages_test[..., 0] - averages_reference[..., 0]
+    b_deltas = averages_test[..., 1] - averages_reference[..., 1]
 
     # Local chromaticity shifts, multiplied by 100 to obtain percentages.
     R_cs = 100 * (a_deltas * cosines + b_deltas * sines) / average_norms
@@ -151,11 +470,8 @@ def colour_fidelity_index_ANSIIESTM3018(sd_test, additional_data=False):
     # Local hue shifts.
     R_hs = (-a_deltas * sines + b_deltas * cosines) / average_norms
 
-    return ColourQuality_Specification_ANSIIESTM3018(
-        specification.name, sd_test, specification.sd_reference,
-        specification.R_f, specification.R_s, specification.CCT,
-        specification.D_uv, specification.colorimetry_data, R_g, bins,
-        averages_test, averages_reference, average_norms, R_fs, R_cs, R_hs)
+    return (averages_test, averages_reference, average_norms, R_g, R_fs,
+            R_cs, R_hs)
 
 
 def averages_area(averages):
@@ -164,21 +480,18 @@ def averages_area(averages):
 
     Parameters
     ----------
-    averages : array_like, (n, 2)
+    averages : array_like, (..., n, 2)
         Hue bin averages.
 
     Returns
     -------
-    float
+    float or ndarray
         Area of the polygon.
     """
 
-    N = averages.shape[0]
+    u = as_float_array(averages)
+    v = np.roll(u, -1, axis=-2)
 
-    triangle_areas = np.empty(N)
-    for i in range(N):
-        u = averages[i, :]
-        v = averages[(i + 1) % N, :]
-        triangle_areas[i] = (u[0] * v[1] - u[1] * v[0]) / 2
+    triangle_areas = (u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]) / 2
 
-    return np.sum(triangle_areas)
+    return np.sum(triangle_areas, axis=-1)
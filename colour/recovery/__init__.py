@@ -27,10 +27,13 @@ from . import datasets
 from .jakob2019 import (sd_Jakob2019, find_coefficients_Jakob2019,
                         XYZ_to_sd_Jakob2019, LUT3D_Jakob2019)
 from .mallett2019 import (spectral_primary_decomposition_Mallett2019,
-                          RGB_to_sd_Mallett2019)
-from .meng2015 import XYZ_to_sd_Meng2015
-from .otsu2018 import Dataset_Otsu2018, NodeTree_Otsu2018, XYZ_to_sd_Otsu2018
-from .smits1999 import RGB_to_sd_Smits1999
+                          RGB_to_sd_Mallett2019,
+                          RGB_to_spectral_array_Mallett2019)
+from .lut import LUT3D_Recovery
+from .meng2015 import XYZ_to_sd_Meng2015, XYZ_to_spectral_array_Meng2015
+from .otsu2018 import (Dataset_Otsu2018, NodeTree_Otsu2018, XYZ_to_sd_Otsu2018,
+                       XYZ_to_spectral_array_Otsu2018)
+from .smits1999 import RGB_to_sd_Smits1999, RGB_to_spectral_array_Smits1999
 __all__ = []
 __all__ += datasets.__all__
 __all__ += [
@@ -38,11 +41,16 @@ __all__ += [
     'LUT3D_Jakob2019'
 ]
 __all__ += [
-    'spectral_primary_decomposition_Mallett2019', 'RGB_to_sd_Mallett2019'
+    'spectral_primary_decomposition_Mallett2019', 'RGB_to_sd_Mallett2019',
+    'RGB_to_spectral_array_Mallett2019'
 ]
-__all__ += ['XYZ_to_sd_Meng2015']
-__all__ += ['Dataset_Otsu2018', 'NodeTree_Otsu2018', 'XYZ_to_sd_Otsu2018']
-__all__ += ['RGB_to_sd_Smits1999']
+__all__ += ['LUT3D_Recovery']
+__all__ += ['XYZ_to_sd_Meng2015', 'XYZ_to_spectral_array_Meng2015']
+__all__ += [
+    'Dataset_Otsu2018', 'NodeTree_Otsu2018', 'XYZ_to_sd_Otsu2018',
+    'XYZ_to_spectral_array_Otsu2018'
+]
+__all__ += ['RGB_to_sd_Smits1999', 'RGB_to_spectral_array_Smits1999']
 
 XYZ_TO_SD_METHODS = CaseInsensitiveMapping({
     'Jakob 2019': XYZ_to_sd_Jakob2019,
@@ -18,9 +18,11 @@ References
     38(2), 147-155. doi:10.1111/cgf.13626
 """
 
+import hashlib
 import numpy as np
+import os
 import struct
-from scipy.optimize import minimize
+from functools import partial
 from scipy.interpolate import RegularGridInterpolator
 
 from colour import SDS_ILLUMINANTS
@@ -30,9 +32,10 @@ from colour.colorimetry import (
     intermediate_lightness_function_CIE1976, sd_to_XYZ)
 from colour.difference import JND_CIE1976
 from colour.models import XYZ_to_xy, XYZ_to_Lab, RGB_to_XYZ
-from colour.utilities import (as_float_array, domain_range_scale, full,
-                              index_along_last_axis, is_tqdm_installed,
-                              message_box, to_domain_1, runtime_warning, zeros)
+from colour.utilities import (
+    as_float_array, batch, domain_range_scale, full, index_along_last_axis,
+    is_tqdm_installed, message_box, multiprocessing_pool, to_domain_1,
+    runtime_warning, zeros)
 try:
     from unittest import mock
 except ImportError:  # pragma: no cover
@@ -235,8 +238,10 @@ def error_function(coefficients,
     XYZ = k * np.dot(E, cmfs.values) * dw
     dXYZ = np.transpose(k * np.dot(dE, cmfs.values) * dw)
 
+    # NOTE: "sd_to_XYZ" returns a cached array that must not be modified
+    # in-place.
     XYZ_n = sd_to_XYZ(illuminant, cmfs)
-    XYZ_n /= XYZ_n[1]
+    XYZ_n = XYZ_n / XYZ_n[1]
     XYZ_XYZ_n = XYZ / XYZ_n
 
     XYZ_f = intermediate_lightness_function_CIE1976(XYZ, XYZ_n)
@@ -391,6 +396,8 @@ def find_coefficients_Jakob2019(
 0.0141941...)
     """
 
+    from scipy.optimize import minimize
+
     shape = cmfs.shape
 
     if illuminant.shape != shape:
@@ -575,6 +582,136 @@ def XYZ_to_sd_Jakob2019(
         return sd
 
 
+def _coefficients_column_Jakob2019(chroma, lightness_scale,
+                                   matrix_RGB_to_XYZ, whitepoint, xy_n, cmfs,
+                                   illuminant):
+    """
+    Computes the *Jakob and Hanika (2019)* lookup table coefficients along the
+    lightness scale for given fully bright chroma.
+
+    Parameters
+    ----------
+    chroma : array_like, (3,)
+        Fully bright *RGB* colourspace array.
+    lightness_scale : array_like
+        Lookup table lightness scale.
+    matrix_RGB_to_XYZ : array_like
+        *RGB* colourspace to *CIE XYZ* tristimulus values matrix.
+    whitepoint : array_like
+        *RGB* colourspace whitepoint chromaticity coordinates.
+    xy_n : array_like
+        Illuminant chromaticity coordinates.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+
+    Returns
+    -------
+    ndarray, (L, 3)
+        Dimensionful coefficients for each lightness of the scale.
+    """
+
+    lightness_steps = len(lightness_scale)
+    coefficients = np.empty([lightness_steps, 3])
+
+    def optimize(L, coefficients_0):
+        """
+        Solves for a specific lightness and stores the result in the
+        appropriate cell.
+        """
+
+        RGB = lightness_scale[L] * chroma
+
+        XYZ = RGB_to_XYZ(RGB, whitepoint, xy_n, matrix_RGB_to_XYZ)
+
+        coefficients_L, _error = find_coefficients_Jakob2019(
+            XYZ, cmfs, illuminant, coefficients_0, dimensionalise=False)
+
+        coefficients[L] = dimensionalise_coefficients(coefficients_L,
+                                                      cmfs.shape)
+
+        return coefficients_L
+
+    # Starts from somewhere in the middle, similarly to how feedback works in
+    # "colour.recovery.find_coefficients_Jakob2019" definition.
+    L_middle = lightness_steps // 3
+    coefficients_middle = optimize(L_middle, zeros(3))
+
+    # Goes down the lightness scale.
+    coefficients_0 = coefficients_middle
+    for L in reversed(range(0, L_middle)):
+        coefficients_0 = optimize(L, coefficients_0)
+
+    # Goes up the lightness scale.
+    coefficients_0 = coefficients_middle
+    for L in range(L_middle + 1, lightness_steps):
+        coefficients_0 = optimize(L, coefficients_0)
+
+    return coefficients
+
+
+def _checksum_Jakob2019(colourspace, cmfs, illuminant, size):
+    """
+    Returns the checksum of given *Jakob and Hanika (2019)* lookup table
+    generation parameters, it is used to validate the checkpoint files.
+
+    Parameters
+    ----------
+    colourspace: RGB_Colourspace
+        *RGB* colourspace.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+    size : int
+        Lookup table resolution.
+
+    Returns
+    -------
+    unicode
+        Parameters checksum.
+    """
+
+    checksum = hashlib.sha1(str(size).encode('utf-8'))
+    for array in (colourspace.matrix_RGB_to_XYZ, colourspace.whitepoint,
+                  cmfs.wavelengths, cmfs.values, illuminant.values):
+        checksum.update(np.ascontiguousarray(array, np.float64).tobytes())
+
+    return checksum.hexdigest()
+
+
+def _write_checkpoint_Jakob2019(path, coefficients, done, checksum):
+    """
+    Writes given *Jakob and Hanika (2019)* partially generated lookup table
+    coefficients to given checkpoint file.
+
+    The checkpoint is written to a temporary file which is then renamed so
+    that an interruption never leaves a truncated checkpoint.
+
+    Parameters
+    ----------
+    path : unicode
+        Path to the checkpoint file.
+    coefficients : ndarray
+        Lookup table coefficients.
+    done : ndarray
+        Whether the lookup table chroma columns have been generated.
+    checksum : unicode
+        Generation parameters checksum.
+    """
+
+    path_temporary = '{0}.tmp'.format(path)
+    with open(path_temporary, 'wb') as checkpoint_file:
+        np.savez(
+            checkpoint_file,
+            coefficients=coefficients,
+            done=done,
+            checksum=checksum)
+
+    os.replace(path_temporary, path)
+
+
 class LUT3D_Jakob2019(object):
     """
     Class for working with pre-computed lookup tables for the
@@ -601,6 +738,7 @@ class LUT3D_Jakob2019(object):
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.generate`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.RGB_to_coefficients`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.RGB_to_sd`
+    -   :meth:`~colour.recovery.LUT3D_Jakob2019.RGB_to_spectral_array`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.read`
     -   :meth:`~colour.recovery.LUT3D_Jakob2019.write`
 
@@ -758,11 +896,18 @@ class LUT3D_Jakob2019(object):
                  illuminant=SDS_ILLUMINANTS['D65'].copy().align(
                      SPECTRAL_SHAPE_JAKOB2019),
                  size=64,
-                 print_callable=print):
+                 print_callable=print,
+                 processes=None,
+                 checkpoint_path=None):
         """
         Generates the lookup table data for given *RGB* colourspace, colour
         matching functions, illuminant and given size.
 
+        The lightness chains of the chroma columns of the table are
+        independent, they can be distributed across a multiprocessing pool
+        and the partially generated table checkpointed to disk so that an
+        interrupted generation can be resumed.
+
         Parameters
         ----------
         colourspace: RGB_Colourspace
@@ -777,6 +922,25 @@ class LUT3D_Jakob2019(object):
             *\\*.coeff* files have a resolution of 64.
         print_callable : callable, optional
             Callable used to print progress and diagnostic information.
+        processes : int, optional
+            Number of processes the chroma columns are distributed across, the
+            generation is performed serially in the current process if
+            *None* or 1.
+        checkpoint_path : unicode, optional
+            Path to the *\\*.npz* checkpoint file the partially generated
+            table is saved to after each batch of chroma columns. If the file
+            exists, the generation resumes from it.
+
+        Raises
+        ------
+        ValueError
+            If the checkpoint file was generated with different parameters.
+
+        Notes
+        -----
+        -   The generated table is identical irrespective of the processes
+            count and of whether the generation was resumed from a
+            checkpoint.
 
         Examples
         --------
@@ -846,49 +1010,67 @@ class LUT3D_Jakob2019(object):
         print_callable(
             '\nOptimising {0} coefficients...\n'.format(total_coefficients))
 
-        def optimize(ijkL, coefficients_0):
-            """
-            Solves for a specific lightness and stores the result in the
-            appropriate cell.
-            """
-
-            i, j, k, L = ijkL
+        columns = list(zip(cube_indexes, chromas))
 
-            RGB = self._lightness_scale[L] * chroma
+        checksum = _checksum_Jakob2019(colourspace, cmfs, illuminant, size)
+        done = np.zeros([3, chroma_steps, chroma_steps], dtype=np.bool_)
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            with np.load(checkpoint_path) as checkpoint:
+                if str(checkpoint['checksum']) != checksum:
+                    raise ValueError(
+                        '"{0}" checkpoint was generated with different '
+                        'parameters!'.format(checkpoint_path))
 
-            XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, xy_n,
-                             colourspace.matrix_RGB_to_XYZ)
+                self._coefficients[...] = checkpoint['coefficients']
+                done[...] = checkpoint['done']
 
-            coefficients, _error = find_coefficients_Jakob2019(
-                XYZ, cmfs, illuminant, coefficients_0, dimensionalise=False)
+            print_callable('Resuming from "{0}" checkpoint with {1} '
+                           'coefficients...\n'.format(
+                               checkpoint_path, np.sum(done)))
 
-            self._coefficients[i, L, j, k, :] = dimensionalise_coefficients(
-                coefficients, shape)
+            columns = [column for column in columns if not done[column[0]]]
 
-            return coefficients
+        coefficients_column = partial(
+            _coefficients_column_Jakob2019,
+            lightness_scale=self._lightness_scale,
+            matrix_RGB_to_XYZ=colourspace.matrix_RGB_to_XYZ,
+            whitepoint=colourspace.whitepoint,
+            xy_n=xy_n,
+            cmfs=cmfs,
+            illuminant=illuminant)
 
-        with tqdm(total=total_coefficients) as progress:
-            for ijk, chroma in zip(cube_indexes, chromas):
-                progress.update()
-
-                # Starts from somewhere in the middle, similarly to how
-                # feedback works in "colour.recovery.\
-                # find_coefficients_Jakob2019" definition.
-                L_middle = lightness_steps // 3
-                coefficients_middle = optimize(
-                    np.hstack([ijk, L_middle]), zeros(3))
-
-                # Goes down the lightness scale.
-                coefficients_0 = coefficients_middle
-                for L in reversed(range(0, L_middle)):
-                    coefficients_0 = optimize(
-                        np.hstack([ijk, L]), coefficients_0)
+        def generate_columns(map_callable):
+            """
+            Generates the remaining chroma columns in batches with given map
+            callable and checkpoints them.
+            """
 
-                # Goes up the lightness scale.
-                coefficients_0 = coefficients_middle
-                for L in range(L_middle + 1, lightness_steps):
-                    coefficients_0 = optimize(
-                        np.hstack([ijk, L]), coefficients_0)
+            with tqdm(total=total_coefficients,
+                      initial=total_coefficients - len(columns)) as progress:
+                for columns_batch in batch(columns, processes * 8):
+                    results = map_callable(
+                        coefficients_column,
+                        [chroma for _ijk, chroma in columns_batch])
+
+                    for (ijk, _chroma), coefficients in zip(
+                            columns_batch, results):
+                        i, j, k = ijk
+                        self._coefficients[i, :, j, k, :] = coefficients
+                        done[ijk] = True
+
+                    progress.update(len(columns_batch))
+
+                    if checkpoint_path is not None:
+                        _write_checkpoint_Jakob2019(
+                            checkpoint_path, self._coefficients, done,
+                            checksum)
+
+        processes = 1 if processes is None else processes
+        if processes > 1:
+            with multiprocessing_pool(processes) as pool:
+                generate_columns(pool.map)
+        else:
+            generate_columns(map)
 
         self._size = size
         self._create_interpolator()
@@ -1025,6 +1207,106 @@ class LUT3D_Jakob2019(object):
 
         return sd
 
+    def RGB_to_spectral_array(self,
+                              RGB,
+                              shape=SPECTRAL_SHAPE_JAKOB2019,
+                              dtype=np.float32,
+                              chunk_size=2 ** 16,
+                              generator=False):
+        """
+        Looks up given *RGB* colourspace array and returns the corresponding
+        spectral reflectance values as an array, e.g. to upsample a whole
+        image.
+
+        Parameters
+        ----------
+        RGB : array_like, (..., 3)
+            *RGB* colourspace array.
+        shape : SpectralShape, optional
+            Shape used by the spectral reflectance values.
+        dtype : type, optional
+            Spectral reflectance values array type.
+        chunk_size : int, optional
+            Elements count processed at once, bounding the size of the
+            intermediate arrays.
+        generator : bool, optional
+            Whether to return a generator yielding the spectral reflectance
+            values of successive blocks of rows along the first axis of
+            the *RGB* colourspace array instead of the whole array.
+
+        Returns
+        -------
+        ndarray or generator, (..., W)
+            Spectral reflectance values with the wavelengths on the last
+            axis.
+
+        Examples
+        --------
+        >>> from colour.models import RGB_COLOURSPACE_sRGB
+        >>> cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+        ...         'CIE 1931 2 Degree Standard Observer'].copy().align(
+        ...             SpectralShape(360, 780, 10))
+        >>> illuminant = SDS_ILLUMINANTS['D65'].copy().align(cmfs.shape)
+        >>> LUT = LUT3D_Jakob2019()
+        >>> LUT.generate(
+        ...     RGB_COLOURSPACE_sRGB, cmfs, illuminant, 3, lambda x: x)
+        >>> RGB = np.array([[0.70573936, 0.19248266, 0.22354169],
+        ...                 [0.19248266, 0.22354169, 0.70573936]])
+        >>> LUT.RGB_to_spectral_array(
+        ...     RGB, SpectralShape(400, 700, 100))  # doctest: +ELLIPSIS
+        array([[ 0.2196213...,  0.0604370...,  0.4952667...,  0.9896088...],
+               [ 0.9714185...,  0.3350409...,  0.0554772...,  0.0551813...]], \
+dtype=float32)
+        """
+
+        RGB = as_float_array(RGB)
+
+        if RGB.ndim == 1:
+            RGB = RGB[np.newaxis]
+            squeeze = True
+        else:
+            squeeze = False
+
+        wavelengths = shape.range()
+        rows_count = max(1, chunk_size // int(np.prod(RGB.shape[1:-1])))
+
+        def spectral_array(RGB_b):
+            """
+            Returns the spectral reflectance values of given *RGB*
+            colourspace array block.
+            """
+
+            R = np.empty(RGB_b.shape[:-1] + wavelengths.shape, dtype=dtype)
+            R_f = np.reshape(R, (-1, len(wavelengths)))
+            RGB_f = np.reshape(RGB_b, (-1, 3))
+
+            for i in range(0, RGB_f.shape[0], chunk_size):
+                c_0, c_1, c_2 = np.transpose(
+                    np.reshape(
+                        self.RGB_to_coefficients(RGB_f[i:i + chunk_size]),
+                        (-1, 3, 1)),
+                    (1, 0, 2))
+
+                U = c_0 * wavelengths
+                U += c_1
+                U *= wavelengths
+                U += c_2
+
+                R_c = U / (2 * np.sqrt(1 + U ** 2))
+                R_c += 1 / 2
+
+                R_f[i:i + chunk_size] = R_c
+
+            return R
+
+        if generator:
+            return (spectral_array(RGB[i:i + rows_count])
+                    for i in range(0, RGB.shape[0], rows_count))
+
+        R = spectral_array(RGB)
+
+        return R[0] if squeeze else R
+
     def read(self, path):
         """
         Loads a lookup table from a *\\*.coeff* file.
@@ -0,0 +1,529 @@
+# -*- coding: utf-8 -*-
+"""
+Reflectance Recovery Lookup Tables
+==================================
+
+Defines objects to bake the reflectance recovery methods of
+:attr:`colour.recovery.XYZ_TO_SD_METHODS` attribute into 3D lookup tables:
+
+-   :class:`colour.recovery.LUT3D_Recovery`
+"""
+
+import numpy as np
+from functools import partial
+
+from colour.algebra import table_interpolation
+from colour.colorimetry import SpectralDistribution
+from colour.models import RGB_COLOURSPACE_sRGB, RGB_to_XYZ
+from colour.utilities import (as_float_array, batch, domain_range_scale,
+                              message_box, multiprocessing_pool, to_domain_1,
+                              usage_warning)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['LUT3D_Recovery']
+
+
+def _recover_spectral_array(XYZ, method, kwargs):
+    """
+    Recovers the spectral reflectance values of given *CIE XYZ* tristimulus
+    values array with given :attr:`colour.recovery.XYZ_TO_SD_METHODS`
+    attribute method.
+
+    Samples for which the method raises a :class:`RuntimeError` exception
+    are set to *NaN*.
+
+    Parameters
+    ----------
+    XYZ : array_like, (N, 3)
+        *CIE XYZ* tristimulus values.
+    method : unicode
+        Reflectance recovery method.
+    kwargs : dict
+        Keywords arguments for :func:`colour.recovery.XYZ_to_sd` definition.
+
+    Returns
+    -------
+    tuple
+        Wavelengths and spectral reflectance values.
+    """
+
+    from colour.recovery import XYZ_to_sd
+
+    wavelengths, R = None, []
+    with domain_range_scale('reference'):
+        for XYZ_i in XYZ:
+            try:
+                sd = XYZ_to_sd(XYZ_i, method, **kwargs)
+            except RuntimeError:
+                R.append(None)
+                continue
+
+            wavelengths = sd.wavelengths
+            R.append(sd.values)
+
+    if wavelengths is not None:
+        R = [np.full(wavelengths.shape, np.nan) if R_i is None else R_i
+             for R_i in R]
+
+    return wavelengths, R
+
+
+class LUT3D_Recovery(object):
+    """
+    Class for baking any :attr:`colour.recovery.XYZ_TO_SD_METHODS` attribute
+    method into a 3D lookup table of spectral reflectance values sampled over
+    an *RGB* colourspace or *CIE XYZ* tristimulus values grid.
+
+    The expensive reflectance recovery, e.g. *Meng et al. (2015)* method
+    optimisation, is performed once ahead of time, the lookups are then
+    performed with :func:`colour.algebra.table_interpolation` definition.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.recovery.LUT3D_Recovery.method`
+    -   :attr:`~colour.recovery.LUT3D_Recovery.space`
+    -   :attr:`~colour.recovery.LUT3D_Recovery.size`
+    -   :attr:`~colour.recovery.LUT3D_Recovery.wavelengths`
+    -   :attr:`~colour.recovery.LUT3D_Recovery.table`
+    -   :attr:`~colour.recovery.LUT3D_Recovery.mean`
+    -   :attr:`~colour.recovery.LUT3D_Recovery.basis_functions`
+
+    Methods
+    -------
+    -   :meth:`~colour.recovery.LUT3D_Recovery.__init__`
+    -   :meth:`~colour.recovery.LUT3D_Recovery.generate`
+    -   :meth:`~colour.recovery.LUT3D_Recovery.spectral_array`
+    -   :meth:`~colour.recovery.LUT3D_Recovery.sd`
+    -   :meth:`~colour.recovery.LUT3D_Recovery.read`
+    -   :meth:`~colour.recovery.LUT3D_Recovery.write`
+
+    Examples
+    --------
+    >>> from colour.utilities import numpy_print_options
+    >>> LUT = LUT3D_Recovery()
+    >>> LUT.generate('Smits 1999', size=5, print_callable=lambda x: x)
+    >>> LUT.table.shape
+    (5, 5, 5, 10)
+    >>> RGB = np.array([[0.70573936, 0.19248266, 0.22354169],
+    ...                 [0.19248266, 0.22354169, 0.70573936]])
+    >>> with numpy_print_options(suppress=True):
+    ...     LUT.spectral_array(RGB)[:, ::3]  # doctest: +ELLIPSIS
+    array([[ 0.2782076...,  0.2099937...,  0.5219119...,  0.5898955...],
+           [ 0.7739873...,  0.4135977...,  0.1717145...,  0.1857187...]])
+    """
+
+    def __init__(self):
+        self._method = None
+        self._space = None
+        self._wavelengths = None
+        self._table = None
+        self._mean = None
+        self._basis_functions = None
+
+    @property
+    def method(self):
+        """
+        Getter property for the lookup table reflectance recovery method.
+
+        Returns
+        -------
+        unicode
+            Lookup table reflectance recovery method.
+        """
+
+        return self._method
+
+    @property
+    def space(self):
+        """
+        Getter property for the lookup table sampling space, i.e. *RGB*
+        colourspace or *CIE XYZ* tristimulus values.
+
+        Returns
+        -------
+        unicode
+            Lookup table sampling space.
+        """
+
+        return self._space
+
+    @property
+    def size(self):
+        """
+        Getter property for the lookup table size, i.e. the samples count on
+        one side of the 3D table.
+
+        Returns
+        -------
+        int
+            Lookup table size.
+        """
+
+        return None if self._table is None else self._table.shape[0]
+
+    @property
+    def wavelengths(self):
+        """
+        Getter property for the lookup table spectral reflectance values
+        wavelengths.
+
+        Returns
+        -------
+        ndarray
+            Lookup table wavelengths.
+        """
+
+        return self._wavelengths
+
+    @property
+    def table(self):
+        """
+        Getter property for the lookup table, i.e. the spectral reflectance
+        values or their coefficients in the basis functions.
+
+        Returns
+        -------
+        ndarray
+            Lookup table.
+        """
+
+        return self._table
+
+    @property
+    def mean(self):
+        """
+        Getter property for the lookup table spectral reflectance values mean
+        used with the basis functions.
+
+        Returns
+        -------
+        ndarray
+            Lookup table spectral reflectance values mean.
+        """
+
+        return self._mean
+
+    @property
+    def basis_functions(self):
+        """
+        Getter property for the lookup table basis functions, *None* if the
+        table stores the spectral reflectance values.
+
+        Returns
+        -------
+        ndarray
+            Lookup table basis functions.
+        """
+
+        return self._basis_functions
+
+    def generate(self,
+                 method='Meng 2015',
+                 colourspace=RGB_COLOURSPACE_sRGB,
+                 size=17,
+                 space='RGB',
+                 components=None,
+                 print_callable=print,
+                 processes=None,
+                 **kwargs):
+        """
+        Generates the lookup table by recovering the spectral reflectance
+        values of each node of a regular grid with given method.
+
+        Parameters
+        ----------
+        method : unicode, optional
+            **{'Meng 2015', 'Jakob 2019', 'Mallett 2019', 'Otsu 2018',
+            'Smits 1999'}**,
+            Reflectance recovery method.
+        colourspace : RGB_Colourspace, optional
+            *RGB* colourspace of the grid, the nodes are converted to *CIE XYZ*
+            tristimulus values without chromatic adaptation.
+        size : int, optional
+            The samples count on one side of the 3D table.
+        space : unicode, optional
+            **{'RGB', 'XYZ'}**,
+            Sampling space, the grid spans the unit cube either in the *RGB*
+            colourspace or in the *CIE XYZ* colourspace.
+        components : int, optional
+            If given, the spectral reflectance values are compressed with a
+            principal component analysis and the table stores the given count
+            of coefficients instead of the spectral reflectance values.
+        print_callable : callable, optional
+            Callable used to print progress and diagnostic information.
+        processes : int, optional
+            Processes count used to recover the spectral reflectance values,
+            default to a single process.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            {:func:`colour.recovery.XYZ_to_sd`},
+            Keywords arguments for the reflectance recovery method.
+
+        Notes
+        -----
+        -   The nodes for which the method fails, e.g. *CIE XYZ* tristimulus
+            values outside the object colour solid, are set to *NaN*.
+
+        Examples
+        --------
+        >>> LUT = LUT3D_Recovery()
+        >>> LUT.generate('Smits 1999', size=3, print_callable=lambda x: x)
+        >>> LUT.table.shape
+        (3, 3, 3, 10)
+        """
+
+        if space not in ('RGB', 'XYZ'):
+            raise ValueError(
+                '"{0}" space is invalid, it must be one of {{\'RGB\', '
+                '\'XYZ\'}}!'.format(space))
+
+        samples = np.linspace(0, 1, size)
+        V_xyz = np.reshape(
+            np.transpose(np.meshgrid(samples, samples, samples,
+                                     indexing='ij'), (1, 2, 3, 0)), (-1, 3))
+
+        if space == 'RGB':
+            XYZ = RGB_to_XYZ(V_xyz, colourspace.whitepoint,
+                             colourspace.whitepoint,
+                             colourspace.matrix_RGB_to_XYZ)
+        else:
+            XYZ = V_xyz
+
+        message_box(
+            '"{0}" LUT Generation'.format(method),
+            print_callable=print_callable)
+
+        print_callable('\nRecovering {0} spectral distributions...\n'.format(
+            XYZ.shape[0]))
+
+        processes = 1 if processes is None else processes
+        recover_spectral_array = partial(
+            _recover_spectral_array, method=method, kwargs=kwargs)
+        batches = list(batch(XYZ, max(1, XYZ.shape[0] // (processes * 8))))
+        if processes > 1:
+            with multiprocessing_pool(processes) as pool:
+                results = pool.map(recover_spectral_array, batches)
+        else:
+            results = list(map(recover_spectral_array, batches))
+
+        wavelengths = [w for w, _R in results if w is not None]
+        if not wavelengths:
+            raise RuntimeError(
+                '"{0}" method failed for every node!'.format(method))
+
+        wavelengths = wavelengths[0]
+        R = np.array([
+            np.full(wavelengths.shape, np.nan) if R_i is None else R_i
+            for _w, R_b in results for R_i in R_b
+        ])
+
+        failures = np.sum(np.any(np.isnan(R), axis=-1))
+        if failures:
+            usage_warning('"{0}" method failed for {1} nodes, they have been '
+                          'set to "NaN"!'.format(method, failures))
+
+        if components is not None:
+            R_v = R[~np.any(np.isnan(R), axis=-1)]
+            mean = np.mean(R_v, axis=0)
+            basis_functions = np.linalg.svd(
+                R_v - mean, full_matrices=False)[2][:components]
+            R = np.dot(R - mean, np.transpose(basis_functions))
+        else:
+            mean = basis_functions = None
+
+        self._method = method
+        self._space = space
+        self._wavelengths = wavelengths
+        self._table = np.reshape(R, (size, size, size, -1))
+        self._mean = mean
+        self._basis_functions = basis_functions
+
+    def spectral_array(self, a, interpolation='Trilinear'):
+        """
+        Looks up given *RGB* colourspace array or *CIE XYZ* tristimulus values
+        and returns the corresponding spectral reflectance values.
+
+        Parameters
+        ----------
+        a : array_like, (..., 3)
+            *RGB* colourspace array or *CIE XYZ* tristimulus values depending
+            on the lookup table sampling space.
+        interpolation : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Table interpolation method.
+
+        Returns
+        -------
+        ndarray, (..., W)
+            Spectral reflectance values with the wavelengths on the last
+            axis.
+
+        Notes
+        -----
+
+        +------------+-----------------------+---------------+
+        | **Domain** | **Scale - Reference** | **Scale - 1** |
+        +============+=======================+===============+
+        | ``a``      | [0, 1]                | [0, 1]        |
+        +------------+-----------------------+---------------+
+
+        -   The interpolation being linear, interpolating the principal
+            components coefficients and projecting them on the basis
+            functions is equivalent to interpolating the projected spectral
+            reflectance values.
+
+        Examples
+        --------
+        >>> LUT = LUT3D_Recovery()
+        >>> LUT.generate('Smits 1999', size=3, print_callable=lambda x: x)
+        >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
+        >>> LUT.spectral_array(RGB)  # doctest: +ELLIPSIS
+        array([ 0.2737260...,  0.2596173...,  0.2503051...,  0.2043669...,  \
+0.2028710...,
+                0.2081037...,  0.5221170...,  0.5867209...,  0.5879688...,  \
+0.5890195...])
+        """
+
+        a = to_domain_1(a)
+
+        R = table_interpolation(a, self._table, interpolation)
+
+        if self._basis_functions is not None:
+            R = np.dot(R, self._basis_functions) + self._mean
+
+        return R
+
+    def sd(self, a, interpolation='Trilinear'):
+        """
+        Looks up given *RGB* colourspace array or *CIE XYZ* tristimulus values
+        and returns the corresponding spectral distribution.
+
+        Parameters
+        ----------
+        a : array_like, (3, )
+            *RGB* colourspace array or *CIE XYZ* tristimulus values depending
+            on the lookup table sampling space.
+        interpolation : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Table interpolation method.
+
+        Returns
+        -------
+        SpectralDistribution
+            Spectral distribution.
+
+        Notes
+        -----
+
+        +------------+-----------------------+---------------+
+        | **Domain** | **Scale - Reference** | **Scale - 1** |
+        +============+=======================+===============+
+        | ``a``      | [0, 1]                | [0, 1]        |
+        +------------+-----------------------+---------------+
+
+        Examples
+        --------
+        >>> from colour.utilities import numpy_print_options
+        >>> LUT = LUT3D_Recovery()
+        >>> LUT.generate('Smits 1999', size=3, print_callable=lambda x: x)
+        >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
+        >>> with numpy_print_options(suppress=True):
+        ...     LUT.sd(RGB)  # doctest: +ELLIPSIS
+        SpectralDistribution([[ 380.        ,    0.2737260...],
+                              [ 417.7778    ,    0.2596173...],
+                              [ 455.5556    ,    0.2503051...],
+                              [ 493.3333    ,    0.2043669...],
+                              [ 531.1111    ,    0.2028710...],
+                              [ 568.8889    ,    0.2081037...],
+                              [ 606.6667    ,    0.5221170...],
+                              [ 644.4444    ,    0.5867209...],
+                              [ 682.2222    ,    0.5879688...],
+                              [ 720.        ,    0.5890195...]],
+                             interpolator=CubicSplineInterpolator,
+                             interpolator_kwargs={},
+                             extrapolator=Extrapolator,
+                             extrapolator_kwargs={...})
+        """
+
+        return SpectralDistribution(
+            self.spectral_array(a, interpolation),
+            self._wavelengths,
+            name='{0} ({1}) - {2} LUT'.format(a, self._space, self._method))
+
+    def read(self, path):
+        """
+        Loads a lookup table from a *\\*.npz* file.
+
+        Parameters
+        ----------
+        path : unicode
+            Path to the file.
+
+        Examples
+        --------
+        >>> import os
+        >>> import colour
+        >>> LUT = LUT3D_Recovery()
+        >>> LUT.generate('Smits 1999', size=3, print_callable=lambda x: x)
+        >>> path = os.path.join(colour.__path__[0], 'recovery', 'tests',
+        ...                     'resources', 'sRGB_Smits1999.npz')
+        >>> LUT.write(path)  # doctest: +SKIP
+        >>> LUT.read(path)  # doctest: +SKIP
+        """
+
+        with np.load(path) as npz_file:
+            self._method = str(npz_file['method'])
+            self._space = str(npz_file['space'])
+            self._wavelengths = npz_file['wavelengths']
+            self._table = as_float_array(npz_file['table'])
+
+            if npz_file['basis_functions'].size:
+                self._mean = as_float_array(npz_file['mean'])
+                self._basis_functions = as_float_array(
+                    npz_file['basis_functions'])
+            else:
+                self._mean = self._basis_functions = None
+
+    def write(self, path):
+        """
+        Writes the lookup table to a compressed *\\*.npz* file, the table, the
+        mean and the basis functions are stored in single precision.
+
+        Parameters
+        ----------
+        path : unicode
+            Path to the file.
+
+        Examples
+        --------
+        >>> import os
+        >>> import colour
+        >>> LUT = LUT3D_Recovery()
+        >>> LUT.generate('Smits 1999', size=3, print_callable=lambda x: x)
+        >>> path = os.path.join(colour.__path__[0], 'recovery', 'tests',
+        ...                     'resources', 'sRGB_Smits1999.npz')
+        >>> LUT.write(path)  # doctest: +SKIP
+        >>> LUT.read(path)  # doctest: +SKIP
+        """
+
+        empty = np.zeros(0, dtype=np.float32)
+
+        with open(path, 'wb') as npz_file:
+            np.savez_compressed(
+                npz_file,
+                method=self._method,
+                space=self._space,
+                wavelengths=self._wavelengths,
+                table=np.float32(self._table),
+                mean=(empty if self._mean is None else np.float32(
+                    self._mean)),
+                basis_functions=(empty if self._basis_functions is None else
+                                 np.float32(self._basis_functions)))
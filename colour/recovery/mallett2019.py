@@ -8,6 +8,7 @@ Defines objects for reflectance recovery, i.e. spectral upsampling, using
 
 -   :func:`colour.recovery.spectral_primary_decomposition_Mallett2019`
 -   :func:`colour.recovery.RGB_to_sd_Mallett2019`
+-   :func:`colour.recovery.RGB_to_spectral_array_Mallett2019`
 
 References
 ----------
@@ -18,7 +19,6 @@ References
 
 import numpy as np
 from scipy.linalg import block_diag
-from scipy.optimize import Bounds, LinearConstraint, minimize
 
 from colour.colorimetry import (SpectralDistribution,
                                 MultiSpectralDistributions,
@@ -36,6 +36,7 @@ __status__ = 'Production'
 __all__ = [
     'spectral_primary_decomposition_Mallett2019',
     'RGB_to_sd_Mallett2019',
+    'RGB_to_spectral_array_Mallett2019',
 ]
 
 
@@ -153,6 +154,8 @@ def spectral_primary_decomposition_Mallett2019(
      [ 780.            0.3475263...    0.3262331...    0.3262404...]]
     """
 
+    from scipy.optimize import Bounds, LinearConstraint, minimize
+
     if illuminant.shape != cmfs.shape:
         runtime_warning(
             'Aligning "{0}" illuminant shape to "{1}" colour matching '
@@ -352,3 +355,70 @@ def RGB_to_sd_Mallett2019(
     sd.name = '{0} (RGB) - Mallett (2019)'.format(RGB)
 
     return sd
+
+
+def RGB_to_spectral_array_Mallett2019(
+        RGB,
+        basis_functions=MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019,
+        dtype=np.float32,
+        chunk_size=2 ** 16):
+    """
+    Recovers the spectral reflectance values of given *RGB* colourspace array
+    using *Mallett and Yuksel (2019)* method, e.g. to upsample a whole
+    texture.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array.
+    basis_functions : MultiSpectralDistributions
+        Basis functions for the method. The default is to use the built-in
+        *sRGB* basis functions, i.e.
+        :attr:`colour.recovery.MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019`.
+    dtype : type, optional
+        Spectral reflectance values array type.
+    chunk_size : int, optional
+        Elements count processed at once, bounding the size of the
+        intermediate arrays.
+
+    Returns
+    -------
+    ndarray, (..., W)
+        Recovered spectral reflectance values with the wavelengths of the
+        basis functions on the last axis.
+
+    References
+    ----------
+    :cite:`Mallett2019`
+
+    Examples
+    --------
+    >>> from colour.models import XYZ_to_sRGB
+    >>> from colour.utilities import numpy_print_options
+    >>> XYZ = np.array([[0.20654008, 0.12197225, 0.05136952],
+    ...                 [0.14223761, 0.23042331, 0.10498244]])
+    >>> RGB = XYZ_to_sRGB(XYZ, apply_cctf_encoding=False)
+    >>> R = RGB_to_spectral_array_Mallett2019(RGB)
+    >>> R.shape
+    (2, 81)
+    >>> with numpy_print_options(suppress=True):
+    ...     R[:, ::20]  # doctest: +ELLIPSIS
+    array([[ 0.1735531...,  0.0446834...,  0.0445902...,  0.2955145...,  \
+0.1760763...],
+           [ 0.1414481...,  0.0900461...,  0.2879862...,  0.1135753...,  \
+0.1416689...]], dtype=float32)
+    """
+
+    RGB = to_domain_1(RGB)
+
+    shape = RGB.shape
+    RGB = np.reshape(RGB, (-1, 3))
+
+    basis = np.transpose(basis_functions.values).astype(dtype)
+
+    R = np.empty((RGB.shape[0], basis.shape[-1]), dtype=dtype)
+    for i in range(0, RGB.shape[0], chunk_size):
+        np.dot(RGB[i:i + chunk_size].astype(dtype), basis,
+               out=R[i:i + chunk_size])
+
+    return np.reshape(R, shape[:-1] + basis.shape[-1:])
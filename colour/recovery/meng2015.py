@@ -7,6 +7,7 @@ Defines objects for reflectance recovery using *Meng, Simon and Hanika (2015)*
 method:
 
 -   :func:`colour.recovery.XYZ_to_sd_Meng2015`
+-   :func:`colour.recovery.XYZ_to_spectral_array_Meng2015`
 
 References
 ----------
@@ -16,7 +17,6 @@ References
 """
 
 import numpy as np
-from scipy.optimize import minimize
 
 from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS,
                                 SpectralDistribution, SpectralShape, sd_ones,
@@ -30,7 +30,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['SPECTRAL_SHAPE_MENG2015', 'XYZ_to_sd_Meng2015']
+__all__ = [
+    'SPECTRAL_SHAPE_MENG2015', 'XYZ_to_sd_Meng2015',
+    'XYZ_to_spectral_array_Meng2015'
+]
 
 SPECTRAL_SHAPE_MENG2015 = SpectralShape(360, 780, 5)
 """
@@ -40,6 +43,13 @@ of 5.
 SPECTRAL_SHAPE_MENG2015 : SpectralShape
 """
 
+_CACHE_OPERATORS_MENG2015 = None
+"""
+Cache for the operators of *Meng et al. (2015)* closed-form solver.
+
+_CACHE_OPERATORS_MENG2015 : dict
+"""
+
 
 def XYZ_to_sd_Meng2015(
         XYZ,
@@ -159,6 +169,8 @@ def XYZ_to_sd_Meng2015(
     array([ 0.2065400...,  0.1219722...,  0.0513695...])
     """
 
+    from scipy.optimize import minimize
+
     XYZ = to_domain_1(XYZ)
 
     if illuminant.shape != cmfs.shape:
@@ -213,3 +225,260 @@ def XYZ_to_sd_Meng2015(
         from_range_100(result.x * 100),
         wavelengths,
         name='{0} (XYZ) - Meng (2015)'.format(XYZ))
+
+
+def _operators_Meng2015(cmfs, illuminant):
+    """
+    Returns the operators used by the closed-form solver of
+    :func:`colour.recovery.XYZ_to_spectral_array_Meng2015` definition.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+
+    Returns
+    -------
+    tuple
+        Tuple of integration matrix :math:`C`, objective function hessian
+        :math:`H` and unconstrained solution operator :math:`K`.
+    """
+
+    global _CACHE_OPERATORS_MENG2015
+    if _CACHE_OPERATORS_MENG2015 is None:
+        _CACHE_OPERATORS_MENG2015 = {}
+
+    hash_key = tuple([hash(arg) for arg in (cmfs, illuminant)])
+    if hash_key in _CACHE_OPERATORS_MENG2015:
+        return _CACHE_OPERATORS_MENG2015[hash_key]
+
+    S = illuminant.values
+    y_bar = cmfs.values[..., 1]
+
+    # The measurement interval cancels out with the normalisation constant.
+    C = np.transpose(cmfs.values * S[..., np.newaxis]) / np.sum(y_bar * S)
+
+    bins = C.shape[-1]
+    D = np.diff(np.identity(bins), axis=0)
+    H = 2 * np.dot(np.transpose(D), D)
+
+    K = np.linalg.solve(
+        _KKT_matrix(H, C),
+        np.vstack([np.zeros([bins, 3]), np.identity(3)]))[:bins]
+
+    operators = _CACHE_OPERATORS_MENG2015[hash_key] = C, H, K
+
+    return operators
+
+
+def _KKT_matrix(H, C):
+    """
+    Returns the *Karush–Kuhn–Tucker* matrix of given hessian :math:`H` and
+    equality constraints matrix :math:`C`.
+    """
+
+    m = C.shape[0]
+
+    return np.block([[H, np.transpose(C)], [C, np.zeros([m, m])]])
+
+
+def _solve_active_set_Meng2015(XYZ, R, C, H, bounds, max_iterations):
+    """
+    Solves the bound constrained *Meng et al. (2015)* quadratic problem for
+    given *CIE XYZ* tristimulus values with a primal active-set method
+    starting from given equality constrained solution :math:`R`.
+
+    Returns *None* if the active-set method did not converge.
+    """
+
+    lower, upper = bounds
+    bins = R.size
+    tolerance = 1e-12 * max(1, np.max(np.abs(R)))
+
+    at_lower = np.zeros(bins, dtype=bool)
+    at_upper = np.zeros(bins, dtype=bool)
+    for _ in range(max_iterations):
+        at_lower |= R < lower - tolerance
+        at_upper |= R > upper + tolerance
+
+        active = at_lower | at_upper
+        free = ~active
+
+        R_a = np.where(at_lower, lower, upper)[active]
+        b = np.hstack([
+            -np.dot(H[free][:, active], R_a),
+            XYZ - np.dot(C[:, active], R_a),
+        ])
+        x = np.linalg.lstsq(_KKT_matrix(H[free][:, free], C[:, free]), b,
+                            rcond=None)[0]
+
+        R = np.empty(bins)
+        R[active] = R_a
+        R[free] = x[:-3]
+
+        if np.any(R[free] < lower - tolerance) or np.any(
+                R[free] > upper + tolerance):
+            continue
+
+        # Bound multipliers, must be positive at lower bounds and negative at
+        # upper bounds for the solution to be optimal.
+        multipliers = np.dot(H, R) + np.dot(np.transpose(C), x[-3:])
+        wrong_sign = np.where(at_lower, -multipliers, multipliers)
+        wrong_sign[free] = 0
+
+        index = np.argmax(wrong_sign)
+        if wrong_sign[index] <= tolerance * max(
+                1, np.max(np.abs(multipliers))):
+            if np.allclose(np.dot(C, R), XYZ, rtol=0, atol=1e-10):
+                return np.clip(R, lower, upper)
+
+            return None
+
+        at_lower[index] = at_upper[index] = False
+
+    return None
+
+
+def XYZ_to_spectral_array_Meng2015(
+        XYZ,
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().align(SPECTRAL_SHAPE_MENG2015),
+        illuminant=SDS_ILLUMINANTS['D65'].copy().align(
+            SPECTRAL_SHAPE_MENG2015),
+        bounds=(0, 1000),
+        max_iterations=None):
+    """
+    Recovers the spectral reflectance values of given *CIE XYZ* tristimulus
+    values array using *Meng et al. (2015)* method.
+
+    The quadratic objective function and the equality constraints of the
+    method are linear in the spectral reflectance values, thus the
+    integration matrix and the solution of the equality constrained problem
+    are computed once for given colour matching functions and illuminant.
+    The bound constraints are then enforced with an active-set method only
+    for the samples whose equality constrained solution violates them.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the spectral reflectance
+        values from.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    bounds : array_like, optional
+        Lower and upper bounds of the recovered spectral reflectance values.
+    max_iterations : int, optional
+        Maximum iterations count of the active-set method, default to twice
+        the wavelengths count. The samples that do not converge are solved
+        with :func:`scipy.optimize.minimize` definition.
+
+    Returns
+    -------
+    ndarray, (..., W)
+        Recovered spectral reflectance values with the wavelengths of the
+        colour matching functions shape on the last axis.
+
+    Raises
+    ------
+    RuntimeError
+        If the optimisation failed for a sample.
+
+    Notes
+    -----
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``XYZ``    | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    -   The results are the same as with
+        :func:`colour.recovery.XYZ_to_sd_Meng2015` definition, within the
+        tolerance of the latter optimisation.
+
+    References
+    ----------
+    :cite:`Meng2015c`
+
+    Examples
+    --------
+    >>> from colour.utilities import numpy_print_options
+    >>> XYZ = np.array([[0.20654008, 0.12197225, 0.05136952],
+    ...                 [0.14223761, 0.23042331, 0.10498244]])
+    >>> cmfs = (
+    ...     MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer'].
+    ...     copy().align(SpectralShape(360, 780, 10))
+    ... )
+    >>> illuminant = SDS_ILLUMINANTS['D65'].copy().align(cmfs.shape)
+    >>> R = XYZ_to_spectral_array_Meng2015(XYZ, cmfs, illuminant)
+    >>> R.shape
+    (2, 43)
+    >>> with numpy_print_options(suppress=True):
+    ...     R[:, ::7]  # doctest: +ELLIPSIS
+    array([[ 0.0767218...,  0.0732749...,  0.       ...,  0.1315138...,  \
+0.4306043...,
+             0.4483712...,  0.4484944...],
+           [ 0.0310613...,  0.0371384...,  0.2472496...,  0.2399652...,  \
+0.0640580...,
+             0.0535547...,  0.0534819...]])
+    """
+
+    from scipy.optimize import minimize
+
+    XYZ = to_domain_1(XYZ)
+
+    if illuminant.shape != cmfs.shape:
+        runtime_warning(
+            'Aligning "{0}" illuminant shape to "{1}" colour matching '
+            'functions shape.'.format(illuminant.name, cmfs.name))
+        illuminant = illuminant.copy().align(cmfs.shape)
+
+    C, H, K = _operators_Meng2015(cmfs, illuminant)
+    lower, upper = bounds
+    bins = C.shape[-1]
+
+    if max_iterations is None:
+        max_iterations = 2 * bins
+
+    shape = XYZ.shape
+    XYZ = np.reshape(XYZ, (-1, 3))
+
+    R = np.dot(XYZ, np.transpose(K))
+
+    tolerance = 1e-12 * np.maximum(1, np.max(np.abs(R), axis=-1))
+    violations = np.where(
+        np.any(R < lower - tolerance[..., np.newaxis], axis=-1) |
+        np.any(R > upper + tolerance[..., np.newaxis], axis=-1))[0]
+
+    for i in violations:
+        R_i = _solve_active_set_Meng2015(XYZ[i], R[i], C, H, (lower, upper),
+                                         max_iterations)
+
+        if R_i is None:
+            result = minimize(
+                lambda a: np.dot(a, np.dot(H, a)) / 2,
+                np.clip(R[i], lower, upper),
+                method='SLSQP',
+                jac=lambda a: np.dot(H, a),
+                constraints={
+                    'type': 'eq',
+                    'fun': lambda a, i=i: np.dot(C, a) - XYZ[i],
+                    'jac': lambda a: C,
+                },
+                bounds=np.tile(np.array([lower, upper]), (bins, 1)),
+                options={'ftol': 1e-10})
+
+            if not result.success:
+                raise RuntimeError(
+                    'Optimization failed for {0} after {1} iterations: '
+                    '"{2}".'.format(XYZ[i], result.nit, result.message))
+
+            R_i = result.x
+
+        R[i] = R_i
+
+    return np.reshape(R, shape[:-1] + (bins, ))
@@ -8,6 +8,7 @@ Defines objects for reflectance recovery, i.e. spectral upsampling, using
 
 -   :class:`colour.recovery.Dataset_Otsu2018`
 -   :func:`colour.recovery.XYZ_to_sd_Otsu2018`
+-   :func:`colour.recovery.XYZ_to_spectral_array_Otsu2018`
 -   :func:`colour.recovery.NodeTree_Otsu2018`
 
 References
@@ -19,22 +20,17 @@ References
 
 import numpy as np
 from collections import namedtuple
-from unittest import mock
 
 from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS,
                                 SpectralDistribution, SpectralShape,
                                 msds_to_XYZ, sd_to_XYZ)
+from colour.constants import DEFAULT_INT_DTYPE
 from colour.models import XYZ_to_xy
 from colour.recovery import (SPECTRAL_SHAPE_OTSU2018, BASIS_FUNCTIONS_OTSU2018,
                              CLUSTER_MEANS_OTSU2018, SELECTOR_ARRAY_OTSU2018)
 from colour.utilities import (as_float_array, domain_range_scale,
-                              is_tqdm_installed, message_box, runtime_warning,
-                              to_domain_1, zeros)
-
-if is_tqdm_installed():
-    from tqdm import tqdm
-else:
-    tqdm = mock.MagicMock()
+                              message_box, multiprocessing_pool,
+                              runtime_warning, to_domain_1, zeros)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -45,7 +41,8 @@ __status__ = 'Production'
 
 __all__ = [
     'Dataset_Otsu2018', 'DATASET_REFERENCE_OTSU2018', 'XYZ_to_sd_Otsu2018',
-    'PartitionAxis', 'ColourData', 'Node', 'NodeTree_Otsu2018'
+    'XYZ_to_spectral_array_Otsu2018', 'PartitionAxis', 'ColourData', 'Node',
+    'NodeTree_Otsu2018'
 ]
 
 
@@ -84,6 +81,7 @@ class Dataset_Otsu2018(object):
     -   :meth:`~colour.recovery.Dataset_Otsu2018.__init__`
     -   :meth:`~colour.recovery.Dataset_Otsu2018.select`
     -   :meth:`~colour.recovery.Dataset_Otsu2018.cluster`
+    -   :meth:`~colour.recovery.Dataset_Otsu2018.cluster_XYZ`
     -   :meth:`~colour.recovery.Dataset_Otsu2018.read`
     -   :meth:`~colour.recovery.Dataset_Otsu2018.write`
 
@@ -120,6 +118,8 @@ class Dataset_Otsu2018(object):
         self._means = as_float_array(means)
         self._selector_array = selector_array
 
+        self._cache_cluster_XYZ = {}
+
     @property
     def shape(self):
         """
@@ -194,29 +194,45 @@ class Dataset_Otsu2018(object):
 
         Parameters
         ----------
-        xy : array_like, (2,)
+        xy : array_like, (..., 2)
             *CIE xy* chromaticity coordinates.
 
         Returns
         -------
-        int
+        int or ndarray
             Cluster index.
+
+        Notes
+        -----
+        -   The selector array tree is walked for all the given *CIE xy*
+            chromaticity coordinates at once.
         """
 
-        i = 0
-        while True:
-            row = self._selector_array[i, :]
-            direction, origin, lesser_index, greater_index = row
+        xy = as_float_array(xy)
 
-            if xy[int(direction)] <= origin:
-                index = int(lesser_index)
-            else:
-                index = int(greater_index)
+        shape = xy.shape[:-1]
+        xy = np.reshape(xy, (-1, 2))
 
-            if index < 0:
-                i = -index
-            else:
-                return index
+        rows = np.zeros(xy.shape[0], dtype=DEFAULT_INT_DTYPE)
+        indexes = np.empty(xy.shape[0], dtype=DEFAULT_INT_DTYPE)
+        active = np.arange(xy.shape[0])
+        while active.size:
+            direction, origin, lesser_index, greater_index = np.transpose(
+                self._selector_array[rows[active]])
+
+            index = np.where(
+                xy[active, direction.astype(DEFAULT_INT_DTYPE)] <= origin,
+                lesser_index, greater_index).astype(DEFAULT_INT_DTYPE)
+
+            leaves = index >= 0
+            indexes[active[leaves]] = index[leaves]
+
+            active = active[~leaves]
+            rows[active] = -index[~leaves]
+
+        indexes = np.reshape(indexes, shape)
+
+        return int(indexes) if indexes.ndim == 0 else indexes
 
     def cluster(self, xy):
         """
@@ -225,14 +241,14 @@ class Dataset_Otsu2018(object):
 
         Parameters
         ----------
-        xy : array_like, (2,)
+        xy : array_like, (..., 2)
             *CIE xy* chromaticity coordinates.
 
         Returns
         -------
-        basis_functions : ndarray, (3, n)
+        basis_functions : ndarray, (..., 3, n)
             Three basis functions.
-        mean : ndarray, (n,)
+        mean : ndarray, (..., n)
             Dataset mean.
         """
 
@@ -240,6 +256,54 @@ class Dataset_Otsu2018(object):
 
         return self._basis_functions[index, :, :], self._means[index, :]
 
+    def cluster_XYZ(self, cmfs, illuminant):
+        """
+        Returns the inverse of the basis functions tristimulus values matrix
+        and the mean tristimulus values of every cluster for given colour
+        matching functions and illuminant.
+
+        The matrices are computed once per colour matching functions and
+        illuminant and cached.
+
+        Parameters
+        ----------
+        cmfs : XYZ_ColourMatchingFunctions
+            Standard observer colour matching functions.
+        illuminant : SpectralDistribution
+            Illuminant spectral distribution.
+
+        Returns
+        -------
+        M_inverse : ndarray, (n, 3, 3)
+            Inverse of the basis functions tristimulus values matrix of every
+            cluster.
+        XYZ_mu : ndarray, (n, 3)
+            Mean tristimulus values of every cluster.
+        """
+
+        hash_key = tuple([hash(arg) for arg in (cmfs, illuminant)])
+        if hash_key in self._cache_cluster_XYZ:
+            return self._cache_cluster_XYZ[hash_key]
+
+        wavelengths = self._shape.range()
+        M = np.empty((self._basis_functions.shape[0], 3, 3))
+        XYZ_mu = np.empty((self._basis_functions.shape[0], 3))
+        with domain_range_scale('ignore'):
+            for i, (basis_functions, mean) in enumerate(
+                    zip(self._basis_functions, self._means)):
+                for j in range(3):
+                    sd = SpectralDistribution(basis_functions[j, :],
+                                              wavelengths)
+                    M[i, :, j] = sd_to_XYZ(sd, cmfs, illuminant) / 100
+
+                sd = SpectralDistribution(mean, wavelengths)
+                XYZ_mu[i] = sd_to_XYZ(sd, cmfs, illuminant) / 100
+
+        cluster_XYZ = self._cache_cluster_XYZ[hash_key] = (np.linalg.inv(M),
+                                                           XYZ_mu)
+
+        return cluster_XYZ
+
     def read(self, path):
         """
         Reads and loads a dataset from an *.npz* file.
@@ -284,6 +348,7 @@ class Dataset_Otsu2018(object):
         self._basis_functions = npz['basis_functions']
         self._means = npz['means']
         self._selector_array = npz['selector_array']
+        self._cache_cluster_XYZ = {}
 
         n, three, m = self._basis_functions.shape
         if (three != 3 or self._means.shape != (n, m) or
@@ -439,28 +504,205 @@ def XYZ_to_sd_Otsu2018(
     XYZ = to_domain_1(XYZ)
     xy = XYZ_to_xy(XYZ)
 
-    basis_functions, mean = dataset.cluster(xy)
+    index = dataset.select(xy)
+    M_inverse, XYZ_mu = dataset.cluster_XYZ(cmfs, illuminant)
 
-    M = np.empty((3, 3))
-    for i in range(3):
-        sd = SpectralDistribution(basis_functions[i, :], dataset.shape.range())
+    weights = np.dot(M_inverse[index], XYZ - XYZ_mu[index])
+    recovered_sd = (np.dot(weights, dataset.basis_functions[index]) +
+                    dataset.means[index])
 
-        with domain_range_scale('ignore'):
-            M[:, i] = sd_to_XYZ(sd, cmfs, illuminant) / 100
+    recovered_sd = np.clip(recovered_sd, 0, 1) if clip else recovered_sd
+
+    return SpectralDistribution(recovered_sd, dataset.shape.range())
 
-    M_inverse = np.linalg.inv(M)
 
-    sd = SpectralDistribution(mean, dataset.shape.range())
+def XYZ_to_spectral_array_Otsu2018(
+        XYZ,
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().align(SPECTRAL_SHAPE_OTSU2018),
+        illuminant=SDS_ILLUMINANTS['D65'].copy().align(
+            SPECTRAL_SHAPE_OTSU2018),
+        dataset=DATASET_REFERENCE_OTSU2018,
+        clip=True):
+    """
+    Recovers the spectral reflectance values of given *CIE XYZ* tristimulus
+    values array using *Otsu et al. (2018)* method, e.g. to upsample a colour
+    chart or an image.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the spectral reflectance
+        values from.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    dataset : Dataset_Otsu2018, optional
+        Dataset to use for reconstruction. The default is to use the published
+        data.
+    clip : bool, optional
+        If *True*, the default, values below zero and above unity in the
+        recovered spectral reflectance values will be clipped.
 
-    with domain_range_scale('ignore'):
-        XYZ_mu = sd_to_XYZ(sd, cmfs, illuminant) / 100
+    Returns
+    -------
+    ndarray, (..., W)
+        Recovered spectral reflectance values with the wavelengths of the
+        dataset shape on the last axis.
 
-    weights = np.dot(M_inverse, XYZ - XYZ_mu)
-    recovered_sd = np.dot(weights, basis_functions) + mean
+    Notes
+    -----
+    -   The clusters of all the *CIE XYZ* tristimulus values are selected at
+        once and the spectral reflectance values are reconstructed cluster by
+        cluster, the results are the same as with
+        :func:`colour.recovery.XYZ_to_sd_Otsu2018` definition.
 
-    recovered_sd = np.clip(recovered_sd, 0, 1) if clip else recovered_sd
+    References
+    ----------
+    :cite:`Otsu2018`
 
-    return SpectralDistribution(recovered_sd, dataset.shape.range())
+    Examples
+    --------
+    >>> from colour.utilities import numpy_print_options
+    >>> XYZ = np.array([[0.20654008, 0.12197225, 0.05136952],
+    ...                 [0.14223761, 0.23042331, 0.10498244]])
+    >>> cmfs = (
+    ...     MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer'].
+    ...     copy().align(SPECTRAL_SHAPE_OTSU2018)
+    ... )
+    >>> illuminant = SDS_ILLUMINANTS['D65'].copy().align(cmfs.shape)
+    >>> R = XYZ_to_spectral_array_Otsu2018(XYZ, cmfs, illuminant)
+    >>> R.shape
+    (2, 36)
+    >>> with numpy_print_options(suppress=True):
+    ...     R[:, ::7]  # doctest: +ELLIPSIS
+    array([[ 0.0601939...,  0.0493782...,  0.0416912...,  0.1334277...,  \
+0.6610548...,
+             0.7234334...],
+           [ 0.0692716...,  0.0634256...,  0.3182707...,  0.1624802...,  \
+0.0784949...,
+             0.1032744...]])
+    """
+
+    XYZ = to_domain_1(XYZ)
+    xy = XYZ_to_xy(XYZ)
+
+    indexes = dataset.select(xy)
+    M_inverse, XYZ_mu = dataset.cluster_XYZ(cmfs, illuminant)
+
+    R = np.empty(XYZ.shape[:-1] + dataset.means.shape[-1:])
+    for index in np.unique(indexes):
+        mask = indexes == index
+
+        weights = np.einsum('ij,...j->...i', M_inverse[index],
+                            XYZ[mask] - XYZ_mu[index])
+        R[mask] = (np.dot(weights, dataset.basis_functions[index]) +
+                   dataset.means[index])
+
+    if clip:
+        np.clip(R, 0, 1, out=R)
+
+    return R
+
+
+def _reconstruction_error(reflectances, XYZ, mean, basis_functions,
+                          M_inverse, XYZ_mu):
+    """
+    Returns the summed squared error between given reflectances and their
+    reconstruction from given *CIE XYZ* tristimulus values with given
+    *Principal Component Analysis* (PCA) results.
+
+    Parameters
+    ----------
+    reflectances : ndarray, (n, m)
+        Reflectances.
+    XYZ : ndarray, (n, 3)
+        *CIE XYZ* tristimulus values of the reflectances.
+    mean : ndarray, (m, )
+        Reflectances mean.
+    basis_functions : ndarray, (3, m)
+        Three basis functions.
+    M_inverse : ndarray, (3, 3)
+        Inverse of the basis functions tristimulus values matrix.
+    XYZ_mu : ndarray, (3, )
+        Reflectances mean tristimulus values.
+
+    Returns
+    -------
+    float
+        Reconstruction error.
+    """
+
+    weights = np.dot(XYZ - XYZ_mu, np.transpose(M_inverse))
+    recovered_reflectances = np.dot(weights, basis_functions)
+    recovered_reflectances += mean
+    np.clip(recovered_reflectances, 0, 1, out=recovered_reflectances)
+    recovered_reflectances -= reflectances
+
+    return np.einsum('ij,ij->', recovered_reflectances,
+                     recovered_reflectances)
+
+
+def _partition_reconstruction_errors(arguments):
+    """
+    Returns the reconstruction errors of the partitions of given sorted
+    reflectances at given positions, i.e. the sum of the reconstruction errors
+    of the reflectances before and after each position.
+
+    The running sums and scatter matrices of the reflectances before each
+    position are updated incrementally.
+
+    Parameters
+    ----------
+    arguments : tuple
+        Sorted reflectances :math:`(n, m)`, their *CIE XYZ* tristimulus values
+        :math:`(n, 3)`, increasing partitions positions and the
+        :math:`(m, 3)` reflectances to *CIE XYZ* tristimulus values matrix.
+
+    Returns
+    -------
+    ndarray
+        Partitions reconstruction errors.
+    """
+
+    reflectances, XYZ, positions, matrix_XYZ = arguments
+
+    # Data is centred on its mean to reduce the cancellation errors of the
+    # running scatter matrices.
+    centre = np.mean(reflectances, axis=0)
+    data = reflectances - centre
+    sum_t, scatter_t = np.sum(data, axis=0), np.dot(np.transpose(data), data)
+
+    sum_l, scatter_l = zeros(data.shape[-1]), zeros([data.shape[-1]] * 2)
+    position_p = 0
+    errors = np.empty(len(positions))
+    for i, position in enumerate(positions):
+        data_p = data[position_p:position]
+        sum_l += np.sum(data_p, axis=0)
+        scatter_l += np.dot(np.transpose(data_p), data_p)
+        position_p = position
+
+        errors[i] = 0
+        for sum_p, scatter_p, samples in (
+            (sum_l, scatter_l, slice(0, position)),
+            (sum_t - sum_l, scatter_t - scatter_l, slice(position, None)),
+        ):
+            reflectances_p, XYZ_p = reflectances[samples], XYZ[samples]
+
+            mean_p = sum_p / len(reflectances_p)
+            _eigenvalues, eigenvectors = np.linalg.eigh(
+                scatter_p - np.outer(sum_p, mean_p))
+            basis_functions = np.transpose(eigenvectors[:, -3:])
+
+            mean_p = mean_p + centre
+            M = np.transpose(np.dot(basis_functions, matrix_XYZ))
+
+            errors[i] += _reconstruction_error(
+                reflectances_p, XYZ_p, mean_p, basis_functions,
+                np.linalg.inv(M), np.dot(mean_p, matrix_XYZ))
+
+    return errors
 
 
 class PartitionAxis(namedtuple('PartitionAxis', ('origin', 'direction'))):
@@ -1015,12 +1257,9 @@ class Node(object):
         if self._M is None:
             self.PCA()
 
-        error = 0
-        for i in range(len(self.colour_data)):
-            sd = self.colour_data.reflectances[i, :]
-            XYZ = self.colour_data.XYZ[i, :]
-            recovered_sd = self.reconstruct(XYZ)
-            error += np.sum((sd - recovered_sd.values) ** 2)
+        error = _reconstruction_error(
+            self.colour_data.reflectances, self.colour_data.XYZ, self._mean,
+            self._basis_functions, self._M_inverse, self._XYZ_mu)
 
         self._cached_leaf_reconstruction_error = error
 
@@ -1082,10 +1321,16 @@ class Node(object):
 
         return error, (lesser, greater)
 
-    def find_best_partition(self):
+    def find_best_partition(self, processes=None):
         """
         Finds the best partition for the node.
 
+        Parameters
+        ----------
+        processes : int, optional
+            Number of processes the candidate partitions are evaluated
+            across, they are evaluated in the current process if *None* or 1.
+
         Returns
         -------
         partition_error : float
@@ -1095,36 +1340,90 @@ class Node(object):
             two half-planes.
         partition : tuple
             Nodes created by splitting a node with a given partition.
+
+        Notes
+        -----
+        -   Every sample *CIE xy* coordinates are candidate partition axes
+            origins. The colour data is sorted once along each axis and the
+            candidate partitions are swept in order while maintaining the
+            running sums and scatter matrices required by the
+            *Principal Component Analysis* (PCA), yielding the same partition
+            as evaluating every candidate with
+            :meth:`colour.recovery.otsu2018.Node.\
+partition_reconstruction_error` method.
         """
 
         if self._best_partition is not None:
             return self._best_partition
 
         leaf_error = self.leaf_reconstruction_error()
-        best_error = None
 
-        with tqdm(total=2 * len(self.colour_data)) as progress:
-            for direction in [0, 1]:
-                for i in range(len(self.colour_data)):
-                    progress.update()
-                    origin = self.colour_data.xy[i, direction]
-                    axis = PartitionAxis(origin, direction)
-
-                    try:
-                        partition_error, partition = (
-                            self.partition_reconstruction_error(axis))
-                    except RuntimeError:
-                        continue
+        reflectances = self.colour_data.reflectances
+        XYZ = self.colour_data.XYZ
+        count = len(self.colour_data)
+        minimum_cluster_size = self._tree.minimum_cluster_size
+        matrix_XYZ = self._tree.msds_to_XYZ(
+            np.identity(reflectances.shape[-1]))
+
+        processes = 1 if processes is None else processes
+
+        sweeps, arguments = [], []
+        for direction in [0, 1]:
+            values = self.colour_data.xy[:, direction]
+            order = np.argsort(values, kind='mergesort')
+            values = values[order]
+
+            # The lesser partitions are the sorted samples prefixes up to
+            # the last occurrence of each value, "indexes" are the first
+            # samples having those values, i.e. the first candidates of the
+            # exhaustive search yielding the partitions.
+            starts = np.hstack([0, np.flatnonzero(np.diff(values) != 0) + 1])
+            positions = np.hstack([starts[1:], count])
+            indexes = np.minimum.reduceat(order, starts)
+            valid = np.logical_and(positions >= minimum_cluster_size,
+                                   count - positions >= minimum_cluster_size)
+            positions, indexes = positions[valid], indexes[valid]
+
+            if positions.size == 0:
+                continue
+
+            sweeps.append((direction, values[positions - 1], indexes))
+            arguments.append([
+                (reflectances[order], XYZ[order], positions_p, matrix_XYZ)
+                for positions_p in np.array_split(
+                    positions, min(processes, positions.size))
+            ])
 
-                    if partition_error >= leaf_error:
-                        continue
+        if processes > 1:
+            with multiprocessing_pool(processes) as pool:
+                errors = pool.map(_partition_reconstruction_errors,
+                                  [a for a_d in arguments for a in a_d])
+        else:
+            errors = [
+                _partition_reconstruction_errors(a) for a_d in arguments
+                for a in a_d
+            ]
+
+        # Candidates are stored as "(error, direction, index, origin)" so that
+        # ties are resolved in the exhaustive search order.
+        candidates = []
+        for (direction, origins, indexes), arguments_d in zip(
+                sweeps, arguments):
+            errors_d = np.hstack(errors[:len(arguments_d)])
+            errors = errors[len(arguments_d):]
+
+            for error, index, origin in zip(errors_d, indexes, origins):
+                if error < leaf_error:
+                    candidates.append((error, direction, index, origin))
+
+        if not candidates:
+            raise RuntimeError('Could not find a best partition!')
 
-                    if best_error is None or partition_error < best_error:
-                        self._best_partition = (partition_error, axis,
-                                                partition)
+        _error, direction, _index, origin = min(candidates)
+        axis = PartitionAxis(origin, direction)
+        partition_error, partition = self.partition_reconstruction_error(axis)
 
-        if self._best_partition is None:
-            raise RuntimeError('Could not find a best partition!')
+        self._best_partition = (partition_error, axis, partition)
 
         return self._best_partition
 
@@ -1413,7 +1712,8 @@ class NodeTree_Otsu2018(Node):
     def optimise(self,
                  iterations=8,
                  minimum_cluster_size=None,
-                 print_callable=print):
+                 print_callable=print,
+                 processes=None):
         """
         Optimises the tree by repeatedly performing optimal partitioning of the
         nodes, creating a tree that minimizes the total reconstruction error.
@@ -1431,6 +1731,10 @@ class NodeTree_Otsu2018(Node):
             *Principal Component Analysis* (PCA) will not be possible.
         print_callable : callable, optional
             Callable used to print progress and diagnostic information.
+        processes : int, optional
+            Number of processes the candidate partitions of the nodes are
+            evaluated across, they are evaluated in the current process if
+            *None* or 1.
 
         Examples
         --------
@@ -1464,24 +1768,24 @@ class NodeTree_Otsu2018(Node):
         Optimising "NodeTree_Otsu2018(1 Node)"...
         <BLANKLINE>
         Split "NodeTree_Otsu2018(1 Node)" into \
-"Node#...(ColourData(10 Reflectances))" and \
-"Node#...(ColourData(14 Reflectances))" along "\
-PartitionAxis(horizontal partition at y = 0.3240945...)".
-        Error is reduced by 0.0054840... and is now 4.8650513..., \
-99.9% of the initial error.
+"Node#...(ColourData(15 Reflectances))" and \
+"Node#...(ColourData(9 Reflectances))" along "\
+PartitionAxis(horizontal partition at y = 0.3308236...)".
+        Error is reduced by 1.7835346... and is now 3.0870007..., \
+63.4% of the initial error.
         <BLANKLINE>
         Iteration 2 of 2:
         <BLANKLINE>
-        Optimising "Node#...(ColourData(10 Reflectances))"...
+        Optimising "Node#...(ColourData(15 Reflectances))"...
+        Optimising "Node#...(ColourData(9 Reflectances))"...
         Optimisation failed: Could not find a best partition!
-        Optimising "Node#...(ColourData(14 Reflectances))"...
         <BLANKLINE>
-        Split "Node#...(ColourData(14 Reflectances))" into \
+        Split "Node#...(ColourData(15 Reflectances))" into \
 "Node#...(ColourData(7 Reflectances))" and \
-"Node#...(ColourData(7 Reflectances))" along \
-"PartitionAxis(horizontal partition at y = 0.3600663...)".
-        Error is reduced by 0.9681059... and is now 3.8969453..., \
-80.0% of the initial error.
+"Node#...(ColourData(8 Reflectances))" along \
+"PartitionAxis(vertical partition at x = 0.3077738...)".
+        Error is reduced by 0.9955437... and is now 2.0914569..., \
+42.9% of the initial error.
         Node tree optimisation is complete!
         >>> len(node_tree)
         3
@@ -1515,7 +1819,7 @@ PartitionAxis(horizontal partition at y = 0.3240945...)".
 
                 try:
                     partition_error, axis, partition = (
-                        leaf.find_best_partition())
+                        leaf.find_best_partition(processes))
                 except RuntimeError as error:
                     print_callable('Optimisation failed: {0}'.format(error))
                     continue
@@ -1544,7 +1848,7 @@ PartitionAxis(horizontal partition at y = 0.3240945...)".
             print_callable(
                 'Error is reduced by {0} and is now {1}, '
                 '{2:.1f}% of the initial error.'.format(
-                    leaf.leaf_reconstruction_error() - partition_error,
+                    total_error - optimised_total_error,
                     optimised_total_error,
                     100 * optimised_total_error / initial_branch_error))
 
@@ -3,7 +3,10 @@
 Smits (1999) - Reflectance Recovery
 ===================================
 
-Defines objects for reflectance recovery using *Smits (1999)* method.
+Defines objects for reflectance recovery using *Smits (1999)* method:
+
+-   :func:`colour.recovery.RGB_to_sd_Smits1999`
+-   :func:`colour.recovery.RGB_to_spectral_array_Smits1999`
 
 References
 ----------
@@ -30,7 +33,7 @@ __status__ = 'Production'
 __all__ = [
     'PRIMARIES_SMITS1999', 'CCS_WHITEPOINT_SMITS1999',
     'MATRIX_XYZ_TO_RGB_SMITS1999', 'XYZ_to_RGB_Smits1999',
-    'RGB_to_sd_Smits1999'
+    'RGB_to_sd_Smits1999', 'RGB_to_spectral_array_Smits1999'
 ]
 
 PRIMARIES_SMITS1999 = RGB_COLOURSPACE_sRGB.primaries
@@ -190,3 +193,95 @@ def RGB_to_sd_Smits1999(RGB):
             sd += red_sd * (R - G)
 
     return sd
+
+
+def RGB_to_spectral_array_Smits1999(RGB, dtype=np.float32, chunk_size=2 ** 16):
+    """
+    Recovers the spectral reflectance values of given *RGB* colourspace array
+    using *Smits (1999)* method, e.g. to upsample a whole texture.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array to recover the spectral reflectance values
+        from.
+    dtype : type, optional
+        Spectral reflectance values array type.
+    chunk_size : int, optional
+        Elements count processed at once, bounding the size of the
+        intermediate arrays.
+
+    Returns
+    -------
+    ndarray, (..., W)
+        Recovered spectral reflectance values with the wavelengths of
+        :attr:`colour.recovery.SDS_SMITS1999` spectral distributions on the
+        last axis.
+
+    Notes
+    -----
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``RGB``    | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    -   The branches of :func:`colour.recovery.RGB_to_sd_Smits1999`
+        definition are expressed as weights of the *white*, *cyan*,
+        *magenta*, *yellow*, *red*, *green* and *blue* basis: the minimum
+        channel weights the *white* basis, the difference between the middle
+        and minimum channels weights the secondary basis excluding the
+        minimum channel and the difference between the maximum and middle
+        channels weights the primary basis of the maximum channel.
+
+    References
+    ----------
+    :cite:`Smits1999a`
+
+    Examples
+    --------
+    >>> from colour.utilities import numpy_print_options
+    >>> XYZ = np.array([[0.21781186, 0.12541048, 0.04697113],
+    ...                 [0.09041425, 0.12541048, 0.21781186]])
+    >>> RGB = XYZ_to_RGB_Smits1999(XYZ)
+    >>> with numpy_print_options(suppress=True):
+    ...     RGB_to_spectral_array_Smits1999(RGB)  # doctest: +ELLIPSIS
+    array([[ 0.0769192...,  0.0587005...,  0.0394319...,  0.0302497...,  \
+0.0275069...,
+             0.0280864...,  0.3429898...,  0.4118579...,  0.4118579...,  \
+0.4118075...],
+           [ 0.2257618...,  0.2208719...,  0.2237734...,  0.1871291...,  \
+0.1653556...,
+             0.1653515...,  0.0199965..., -0.0045344..., -0.0037874..., \
+-0.0037023...]], dtype=float32)
+    """
+
+    RGB = to_domain_1(RGB)
+
+    shape = RGB.shape
+    RGB = np.reshape(RGB, (-1, 3))
+
+    basis = np.array([
+        SDS_SMITS1999[name].values
+        for name in ('white', 'cyan', 'magenta', 'yellow', 'red', 'green',
+                     'blue')
+    ])
+
+    R = np.empty((RGB.shape[0], basis.shape[-1]), dtype=dtype)
+    for i in range(0, RGB.shape[0], chunk_size):
+        RGB_c = RGB[i:i + chunk_size]
+        indexes = np.arange(RGB_c.shape[0])
+
+        sort = np.argsort(RGB_c, axis=-1, kind='stable')
+        c_min, c_mid, c_max = np.transpose(
+            np.take_along_axis(RGB_c, sort, axis=-1))
+
+        weights = np.zeros((RGB_c.shape[0], basis.shape[0]))
+        weights[..., 0] = c_min
+        weights[indexes, 1 + sort[..., 0]] = c_mid - c_min
+        weights[indexes, 4 + sort[..., 2]] = c_max - c_mid
+
+        R[i:i + chunk_size] = np.dot(weights, basis)
+
+    return np.reshape(R, shape[:-1] + basis.shape[-1:])
@@ -11,7 +11,8 @@ import unittest
 
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_to_XYZ)
+                                MSDS_CMFS_STANDARD_OBSERVER, SpectralShape,
+                                sd_to_XYZ)
 from colour.difference import JND_CIE1976, delta_E_CIE1976
 from colour.models import RGB_COLOURSPACE_sRGB, RGB_to_XYZ, XYZ_to_Lab
 from colour.recovery.jakob2019 import (
@@ -233,7 +234,8 @@ class TestLUT3D_Jakob2019(unittest.TestCase):
         """
 
         required_methods = ('__init__', 'generate', 'RGB_to_coefficients',
-                            'RGB_to_sd', 'read', 'write')
+                            'RGB_to_sd', 'RGB_to_spectral_array', 'read',
+                            'write')
 
         for method in required_methods:
             self.assertIn(method, dir(LUT3D_Jakob2019))
@@ -276,6 +278,98 @@ class TestLUT3D_Jakob2019(unittest.TestCase):
                 self.fail('Delta E for RGB={0} in colourspace {1} is {2}!'
                           .format(RGB, self._RGB_colourspace.name, error))
 
+    def test_RGB_to_spectral_array(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.\
+RGB_to_spectral_array` method.
+        """
+
+        cmfs = self._cmfs.copy().align(SpectralShape(360, 780, 10))
+        sd_D65 = self._sd_D65.copy().align(cmfs.shape)
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(self._RGB_colourspace, cmfs, sd_D65, 3, lambda x: x)
+
+        RGB = np.random.RandomState(4).random_sample([5, 7, 3])
+        R = LUT.RGB_to_spectral_array(RGB, chunk_size=8)
+
+        self.assertEqual(R.shape, (5, 7, len(self._shape.range())))
+        self.assertEqual(R.dtype, np.float32)
+
+        for i, j in np.ndindex(5, 7):
+            np.testing.assert_almost_equal(
+                R[i, j], LUT.RGB_to_sd(RGB[i, j]).values, decimal=7)
+
+        np.testing.assert_almost_equal(
+            LUT.RGB_to_spectral_array(RGB[0, 0]), R[0, 0], decimal=7)
+
+        np.testing.assert_equal(
+            np.concatenate(
+                list(
+                    LUT.RGB_to_spectral_array(
+                        RGB, chunk_size=8, generator=True))), R)
+
+    def test_generate(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.generate`
+        method multiprocessing and checkpoints support.
+        """
+
+        cmfs = self._cmfs.copy().align(SpectralShape(360, 780, 10))
+        sd_D65 = self._sd_D65.copy().align(cmfs.shape)
+        arguments = (self._RGB_colourspace, cmfs, sd_D65, 3, lambda x: x)
+
+        LUT_r = LUT3D_Jakob2019()
+        LUT_r.generate(*arguments)
+
+        path = os.path.join(self._temporary_directory, 'Checkpoint.npz')
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(*arguments, processes=2, checkpoint_path=path)
+        np.testing.assert_equal(LUT.coefficients, LUT_r.coefficients)
+
+        # Simulating an interrupted generation: the first cube face has
+        # been generated, its coefficients must not be generated again.
+        with np.load(path) as checkpoint:
+            coefficients = checkpoint['coefficients']
+            done = checkpoint['done']
+            checksum = checkpoint['checksum']
+
+        coefficients[0] = 1
+        coefficients[1:] = 0
+        done[1:] = False
+        np.savez(
+            path, coefficients=coefficients, done=done, checksum=checksum)
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(*arguments, checkpoint_path=path)
+        np.testing.assert_equal(LUT.coefficients[0], 1)
+        np.testing.assert_equal(LUT.coefficients[1:],
+                                LUT_r.coefficients[1:])
+
+    def test_raise_exception_generate(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.generate`
+        method raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'Checkpoint.npz')
+        np.savez(
+            path,
+            coefficients=zeros([3, 3, 3, 3, 3]),
+            done=np.zeros([3, 3, 3], dtype=np.bool_),
+            checksum='')
+
+        self.assertRaises(
+            ValueError,
+            LUT3D_Jakob2019().generate,
+            self._RGB_colourspace,
+            self._cmfs,
+            self._sd_D65,
+            3,
+            lambda x: x,
+            checkpoint_path=path)
+
 
 if __name__ == '__main__':
     unittest.main()
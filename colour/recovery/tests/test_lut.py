@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.recovery.lut` module.
+"""
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.models import RGB_COLOURSPACE_sRGB, RGB_to_XYZ
+from colour.recovery import LUT3D_Recovery, XYZ_to_sd
+from colour.utilities import domain_range_scale
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['TestLUT3D_Recovery']
+
+
+class TestLUT3D_Recovery(unittest.TestCase):
+    """
+    Defines :class:`colour.recovery.lut.LUT3D_Recovery` definition unit tests
+    methods.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Initialises common tests attributes.
+        """
+
+        cls._LUT = LUT3D_Recovery()
+        cls._LUT.generate('Smits 1999', size=3, print_callable=lambda x: x)
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('method', 'space', 'size', 'wavelengths',
+                               'table', 'mean', 'basis_functions')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LUT3D_Recovery))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'generate', 'spectral_array', 'sd',
+                            'read', 'write')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LUT3D_Recovery))
+
+    def test_generate(self):
+        """
+        Tests :meth:`colour.recovery.lut.LUT3D_Recovery.generate` method.
+        """
+
+        self.assertEqual(self._LUT.method, 'Smits 1999')
+        self.assertEqual(self._LUT.space, 'RGB')
+        self.assertEqual(self._LUT.size, 3)
+        self.assertEqual(self._LUT.table.shape, (3, 3, 3, 10))
+        self.assertIsNone(self._LUT.basis_functions)
+
+        RGB = np.array([1.0, 0.5, 0.0])
+        XYZ = RGB_to_XYZ(RGB, RGB_COLOURSPACE_sRGB.whitepoint,
+                         RGB_COLOURSPACE_sRGB.whitepoint,
+                         RGB_COLOURSPACE_sRGB.matrix_RGB_to_XYZ)
+        np.testing.assert_almost_equal(
+            self._LUT.table[2, 1, 0],
+            XYZ_to_sd(XYZ, 'Smits 1999').values,
+            decimal=7)
+
+        LUT = LUT3D_Recovery()
+        LUT.generate(
+            'Smits 1999',
+            size=3,
+            space='XYZ',
+            components=7,
+            print_callable=lambda x: x,
+            processes=2)
+        self.assertEqual(LUT.space, 'XYZ')
+        self.assertEqual(LUT.table.shape, (3, 3, 3, 7))
+        self.assertEqual(LUT.basis_functions.shape, (7, 10))
+
+        # The spectral distributions of "Smits (1999)" method span 7 basis
+        # functions, thus the table nodes are reconstructed exactly.
+        np.testing.assert_almost_equal(
+            np.dot(LUT.table[2, 1, 0], LUT.basis_functions) + LUT.mean,
+            XYZ_to_sd(np.array([1.0, 0.5, 0.0]), 'Smits 1999').values,
+            decimal=7)
+
+    def test_spectral_array(self):
+        """
+        Tests :meth:`colour.recovery.lut.LUT3D_Recovery.spectral_array`
+        method.
+        """
+
+        np.testing.assert_almost_equal(
+            self._LUT.spectral_array(np.array([1.0, 0.5, 0.0])),
+            self._LUT.table[2, 1, 0],
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            self._LUT.spectral_array(np.array([0.75, 0.5, 0.0])),
+            np.mean(self._LUT.table[1:, 1, 0], axis=0),
+            decimal=7)
+
+        RGB = np.array([
+            [0.70573936, 0.19248266, 0.22354169],
+            [0.19248266, 0.22354169, 0.70573936],
+        ])
+        for interpolation in ('Trilinear', 'Tetrahedral'):
+            R = self._LUT.spectral_array(RGB, interpolation)
+            np.testing.assert_almost_equal(
+                self._LUT.spectral_array(
+                    np.reshape(np.tile(RGB, (2, 1)), (2, 2, 3)),
+                    interpolation),
+                np.reshape(np.tile(R, (2, 1)), (2, 2, 10)),
+                decimal=7)
+
+        R = self._LUT.spectral_array(RGB)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    self._LUT.spectral_array(RGB * factor), R, decimal=7)
+
+    def test_sd(self):
+        """
+        Tests :meth:`colour.recovery.lut.LUT3D_Recovery.sd` method.
+        """
+
+        RGB = np.array([0.70573936, 0.19248266, 0.22354169])
+        sd = self._LUT.sd(RGB)
+
+        np.testing.assert_almost_equal(
+            sd.wavelengths, self._LUT.wavelengths, decimal=7)
+        np.testing.assert_almost_equal(
+            sd.values, self._LUT.spectral_array(RGB), decimal=7)
+
+    def test_raise_exception_generate(self):
+        """
+        Tests :meth:`colour.recovery.lut.LUT3D_Recovery.generate` method
+        raised exception.
+        """
+
+        self.assertRaises(ValueError, LUT3D_Recovery().generate, 'Smits 1999',
+                          size=3, space='Lab', print_callable=lambda x: x)
+
+    def test_read_write(self):
+        """
+        Tests :meth:`colour.recovery.lut.LUT3D_Recovery.read` and
+        :meth:`colour.recovery.lut.LUT3D_Recovery.write` methods.
+        """
+
+        path = os.path.join(self._temporary_directory, 'Smits1999.npz')
+        self._LUT.write(path)
+
+        LUT = LUT3D_Recovery()
+        LUT.read(path)
+
+        self.assertEqual(LUT.method, self._LUT.method)
+        self.assertEqual(LUT.space, self._LUT.space)
+        self.assertIsNone(LUT.basis_functions)
+        np.testing.assert_almost_equal(
+            LUT.table, self._LUT.table, decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.wavelengths, self._LUT.wavelengths, decimal=7)
+
+        LUT.generate(
+            'Smits 1999', size=3, components=4, print_callable=lambda x: x)
+        LUT.write(path)
+        LUT_r = LUT3D_Recovery()
+        LUT_r.read(path)
+
+        RGB = np.array([0.70573936, 0.19248266, 0.22354169])
+        np.testing.assert_almost_equal(
+            LUT_r.spectral_array(RGB), LUT.spectral_array(RGB), decimal=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
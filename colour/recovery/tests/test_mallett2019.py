@@ -14,7 +14,8 @@ from colour.models import (RGB_COLOURSPACE_PAL_SECAM, RGB_COLOURSPACE_sRGB,
                            XYZ_to_RGB, XYZ_to_Lab)
 from colour.recovery import (MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019,
                              spectral_primary_decomposition_Mallett2019,
-                             RGB_to_sd_Mallett2019)
+                             RGB_to_sd_Mallett2019,
+                             RGB_to_spectral_array_Mallett2019)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -25,7 +26,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestMixinMallett2019', 'TestSpectralPrimaryDecompositionMallett2019',
-    'TestRGB_to_sd_Mallett2019'
+    'TestRGB_to_sd_Mallett2019', 'TestRGB_to_spectral_array_Mallett2019'
 ]
 
 
@@ -138,5 +139,50 @@ class TestRGB_to_sd_Mallett2019(unittest.TestCase, TestMixinMallett2019):
         self.check_basis_functions()
 
 
+class TestRGB_to_spectral_array_Mallett2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.RGB_to_spectral_array_Mallett2019`
+    definition unit tests methods.
+    """
+
+    def test_RGB_to_spectral_array_Mallett2019(self):
+        """
+        Tests :func:`colour.recovery.RGB_to_spectral_array_Mallett2019`
+        definition.
+        """
+
+        RGB = np.random.RandomState(4).uniform(0, 1, (256, 3))
+
+        R = RGB_to_spectral_array_Mallett2019(
+            RGB, dtype=np.float64, chunk_size=100)
+        np.testing.assert_almost_equal(
+            R,
+            np.array([RGB_to_sd_Mallett2019(RGB_i).values for RGB_i in RGB]),
+            decimal=7)
+
+        R_f = RGB_to_spectral_array_Mallett2019(RGB)
+        self.assertEqual(R_f.dtype, np.float32)
+        np.testing.assert_almost_equal(R_f, R, decimal=5)
+
+    def test_n_dimensional_RGB_to_spectral_array_Mallett2019(self):
+        """
+        Tests :func:`colour.recovery.RGB_to_spectral_array_Mallett2019`
+        definition n-dimensional arrays support.
+        """
+
+        RGB = np.array([0.70573936, 0.19248266, 0.22354169])
+        R = RGB_to_spectral_array_Mallett2019(RGB)
+
+        RGB = np.tile(RGB, (6, 1))
+        R = np.tile(R, (6, 1))
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_array_Mallett2019(RGB), R, decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        R = np.reshape(R, (2, 3, -1))
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_array_Mallett2019(RGB), R, decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -8,7 +8,8 @@ import unittest
 
 from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SpectralShape,
                                 SDS_ILLUMINANTS, sd_to_XYZ_integration)
-from colour.recovery import XYZ_to_sd_Meng2015
+from colour.recovery import (XYZ_to_sd_Meng2015,
+                             XYZ_to_spectral_array_Meng2015)
 from colour.utilities import domain_range_scale
 
 __author__ = 'Colour Developers'
@@ -18,7 +19,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestXYZ_to_sd_Meng2015']
+__all__ = ['TestXYZ_to_sd_Meng2015', 'TestXYZ_to_spectral_array_Meng2015']
 
 
 class TestXYZ_to_sd_Meng2015(unittest.TestCase):
@@ -118,5 +119,116 @@ class TestXYZ_to_sd_Meng2015(unittest.TestCase):
                     decimal=7)
 
 
+class TestXYZ_to_spectral_array_Meng2015(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.meng2015.XYZ_to_spectral_array_Meng2015`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(
+                SpectralShape(360, 780, 10))
+        self._sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(self._cmfs.shape)
+
+        self._XYZ = np.array([
+            [0.20654008, 0.12197225, 0.05136952],
+            [0.14223761, 0.23042331, 0.10498244],
+            [0.07818780, 0.06157201, 0.28099326],
+            [0.52819189, 0.55880014, 0.09910606],
+        ])
+
+    def test_XYZ_to_spectral_array_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_spectral_array_Meng2015`
+        definition.
+        """
+
+        R = XYZ_to_spectral_array_Meng2015(self._XYZ, self._cmfs,
+                                           self._sd_D65)
+
+        self.assertTrue(np.all(R >= 0))
+
+        for i, XYZ in enumerate(self._XYZ):
+            sd = XYZ_to_sd_Meng2015(XYZ, self._cmfs, self._sd_D65)
+
+            np.testing.assert_almost_equal(R[i], sd.values, decimal=2)
+
+            sd[:] = R[i]
+            np.testing.assert_almost_equal(
+                sd_to_XYZ_integration(sd, self._cmfs, self._sd_D65) / 100,
+                XYZ,
+                decimal=7)
+
+            # The closed-form solution is the exact optimum.
+            self.assertLessEqual(
+                np.sum(np.diff(R[i]) ** 2),
+                np.sum(np.diff(XYZ_to_sd_Meng2015(
+                    XYZ, self._cmfs, self._sd_D65).values) ** 2) + 1e-10)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_array_Meng2015(
+                self._XYZ, self._cmfs, self._sd_D65, max_iterations=0),
+            R,
+            decimal=4)
+
+        R = XYZ_to_spectral_array_Meng2015(
+            self._XYZ, self._cmfs, self._sd_D65, bounds=(0.01, 0.9))
+        self.assertTrue(np.all(R >= 0.01) and np.all(R <= 0.9))
+
+    def test_n_dimensional_XYZ_to_spectral_array_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_spectral_array_Meng2015`
+        definition n-dimensional arrays support.
+        """
+
+        R = XYZ_to_spectral_array_Meng2015(self._XYZ, self._cmfs,
+                                           self._sd_D65)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_array_Meng2015(
+                np.reshape(self._XYZ, (2, 2, 3)), self._cmfs, self._sd_D65),
+            np.reshape(R, (2, 2, -1)),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_array_Meng2015(self._XYZ[0], self._cmfs,
+                                           self._sd_D65),
+            R[0],
+            decimal=7)
+
+    def test_raise_exception_XYZ_to_spectral_array_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_spectral_array_Meng2015`
+        definition raised exception.
+        """
+
+        self.assertRaises(RuntimeError, XYZ_to_spectral_array_Meng2015,
+                          np.array([0.0, 0.0, 1.0]), self._cmfs, self._sd_D65,
+                          (0, 1))
+
+    def test_domain_range_scale_XYZ_to_spectral_array_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_spectral_array_Meng2015`
+        definition domain and range scale support.
+        """
+
+        R = XYZ_to_spectral_array_Meng2015(self._XYZ, self._cmfs,
+                                           self._sd_D65)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    XYZ_to_spectral_array_Meng2015(
+                        self._XYZ * factor, self._cmfs, self._sd_D65),
+                    R,
+                    decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -14,9 +14,11 @@ from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
                                 MSDS_CMFS_STANDARD_OBSERVER, sd_to_XYZ)
 from colour.difference import delta_E_CIE1976
 from colour.models import XYZ_to_Lab
-from colour.recovery import (XYZ_to_sd_Otsu2018, SPECTRAL_SHAPE_OTSU2018,
-                             Dataset_Otsu2018, NodeTree_Otsu2018)
-from colour.recovery.otsu2018 import ColourData, Node
+from colour.recovery import (
+    XYZ_to_sd_Otsu2018, XYZ_to_spectral_array_Otsu2018,
+    SPECTRAL_SHAPE_OTSU2018, Dataset_Otsu2018, NodeTree_Otsu2018)
+from colour.recovery.otsu2018 import (DATASET_REFERENCE_OTSU2018,
+                                      ColourData, Node, PartitionAxis)
 from colour.utilities import domain_range_scale, metric_mse
 
 __author__ = 'Colour Developers'
@@ -27,8 +29,9 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestDataset_Otsu2018', 'TestXYZ_to_sd_Otsu2018', 'TestColourData',
-    'TestNode', 'TestNodeTree_Otsu2018'
+    'TestDataset_Otsu2018', 'TestXYZ_to_sd_Otsu2018',
+    'TestXYZ_to_spectral_array_Otsu2018', 'TestColourData', 'TestNode',
+    'TestNodeTree_Otsu2018'
 ]
 
 
@@ -54,11 +57,25 @@ class TestDataset_Otsu2018(unittest.TestCase):
         Tests presence of required methods.
         """
 
-        required_methods = ('__init__', 'select', 'cluster', 'read', 'write')
+        required_methods = ('__init__', 'select', 'cluster', 'cluster_XYZ',
+                            'read', 'write')
 
         for method in required_methods:
             self.assertIn(method, dir(Dataset_Otsu2018))
 
+    def test_select(self):
+        """
+        Tests :meth:`colour.recovery.otsu2018.Dataset_Otsu2018.select` method.
+        """
+
+        xy = np.random.RandomState(4).random_sample([6, 4, 2]) * 0.8
+        indexes = DATASET_REFERENCE_OTSU2018.select(xy)
+
+        self.assertEqual(indexes.shape, (6, 4))
+        for i, j in np.ndindex(6, 4):
+            self.assertEqual(
+                DATASET_REFERENCE_OTSU2018.select(xy[i, j]), indexes[i, j])
+
 
 class TestXYZ_to_sd_Otsu2018(unittest.TestCase):
     """
@@ -125,6 +142,86 @@ class TestXYZ_to_sd_Otsu2018(unittest.TestCase):
                     decimal=7)
 
 
+class TestXYZ_to_spectral_array_Otsu2018(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.otsu2018.XYZ_to_spectral_array_Otsu2018`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._shape = SPECTRAL_SHAPE_OTSU2018
+        self._cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(self._shape)
+
+        self._sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(self._shape)
+
+        self._XYZ = np.array([
+            sd_to_XYZ(sd, self._cmfs, self._sd_D65) / 100
+            for sd in SDS_COLOURCHECKERS['ColorChecker N Ohta'].values()
+        ])
+
+    def test_XYZ_to_spectral_array_Otsu2018(self):
+        """
+        Tests :func:`colour.recovery.otsu2018.\
+XYZ_to_spectral_array_Otsu2018` definition.
+        """
+
+        for clip in (True, False):
+            R = XYZ_to_spectral_array_Otsu2018(self._XYZ, self._cmfs,
+                                               self._sd_D65, clip=clip)
+
+            self.assertEqual(R.shape, (24, len(self._shape.range())))
+            for i, XYZ in enumerate(self._XYZ):
+                np.testing.assert_almost_equal(
+                    R[i],
+                    XYZ_to_sd_Otsu2018(
+                        XYZ, self._cmfs, self._sd_D65, clip=clip).values,
+                    decimal=7)
+
+    def test_n_dimensional_XYZ_to_spectral_array_Otsu2018(self):
+        """
+        Tests :func:`colour.recovery.otsu2018.\
+XYZ_to_spectral_array_Otsu2018` definition n-dimensional arrays support.
+        """
+
+        R = XYZ_to_spectral_array_Otsu2018(self._XYZ, self._cmfs,
+                                           self._sd_D65)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_array_Otsu2018(
+                np.reshape(self._XYZ, (4, 6, 3)), self._cmfs, self._sd_D65),
+            np.reshape(R, (4, 6, -1)),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_array_Otsu2018(self._XYZ[0], self._cmfs,
+                                           self._sd_D65),
+            R[0],
+            decimal=7)
+
+    def test_domain_range_scale_XYZ_to_spectral_array_Otsu2018(self):
+        """
+        Tests :func:`colour.recovery.otsu2018.\
+XYZ_to_spectral_array_Otsu2018` definition domain and range scale support.
+        """
+
+        R = XYZ_to_spectral_array_Otsu2018(self._XYZ, self._cmfs,
+                                           self._sd_D65)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    XYZ_to_spectral_array_Otsu2018(
+                        self._XYZ * factor, self._cmfs, self._sd_D65),
+                    R,
+                    decimal=7)
+
+
 class TestColourData(unittest.TestCase):
     """
     Defines :class:`colour.recovery.otsu2018.ColourData` definition unit tests
@@ -185,6 +282,68 @@ class TestNode(unittest.TestCase):
         for method in required_methods:
             self.assertIn(method, dir(Node))
 
+    def test_leaf_reconstruction_error(self):
+        """
+        Tests :meth:`colour.recovery.otsu2018.Node.leaf_reconstruction_error`
+        method.
+        """
+
+        reflectances = np.array([
+            sd.copy().align(SPECTRAL_SHAPE_OTSU2018).values
+            for sd in SDS_COLOURCHECKERS['ColorChecker N Ohta'].values()
+        ])
+
+        node_tree = NodeTree_Otsu2018(reflectances)
+        node_tree.PCA()
+
+        error = 0
+        for i, sd in enumerate(reflectances):
+            error += np.sum(
+                (sd - node_tree.reconstruct(node_tree.colour_data.XYZ[i])
+                 .values) ** 2)
+
+        self.assertAlmostEqual(
+            node_tree.leaf_reconstruction_error(), error, places=7)
+
+    def test_find_best_partition(self):
+        """
+        Tests :meth:`colour.recovery.otsu2018.Node.find_best_partition`
+        method against an exhaustive search.
+        """
+
+        reflectances = np.array([
+            sd.copy().align(SPECTRAL_SHAPE_OTSU2018).values
+            for colourchecker in ['ColorChecker N Ohta', 'BabelColor Average']
+            for sd in SDS_COLOURCHECKERS[colourchecker].values()
+        ])
+
+        for processes in (None, 2):
+            node_tree = NodeTree_Otsu2018(reflectances)
+            node_tree._minimum_cluster_size = 5
+
+            leaf_error = node_tree.leaf_reconstruction_error()
+            best_error, best_axis = None, None
+            for direction in [0, 1]:
+                for origin in node_tree.colour_data.xy[:, direction]:
+                    axis = PartitionAxis(origin, direction)
+                    try:
+                        error, _partition = (
+                            node_tree.partition_reconstruction_error(axis))
+                    except RuntimeError:
+                        continue
+
+                    if error < leaf_error and (best_error is None or
+                                               error < best_error):
+                        best_error, best_axis = error, axis
+
+            error, axis, partition = node_tree.find_best_partition(processes)
+
+            self.assertEqual(axis, best_axis)
+            self.assertAlmostEqual(error, best_error, places=7)
+            self.assertEqual(
+                len(partition[0].colour_data) + len(
+                    partition[1].colour_data), len(reflectances))
+
 
 class TestNodeTree_Otsu2018(unittest.TestCase):
     """
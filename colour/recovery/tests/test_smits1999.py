@@ -7,7 +7,8 @@ import numpy as np
 import unittest
 
 from colour.colorimetry import sd_to_XYZ_integration
-from colour.recovery import RGB_to_sd_Smits1999
+from colour.recovery import (RGB_to_sd_Smits1999,
+                             RGB_to_spectral_array_Smits1999)
 from colour.recovery.smits1999 import XYZ_to_RGB_Smits1999
 from colour.utilities import domain_range_scale
 
@@ -18,7 +19,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestRGB_to_sd_Smits1999']
+__all__ = ['TestRGB_to_sd_Smits1999', 'TestRGB_to_spectral_array_Smits1999']
 
 
 class TestRGB_to_sd_Smits1999(unittest.TestCase):
@@ -110,5 +111,72 @@ class TestRGB_to_sd_Smits1999(unittest.TestCase):
                     decimal=7)
 
 
+class TestRGB_to_spectral_array_Smits1999(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.smits1999.RGB_to_spectral_array_Smits1999`
+    definition unit tests methods.
+    """
+
+    def test_RGB_to_spectral_array_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_spectral_array_Smits1999`
+        definition.
+        """
+
+        RGB = np.random.RandomState(4).uniform(0, 1, (256, 3))
+        # Ties between channels exercise the branches boundaries.
+        RGB[:16, 1] = RGB[:16, 0]
+        RGB[16:32, 2] = RGB[16:32, 1]
+        RGB[32:48] = RGB[32:48, :1]
+
+        R = RGB_to_spectral_array_Smits1999(RGB, np.float64, chunk_size=100)
+        np.testing.assert_almost_equal(
+            R,
+            np.array([RGB_to_sd_Smits1999(RGB_i).values for RGB_i in RGB]),
+            decimal=7)
+
+        R_f = RGB_to_spectral_array_Smits1999(RGB)
+        self.assertEqual(R_f.dtype, np.float32)
+        np.testing.assert_almost_equal(R_f, R, decimal=5)
+
+    def test_n_dimensional_RGB_to_spectral_array_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_spectral_array_Smits1999`
+        definition n-dimensional arrays support.
+        """
+
+        RGB = XYZ_to_RGB_Smits1999(
+            np.array([0.20654008, 0.12197225, 0.05136952]))
+        R = RGB_to_spectral_array_Smits1999(RGB)
+
+        RGB = np.tile(RGB, (6, 1))
+        R = np.tile(R, (6, 1))
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_array_Smits1999(RGB), R, decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        R = np.reshape(R, (2, 3, -1))
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_array_Smits1999(RGB), R, decimal=7)
+
+    def test_domain_range_scale_RGB_to_spectral_array_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_spectral_array_Smits1999`
+        definition domain and range scale support.
+        """
+
+        RGB = XYZ_to_RGB_Smits1999(
+            np.array([0.20654008, 0.12197225, 0.05136952]))
+        R = RGB_to_spectral_array_Smits1999(RGB)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    RGB_to_spectral_array_Smits1999(RGB * factor),
+                    R,
+                    decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -22,7 +22,6 @@ References
 """
 
 import numpy as np
-from scipy.optimize import minimize
 
 from colour.colorimetry import daylight_locus_function
 from colour.utilities import as_float_array, as_numeric, tstack, usage_warning
@@ -78,6 +77,8 @@ def xy_to_CCT_CIE_D(xy, optimisation_kwargs=None, **kwargs):
     6504.3895840...
     """
 
+    from scipy.optimize import minimize
+
     xy = as_float_array(xy)
     shape = xy.shape
     xy = np.atleast_1d(xy.reshape([-1, 2]))
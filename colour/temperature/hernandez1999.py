@@ -22,7 +22,6 @@ References
 """
 
 import numpy as np
-from scipy.optimize import minimize
 
 from colour.colorimetry import CCS_ILLUMINANTS
 from colour.utilities import as_float_array, as_numeric, tsplit, usage_warning
@@ -124,6 +123,8 @@ def CCT_to_xy_Hernandez1999(CCT, optimisation_kwargs=None, **kwargs):
     array([ 0.3127...,  0.329...])
     """
 
+    from scipy.optimize import minimize
+
     usage_warning('"Hernandez-Andres et al. (1999)" method for computing '
                   '"CIE xy" chromaticity coordinates from given correlated '
                   'colour temperature is not a bijective function and and'
@@ -21,7 +21,6 @@ References
 """
 
 import numpy as np
-from scipy.optimize import minimize
 
 from colour.utilities import as_float_array, as_numeric, tstack, usage_warning
 
@@ -76,6 +75,8 @@ def xy_to_CCT_Kang2002(xy, optimisation_kwargs=None, **kwargs):
     6504.3893128...
     """
 
+    from scipy.optimize import minimize
+
     xy = as_float_array(xy)
     shape = xy.shape
     xy = np.atleast_1d(xy.reshape([-1, 2]))
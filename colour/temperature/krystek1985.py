@@ -21,7 +21,6 @@ References
 """
 
 import numpy as np
-from scipy.optimize import minimize
 
 from colour.utilities import as_float_array, as_numeric, tstack
 
@@ -82,6 +81,8 @@ def uv_to_CCT_Krystek1985(uv, optimisation_kwargs=None, **kwargs):
     6504.3894290...
     """
 
+    from scipy.optimize import minimize
+
     uv = as_float_array(uv)
     shape = uv.shape
     uv = np.atleast_1d(uv.reshape([-1, 2]))
@@ -20,7 +20,6 @@ References
 """
 
 import numpy as np
-from scipy.optimize import minimize
 
 from colour.colorimetry import CCS_ILLUMINANTS
 from colour.utilities import as_float_array, as_numeric, tsplit, usage_warning
@@ -112,6 +111,8 @@ def CCT_to_xy_McCamy1992(CCT, optimisation_kwargs=None, **kwargs):
     array([ 0.3127...,  0.329...])
     """
 
+    from scipy.optimize import minimize
+
     usage_warning('"McCamy (1992)" method for computing "CIE xy" '
                   'chromaticity coordinates from given correlated colour '
                   'temperature is not a bijective function and might produce '
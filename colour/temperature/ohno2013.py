@@ -24,10 +24,11 @@ import numpy as np
 from collections import namedtuple
 
 from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody,
-                                sd_to_XYZ)
+                                MSDS_CMFS_STANDARD_OBSERVER, planck_law,
+                                sd_blackbody, sd_to_XYZ)
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models import UCS_to_uv, XYZ_to_UCS
-from colour.utilities import as_float_array, runtime_warning, tsplit
+from colour.utilities import as_float_array, runtime_warning, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -51,6 +52,14 @@ CCT_MAXIMAL = 100000
 CCT_SAMPLES = 10
 CCT_CALCULATION_ITERATIONS = 6
 
+_CHUNK_SIZE_OHNO2013 = 2 ** 10
+"""
+Count of chromaticity coordinates processed at once, bounding the memory used
+by the planckian tables spectral computations.
+
+_CHUNK_SIZE_OHNO2013 : int
+"""
+
 
 def planckian_table(uv, cmfs, start, end, count):
     """
@@ -182,7 +191,7 @@ def _uv_to_CCT_Ohno2013(
 
     Parameters
     ----------
-    uv : array_like
+    uv : array_like, (n, 2)
         *CIE UCS* colourspace *uv* chromaticity coordinates.
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
@@ -197,37 +206,58 @@ def _uv_to_CCT_Ohno2013(
 
     Returns
     -------
-    ndarray
+    ndarray, (n, 2)
         Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
+
+    Notes
+    -----
+    -   The planckian tables of all the given chromaticity coordinates are
+        generated at once, each table row being the *uv* chromaticity
+        coordinates of the planckian radiator integrated with the colour
+        matching functions.
     """
 
+    ux, vx = tsplit(uv)
+
+    cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_DEFAULT)
+    wavelengths = cmfs.wavelengths * 1e-9
+
     # Ensuring we do at least one iteration to initialise variables.
     iterations = max(iterations, 1)
 
-    # Planckian table creation through cascade expansion.
+    start = np.full(ux.shape, start, dtype=DEFAULT_FLOAT_DTYPE)
+    end = np.full(ux.shape, end, dtype=DEFAULT_FLOAT_DTYPE)
+    samples = np.arange(ux.shape[0])
+
+    # Planckian tables creation through cascade expansion.
     for _i in range(iterations):
-        table = planckian_table(uv, cmfs, start, end, count)
-        index = planckian_table_minimal_distance_index(table)
-        if index == 0:
+        Ti = np.linspace(start, end, count, axis=-1)
+        XYZ = np.dot(
+            planck_law(wavelengths, Ti[..., np.newaxis]) * 1e-9, cmfs.values)
+        ui, vi = tsplit(UCS_to_uv(XYZ_to_UCS(XYZ)))
+        di = np.hypot(ux[..., np.newaxis] - ui, vx[..., np.newaxis] - vi)
+
+        index = np.argmin(di, axis=-1)
+        if np.any(index == 0):
             runtime_warning(
                 ('Minimal distance index is on lowest planckian table bound, '
                  'unpredictable results may occur!'))
-            index += 1
-        elif index == len(table) - 1:
+            index[index == 0] += 1
+        if np.any(index == count - 1):
             runtime_warning(
                 ('Minimal distance index is on highest planckian table bound, '
                  'unpredictable results may occur!'))
-            index -= 1
-
-        start = table[index - 1].Ti
-        end = table[index + 1].Ti
+            index[index == count - 1] -= 1
 
-    _ux, vx = uv
+        start = Ti[samples, index - 1]
+        end = Ti[samples, index + 1]
 
-    Tuvdip, Tuvdi, Tuvdin = (table[index - 1], table[index], table[index + 1])
-    Tip, uip, vip, dip = Tuvdip.Ti, Tuvdip.ui, Tuvdip.vi, Tuvdip.di
-    Ti, di = Tuvdi.Ti, Tuvdi.di
-    Tin, uin, vin, din = Tuvdin.Ti, Tuvdin.ui, Tuvdin.vi, Tuvdin.di
+    Tuvdip, Tuvdi, Tuvdin = [
+        [x[samples, index + i] for x in (Ti, ui, vi, di)] for i in (-1, 0, 1)
+    ]
+    Tip, uip, vip, dip = Tuvdip
+    Ti, _ui, _vi, di = Tuvdi
+    Tin, uin, vin, din = Tuvdin
 
     # Triangular solution.
     l = np.hypot(uin - uip, vin - vip)  # noqa
@@ -235,24 +265,25 @@ def _uv_to_CCT_Ohno2013(
     T = Tip + (Tin - Tip) * (x / l)
 
     vtx = vip + (vin - vip) * (x / l)
-    sign = 1 if vx - vtx >= 0 else -1
+    sign = np.where(vx - vtx >= 0, 1, -1)
     D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
 
     # Parabolic solution.
-    if np.abs(D_uv) >= 0.002:
-        X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
-        a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
-        b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
-               (di - dip)) * X ** -1)
-        c = (
-            -(dip * (Tin - Ti) * Ti * Tin + di *
-              (Tip - Tin) * Tip * Tin + din * (Ti - Tip) * Tip * Ti) * X ** -1)
+    parabolic = np.abs(D_uv) >= 0.002
+
+    X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
+    a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
+    b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
+           (di - dip)) * X ** -1)
+    c = (-(dip * (Tin - Ti) * Ti * Tin + di * (Tip - Tin) * Tip * Tin + din *
+           (Ti - Tip) * Tip * Ti) * X ** -1)
 
-        T = -b / (2 * a)
+    T_p = -b / (2 * a)
 
-        D_uv = sign * (a * T ** 2 + b * T + c)
+    T = np.where(parabolic, T_p, T)
+    D_uv = np.where(parabolic, sign * (a * T_p ** 2 + b * T_p + c), D_uv)
 
-    return np.array([T, D_uv])
+    return tstack([T, D_uv])
 
 
 def uv_to_CCT_Ohno2013(uv,
@@ -311,12 +342,15 @@ def uv_to_CCT_Ohno2013(uv,
 
     uv = as_float_array(uv)
 
-    CCT_D_uv = [
-        _uv_to_CCT_Ohno2013(a, cmfs, start, end, count, iterations)
-        for a in np.reshape(uv, (-1, 2))
-    ]
+    uv_r = np.reshape(uv, (-1, 2))
+
+    CCT_D_uv = np.vstack([
+        _uv_to_CCT_Ohno2013(uv_r[i:i + _CHUNK_SIZE_OHNO2013], cmfs, start,
+                            end, count, iterations)
+        for i in range(0, max(uv_r.shape[0], 1), _CHUNK_SIZE_OHNO2013)
+    ])
 
-    return as_float_array(CCT_D_uv).reshape(uv.shape)
+    return np.reshape(CCT_D_uv, uv.shape)
 
 
 def _CCT_to_uv_Ohno2013(CCT_D_uv,
@@ -37,7 +37,7 @@ Set_xy_coord. https://www.adobe.com/support/downloads/dng/dng_sdk.html
 import numpy as np
 from collections import namedtuple
 
-from colour.utilities import as_float_array, tsplit
+from colour.utilities import as_float_array, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -121,66 +121,65 @@ def _uv_to_CCT_Robertson1968(uv):
 
     Parameters
     ----------
-    uv : array_like
+    uv : array_like, (n, 2)
         *CIE UCS* colourspace *uv* chromaticity coordinates.
 
     Returns
     -------
-    ndarray
+    ndarray, (n, 2)
         Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
-    """
-
-    u, v = uv
-
-    last_dt = last_dv = last_du = 0
 
-    for i in range(1, 31):
-        wr_ruvt = ISOTEMPERATURE_LINES_ROBERTSON1968[i]
-        wr_ruvt_previous = ISOTEMPERATURE_LINES_ROBERTSON1968[i - 1]
-
-        du = 1
-        dv = wr_ruvt.t
-
-        length = np.hypot(1, dv)
-
-        du /= length
-        dv /= length
+    Notes
+    -----
+    -   The isotemperature lines search is performed for all the given
+        chromaticity coordinates at once: the signed distances to the 30
+        isotemperature lines are computed and the first line with a
+        non-positive distance, or the last one, is selected.
+    """
 
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
+    u, v = tsplit(uv)
 
-        dt = -uu * dv + vv * du
+    r, u_i, v_i, t_i = tsplit(
+        as_float_array(DATA_ISOTEMPERATURE_LINES_ROBERTSON1968))
 
-        if dt <= 0 or i == 30:
-            if dt > 0:
-                dt = 0
+    length = np.hypot(1, t_i)
+    du_i = 1 / length
+    dv_i = t_i / length
 
-            dt = -dt
+    dt_i = (-(u[..., np.newaxis] - u_i[1:]) * dv_i[1:] +
+            (v[..., np.newaxis] - v_i[1:]) * du_i[1:])
 
-            f = 0 if i == 1 else dt / (last_dt + dt)
+    # Index of the first isotemperature line with a non-positive distance,
+    # the last isotemperature line is used if there are none.
+    stop = dt_i <= 0
+    stop[..., -1] = True
+    index = np.argmax(stop, axis=-1)
+    i = index + 1
 
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
+    dt = -np.minimum(dt_i[np.arange(len(index)), index], 0)
 
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
+    f = np.zeros(dt.shape)
+    has_previous = i > 1
+    last_dt = dt_i[np.arange(len(index)), index - 1]
+    f[has_previous] = (dt[has_previous] /
+                       (last_dt[has_previous] + dt[has_previous]))
 
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
+    T = 1.0e6 / (r[i - 1] * f + r[i] * (1 - f))
 
-            length = np.hypot(du, dv)
+    uu = u - (u_i[i - 1] * f + u_i[i] * (1 - f))
+    vv = v - (v_i[i - 1] * f + v_i[i] * (1 - f))
 
-            du /= length
-            dv /= length
+    du = du_i[i] * (1 - f) + du_i[i - 1] * f
+    dv = dv_i[i] * (1 - f) + dv_i[i - 1] * f
 
-            D_uv = uu * du + vv * dv
+    length = np.hypot(du, dv)
 
-            break
+    du /= length
+    dv /= length
 
-        last_dt = dt
-        last_du = du
-        last_dv = dv
+    D_uv = uu * du + vv * dv
 
-    return np.array([T, -D_uv])
+    return tstack([T, -D_uv])
 
 
 def uv_to_CCT_Robertson1968(uv):
@@ -212,9 +211,9 @@ def uv_to_CCT_Robertson1968(uv):
 
     uv = as_float_array(uv)
 
-    CCT_D_uv = [_uv_to_CCT_Robertson1968(a) for a in np.reshape(uv, (-1, 2))]
+    CCT_D_uv = _uv_to_CCT_Robertson1968(np.reshape(uv, (-1, 2)))
 
-    return as_float_array(CCT_D_uv).reshape(uv.shape)
+    return np.reshape(CCT_D_uv, uv.shape)
 
 
 def _CCT_to_uv_Robertson1968(CCT_D_uv):
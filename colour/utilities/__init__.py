@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 
 from .data_structures import (Lookup, Structure, CaseInsensitiveMapping,
-                              LazyCaseInsensitiveMapping)
+                              LazyCaseInsensitiveMapping, ArchiveMapping)
 from .common import (
     handle_numpy_errors, ignore_numpy_errors, raise_numpy_errors,
     print_numpy_errors, warn_numpy_errors, ignore_python_warnings, batch,
-    disable_multiprocessing, multiprocessing_pool, is_matplotlib_installed,
+    disable_multiprocessing, multiprocessing_pool, Cache, content_digest,
+    persistent_cache_directory, PersistentCache, CacheRegistry,
+    CACHE_REGISTRY, lazy_import_attributes, is_matplotlib_installed,
     is_networkx_installed, is_openimageio_installed, is_pandas_installed,
     is_tqdm_installed, required, is_iterable, is_string, is_numeric,
     is_integer, is_sibling, filter_kwargs, filter_mapping, first_item,
@@ -21,25 +23,28 @@ from .verbose import (
     ANCILLARY_EXTRAS_PACKAGES, describe_environment)
 from .array import (as_array, as_int_array, as_float_array, as_numeric, as_int,
                     as_float, set_float_precision, set_int_precision,
-                    as_namedtuple, closest_indexes, closest, normalise_maximum,
-                    interval, is_uniform, in_array, tstack, tsplit,
-                    row_as_diagonal, vector_dot, matrix_dot, orient, centroid,
-                    linear_conversion, lerp, fill_nan, ndarray_write, zeros,
-                    ones, full, index_along_last_axis)
+                    as_namedtuple, as_structured_array, closest_indexes,
+                    closest, normalise_maximum, interval, is_uniform, in_array,
+                    tstack, tsplit, row_as_diagonal, vector_dot, matrix_dot,
+                    orient, centroid, linear_conversion, lerp, fill_nan,
+                    ndarray_write, zeros, ones, full, index_along_last_axis)
 from .metrics import metric_mse, metric_psnr
 
 __all__ = [
     'Lookup', 'Structure', 'CaseInsensitiveMapping',
-    'LazyCaseInsensitiveMapping'
+    'LazyCaseInsensitiveMapping', 'ArchiveMapping'
 ]
 __all__ += [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
-    'batch', 'disable_multiprocessing', 'multiprocessing_pool',
-    'is_matplotlib_installed', 'is_networkx_installed',
-    'is_openimageio_installed', 'is_pandas_installed', 'is_tqdm_installed',
-    'required', 'is_iterable', 'is_string', 'is_numeric', 'is_integer',
-    'is_sibling', 'filter_kwargs', 'filter_mapping', 'first_item',
+    'batch', 'disable_multiprocessing', 'multiprocessing_pool', 'Cache',
+    'content_digest', 'persistent_cache_directory', 'PersistentCache',
+    'CacheRegistry', 'CACHE_REGISTRY', 'lazy_import_attributes',
+    'is_matplotlib_installed',
+    'is_networkx_installed', 'is_openimageio_installed', 'is_pandas_installed',
+    'is_tqdm_installed', 'required', 'is_iterable', 'is_string',
+    'is_numeric', 'is_integer', 'is_sibling', 'filter_kwargs',
+    'filter_mapping', 'first_item',
     'get_domain_range_scale', 'set_domain_range_scale', 'domain_range_scale',
     'to_domain_1', 'to_domain_10', 'to_domain_100', 'to_domain_degrees',
     'to_domain_int', 'from_range_1', 'from_range_10', 'from_range_100',
@@ -56,9 +61,10 @@ __all__ += [
 __all__ += [
     'as_array', 'as_int_array', 'as_float_array', 'as_numeric', 'as_int',
     'as_float', 'set_float_precision', 'set_int_precision', 'as_namedtuple',
-    'closest_indexes', 'closest', 'normalise_maximum', 'interval',
-    'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
-    'vector_dot', 'matrix_dot', 'orient', 'centroid', 'linear_conversion',
+    'as_structured_array', 'closest_indexes', 'closest', 'normalise_maximum',
+    'interval', 'is_uniform', 'in_array', 'tstack', 'tsplit',
+    'row_as_diagonal', 'vector_dot', 'matrix_dot', 'orient', 'centroid',
+    'linear_conversion',
     'fill_nan', 'lerp', 'ndarray_write', 'zeros', 'ones', 'full',
     'index_along_last_axis'
 ]
@@ -36,9 +36,10 @@ __status__ = 'Production'
 __all__ = [
     'as_array', 'as_int_array', 'as_float_array', 'as_numeric', 'as_int',
     'as_float', 'set_float_precision', 'set_int_precision', 'as_namedtuple',
-    'closest_indexes', 'closest', 'normalise_maximum', 'interval',
-    'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
-    'vector_dot', 'matrix_dot', 'orient', 'centroid', 'linear_conversion',
+    'as_structured_array', 'closest_indexes', 'closest', 'normalise_maximum',
+    'interval', 'is_uniform', 'in_array', 'tstack', 'tsplit',
+    'row_as_diagonal', 'vector_dot', 'matrix_dot', 'orient', 'centroid',
+    'linear_conversion',
     'lerp', 'fill_nan', 'ndarray_write', 'zeros', 'ones', 'full',
     'index_along_last_axis'
 ]
@@ -299,6 +300,15 @@ def set_float_precision(dtype=DEFAULT_FLOAT_DTYPE):
         `set COLOUR_SCIENCE__FLOAT_PRECISION=float32`.
     -   Some definition returning a single-scalar ndarray might not honour the
         given float precision: https://github.com/numpy/numpy/issues/16353
+    -   *float32* precision is supported for the image processing definitions,
+        i.e. colour models, transfer functions, chromatic adaptation, colour
+        appearance models and *LUTs*. It halves the memory bandwidth and
+        typically doubles the throughput, see the
+        ``benchmarks/float_precision.py`` benchmark.
+    -   *float16* precision is only suitable for storage: *Numpy* type
+        promotion rules, e.g. with integer scalars greater than 255, and
+        the limited range of the type, e.g. :math:`10000 cd/m^2` for *ST 2084*,
+        are likely to promote or overflow the computations.
 
     Examples
     --------
@@ -314,7 +324,7 @@ def set_float_precision(dtype=DEFAULT_FLOAT_DTYPE):
 
     with suppress_warnings(colour_usage_warnings=True):
         for name, module in sys.modules.items():
-            if not name.startswith(name):
+            if not name.startswith('colour'):
                 continue
 
             if not hasattr(module, 'DEFAULT_FLOAT_DTYPE'):
@@ -362,7 +372,7 @@ def set_int_precision(dtype=DEFAULT_INT_DTYPE):
     # TODO: Investigate behaviour on Windows.
     with suppress_warnings(colour_usage_warnings=True):
         for name, module in sys.modules.items():
-            if not name.startswith(name):
+            if not name.startswith('colour'):
                 continue
 
             if not hasattr(module, 'DEFAULT_INT_DTYPE'):
@@ -418,6 +428,60 @@ def as_namedtuple(a, named_tuple):
         return named_tuple(*a)
 
 
+def as_structured_array(a, dtype=None):
+    """
+    Converts given :math:`a` variable to a *Numpy* record array.
+
+    :math:`a` can be either a *namedtuple* or a *mapping*, the fields with
+    *None* values are skipped and the remaining ones are broadcast to a
+    common shape. The fields are stored contiguously so that the resulting
+    record array can be viewed as an array of shape (..., k), where k is the
+    number of fields, e.g. with
+    :func:`numpy.lib.recfunctions.structured_to_unstructured` definition,
+    while its fields remain accessible by name.
+
+    Parameters
+    ----------
+    a : namedtuple or dict_like
+        Variable to convert.
+    dtype : object
+        Fields type, default to :attr:`colour.constants.DEFAULT_FLOAT_DTYPE`
+        attribute.
+
+    Returns
+    -------
+    recarray
+        math:`a` variable converted to *Numpy* record array.
+
+    Examples
+    --------
+    >>> from collections import namedtuple
+    >>> NamedTuple = namedtuple('NamedTuple', 'a b c')
+    >>> a = as_structured_array(NamedTuple(a=1, b=np.array([2, 3]), c=None))
+    >>> a.a
+    array([ 1.,  1.])
+    >>> a.b
+    array([ 2.,  3.])
+    """
+
+    if dtype is None:
+        dtype = DEFAULT_FLOAT_DTYPE
+
+    if isinstance(a, tuple) and hasattr(a, '_asdict'):
+        a = a._asdict()
+
+    fields = [(field, np.asarray(value)) for field, value in a.items()
+              if value is not None]
+
+    shape = np.broadcast(*[value for _field, value in fields]).shape
+
+    b = np.recarray(shape, dtype=[(field, dtype) for field, _value in fields])
+    for field, value in fields:
+        b[field] = value
+
+    return b
+
+
 def closest_indexes(a, b):
     """
     Returns the :math:`a` variable closest element indexes to reference
@@ -801,9 +865,9 @@ def row_as_diagonal(a):
             [ 0.        ,  0.        ,  0.88027331]]])
     """
 
-    a = np.expand_dims(a, -2)
+    a = np.expand_dims(as_float_array(a), -2)
 
-    return np.eye(a.shape[-1]) * a
+    return np.eye(a.shape[-1], dtype=a.dtype) * a
 
 
 def vector_dot(m, v):
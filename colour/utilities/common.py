@@ -14,12 +14,18 @@ References
 numpyerrors.html
 """
 
+import hashlib
+import importlib
 import inspect
 import multiprocessing
 import multiprocessing.pool
 import functools
 import numpy as np
+import os
 import re
+import shutil
+import sys
+import tempfile
 import types
 import warnings
 from contextlib import contextmanager
@@ -39,11 +45,14 @@ __status__ = 'Production'
 __all__ = [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
-    'batch', 'disable_multiprocessing', 'multiprocessing_pool',
-    'is_matplotlib_installed', 'is_networkx_installed',
-    'is_openimageio_installed', 'is_pandas_installed', 'is_tqdm_installed',
-    'required', 'is_iterable', 'is_string', 'is_numeric', 'is_integer',
-    'is_sibling', 'filter_kwargs', 'filter_mapping', 'first_item',
+    'batch', 'disable_multiprocessing', 'multiprocessing_pool', 'Cache',
+    'content_digest', 'persistent_cache_directory', 'PersistentCache',
+    'CacheRegistry', 'CACHE_REGISTRY', 'lazy_import_attributes',
+    'is_matplotlib_installed',
+    'is_networkx_installed', 'is_openimageio_installed', 'is_pandas_installed',
+    'is_tqdm_installed', 'required', 'is_iterable', 'is_string',
+    'is_numeric', 'is_integer', 'is_sibling', 'filter_kwargs',
+    'filter_mapping', 'first_item',
     'get_domain_range_scale', 'set_domain_range_scale', 'domain_range_scale',
     'to_domain_1', 'to_domain_10', 'to_domain_100', 'to_domain_degrees',
     'to_domain_int', 'from_range_1', 'from_range_10', 'from_range_100',
@@ -299,6 +308,666 @@ def multiprocessing_pool(*args, **kwargs):
         pool.terminate()
 
 
+class Cache(OrderedDict):
+    """
+    Defines a cache, i.e. a mapping optionally bounded to a maximum size by
+    evicting its least recently used items and counting its hits and misses.
+
+    Parameters
+    ----------
+    maximum_size : int, optional
+        Maximum items count, the cache is unbounded if *None*.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.Cache.maximum_size`
+    -   :attr:`~colour.utilities.Cache.hits`
+    -   :attr:`~colour.utilities.Cache.misses`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.Cache.__init__`
+    -   :meth:`~colour.utilities.Cache.__setitem__`
+    -   :meth:`~colour.utilities.Cache.get`
+
+    Examples
+    --------
+    >>> cache = Cache(2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3
+    >>> cache.get('b') is None
+    True
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+
+    def __init__(self, maximum_size=None):
+        super(Cache, self).__init__()
+
+        self.maximum_size = maximum_size
+        self.hits = 0
+        self.misses = 0
+
+    def __setitem__(self, key, value):
+        """
+        Sets given item with given value, evicting the least recently used
+        items if the cache is full.
+
+        Parameters
+        ----------
+        key : object
+            Item key.
+        value : object
+            Item value.
+        """
+
+        super(Cache, self).__setitem__(key, value)
+        self.move_to_end(key)
+
+        if self.maximum_size is not None:
+            while len(self) > self.maximum_size:
+                self.popitem(last=False)
+
+    def get(self, key, default=None):
+        """
+        Returns given item value if it exists, counting a hit, otherwise
+        returns given default value, counting a miss.
+
+        Parameters
+        ----------
+        key : object
+            Item key.
+        default : object, optional
+            Default value.
+
+        Returns
+        -------
+        object
+            Item value.
+        """
+
+        if key in self:
+            self.hits += 1
+            self.move_to_end(key)
+
+            return self[key]
+
+        self.misses += 1
+
+        return default
+
+
+def _update_digest(digest, value):
+    """
+    Updates given digest with the content of given value.
+
+    Parameters
+    ----------
+    digest : object
+        :mod:`hashlib` digest to update.
+    value : object
+        Value to update the digest with.
+    """
+
+    if isinstance(value, (np.ndarray, np.generic)):
+        value = np.ascontiguousarray(value)
+        digest.update('ndarray{0}{1}'.format(value.dtype.str,
+                                             value.shape).encode('utf-8'))
+        digest.update(value.tobytes())
+    elif isinstance(value, (tuple, list)):
+        digest.update('{0}{1}'.format(type(value).__name__,
+                                      len(value)).encode('utf-8'))
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, dict):
+        digest.update('dict{0}'.format(len(value)).encode('utf-8'))
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    elif isinstance(value, (type, types.FunctionType)):
+        digest.update('{0}.{1}'.format(value.__module__,
+                                       value.__name__).encode('utf-8'))
+    elif all(
+            hasattr(value, attribute)
+            for attribute in ('domain', 'range', 'interpolator')):
+        # Continuous signals: their "repr" is truncated for large arrays.
+        _update_digest(digest, (type(value), value.domain, value.range,
+                                value.interpolator, value.interpolator_kwargs,
+                                value.extrapolator, value.extrapolator_kwargs))
+    else:
+        digest.update('{0}{1!r}'.format(type(value).__name__,
+                                        value).encode('utf-8'))
+
+
+def content_digest(*args):
+    """
+    Returns a digest of the content of given objects, stable across processes
+    contrary to the :func:`hash` builtin definition.
+
+    Parameters
+    ----------
+    \\*args : list, optional
+        Objects to digest, e.g. *ndarray*, continuous signals, numerics,
+        strings and nested sequences and mappings of those.
+
+    Returns
+    -------
+    unicode
+        Hexadecimal digest.
+
+    Examples
+    --------
+    >>> content_digest(np.array([1, 2, 3]), 'Foo')  # doctest: +ELLIPSIS
+    '...'
+    >>> content_digest(1) == content_digest(1.0)
+    False
+    """
+
+    digest = hashlib.sha256()
+    _update_digest(digest, args)
+
+    return digest.hexdigest()
+
+
+def persistent_cache_directory():
+    """
+    Returns the directory storing the persistent caches of the current
+    *Colour* version.
+
+    The persistent caches are opt-in, and enabled by setting the
+    *COLOUR_SCIENCE__CACHE_DIR* environment variable to the directory
+    storing them, for example `set COLOUR_SCIENCE__CACHE_DIR=~/.cache/colour`.
+
+    Returns
+    -------
+    unicode
+        Persistent caches directory or *None* if the persistent caches are
+        disabled.
+
+    Examples
+    --------
+    >>> os.environ['COLOUR_SCIENCE__CACHE_DIR'] = '/tmp/colour'
+    ... # doctest: +SKIP
+    >>> persistent_cache_directory()  # doctest: +SKIP
+    '/tmp/colour/0.3.16'
+    >>> del os.environ['COLOUR_SCIENCE__CACHE_DIR']  # doctest: +SKIP
+    >>> print(persistent_cache_directory())  # doctest: +SKIP
+    None
+    """
+
+    directory = os.environ.get('COLOUR_SCIENCE__CACHE_DIR')
+    version = getattr(sys.modules.get('colour'), '__version__', None)
+
+    if not directory or version is None:
+        return None
+
+    return os.path.join(os.path.expanduser(directory), version)
+
+
+class PersistentCache(Cache):
+    """
+    Defines a cache whose items are also stored on disk in the
+    persistent caches directory, shared by the processes using the same
+    *Colour* version.
+
+    Only *ndarray* items and tuples of *ndarray* are stored on disk, other
+    items are only stored in memory. The persistent storage is disabled, and
+    the cache behaves like :class:`colour.utilities.Cache` class, if
+    :func:`colour.utilities.persistent_cache_directory` definition returns
+    *None*.
+
+    Parameters
+    ----------
+    name : unicode
+        Cache name, used as the cache directory name.
+    maximum_size : int, optional
+        Maximum items count held in memory, the cache is unbounded if *None*.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.PersistentCache.name`
+    -   :attr:`~colour.utilities.PersistentCache.directory`
+    -   :attr:`~colour.utilities.PersistentCache.persistent_hits`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.PersistentCache.__init__`
+    -   :meth:`~colour.utilities.PersistentCache.__setitem__`
+    -   :meth:`~colour.utilities.PersistentCache.get`
+    -   :meth:`~colour.utilities.PersistentCache.clear_persistent`
+
+    Notes
+    -----
+    -   The keys must be valid file names, e.g. digests returned by
+        :func:`colour.utilities.content_digest` definition, and should
+        identify the content of the inputs the item is computed from.
+    -   The items are written to a temporary file renamed atomically,
+        concurrent processes thus either read a complete item or none.
+
+    Examples
+    --------
+    >>> cache = PersistentCache('Cache A')
+    >>> key = content_digest(np.array([1, 2, 3]))
+    >>> cache[key] = np.array([4, 5, 6])
+    >>> cache.get(key)
+    array([4, 5, 6])
+    """
+
+    def __init__(self, name, maximum_size=None):
+        super(PersistentCache, self).__init__(maximum_size)
+
+        self.name = name
+        self.persistent_hits = 0
+
+    @property
+    def directory(self):
+        """
+        Getter property for the cache directory.
+
+        Returns
+        -------
+        unicode
+            Cache directory or *None* if the persistent storage is disabled.
+        """
+
+        directory = persistent_cache_directory()
+
+        if directory is None:
+            return None
+
+        return os.path.join(directory, self.name)
+
+    def __setitem__(self, key, value):
+        """
+        Sets given item with given value in memory and, if it is an *ndarray*
+        or a tuple of *ndarray*, on disk.
+
+        Parameters
+        ----------
+        key : unicode
+            Item key.
+        value : object
+            Item value.
+        """
+
+        super(PersistentCache, self).__setitem__(key, value)
+
+        directory = self.directory
+        if directory is None:
+            return
+
+        if isinstance(value, np.ndarray):
+            arrays = {'value': value}
+        elif (isinstance(value, tuple) and
+              all(isinstance(item, np.ndarray) for item in value)):
+            arrays = dict(('item_{0}'.format(i), item)
+                          for i, item in enumerate(value))
+        else:
+            return
+
+        path = None
+        try:
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+
+            descriptor, path = tempfile.mkstemp(
+                '.tmp', '{0}-'.format(key), directory)
+            with os.fdopen(descriptor, 'wb') as file_:
+                np.savez(file_, **arrays)
+
+            os.replace(path, os.path.join(directory, '{0}.npz'.format(key)))
+        except (OSError, ValueError):
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
+    def get(self, key, default=None):
+        """
+        Returns given item value if it exists in memory or on disk, counting
+        a hit, otherwise returns given default value, counting a miss.
+
+        Parameters
+        ----------
+        key : unicode
+            Item key.
+        default : object, optional
+            Default value.
+
+        Returns
+        -------
+        object
+            Item value.
+        """
+
+        if key in self:
+            return super(PersistentCache, self).get(key, default)
+
+        directory = self.directory
+        if directory is not None:
+            path = os.path.join(directory, '{0}.npz'.format(key))
+            try:
+                with np.load(path, allow_pickle=False) as arrays:
+                    if 'value' in arrays:
+                        value = arrays['value']
+                    else:
+                        value = tuple(
+                            arrays['item_{0}'.format(i)]
+                            for i in range(len(arrays.files)))
+            except (IOError, OSError, ValueError, KeyError):
+                value = None
+
+            if value is not None:
+                Cache.__setitem__(self, key, value)
+                self.hits += 1
+                self.persistent_hits += 1
+
+                return value
+
+        self.misses += 1
+
+        return default
+
+    def clear_persistent(self):
+        """
+        Clears the items stored on disk.
+        """
+
+        directory = self.directory
+
+        if directory is not None and os.path.exists(directory):
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+class CacheRegistry(object):
+    """
+    A registry for mapping-based caches, reporting their statistics.
+
+    The caches registered as persistent are instances of
+    :class:`colour.utilities.PersistentCache` class, also storing their items
+    on disk if the *COLOUR_SCIENCE__CACHE_DIR* environment variable is set.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.CacheRegistry.registry`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.CacheRegistry.__init__`
+    -   :meth:`~colour.utilities.CacheRegistry.__str__`
+    -   :meth:`~colour.utilities.CacheRegistry.register_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.unregister_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.clear_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.clear_all_caches`
+    -   :meth:`~colour.utilities.CacheRegistry.statistics`
+
+    Examples
+    --------
+    >>> cache_registry = CacheRegistry()
+    >>> cache_a = cache_registry.register_cache('Cache A', 8)
+    >>> cache_a['Foo'] = 'Bar'
+    >>> cache_a.get('Foo')
+    'Bar'
+    >>> cache_a.get('Baz')
+    >>> print(cache_registry)
+    {'Cache A': '1 item(s), 1 hit(s), 1 miss(es)'}
+    """
+
+    def __init__(self):
+        self._registry = OrderedDict()
+
+    @property
+    def registry(self):
+        """
+        Getter property for the cache registry.
+
+        Returns
+        -------
+        OrderedDict
+            Cache registry.
+        """
+
+        return self._registry
+
+    def __str__(self):
+        """
+        Returns a formatted string representation of the cache registry.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        return '{{{0}}}'.format(', '.join([
+            "'{0}': '{1} item(s), {2} hit(s), {3} miss(es)'".format(
+                name, len(cache), cache.hits, cache.misses)
+            for name, cache in self._registry.items()
+        ]))
+
+    def register_cache(self, name, maximum_size=None, persistent=False):
+        """
+        Registers a new cache with given name in the registry.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name for the registry.
+        maximum_size : int, optional
+            Maximum items count of the cache, unbounded if *None*.
+        persistent : bool, optional
+            Whether the cache also stores its items on disk, see
+            :class:`colour.utilities.PersistentCache` class.
+
+        Returns
+        -------
+        Cache or PersistentCache
+            Registered cache.
+        """
+
+        if persistent:
+            cache = PersistentCache(name, maximum_size)
+        else:
+            cache = Cache(maximum_size)
+
+        self._registry[name] = cache
+
+        return cache
+
+    def unregister_cache(self, name):
+        """
+        Unregisters cache with given name in the registry.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name in the registry.
+        """
+
+        del self._registry[name]
+
+    def clear_cache(self, name, persistent=False):
+        """
+        Clears the cache with given name.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name in the registry.
+        persistent : bool, optional
+            Whether to also clear the items stored on disk by a persistent
+            cache.
+        """
+
+        cache = self._registry[name]
+        cache.clear()
+
+        if persistent and isinstance(cache, PersistentCache):
+            cache.clear_persistent()
+
+    def clear_all_caches(self, persistent=False):
+        """
+        Clears all the caches in the registry.
+
+        Parameters
+        ----------
+        persistent : bool, optional
+            Whether to also clear the items stored on disk by the persistent
+            caches.
+        """
+
+        for name in self._registry:
+            self.clear_cache(name, persistent)
+
+    def statistics(self):
+        """
+        Returns the size, hits and misses counts of the caches in the
+        registry, and the count of hits read from disk for the persistent
+        caches.
+
+        Returns
+        -------
+        OrderedDict
+            Caches statistics.
+        """
+
+        statistics = OrderedDict()
+        for name, cache in self._registry.items():
+            statistics[name] = {
+                'size': len(cache),
+                'maximum_size': cache.maximum_size,
+                'hits': cache.hits,
+                'misses': cache.misses
+            }
+
+            if isinstance(cache, PersistentCache):
+                statistics[name]['persistent_hits'] = cache.persistent_hits
+
+        return statistics
+
+
+CACHE_REGISTRY = CacheRegistry()
+"""
+*Colour* cache registry referencing all the caches used for repetitive or long
+computations.
+
+CACHE_REGISTRY : CacheRegistry
+"""
+
+
+def lazy_import_attributes(module_name, attributes, submodules=None):
+    """
+    Returns *PEP 562* module level ``__getattr__`` and ``__dir__`` definitions
+    deferring the import of given attributes and sub-modules of given module
+    to their first access.
+
+    Parameters
+    ----------
+    module_name : unicode
+        Name of the module to define the attributes of, i.e. its ``__name__``.
+    attributes : dict
+        Mapping of the names of the modules to import the attributes from, if
+        relative they are resolved against given module, to the names of the
+        attributes.
+    submodules : array_like, optional
+        Names of the sub-modules of given module to import on first access.
+
+    Returns
+    -------
+    tuple
+        ``__getattr__`` and ``__dir__`` definitions.
+
+    Notes
+    -----
+    -   The definitions are also set on the module so that they are in effect
+        before the module finishes initialising.
+    -   The attributes are set on the module once imported, thus the
+        ``__getattr__`` definition is only called on their first access.
+    -   The attributes sharing their name with a sub-module, e.g.
+        :func:`colour.colorimetry.lightness` definition, are imported
+        immediately: importing the sub-module would otherwise bind it on the
+        module in place of the attribute.
+    -   *PEP 562* being implemented in *Python 3.7*, the attributes are
+        imported immediately with earlier *Python* versions.
+
+    Examples
+    --------
+    >>> import types
+    >>> module = sys.modules['module'] = types.ModuleType('module')
+    >>> __getattr__, __dir__ = lazy_import_attributes(
+    ...     'module', {'fractions': ('Fraction', )})
+    >>> module.Fraction(1, 2)
+    Fraction(1, 2)
+    >>> del sys.modules['module']
+    """
+
+    module = sys.modules[module_name]
+    sources = dict((name, source) for source, names in attributes.items()
+                   for name in names)
+    submodules = set(submodules if submodules is not None else [])
+
+    def __getattr__(name):
+        """
+        Imports given attribute of the module.
+
+        Parameters
+        ----------
+        name : unicode
+            Attribute name.
+
+        Returns
+        -------
+        object
+            Attribute value.
+
+        Raises
+        ------
+        AttributeError
+            If the attribute is not defined.
+        """
+
+        if name in sources:
+            value = getattr(
+                importlib.import_module(sources[name], module_name), name)
+        elif name in submodules:
+            value = importlib.import_module('.{0}'.format(name), module_name)
+        else:
+            raise AttributeError('module "{0}" has no attribute "{1}"'.format(
+                module_name, name))
+
+        setattr(module, name, value)
+
+        return value
+
+    def __dir__():
+        """
+        Returns the attributes of the module, including the attributes not
+        imported yet.
+
+        Returns
+        -------
+        list
+            Attributes of the module.
+        """
+
+        return sorted(set(vars(module)) | set(sources) | submodules)
+
+    module.__getattr__, module.__dir__ = __getattr__, __dir__
+
+    if sys.version_info[:2] < (3, 7):  # pragma: no cover
+        eager = set(sources)
+    else:
+        eager = set(name for name in sources
+                    if name in submodules or
+                    sources[name].rsplit('.', 1)[-1] == name)
+
+    for name in sorted(eager):
+        __getattr__(name)
+
+    return __getattr__, __dir__
+
+
 def is_matplotlib_installed(raise_exception=False):
     """
     Returns if *Matplotlib* is installed and available.
@@ -14,6 +14,8 @@ Defines various data structures classes:
 -   :class:`colour.utilities.LazyCaseInsensitiveMapping`: Another case
     insensitive mapping allowing lazy values retrieving from keys while
     ignoring the key case.
+-   :class:`colour.utilities.ArchiveMapping`: A read-only mapping of the
+    arrays stored in a *Numpy* *.npz* archive, reading them on access.
 
 References
 ----------
@@ -28,6 +30,7 @@ data_structures.py
 structures.py#L37
 """
 
+import numpy as np
 from collections.abc import Mapping, MutableMapping
 
 __author__ = 'Colour Developers'
@@ -39,7 +42,7 @@ __status__ = 'Production'
 
 __all__ = [
     'Structure', 'Lookup', 'CaseInsensitiveMapping',
-    'LazyCaseInsensitiveMapping'
+    'LazyCaseInsensitiveMapping', 'ArchiveMapping'
 ]
 
 
@@ -379,7 +382,7 @@ class CaseInsensitiveMapping(MutableMapping):
             returned is a simple *copy* not a *deepcopy*.
         """
 
-        return CaseInsensitiveMapping(self._data.values())
+        return self.__class__(self._data.values())
 
     def lower_items(self):
         """
@@ -463,3 +466,168 @@ class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
             super(LazyCaseInsensitiveMapping, self).__setitem__(item, value)
 
         return value
+
+    def lower_items(self):
+        """
+        Iterates over the lower items names, evaluating the callable values.
+
+        Returns
+        -------
+        generator
+            Lower item names.
+        """
+
+        return ((item, self[item]) for item in self._data)
+
+
+class ArchiveMapping(Mapping):
+    """
+    Implements a read-only mapping / *dict* object of the arrays stored in a
+    *Numpy* *.npz* archive.
+
+    The arrays are read from the archive on access, only the names of the
+    arrays are read and kept in memory, once, the first time they are needed.
+
+    Parameters
+    ----------
+    path : unicode
+        Path of the *.npz* archive.
+    as_dict : bool, optional
+        Whether to return the 2-dimensional arrays as *dict* mapping the values
+        of their first column to the values of their other columns, e.g. the
+        spectral data form accepted by :class:`colour.SpectralDistribution`
+        and :class:`colour.MultiSpectralDistributions` classes.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.ArchiveMapping.path`
+    -   :attr:`~colour.utilities.ArchiveMapping.as_dict`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.ArchiveMapping.__init__`
+    -   :meth:`~colour.utilities.ArchiveMapping.__getitem__`
+    -   :meth:`~colour.utilities.ArchiveMapping.__iter__`
+    -   :meth:`~colour.utilities.ArchiveMapping.__len__`
+
+    Notes
+    -----
+    -   The archive is not kept open, a new array, or *dict*, is returned on
+        each access.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'archive.npz')
+    >>> np.savez(path, John=np.array([[1, 2], [3, 4]]))
+    >>> ArchiveMapping(path)['John']
+    array([[1, 2],
+           [3, 4]])
+    >>> ArchiveMapping(path, as_dict=True)['John']
+    {1: 2, 3: 4}
+    """
+
+    def __init__(self, path, as_dict=False):
+        self._path = path
+        self._as_dict = as_dict
+        self._names = None
+
+    @property
+    def path(self):
+        """
+        Getter property for the path of the *.npz* archive.
+
+        Returns
+        -------
+        unicode
+            Path of the *.npz* archive.
+        """
+
+        return self._path
+
+    @property
+    def as_dict(self):
+        """
+        Getter property for whether the 2-dimensional arrays are returned as
+        *dict*.
+
+        Returns
+        -------
+        bool
+            Whether the 2-dimensional arrays are returned as *dict*.
+        """
+
+        return self._as_dict
+
+    @property
+    def _archive_names(self):
+        """
+        Returns the names of the arrays stored in the *.npz* archive, reading
+        them if not existing.
+
+        Returns
+        -------
+        tuple
+            Names of the arrays.
+        """
+
+        if self._names is None:
+            with np.load(self._path, allow_pickle=False) as archive:
+                self._names = tuple(archive.files)
+
+        return self._names
+
+    def __getitem__(self, item):
+        """
+        Reads and returns the array with given name.
+
+        Parameters
+        ----------
+        item : unicode
+            Array name.
+
+        Returns
+        -------
+        ndarray or dict
+            Array or *dict*.
+        """
+
+        if item not in self._archive_names:
+            raise KeyError(item)
+
+        with np.load(self._path, allow_pickle=False) as archive:
+            array = archive[item]
+
+        if self._as_dict and array.ndim == 2:
+            keys = array[:, 0].tolist()
+            values = (array[:, 1].tolist() if array.shape[1] == 2 else
+                      [tuple(row) for row in array[:, 1:].tolist()])
+
+            return dict(zip(keys, values))
+
+        return array
+
+    def __iter__(self):
+        """
+        Iterates over the arrays names in the archive order.
+
+        Returns
+        -------
+        generator
+            Arrays names.
+        """
+
+        return iter(self._archive_names)
+
+    def __len__(self):
+        """
+        Returns the arrays count.
+
+        Returns
+        -------
+        int
+            Arrays count.
+        """
+
+        return len(self._archive_names)
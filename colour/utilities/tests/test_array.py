@@ -10,11 +10,11 @@ from collections import namedtuple
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.utilities import (
     as_array, as_int_array, as_float_array, as_numeric, as_int, as_float,
-    set_float_precision, set_int_precision, as_namedtuple, closest_indexes,
-    closest, normalise_maximum, interval, is_uniform, in_array, tstack, tsplit,
-    row_as_diagonal, vector_dot, matrix_dot, orient, centroid,
-    linear_conversion, lerp, fill_nan, ndarray_write, zeros, ones, full,
-    index_along_last_axis)
+    set_float_precision, set_int_precision, as_namedtuple, as_structured_array,
+    closest_indexes, closest, normalise_maximum, interval, is_uniform,
+    in_array, tstack, tsplit, row_as_diagonal, vector_dot, matrix_dot, orient,
+    centroid, linear_conversion, lerp, fill_nan, ndarray_write, zeros, ones,
+    full, index_along_last_axis)
 from colour.utilities import is_networkx_installed
 
 __author__ = 'Colour Developers'
@@ -27,12 +27,12 @@ __status__ = 'Production'
 __all__ = [
     'TestAsArray', 'TestAsIntArray', 'TestAsFloatArray', 'TestAsNumeric',
     'TestAsInt', 'TestAsFloat', 'TestSetFloatPrecision', 'TestSetIntPrecision',
-    'TestAsNametuple', 'TestClosestIndexes', 'TestClosest',
-    'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform', 'TestInArray',
-    'TestTstack', 'TestTsplit', 'TestRowAsDiagonal', 'TestDotVector',
-    'TestDotMatrix', 'TestOrient', 'TestCentroid', 'TestLinearConversion',
-    'TestLerp', 'TestFillNan', 'TestNdarrayWrite', 'TestZeros', 'TestOnes',
-    'TestFull', 'TestIndexAlongLastAxis'
+    'TestAsNametuple', 'TestAsStructuredArray', 'TestClosestIndexes',
+    'TestClosest', 'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform',
+    'TestInArray', 'TestTstack', 'TestTsplit', 'TestRowAsDiagonal',
+    'TestDotVector', 'TestDotMatrix', 'TestOrient', 'TestCentroid',
+    'TestLinearConversion', 'TestLerp', 'TestFillNan', 'TestNdarrayWrite',
+    'TestZeros', 'TestOnes', 'TestFull', 'TestIndexAlongLastAxis'
 ]
 
 
@@ -255,6 +255,103 @@ class TestSetFloatPrecision(unittest.TestCase):
 
             self.assertEqual(dtype_getter(convert(a, source, target)), dtype)
 
+    def test_set_float_precision_tolerance(self):
+        """
+        Tests whether :func:`colour.utilities.array.set_float_precision`
+        definition computations in *float32* precision stay within tolerance of
+        the *float64* computations for the *Colour* image processing API, i.e.
+        colour models, transfer functions, chromatic adaptation, colour
+        appearance models and *LUTs*.
+        """
+
+        from colour.adaptation import chromatic_adaptation
+        from colour.appearance import (XYZ_to_ATD95, XYZ_to_CAM16,
+                                       XYZ_to_CIECAM02, XYZ_to_Hunt,
+                                       XYZ_to_LLAB, XYZ_to_Nayatani95,
+                                       XYZ_to_RLAB, CIECAM02_to_XYZ)
+        from colour.io import LUT1D, LUT3x1D, LUT3D
+        from colour.models import (
+            CCTF_DECODINGS, CCTF_ENCODINGS, RGB_COLOURSPACES, RGB_to_ICTCP,
+            RGB_to_RGB, RGB_to_YCbCr, XYZ_to_IPT, XYZ_to_JzAzBz, XYZ_to_Lab,
+            XYZ_to_Luv, XYZ_to_OSA_UCS, XYZ_to_RGB, cctf_decoding,
+            cctf_encoding)
+
+        RGB = np.array([
+            [0.45620519, 0.03081071, 0.04091952],
+            [0.18000000, 0.18000000, 0.18000000],
+            [0.90000000, 0.50000000, 0.10000000],
+        ])
+        XYZ = np.array([
+            [0.20654008, 0.12197225, 0.05136952],
+            [0.14222010, 0.23042768, 0.10495772],
+            [0.07818780, 0.06157201, 0.28099326],
+        ])
+        XYZ_w = np.array([0.95045593, 1.00000000, 1.08905775])
+        XYZ_wr = np.array([0.96429568, 1.00000000, 0.82510460])
+        sRGB = RGB_COLOURSPACES['sRGB']
+        ACEScg = RGB_COLOURSPACES['ACEScg']
+
+        definitions = [
+            lambda: RGB_to_RGB(RGB, sRGB, ACEScg, apply_cctf_decoding=True),
+            lambda: XYZ_to_RGB(XYZ, sRGB.whitepoint, sRGB.whitepoint,
+                               sRGB.matrix_XYZ_to_RGB, 'Bradford',
+                               sRGB.cctf_encoding),
+            lambda: XYZ_to_Lab(XYZ),
+            lambda: XYZ_to_Luv(XYZ),
+            lambda: XYZ_to_IPT(XYZ),
+            lambda: XYZ_to_JzAzBz(XYZ),
+            lambda: XYZ_to_OSA_UCS(XYZ * 100),
+            lambda: RGB_to_ICTCP(RGB),
+            lambda: RGB_to_YCbCr(RGB),
+            lambda: chromatic_adaptation(XYZ, XYZ_w, XYZ_wr),
+            lambda: chromatic_adaptation(
+                XYZ, XYZ_w, XYZ_wr, 'CMCCAT2000', L_A1=200, L_A2=200),
+            lambda: chromatic_adaptation(
+                XYZ, XYZ_w, XYZ_wr, 'Fairchild 1990', Y_n=200),
+            lambda: XYZ_to_CIECAM02(XYZ * 100, XYZ_w * 100, 318.31, 20.0),
+            lambda: CIECAM02_to_XYZ(
+                XYZ_to_CIECAM02(XYZ * 100, XYZ_w * 100, 318.31, 20.0),
+                XYZ_w * 100, 318.31, 20.0),
+            lambda: XYZ_to_CAM16(XYZ * 100, XYZ_w * 100, 318.31, 20.0),
+            lambda: XYZ_to_Hunt(
+                XYZ * 100, XYZ_w * 100, XYZ_w * 100, 318.31, CCT_w=6504),
+            lambda: XYZ_to_ATD95(XYZ * 100, XYZ_w * 100, 18, 1, 1),
+            lambda: XYZ_to_LLAB(XYZ * 100, XYZ_w * 100, 318.31, 20.0),
+            lambda: XYZ_to_Nayatani95(XYZ * 100, XYZ_w * 100, 20, 5000, 1000),
+            lambda: XYZ_to_RLAB(XYZ * 100, XYZ_w * 100, 318.31),
+            lambda: LUT1D().table,
+            lambda: LUT3x1D().table,
+            lambda: LUT3D().table,
+            lambda: LUT1D(LUT1D.linear_table(17) ** (1 / 2.2)).apply(RGB),
+            lambda: LUT3x1D(LUT3x1D.linear_table(17) ** (1 / 2.2)).apply(RGB),
+            lambda: LUT3D(LUT3D.linear_table(17) ** (1 / 2.2)).apply(RGB),
+        ]
+        for cctf in sorted(CCTF_ENCODINGS):
+            definitions.append(lambda cctf=cctf: cctf_encoding(RGB, cctf))
+        for cctf in sorted(CCTF_DECODINGS):
+            definitions.append(lambda cctf=cctf: cctf_decoding(RGB, cctf))
+
+        def as_arrays(a):
+            """
+            Converts given definition output to a list of *ndarray*.
+            """
+
+            if isinstance(a, tuple):
+                return [np.asarray(x) for x in a if x is not None]
+
+            return [np.asarray(a)]
+
+        references = [as_arrays(definition()) for definition in definitions]
+
+        dtype = np.float32
+        set_float_precision(dtype)
+
+        for definition, reference in zip(definitions, references):
+            for a, b in zip(as_arrays(definition()), reference):
+                self.assertEqual(a.dtype, dtype)
+                np.testing.assert_allclose(
+                    a, b, rtol=0.0001, atol=0.0001 * np.max(np.abs(b)))
+
     def tearDown(self):
         """
         After tests actions.
@@ -333,6 +430,40 @@ class TestAsNametuple(unittest.TestCase):
             np.array(named_tuple), np.array(as_namedtuple(a_r, NamedTuple)))
 
 
+class TestAsStructuredArray(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.as_structured_array` definition unit
+    tests methods.
+    """
+
+    def test_as_structured_array(self):
+        """
+        Tests :func:`colour.utilities.array.as_structured_array` definition.
+        """
+
+        NamedTuple = namedtuple('NamedTuple', 'a b c')
+
+        a_a = np.ones(3)
+        a_b = np.ones(3) + 1
+
+        a_r = as_structured_array(NamedTuple(a_a, a_b, None))
+        self.assertTupleEqual(a_r.dtype.names, ('a', 'b'))
+        self.assertTupleEqual(a_r.shape, (3, ))
+        np.testing.assert_array_equal(a_r.a, a_a)
+        np.testing.assert_array_equal(a_r['b'], a_b)
+
+        a_r = as_structured_array({'a': 1, 'b': a_b})
+        np.testing.assert_array_equal(a_r.a, a_a)
+
+        a_r = as_structured_array(NamedTuple(a_a, a_b, a_a + 2))
+        np.testing.assert_array_equal(
+            np.array(as_namedtuple(a_r, NamedTuple)),
+            np.array(NamedTuple(a_a, a_b, a_a + 2)))
+
+        a_r = as_structured_array({'a': a_a, 'b': a_b}, np.float32)
+        self.assertEqual(a_r.a.dtype, np.float32)
+
+
 class TestClosestIndexes(unittest.TestCase):
     """
     Defines :func:`colour.utilities.array.closest_indexes` definition unit
@@ -4,13 +4,22 @@ Defines unit tests for :mod:`colour.utilities.common` module.
 """
 
 import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+import types
 import unittest
 from collections import OrderedDict
+from fractions import Fraction
 from functools import partial
 
+from colour.colorimetry import SDS_ILLUMINANTS, SpectralShape
 from colour.utilities import (
-    batch, multiprocessing_pool, is_iterable, is_string, is_numeric,
-    is_integer, is_sibling, filter_kwargs, filter_mapping, first_item,
+    batch, multiprocessing_pool, Cache, content_digest,
+    persistent_cache_directory, PersistentCache, CacheRegistry,
+    lazy_import_attributes, is_iterable, is_string, is_numeric, is_integer,
+    is_sibling, filter_kwargs, filter_mapping, first_item,
     get_domain_range_scale, set_domain_range_scale, domain_range_scale,
     to_domain_1, to_domain_10, to_domain_100, to_domain_int, to_domain_degrees,
     from_range_1, from_range_10, from_range_100, from_range_int,
@@ -24,7 +33,10 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestBatch', 'TestMultiprocessingPool', 'TestIsIterable', 'TestIsString',
+    'TestBatch', 'TestMultiprocessingPool', 'TestCache', 'TestContentDigest',
+    'TestPersistentCacheDirectory', 'TestPersistentCache',
+    'TestCacheRegistry', 'TestLazyImportAttributes',
+    'TestIsIterable', 'TestIsString',
     'TestIsNumeric', 'TestIsInteger', 'TestIsSibling', 'TestFilterKwargs',
     'TestFilterMapping', 'TestFirstItem', 'TestGetDomainRangeScale',
     'TestSetDomainRangeScale', 'TestDomainRangeScale', 'TestToDomain1',
@@ -98,6 +110,382 @@ class TestMultiprocessingPool(unittest.TestCase):
                 [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
 
 
+class TestCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.common.Cache` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('maximum_size', 'hits', 'misses')
+
+        cache = Cache()
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(cache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__setitem__', 'get')
+
+        for method in required_methods:
+            self.assertIn(method, dir(Cache))
+
+    def test_get(self):
+        """
+        Tests :meth:`colour.utilities.common.Cache.get` method.
+        """
+
+        cache = Cache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('c'))
+        self.assertEqual(cache.get('c', 3), 3)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        # "b" is the least recently used item.
+        cache['c'] = 3
+        self.assertListEqual(list(cache.keys()), ['a', 'c'])
+
+        cache = Cache()
+        for i in range(64):
+            cache[i] = i
+        self.assertEqual(len(cache), 64)
+
+
+class TestContentDigest(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.content_digest` definition unit
+    tests methods.
+    """
+
+    def test_content_digest(self):
+        """
+        Tests :func:`colour.utilities.common.content_digest` definition.
+        """
+
+        sd = SDS_ILLUMINANTS['D65']
+        digest = content_digest(sd, SpectralShape(360, 830, 1), {'k': 1})
+
+        self.assertEqual(
+            digest,
+            content_digest(sd.copy(), SpectralShape(360, 830, 1), {'k': 1}))
+        self.assertNotEqual(
+            digest, content_digest(sd, SpectralShape(360, 830, 1), {'k': 2}))
+        self.assertNotEqual(
+            digest,
+            content_digest(sd.copy().normalise(), SpectralShape(360, 830, 1),
+                           {'k': 1}))
+
+        self.assertNotEqual(
+            content_digest(np.array([1, 2, 3])),
+            content_digest(np.array([1.0, 2.0, 3.0])))
+        self.assertNotEqual(
+            content_digest(np.zeros([2, 3])), content_digest(np.zeros([3, 2])))
+        self.assertNotEqual(
+            content_digest((1, (2, 3))), content_digest((1, 2, 3)))
+
+
+class TestPersistentCacheDirectory(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.persistent_cache_directory`
+    definition unit tests methods.
+    """
+
+    def test_persistent_cache_directory(self):
+        """
+        Tests :func:`colour.utilities.common.persistent_cache_directory`
+        definition.
+        """
+
+        directory = os.environ.pop('COLOUR_SCIENCE__CACHE_DIR', None)
+        try:
+            self.assertIsNone(persistent_cache_directory())
+
+            os.environ['COLOUR_SCIENCE__CACHE_DIR'] = 'Foo'
+            self.assertEqual(
+                os.path.dirname(persistent_cache_directory()), 'Foo')
+        finally:
+            if directory is None:
+                del os.environ['COLOUR_SCIENCE__CACHE_DIR']
+            else:
+                os.environ['COLOUR_SCIENCE__CACHE_DIR'] = directory
+
+
+class TestPersistentCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.common.PersistentCache` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._environment = os.environ.get('COLOUR_SCIENCE__CACHE_DIR')
+        self._temporary_directory = tempfile.mkdtemp()
+
+        os.environ['COLOUR_SCIENCE__CACHE_DIR'] = self._temporary_directory
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        if self._environment is None:
+            del os.environ['COLOUR_SCIENCE__CACHE_DIR']
+        else:
+            os.environ['COLOUR_SCIENCE__CACHE_DIR'] = self._environment
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('name', 'directory', 'maximum_size', 'hits',
+                               'misses', 'persistent_hits')
+
+        cache = PersistentCache('Cache A')
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(cache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__setitem__', 'get',
+                            'clear_persistent')
+
+        for method in required_methods:
+            self.assertIn(method, dir(PersistentCache))
+
+    def test_get(self):
+        """
+        Tests :meth:`colour.utilities.common.PersistentCache.get` method.
+        """
+
+        cache = PersistentCache('Cache A')
+        cache['a'] = np.array([1, 2, 3])
+        cache['b'] = (np.array([1.0]), np.array([[2.0, 3.0]]))
+        cache['c'] = 'Foo'
+
+        self.assertListEqual(
+            sorted(os.listdir(cache.directory)), ['a.npz', 'b.npz'])
+
+        # A new cache with the same name, e.g. in another process, reads the
+        # items stored on disk.
+        cache = PersistentCache('Cache A', 1)
+        np.testing.assert_equal(cache.get('a'), [1, 2, 3])
+        value = cache.get('b')
+        self.assertIsInstance(value, tuple)
+        np.testing.assert_equal(value[1], [[2.0, 3.0]])
+        self.assertIsNone(cache.get('c'))
+        self.assertEqual(
+            (cache.hits, cache.misses, cache.persistent_hits), (2, 1, 2))
+        self.assertListEqual(list(cache.keys()), ['b'])
+
+        cache.clear_persistent()
+        cache.clear()
+        self.assertIsNone(cache.get('a'))
+
+        del os.environ['COLOUR_SCIENCE__CACHE_DIR']
+        self.assertIsNone(cache.directory)
+        cache['a'] = np.array([1, 2, 3])
+        np.testing.assert_equal(cache.get('a'), [1, 2, 3])
+        os.environ['COLOUR_SCIENCE__CACHE_DIR'] = self._temporary_directory
+
+
+class TestCacheRegistry(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.common.CacheRegistry` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('registry', )
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CacheRegistry))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__str__', 'register_cache',
+                            'unregister_cache', 'clear_cache',
+                            'clear_all_caches', 'statistics')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CacheRegistry))
+
+    def test__str__(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.__str__` method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_registry.register_cache('Cache A')['Foo'] = 'Bar'
+        cache_registry.register_cache('Cache B')
+
+        self.assertEqual(
+            str(cache_registry),
+            "{'Cache A': '1 item(s), 0 hit(s), 0 miss(es)', "
+            "'Cache B': '0 item(s), 0 hit(s), 0 miss(es)'}")
+
+    def test_register_cache(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.register_cache`
+        and :meth:`colour.utilities.common.CacheRegistry.unregister_cache`
+        methods.
+        """
+
+        cache_registry = CacheRegistry()
+        cache = cache_registry.register_cache('Cache A', 4)
+
+        self.assertIs(cache_registry.registry['Cache A'], cache)
+        self.assertEqual(cache.maximum_size, 4)
+
+        cache_registry.unregister_cache('Cache A')
+        self.assertNotIn('Cache A', cache_registry.registry)
+
+    def test_clear_cache(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.clear_cache` and
+        :meth:`colour.utilities.common.CacheRegistry.clear_all_caches`
+        methods.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A')
+        cache_b = cache_registry.register_cache('Cache B')
+        cache_a['Foo'] = cache_b['Foo'] = 'Bar'
+
+        cache_registry.clear_cache('Cache A')
+        self.assertEqual((len(cache_a), len(cache_b)), (0, 1))
+
+        cache_registry.clear_all_caches()
+        self.assertEqual((len(cache_a), len(cache_b)), (0, 0))
+
+        environment = os.environ.get('COLOUR_SCIENCE__CACHE_DIR')
+        temporary_directory = tempfile.mkdtemp()
+        os.environ['COLOUR_SCIENCE__CACHE_DIR'] = temporary_directory
+        try:
+            cache_c = cache_registry.register_cache(
+                'Cache C', persistent=True)
+            self.assertIsInstance(cache_c, PersistentCache)
+
+            cache_c['Foo'] = np.array([1, 2, 3])
+            cache_registry.clear_cache('Cache C')
+            np.testing.assert_equal(cache_c.get('Foo'), [1, 2, 3])
+
+            cache_registry.clear_all_caches(persistent=True)
+            self.assertIsNone(cache_c.get('Foo'))
+        finally:
+            if environment is None:
+                del os.environ['COLOUR_SCIENCE__CACHE_DIR']
+            else:
+                os.environ['COLOUR_SCIENCE__CACHE_DIR'] = environment
+
+            shutil.rmtree(temporary_directory)
+
+    def test_statistics(self):
+        """
+        Tests :meth:`colour.utilities.common.CacheRegistry.statistics`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache = cache_registry.register_cache('Cache A', 8)
+        cache['Foo'] = 'Bar'
+        cache.get('Foo')
+        cache.get('Baz')
+
+        self.assertDictEqual(
+            cache_registry.statistics()['Cache A'], {
+                'size': 1,
+                'maximum_size': 8,
+                'hits': 1,
+                'misses': 1
+            })
+
+        cache_registry.register_cache('Cache B', persistent=True)
+        self.assertEqual(
+            cache_registry.statistics()['Cache B']['persistent_hits'], 0)
+
+
+class TestLazyImportAttributes(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.lazy_import_attributes` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._module = sys.modules['colour_lazy_module'] = types.ModuleType(
+            'colour_lazy_module')
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        del sys.modules['colour_lazy_module']
+
+    def test_lazy_import_attributes(self):
+        """
+        Tests :func:`colour.utilities.common.lazy_import_attributes`
+        definition.
+        """
+
+        __getattr__, __dir__ = lazy_import_attributes(
+            'colour_lazy_module', {
+                'fractions': ('Fraction', ),
+                'colour.utilities.common': ('first_item', ),
+            })
+
+        self.assertIs(self._module.__getattr__, __getattr__)
+        self.assertNotIn('Fraction', vars(self._module))
+        self.assertListEqual(
+            [name for name in dir(self._module) if not name.startswith('_')],
+            ['Fraction', 'first_item'])
+
+        self.assertIs(self._module.Fraction, Fraction)
+        self.assertIs(vars(self._module)['Fraction'], Fraction)
+        self.assertIs(self._module.first_item, first_item)
+
+        self.assertRaises(AttributeError, getattr, self._module, 'Undefined')
+
+    def test_lazy_import_attributes_submodules(self):
+        """
+        Tests :func:`colour.utilities.common.lazy_import_attributes`
+        definition attributes sharing their name with a sub-module.
+        """
+
+        import colour.colorimetry.lightness
+        import colour.colorimetry
+
+        self.assertIsInstance(colour.colorimetry.lightness, types.FunctionType)
+
+
 class TestIsIterable(unittest.TestCase):
     """
     Defines :func:`colour.utilities.common.is_iterable` definition unit tests
@@ -5,11 +5,14 @@ Defines unit tests for :mod:`colour.utilities.data_structures` module.
 
 import numpy as np
 import operator
+import os
 import pickle
+import shutil
+import tempfile
 import unittest
 
 from colour.utilities import (Structure, Lookup, CaseInsensitiveMapping,
-                              LazyCaseInsensitiveMapping)
+                              LazyCaseInsensitiveMapping, ArchiveMapping)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -20,7 +23,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestStructure', 'TestLookup', 'TestCaseInsensitiveMapping',
-    'TestLazyCaseInsensitiveMapping'
+    'TestLazyCaseInsensitiveMapping', 'TestArchiveMapping'
 ]
 
 
@@ -377,6 +380,131 @@ LazyCaseInsensitiveMapping.__getitem__` method.
 
         self.assertEqual(mapping['jane'], 'Doe')
 
+    def test_copy(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.copy` method.
+        """
+
+        calls = []
+
+        def value():
+            """
+            Returns a value while recording the call.
+            """
+
+            calls.append(None)
+
+            return 'Doe'
+
+        mapping1 = LazyCaseInsensitiveMapping(John='Doe', Jane=value)
+        mapping2 = mapping1.copy()
+
+        self.assertIsInstance(mapping2, LazyCaseInsensitiveMapping)
+
+        self.assertListEqual(calls, [])
+
+        self.assertEqual(mapping2['Jane'], 'Doe')
+
+    def test_lower_items(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.lower_items` method.
+        """
+
+        mapping = LazyCaseInsensitiveMapping(John='Doe', Jane=lambda: 'Doe')
+
+        self.assertListEqual(
+            sorted([item for item in mapping.lower_items()]),
+            [('jane', 'Doe'), ('john', 'Doe')])
+
+
+class TestArchiveMapping(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.ArchiveMapping` class
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._path = os.path.join(self._temporary_directory, 'archive.npz')
+        np.savez(
+            self._path,
+            Jane=np.array([[1, 2, 3], [4, 5, 6]]),
+            John=np.array([[1, 2], [3, 4]]),
+            Doe=np.array(['John', 'Jane']))
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('path', 'as_dict')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ArchiveMapping))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__getitem__', '__iter__', '__len__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ArchiveMapping))
+
+    def test__getitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.ArchiveMapping.\
+__getitem__` method.
+        """
+
+        mapping = ArchiveMapping(self._path)
+
+        np.testing.assert_equal(mapping['John'], np.array([[1, 2], [3, 4]]))
+
+        np.testing.assert_equal(mapping['Doe'], np.array(['John', 'Jane']))
+
+        mapping = ArchiveMapping(self._path, as_dict=True)
+
+        self.assertDictEqual(mapping['John'], {1: 2, 3: 4})
+
+        self.assertDictEqual(mapping['Jane'], {1: (2, 3), 4: (5, 6)})
+
+        np.testing.assert_equal(mapping['Doe'], np.array(['John', 'Jane']))
+
+        self.assertRaises(KeyError, lambda: mapping['Smith'])
+
+    def test__iter__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.ArchiveMapping.\
+__iter__` method.
+        """
+
+        self.assertListEqual(
+            list(ArchiveMapping(self._path)), ['Jane', 'John', 'Doe'])
+
+    def test__len__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.ArchiveMapping.\
+__len__` method.
+        """
+
+        self.assertEqual(len(ArchiveMapping(self._path)), 3)
+
 
 if __name__ == '__main__':
     unittest.main()
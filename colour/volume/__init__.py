@@ -1,21 +1,47 @@
 # -*- coding: utf-8 -*-
 
-from .datasets import *  # noqa
+from colour.utilities import lazy_import_attributes
+
 from . import datasets
-from .macadam_limits import is_within_macadam_limits
-from .mesh import is_within_mesh_volume
-from .pointer_gamut import is_within_pointer_gamut
-from .spectrum import (generate_pulse_waves, XYZ_outer_surface,
-                       is_within_visible_spectrum)
-from .rgb import (RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
-                  RGB_colourspace_volume_coverage_MonteCarlo,
-                  RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
-                  RGB_colourspace_visible_spectrum_coverage_MonteCarlo)
+
+_LAZY_ATTRIBUTES = {
+    '.mesh': (
+        'GamutHull', 'is_within_mesh_volume', 'mesh_volume',
+        'mesh_volume_intersection',
+    ),
+    '.macadam_limits': (
+        'XYZ_optimal_colour_stimuli', 'is_within_macadam_limits',
+    ),
+    '.pointer_gamut': (
+        'is_within_pointer_gamut',
+    ),
+    '.spectrum': (
+        'generate_pulse_waves', 'XYZ_outer_surface',
+        'is_within_visible_spectrum',
+    ),
+    '.rgb': (
+        'RGB_colourspace_limits', 'RGB_colourspace_volume_MonteCarlo',
+        'RGB_colourspace_volume_coverage_MonteCarlo',
+        'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
+        'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+        'RGB_colourspace_volume', 'RGB_colourspace_volume_coverage',
+        'RGB_colourspace_pointer_gamut_coverage',
+        'RGB_colourspace_visible_spectrum_coverage',
+    ),
+    '.datasets': datasets.__all__,
+}
+
+__getattr__, __dir__ = lazy_import_attributes(
+    __name__, _LAZY_ATTRIBUTES,
+    ('macadam_limits', 'mesh', 'pointer_gamut', 'rgb', 'spectrum'))
 
 __all__ = []
 __all__ += datasets.__all__
-__all__ += ['is_within_macadam_limits']
-__all__ += ['is_within_mesh_volume']
+__all__ += [
+    'GamutHull', 'is_within_mesh_volume', 'mesh_volume',
+    'mesh_volume_intersection'
+]
+__all__ += ['XYZ_optimal_colour_stimuli', 'is_within_macadam_limits']
 __all__ += ['is_within_pointer_gamut']
 __all__ += [
     'generate_pulse_waves', 'XYZ_outer_surface', 'is_within_visible_spectrum'
@@ -24,5 +50,8 @@ __all__ += [
     'RGB_colourspace_limits', 'RGB_colourspace_volume_MonteCarlo',
     'RGB_colourspace_volume_coverage_MonteCarlo',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
-    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
+    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+    'RGB_colourspace_volume', 'RGB_colourspace_volume_coverage',
+    'RGB_colourspace_pointer_gamut_coverage',
+    'RGB_colourspace_visible_spectrum_coverage'
 ]
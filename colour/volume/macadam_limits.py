@@ -6,11 +6,12 @@ Optimal Colour Stimuli - MacAdam Limits
 Defines objects related to *Optimal Colour Stimuli* computations.
 """
 
-import numpy as np
-from scipy.spatial import Delaunay
-
+from colour.colorimetry import MSDS_CMFS
 from colour.models import xyY_to_XYZ
-from colour.volume import OPTIMAL_COLOUR_STIMULI_ILLUMINANTS
+from colour.volume import GamutHull, OPTIMAL_COLOUR_STIMULI_ILLUMINANTS
+from colour.volume.spectrum import (SPECTRAL_SHAPE_OUTER_SURFACE_XYZ,
+                                    XYZ_outer_surface)
+from colour.utilities import CACHE_REGISTRY
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -19,28 +20,56 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['is_within_macadam_limits']
+__all__ = ['XYZ_optimal_colour_stimuli', 'is_within_macadam_limits']
 
-_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ = {}
-_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS = {}
+_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_OPTIMAL_COLOUR_STIMULI_XYZ'.format(__name__), 8)
 
 
-def _XYZ_optimal_colour_stimuli(illuminant):
+def XYZ_optimal_colour_stimuli(
+        illuminant,
+        cmfs=MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        .copy().align(SPECTRAL_SHAPE_OUTER_SURFACE_XYZ),
+        hue_samples=None):
     """
     Returns given illuminant *Optimal Colour Stimuli* in *CIE XYZ* tristimulus
     values and caches it if not existing.
 
     Parameters
     ----------
-    illuminant : unicode
-        Illuminant.
+    illuminant : unicode or SpectralDistribution
+        Illuminant name, one of
+        :attr:`colour.OPTIMAL_COLOUR_STIMULI_ILLUMINANTS` attribute keys, or
+        illuminant spectral distribution in which case the *Optimal Colour
+        Stimuli* are computed with :func:`colour.volume.XYZ_outer_surface`
+        definition.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions used with an illuminant
+        spectral distribution.
+    hue_samples : int, optional
+        Number of evenly spaced wavelengths at which the pulse waves start and
+        end with an illuminant spectral distribution, see
+        :func:`colour.volume.XYZ_outer_surface` definition.
 
     Returns
     -------
-    tuple
+    ndarray
         Illuminant *Optimal Colour Stimuli*.
+
+    Examples
+    --------
+    >>> XYZ_optimal_colour_stimuli('D65').shape
+    (240, 3)
+    >>> from colour import SDS_ILLUMINANTS
+    >>> XYZ_optimal_colour_stimuli(  # doctest: +ELLIPSIS
+    ...     SDS_ILLUMINANTS['D65'], hue_samples=32)[-1]
+    array([ 0.9504650...,  1.        ,  1.0889702...])
     """
 
+    if not isinstance(illuminant, str):
+        return XYZ_outer_surface(
+            cmfs, illuminant.copy().align(cmfs.shape), hue_samples)
+
     optimal_colour_stimuli = OPTIMAL_COLOUR_STIMULI_ILLUMINANTS.get(illuminant)
     if optimal_colour_stimuli is None:
         raise KeyError('"{0}" not found in factory '
@@ -55,7 +84,12 @@ def _XYZ_optimal_colour_stimuli(illuminant):
     return vertices
 
 
-def is_within_macadam_limits(xyY, illuminant, tolerance=None):
+def is_within_macadam_limits(
+        xyY,
+        illuminant,
+        tolerance=None,
+        cmfs=MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        .copy().align(SPECTRAL_SHAPE_OUTER_SURFACE_XYZ)):
     """
     Returns if given *CIE xyY* colourspace array is within MacAdam limits of
     given illuminant.
@@ -64,10 +98,14 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     ----------
     xyY : array_like
         *CIE xyY* colourspace array.
-    illuminant : unicode
-        Illuminant.
+    illuminant : unicode or SpectralDistribution
+        Illuminant name or illuminant spectral distribution, see
+        :func:`colour.volume.XYZ_optimal_colour_stimuli` definition.
     tolerance : numeric, optional
         Tolerance allowed in the inside-triangle check.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions used with an illuminant
+        spectral distribution.
 
     Returns
     -------
@@ -85,22 +123,19 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
 
     Examples
     --------
+    >>> import numpy as np
     >>> is_within_macadam_limits(np.array([0.3205, 0.4131, 0.51]), 'A')
     array(True, dtype=bool)
     >>> a = np.array([[0.3205, 0.4131, 0.51],
     ...               [0.0005, 0.0031, 0.001]])
     >>> is_within_macadam_limits(a, 'A')
     array([ True, False], dtype=bool)
+    >>> from colour import SDS_ILLUMINANTS
+    >>> is_within_macadam_limits(a, SDS_ILLUMINANTS['A'])
+    array([ True, False], dtype=bool)
     """
 
-    optimal_colour_stimuli = _XYZ_optimal_colour_stimuli(illuminant)
-    triangulation = _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS.get(
-        illuminant)
-    if triangulation is None:
-        _CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS[illuminant] = \
-            triangulation = Delaunay(optimal_colour_stimuli)
-
-    simplex = triangulation.find_simplex(xyY_to_XYZ(xyY), tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
+    optimal_colour_stimuli = XYZ_optimal_colour_stimuli(illuminant, cmfs)
 
-    return simplex
+    return GamutHull(optimal_colour_stimuli).contains(
+        xyY_to_XYZ(xyY), tolerance)
@@ -6,8 +6,12 @@ Mesh Volume Computation Helpers
 Defines helpers objects related to volume computations.
 """
 
+import hashlib
 import numpy as np
-from scipy.spatial import Delaunay
+from scipy.spatial import ConvexHull, Delaunay, HalfspaceIntersection
+
+from colour.constants import EPSILON
+from colour.utilities import CACHE_REGISTRY, as_float_array, as_int_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -16,7 +20,329 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['is_within_mesh_volume']
+__all__ = [
+    'GamutHull', 'is_within_mesh_volume', 'mesh_volume',
+    'mesh_volume_intersection'
+]
+
+_CACHE_GAMUT_HULLS = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_GAMUT_HULLS'.format(__name__), 32)
+
+_CHUNK_SIZE_GAMUT_HULL = 2 ** 18
+"""
+Points count tested at once by :meth:`colour.volume.GamutHull.contains`
+method, bounding the size of the intermediate arrays.
+
+_CHUNK_SIZE_GAMUT_HULL : int
+"""
+
+
+def _cube_map_bins(directions, resolution):
+    """
+    Returns the bins indexes of given directions in a cube map of given
+    resolution.
+    """
+
+    directions = np.asarray(directions)
+    indexes = np.arange(directions.shape[0])
+
+    axis = np.argmax(np.abs(directions), axis=-1)
+    major = directions[indexes, axis]
+    major_a = np.where(major == 0, 1, np.abs(major))
+
+    bins = 2 * axis + (major < 0)
+    for i in (1, 2):
+        minor = directions[indexes, (axis + i) % 3] / major_a
+        bins = bins * resolution + np.clip(
+            ((minor + 1) / 2 * resolution).astype(np.int_), 0,
+            resolution - 1)
+
+    return bins
+
+
+def _cube_map_directions(resolution):
+    """
+    Returns the unit directions of the bins centers of a cube map of given
+    resolution and the maximum distance between the unit directions within a
+    bin and its center.
+    """
+
+    edges = np.linspace(-1, 1, resolution + 1)
+    centers = (edges[:-1] + edges[1:]) / 2
+
+    def unit_directions(axis, sign, u, v):
+        """
+        Returns the unit directions of given cube map face coordinates.
+        """
+
+        u, v = np.meshgrid(u, v, indexing='ij')
+        directions = np.zeros(u.shape + (3, ))
+        directions[..., axis] = sign
+        directions[..., (axis + 1) % 3] = u
+        directions[..., (axis + 2) % 3] = v
+
+        return np.reshape(
+            directions / np.linalg.norm(directions, axis=-1)[..., np.newaxis],
+            (-1, 3))
+
+    directions, deltas = [], []
+    for axis in range(3):
+        for sign in (1, -1):
+            directions_c = unit_directions(axis, sign, centers, centers)
+            # The farthest direction of a bin from its center is one of its
+            # corners.
+            deltas.append(
+                np.max([
+                    np.linalg.norm(
+                        unit_directions(axis, sign,
+                                        edges[i:resolution + i],
+                                        edges[j:resolution + j]) -
+                        directions_c,
+                        axis=-1) for i in (0, 1) for j in (0, 1)
+                ],
+                       axis=0))
+            directions.append(directions_c)
+
+    return np.vstack(directions), np.hstack(deltas)
+
+
+class GamutHull(object):
+    """
+    Defines a gamut hull, i.e. the convex hull of a mesh, for repeated
+    point-in-gamut queries.
+
+    A point :math:`p` is within the hull if
+    :math:`\\max_i a_i \\cdot (p - c) \\leq 1` where :math:`c` is an interior
+    point and :math:`a_i` are the hull half-space normals scaled by the
+    inverse of their distance to :math:`c`. The directions around :math:`c`
+    are binned in a cube map storing for each bin the half-spaces that can
+    reach the maximum within it, thus only a few half-spaces are evaluated per
+    point. The half-spaces and the cube map are computed once per mesh content
+    and cached.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the mesh whose convex hull defines the gamut.
+    resolution : int, optional
+        Cube map resolution, i.e. the bins count along the edge of a cube map
+        face.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.volume.GamutHull.mesh`
+    -   :attr:`~colour.volume.GamutHull.equations`
+    -   :attr:`~colour.volume.GamutHull.triangulation`
+
+    Methods
+    -------
+    -   :meth:`~colour.volume.GamutHull.__init__`
+    -   :meth:`~colour.volume.GamutHull.contains`
+
+    Notes
+    -----
+    -   The hulls are cached in the
+        *colour.volume.mesh._CACHE_GAMUT_HULLS* cache whose hits and
+        misses are reported by :attr:`colour.utilities.CACHE_REGISTRY`
+        attribute.
+    -   Only 3-dimensional meshes are supported.
+
+    Examples
+    --------
+    >>> mesh = np.array(
+    ...     [[-1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, -1.0],
+    ...       [-1.0, -1.0, -1.0],
+    ...       [0.0, 1.0, 0.0]]
+    ... )
+    >>> hull = GamutHull(mesh)
+    >>> a = np.array([[0.0005, 0.0031, 0.0010],
+    ...               [0.3205, 0.4131, 0.5100]])
+    >>> hull.contains(a)
+    array([ True, False], dtype=bool)
+    """
+
+    def __init__(self, mesh, resolution=32):
+        self._mesh = as_float_array(mesh)
+
+        key = (self._mesh.shape, resolution,
+               hashlib.sha1(np.ascontiguousarray(self._mesh)).hexdigest())
+        self._hull = _CACHE_GAMUT_HULLS.get(key)
+
+        if self._hull is None:
+            _CACHE_GAMUT_HULLS[key] = self._hull = self._compute_hull(
+                self._mesh, resolution)
+
+    @staticmethod
+    def _compute_hull(mesh, resolution):
+        """
+        Computes the scaled half-spaces and the cube map of given mesh.
+        """
+
+        hull = ConvexHull(mesh)
+        # Merging the coplanar facets of the triangulated hull.
+        equations = np.unique(hull.equations, axis=0)
+
+        center = np.mean(mesh[hull.vertices], axis=0)
+        normals = equations[..., :-1]
+        gauge = normals / -(np.dot(normals, center) +
+                            equations[..., -1])[..., np.newaxis]
+
+        # A half-space can reach the maximum in a bin only if it is within
+        # reach of the maximum at the bin center given the bin extent.
+        directions, deltas = _cube_map_directions(resolution)
+        candidates, counts = [], []
+        size = max(1, _CHUNK_SIZE_GAMUT_HULL // len(gauge))
+        for i in range(0, len(directions), size):
+            values = np.dot(directions[i:i + size], gauge.T)
+            maxima = np.argmax(values, axis=-1)
+            reach = np.linalg.norm(
+                gauge[np.newaxis] - gauge[maxima][:, np.newaxis], axis=-1)
+            mask = (values - values[np.arange(len(maxima)), maxima, np.newaxis]
+                    + reach * deltas[i:i + size, np.newaxis] * (1 + 1e-6) >= 0)
+            candidates.append(np.nonzero(mask)[1])
+            counts.append(np.sum(mask, axis=-1))
+
+        # Smaller integers allow a faster sort of the points by candidates
+        # count in :meth:`colour.volume.GamutHull._gauge` method.
+        counts = np.hstack(counts)
+        counts = counts.astype(np.min_scalar_type(-np.max(counts)))
+
+        return {
+            'equations': equations,
+            'center': center,
+            'gauge': gauge,
+            'resolution': resolution,
+            'candidates': np.hstack(candidates),
+            'offsets': np.hstack([0, np.cumsum(counts)[:-1]]),
+            'counts': counts,
+            'triangulation': None,
+        }
+
+    @property
+    def mesh(self):
+        """
+        Getter property for the mesh.
+
+        Returns
+        -------
+        ndarray
+            Mesh.
+        """
+
+        return self._mesh
+
+    @property
+    def equations(self):
+        """
+        Getter property for the convex hull half-space equations, i.e. the
+        outward facets normals and offsets.
+
+        Returns
+        -------
+        ndarray
+            Convex hull half-space equations.
+        """
+
+        return self._hull['equations']
+
+    @property
+    def triangulation(self):
+        """
+        Getter property for the mesh *Delaunay* triangulation, computed on
+        first access.
+
+        Returns
+        -------
+        Delaunay
+            Mesh *Delaunay* triangulation.
+        """
+
+        if self._hull['triangulation'] is None:
+            self._hull['triangulation'] = Delaunay(self._mesh)
+
+        return self._hull['triangulation']
+
+    def _gauge(self, points):
+        """
+        Returns the gauge function value of given points, i.e. the factor by
+        which the hull must be scaled around its center to reach them.
+        """
+
+        gauge = self._hull['gauge']
+        candidates = self._hull['candidates']
+
+        directions = points - self._hull['center']
+        bins = _cube_map_bins(directions, self._hull['resolution'])
+
+        # Sorting the points by decreasing candidates count so that the points
+        # having at least "k" candidates are a prefix of the sorted arrays.
+        counts = self._hull['counts'][bins]
+        order = np.argsort(-counts, kind='stable')
+        counts = counts[order]
+        offsets = self._hull['offsets'][bins][order]
+        directions = directions[order]
+
+        values = np.einsum('...i,...i->...', gauge[candidates[offsets]],
+                           directions)
+        if len(counts):
+            prefixes = np.searchsorted(
+                -counts, -np.arange(1, counts[0] + 1), side='right')
+            for k in range(1, counts[0]):
+                n = prefixes[k]
+                np.maximum(
+                    values[:n],
+                    np.einsum('...i,...i->...',
+                              gauge[candidates[offsets[:n] + k]],
+                              directions[:n]),
+                    out=values[:n])
+
+        values[order] = values.copy()
+
+        return values
+
+    def contains(self, points, tolerance=None):
+        """
+        Returns if given points are within the gamut hull.
+
+        Parameters
+        ----------
+        points : array_like
+            Points to check if they are within the gamut hull.
+        tolerance : numeric, optional
+            Tolerance allowed in the inside-triangle check, if given, the
+            points outside the hull are tested with the *Delaunay*
+            triangulation.
+
+        Returns
+        -------
+        bool
+            Is within gamut hull.
+        """
+
+        points = as_float_array(points)
+        shape = points.shape[:-1]
+        points = np.reshape(points, (-1, 3))
+
+        within = np.zeros(points.shape[0], dtype=np.bool_)
+        for i in range(0, points.shape[0], _CHUNK_SIZE_GAMUT_HULL):
+            points_c = points[i:i + _CHUNK_SIZE_GAMUT_HULL]
+            finite = np.all(np.isfinite(points_c), axis=-1)
+
+            within_c = np.zeros(points_c.shape[0], dtype=np.bool_)
+            within_c[finite] = (
+                self._gauge(points_c[finite]) <= 1 + 100 * EPSILON)
+
+            if tolerance is not None:
+                outside = np.logical_and(finite, ~within_c)
+                if np.any(outside):
+                    within_c[outside] = self.triangulation.find_simplex(
+                        points_c[outside], tol=tolerance) >= 0
+
+            within[i:i + _CHUNK_SIZE_GAMUT_HULL] = within_c
+
+        return np.reshape(within, shape)
 
 
 def is_within_mesh_volume(points, mesh, tolerance=None):
@@ -38,6 +364,12 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     bool
         Is within mesh volume.
 
+    Notes
+    -----
+    -   The mesh convex hull and triangulation are cached by content with
+        :class:`colour.volume.GamutHull` class, prefer the latter for
+        repeated queries against large meshes.
+
     Examples
     --------
     >>> mesh = np.array(
@@ -55,9 +387,97 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
-    triangulation = Delaunay(mesh)
+    return GamutHull(mesh).contains(points, tolerance)
+
+
+def mesh_volume(vertices, faces):
+    """
+    Computes the signed volume enclosed by given closed triangular mesh using
+    the divergence theorem.
+
+    Parameters
+    ----------
+    vertices : array_like
+        Vertices of the mesh.
+    faces : array_like
+        Indexes of the vertices of the mesh triangular faces, the faces must
+        be consistently oriented.
+
+    Returns
+    -------
+    numeric
+        Mesh volume, positive if the faces are oriented outwards.
+
+    Examples
+    --------
+    >>> vertices = np.array(
+    ...     [[0.0, 0.0, 0.0],
+    ...      [1.0, 0.0, 0.0],
+    ...      [0.0, 1.0, 0.0],
+    ...      [0.0, 0.0, 1.0]]
+    ... )
+    >>> faces = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+    >>> mesh_volume(vertices, faces)  # doctest: +ELLIPSIS
+    0.1666666...
+    """
+
+    triangles = as_float_array(vertices)[as_int_array(faces)]
+
+    return np.sum(
+        np.einsum('...i,...i->...', triangles[..., 0, :],
+                  np.cross(triangles[..., 1, :], triangles[..., 2, :]))) / 6
+
+
+def mesh_volume_intersection(*meshes):
+    """
+    Computes the volume of the intersection of the convex hulls of given
+    meshes.
+
+    The convex hulls are converted to half-spaces whose intersection is
+    computed exactly around its *Chebyshev* center.
+
+    Parameters
+    ----------
+    \\*meshes : list, optional
+        Points of the meshes whose convex hulls are intersected.
+
+    Returns
+    -------
+    numeric
+        Convex hulls intersection volume.
+
+    Examples
+    --------
+    >>> mesh = np.array(
+    ...     [[-1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, -1.0],
+    ...       [-1.0, -1.0, -1.0],
+    ...       [0.0, 1.0, 0.0]]
+    ... )
+    >>> mesh_volume_intersection(mesh, mesh + 1)  # doctest: +ELLIPSIS
+    0.0416666...
+    """
+
+    from scipy.optimize import linprog
+
+    equations = np.vstack(
+        [ConvexHull(as_float_array(mesh)).equations for mesh in meshes])
+    normals, offsets = equations[..., :-1], equations[..., -1]
+
+    # The *Chebyshev* center, i.e. the center of the largest sphere inscribed
+    # in the intersection, is a strictly interior point if it exists.
+    dimensions = normals.shape[-1]
+    result = linprog(
+        np.hstack([np.zeros(dimensions), -1]),
+        A_ub=np.hstack(
+            [normals, np.linalg.norm(normals, axis=-1)[..., np.newaxis]]),
+        b_ub=-offsets,
+        bounds=[(None, None)] * dimensions + [(0, None)])
+
+    if not result.success or result.x[-1] <= EPSILON:
+        return 0
 
-    simplex = triangulation.find_simplex(points, tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
+    intersection = HalfspaceIntersection(equations, result.x[:-1])
 
-    return simplex
+    return ConvexHull(intersection.intersections).volume
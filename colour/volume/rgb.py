@@ -10,18 +10,28 @@ Defines various RGB colourspace volume computation objects:
 -   :func:`colour.RGB_colourspace_volume_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_pointer_gamut_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_visible_spectrum_coverage_MonteCarlo`
+-   :func:`colour.RGB_colourspace_volume`
+-   :func:`colour.RGB_colourspace_volume_coverage`
+-   :func:`colour.RGB_colourspace_pointer_gamut_coverage`
+-   :func:`colour.RGB_colourspace_visible_spectrum_coverage`
 """
 
 import itertools
 import multiprocessing
 import numpy as np
+from functools import partial
 
 from colour.algebra import random_triplet_generator
 from colour.colorimetry import CCS_ILLUMINANTS
-from colour.constants import DEFAULT_INT_DTYPE
-from colour.models import (Lab_to_XYZ, RGB_to_XYZ, XYZ_to_Lab, XYZ_to_RGB)
-from colour.volume import is_within_pointer_gamut, is_within_visible_spectrum
-from colour.utilities import as_float_array, multiprocessing_pool
+from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
+from colour.models import (
+    CCS_ILLUMINANT_POINTER_GAMUT, DATA_POINTER_GAMUT_VOLUME, Lab_to_XYZ,
+    LCHab_to_Lab, RGB_to_XYZ, XYZ_to_Lab, XYZ_to_RGB)
+from colour.volume import (XYZ_outer_surface, is_within_pointer_gamut,
+                           is_within_visible_spectrum,
+                           mesh_volume_intersection)
+from colour.utilities import (as_float_array, batch, domain_range_scale,
+                              multiprocessing_pool, tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -35,28 +45,181 @@ __all__ = [
     'RGB_colourspace_volume_MonteCarlo',
     'RGB_colourspace_volume_coverage_MonteCarlo',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
-    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
+    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+    'RGB_colourspace_volume', 'RGB_colourspace_volume_coverage',
+    'RGB_colourspace_pointer_gamut_coverage',
+    'RGB_colourspace_visible_spectrum_coverage'
 ]
 
 
-def _wrapper_RGB_colourspace_volume_MonteCarlo(arguments):
+_CHUNK_SIZE_MONTE_CARLO = 2 ** 18
+"""
+Samples count drawn and evaluated at once by the *Monte Carlo* volume
+computation objects, bounding the size of the intermediate arrays.
+
+_CHUNK_SIZE_MONTE_CARLO : int
+"""
+
+
+def _count_within_RGB_colourspace(Lab, colourspace, illuminant_Lab,
+                                  chromatic_adaptation_method):
+    """
+    Returns the count of given *CIE L\\*a\\*b\\** colourspace samples and
+    the count of those within given *RGB* colourspace volume.
+    """
+
+    RGB = XYZ_to_RGB(
+        Lab_to_XYZ(Lab, illuminant_Lab),
+        illuminant_Lab,
+        colourspace.whitepoint,
+        colourspace.matrix_XYZ_to_RGB,
+        chromatic_adaptation_transform=chromatic_adaptation_method)
+
+    return len(RGB), np.count_nonzero(
+        np.logical_and(
+            np.min(RGB, axis=-1) >= 0,
+            np.max(RGB, axis=-1) <= 1))
+
+
+def _count_within_RGB_colourspace_coverage(XYZ, colourspace,
+                                           coverage_sampler):
+    """
+    Returns the count of given *CIE XYZ* tristimulus values samples within
+    given coverage sampler volume and the count of those also within given
+    *RGB* colourspace volume.
+    """
+
+    XYZ_vs = XYZ[coverage_sampler(XYZ)]
+
+    RGB = XYZ_to_RGB(XYZ_vs, colourspace.whitepoint, colourspace.whitepoint,
+                     colourspace.matrix_XYZ_to_RGB)
+
+    return len(RGB), np.count_nonzero(
+        np.logical_and(
+            np.min(RGB, axis=-1) >= 0,
+            np.max(RGB, axis=-1) <= 1))
+
+
+def _count_MonteCarlo(arguments):
     """
-    Convenient wrapper to be able to call
-    :func:`colour.volume.rgb.sample_RGB_colourspace_volume_MonteCarlo`:
-    definition with multiple arguments.
+    Draws a chunk of random samples and evaluates given counter on it.
 
     Parameters
     ----------
-    arguments : array_like, optional
-        Arguments.
+    arguments : array_like
+        Counter, samples count, limits, random generator and random state.
 
     Returns
     -------
-    integer
-        Inside *RGB* colourspace volume samples count.
+    tuple
+        Counts returned by the counter.
+    """
+
+    counter, samples, limits, random_generator, random_state = arguments
+
+    return counter(
+        as_float_array(random_generator(samples, limits, random_state)))
+
+
+def _ratio_MonteCarlo(counter,
+                      samples,
+                      limits,
+                      random_generator,
+                      random_state,
+                      seed,
+                      target_standard_error,
+                      scale,
+                      chunk_size,
+                      processes):
+    """
+    Estimates the ratio of the two counts returned by given counter over
+    random samples using *Monte Carlo* method.
+
+    The samples are drawn and evaluated in chunks, each chunk drawing from its
+    own independent stream spawned from given seed with
+    :class:`numpy.random.SeedSequence` class, the result is thus reproducible
+    and independent of the processes count. When a target standard error is
+    given, the estimation stops as soon as it is reached.
+
+    Parameters
+    ----------
+    counter : callable
+        Callable returning the count of evaluated samples and the count of
+        samples within the estimated volume for given samples.
+    samples : numeric
+        Maximum samples count.
+    limits : array_like
+        Random samples limits.
+    random_generator : callable
+        Random triplet generator.
+    random_state : RandomState
+        If given, every chunk draws serially from that pseudo-random number
+        generator instead of independent streams.
+    seed : None, int or array_like
+        Seed of the independent streams.
+    target_standard_error : numeric
+        Target standard error of the scaled ratio.
+    scale : numeric
+        Ratio scale, e.g. the sampled volume.
+    chunk_size : int
+        Samples count drawn and evaluated at once.
+    processes : int
+        Processes count.
+
+    Returns
+    -------
+    float
+        Ratio estimate.
     """
 
-    return sample_RGB_colourspace_volume_MonteCarlo(*arguments)
+    samples = DEFAULT_INT_DTYPE(samples)
+    sizes = [
+        min(chunk_size, samples - i) for i in range(0, samples, chunk_size)
+    ]
+
+    if random_state is not None:
+        random_states = itertools.repeat(random_state)
+        processes = 1
+    else:
+        random_states = (np.random.RandomState(np.random.MT19937(child))
+                         for child in np.random.SeedSequence(seed).spawn(
+                             len(sizes)))
+
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+
+    arguments = [(counter, size, limits, random_generator, state)
+                 for size, state in zip(sizes, random_states)]
+
+    def accumulate(map_callable):
+        """
+        Accumulates the counts of the chunks in order until the target
+        standard error is reached.
+        """
+
+        total, within = 0, 0
+        for arguments_batch in batch(arguments, processes):
+            for total_c, within_c in map_callable(_count_MonteCarlo,
+                                                  arguments_batch):
+                total += total_c
+                within += within_c
+
+                if target_standard_error is not None and total:
+                    ratio = within / total
+                    standard_error = scale * np.sqrt(
+                        ratio * (1 - ratio) / total)
+                    if standard_error <= target_standard_error:
+                        return total, within
+
+        return total, within
+
+    if processes > 1 and len(arguments) > 1:
+        with multiprocessing_pool(processes) as pool:
+            total, within = accumulate(pool.map)
+    else:
+        total, within = accumulate(map)
+
+    return within / total
 
 
 def sample_RGB_colourspace_volume_MonteCarlo(
@@ -122,17 +285,10 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     random_state = (random_state
                     if random_state is not None else np.random.RandomState())
 
-    Lab = as_float_array(list(random_generator(samples, limits, random_state)))
-    RGB = XYZ_to_RGB(
-        Lab_to_XYZ(Lab, illuminant_Lab),
-        illuminant_Lab,
-        colourspace.whitepoint,
-        colourspace.matrix_XYZ_to_RGB,
-        chromatic_adaptation_transform=chromatic_adaptation_method)
-    RGB_w = RGB[np.logical_and(
-        np.min(RGB, axis=-1) >= 0,
-        np.max(RGB, axis=-1) <= 1)]
-    return len(RGB_w)
+    Lab = as_float_array(random_generator(samples, limits, random_state))
+
+    return _count_within_RGB_colourspace(Lab, colourspace, illuminant_Lab,
+                                         chromatic_adaptation_method)[1]
 
 
 def RGB_colourspace_limits(colourspace,
@@ -186,7 +342,11 @@ def RGB_colourspace_volume_MonteCarlo(
             'D65'],
         chromatic_adaptation_method='CAT02',
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        seed=None,
+        target_standard_error=None,
+        chunk_size=_CHUNK_SIZE_MONTE_CARLO,
+        processes=None):
     """
     Performs given *RGB* colourspace volume computation using *Monte Carlo*
     method and multiprocessing.
@@ -211,7 +371,23 @@ def RGB_colourspace_volume_MonteCarlo(
         *CIE L\\*a\\*b\\** colourspace volume.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        number generator. If given, the samples are drawn serially from it,
+        otherwise each chunk draws from an independent stream spawned from
+        ``seed``.
+    seed : None, int or array_like, optional
+        Entropy used to spawn the independent random streams with
+        :class:`numpy.random.SeedSequence` class.
+    target_standard_error : numeric, optional
+        If given, the sampling stops as soon as the standard error of the
+        result is lower than or equal to it, ``samples`` is then the maximum
+        samples count.
+    chunk_size : int, optional
+        Samples count drawn and evaluated at once, bounding the size of the
+        intermediate arrays.
+    processes : int, optional
+        Processes count, default to the processors count. Multiprocessing is
+        only used when no ``random_state`` is given and for more than one
+        chunk.
 
     Returns
     -------
@@ -240,19 +416,18 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     8...
     """
 
-    processes = multiprocessing.cpu_count()
-    process_samples = DEFAULT_INT_DTYPE(np.round(samples / processes))
-
-    arguments = (colourspace, process_samples, limits, illuminant_Lab,
-                 chromatic_adaptation_method, random_generator, random_state)
-
-    with multiprocessing_pool() as pool:
-        results = pool.map(_wrapper_RGB_colourspace_volume_MonteCarlo,
-                           [arguments for _ in range(processes)])
-
+    limits = as_float_array(limits)
     Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
 
-    return Lab_volume * np.sum(results) / (process_samples * processes)
+    counter = partial(
+        _count_within_RGB_colourspace,
+        colourspace=colourspace,
+        illuminant_Lab=illuminant_Lab,
+        chromatic_adaptation_method=chromatic_adaptation_method)
+
+    return Lab_volume * _ratio_MonteCarlo(
+        counter, samples, limits, random_generator, random_state, seed,
+        target_standard_error, Lab_volume, chunk_size, processes)
 
 
 def RGB_colourspace_volume_coverage_MonteCarlo(
@@ -260,7 +435,11 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
         coverage_sampler,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        seed=None,
+        target_standard_error=None,
+        chunk_size=_CHUNK_SIZE_MONTE_CARLO,
+        processes=None):
     """
     Returns given *RGB* colourspace percentage coverage of an arbitrary volume.
 
@@ -276,7 +455,23 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
         Random triplet generator providing the random samples.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        number generator. If given, the samples are drawn serially from it,
+        otherwise each chunk draws from an independent stream spawned from
+        ``seed``.
+    seed : None, int or array_like, optional
+        Entropy used to spawn the independent random streams with
+        :class:`numpy.random.SeedSequence` class.
+    target_standard_error : numeric, optional
+        If given, the sampling stops as soon as the standard error of the
+        result is lower than or equal to it, ``samples`` is then the maximum
+        samples count.
+    chunk_size : int, optional
+        Samples count drawn and evaluated at once, bounding the size of the
+        intermediate arrays.
+    processes : int, optional
+        Processes count, default to the processors count. Multiprocessing is
+        only used when no ``random_state`` is given and for more than one
+        chunk.
 
     Returns
     -------
@@ -293,29 +488,26 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
     81...
     """
 
-    random_state = (random_state
-                    if random_state is not None else np.random.RandomState())
-
-    # TODO: Investigate for generator yielding directly a ndarray.
-    XYZ = as_float_array(
-        list(random_generator(samples, random_state=random_state)))
-    XYZ_vs = XYZ[coverage_sampler(XYZ)]
-
-    RGB = XYZ_to_RGB(XYZ_vs, colourspace.whitepoint, colourspace.whitepoint,
-                     colourspace.matrix_XYZ_to_RGB)
-
-    RGB_c = RGB[np.logical_and(
-        np.min(RGB, axis=-1) >= 0,
-        np.max(RGB, axis=-1) <= 1)]
+    counter = partial(
+        _count_within_RGB_colourspace_coverage,
+        colourspace=colourspace,
+        coverage_sampler=coverage_sampler)
 
-    return 100 * RGB_c.size / XYZ_vs.size
+    return 100 * _ratio_MonteCarlo(
+        counter, samples, np.array([[0, 1], [0, 1], [0, 1]]),
+        random_generator, random_state, seed, target_standard_error, 100,
+        chunk_size, processes)
 
 
 def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
         colourspace,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        seed=None,
+        target_standard_error=None,
+        chunk_size=_CHUNK_SIZE_MONTE_CARLO,
+        processes=None):
     """
     Returns given *RGB* colourspace percentage coverage of Pointer's Gamut
     volume using *Monte Carlo* method.
@@ -330,7 +522,23 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
         Random triplet generator providing the random samples.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        number generator. If given, the samples are drawn serially from it,
+        otherwise each chunk draws from an independent stream spawned from
+        ``seed``.
+    seed : None, int or array_like, optional
+        Entropy used to spawn the independent random streams with
+        :class:`numpy.random.SeedSequence` class.
+    target_standard_error : numeric, optional
+        If given, the sampling stops as soon as the standard error of the
+        result is lower than or equal to it, ``samples`` is then the maximum
+        samples count.
+    chunk_size : int, optional
+        Samples count drawn and evaluated at once, bounding the size of the
+        intermediate arrays.
+    processes : int, optional
+        Processes count, default to the processors count. Multiprocessing is
+        only used when no ``random_state`` is given and for more than one
+        chunk.
 
     Returns
     -------
@@ -348,14 +556,18 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
 
     return RGB_colourspace_volume_coverage_MonteCarlo(
         colourspace, is_within_pointer_gamut, samples, random_generator,
-        random_state)
+        random_state, seed, target_standard_error, chunk_size, processes)
 
 
 def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
         colourspace,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        seed=None,
+        target_standard_error=None,
+        chunk_size=_CHUNK_SIZE_MONTE_CARLO,
+        processes=None):
     """
     Returns given *RGB* colourspace percentage coverage of visible spectrum
     volume using *Monte Carlo* method.
@@ -370,7 +582,23 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
         Random triplet generator providing the random samples.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        number generator. If given, the samples are drawn serially from it,
+        otherwise each chunk draws from an independent stream spawned from
+        ``seed``.
+    seed : None, int or array_like, optional
+        Entropy used to spawn the independent random streams with
+        :class:`numpy.random.SeedSequence` class.
+    target_standard_error : numeric, optional
+        If given, the sampling stops as soon as the standard error of the
+        result is lower than or equal to it, ``samples`` is then the maximum
+        samples count.
+    chunk_size : int, optional
+        Samples count drawn and evaluated at once, bounding the size of the
+        intermediate arrays.
+    processes : int, optional
+        Processes count, default to the processors count. Multiprocessing is
+        only used when no ``random_state`` is given and for more than one
+        chunk.
 
     Returns
     -------
@@ -388,4 +616,289 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
 
     return RGB_colourspace_volume_coverage_MonteCarlo(
         colourspace, is_within_visible_spectrum, samples, random_generator,
-        random_state)
+        random_state, seed, target_standard_error, chunk_size, processes)
+
+
+_RGB_CUBE_FACES = np.array([
+    [[0, 0, 0], [0, 0, 1], [0, 1, 0]],
+    [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+    [[0, 0, 0], [1, 0, 0], [0, 0, 1]],
+    [[0, 1, 0], [0, 0, 1], [1, 0, 0]],
+    [[0, 0, 0], [0, 1, 0], [1, 0, 0]],
+    [[0, 0, 1], [1, 0, 0], [0, 1, 0]],
+], dtype=DEFAULT_FLOAT_DTYPE)
+"""
+Origin and :math:`u`, :math:`v` axes of the *RGB* colourspace cube faces,
+oriented so that :math:`u \\times v` is the outward normal.
+
+_RGB_CUBE_FACES : ndarray
+"""
+
+
+def _signed_volume_cells(P, origin):
+    """
+    Returns the signed volume of the cones joining given origin to the two
+    triangles of given cells, i.e. quadrilaterals whose corners are ordered
+    as :math:`(0, 0)`, :math:`(1, 0)`, :math:`(1, 1)` and :math:`(0, 1)`.
+    """
+
+    P00, P10, P11, P01 = [P[..., i, :] - origin for i in range(4)]
+
+    return (np.einsum('...i,...i->...', P00, np.cross(P10, P11)) +
+            np.einsum('...i,...i->...', P00, np.cross(P11, P01))) / 6
+
+
+def RGB_colourspace_volume(
+        colourspace,
+        illuminant_Lab=CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D65'],
+        chromatic_adaptation_method='CAT02',
+        XYZ_to_model=None,
+        tolerance=1e-3,
+        subdivisions=8,
+        maximum_level=6):
+    """
+    Computes given *RGB* colourspace volume by integrating its surface with
+    the divergence theorem.
+
+    The *RGB* colourspace cube surface is tessellated, its vertices are
+    converted to *CIE L\\*a\\*b\\** colourspace, or any given model, and the
+    enclosed volume is the sum of the signed volumes of the cones joining the
+    triangles to the *RGB* colourspace cube center. Every cell of the
+    tessellation is adaptively subdivided until the volume difference between
+    a cell and its four children is lower than its share of the tolerance,
+    the children volume is then refined with *Richardson* extrapolation.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    illuminant_Lab : array_like, optional
+        *CIE L\\*a\\*b\\** colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02 Brill 2008',
+        'Bianco 2010', 'Bianco PC 2010'}**,
+        *Chromatic adaptation* method.
+    XYZ_to_model : callable, optional
+        Callable converting the *CIE XYZ* tristimulus values, adapted to
+        ``illuminant_Lab``, to the colour model the volume is computed in,
+        default to *CIE L\\*a\\*b\\** colourspace. The callable is evaluated
+        with the *Reference* domain-range scale.
+    tolerance : numeric, optional
+        Relative tolerance of the volume.
+    subdivisions : int, optional
+        Initial subdivisions count of the *RGB* colourspace cube edges.
+    maximum_level : int, optional
+        Maximum subdivision level of the initial cells.
+
+    Returns
+    -------
+    float
+        *RGB* colourspace volume.
+
+    Notes
+    -----
+    -   The result is deterministic and, for the default
+        *CIE L\\*a\\*b\\** colourspace, is the limit to which
+        :func:`colour.RGB_colourspace_volume_MonteCarlo` definition converges
+        when ``limits`` encloses the *RGB* colourspace volume.
+
+    Examples
+    --------
+    >>> from colour.models import RGB_COLOURSPACE_sRGB as sRGB
+    >>> RGB_colourspace_volume(sRGB)  # doctest: +ELLIPSIS
+    820432.0454...
+    """
+
+    if XYZ_to_model is None:
+        XYZ_to_model = partial(XYZ_to_Lab, illuminant=illuminant_Lab)
+
+    def RGB_to_model(RGB):
+        """
+        Converts given *RGB* colourspace array to the volume colour model.
+        """
+
+        with domain_range_scale('ignore'):
+            return as_float_array(
+                XYZ_to_model(
+                    RGB_to_XYZ(
+                        RGB,
+                        colourspace.whitepoint,
+                        illuminant_Lab,
+                        colourspace.matrix_RGB_to_XYZ,
+                        chromatic_adaptation_transform=(
+                            chromatic_adaptation_method))))
+
+    origin = RGB_to_model(np.array([0.5, 0.5, 0.5]))
+
+    # Cells are expressed by their face index and parametric origin, all the
+    # cells of a given level sharing the same size.
+    u, v = tsplit(
+        np.reshape(
+            np.moveaxis(np.mgrid[0:subdivisions, 0:subdivisions], 0, -1),
+            (-1, 2)) / subdivisions)
+    faces = np.repeat(np.arange(6), len(u))
+    u, v = np.tile(u, 6), np.tile(v, 6)
+    size = 1 / subdivisions
+
+    # The 3x3 nodes of a cell: the corners of the coarse cell are nodes 0, 2,
+    # 8 and 6, the four children cells are sharing the central node 4.
+    i_n, j_n = np.reshape(np.mgrid[0:3, 0:3], (2, -1)) / 2
+    children = np.array([
+        [0, 1, 4, 3],
+        [1, 2, 5, 4],
+        [3, 4, 7, 6],
+        [4, 5, 8, 7],
+    ])
+    children_offsets = np.array([[0, 0], [0.5, 0], [0, 0.5], [0.5, 0.5]])
+
+    volume, tolerance_cell = 0, None
+    for level in range(maximum_level + 1):
+        if len(faces) == 0:
+            break
+
+        o, e_u, e_v = [_RGB_CUBE_FACES[faces, i] for i in range(3)]
+        U = (u[..., np.newaxis] + i_n * size)[..., np.newaxis]
+        V = (v[..., np.newaxis] + j_n * size)[..., np.newaxis]
+        P = RGB_to_model(o[:, np.newaxis] + U * e_u[:, np.newaxis] +
+                         V * e_v[:, np.newaxis])
+
+        coarse = _signed_volume_cells(P[:, [0, 2, 8, 6]], origin)
+        fine = np.sum(_signed_volume_cells(P[:, children], origin), axis=-1)
+
+        if tolerance_cell is None:
+            tolerance_cell = (
+                tolerance * np.abs(np.sum(fine)) * size ** 2 / 6)
+
+        if level == maximum_level:
+            converged = np.ones(len(faces), dtype=np.bool_)
+        else:
+            converged = np.abs(fine - coarse) <= tolerance_cell
+
+        volume += np.sum((fine + (fine - coarse) / 3)[converged])
+
+        u_c, v_c = [
+            (a[~converged, np.newaxis] + children_offsets[:, i] * size).ravel()
+            for i, a in enumerate((u, v))
+        ]
+        faces = np.repeat(faces[~converged], 4)
+        u, v = u_c, v_c
+        size /= 2
+        tolerance_cell /= 4
+
+    return np.abs(volume)
+
+
+def RGB_colourspace_volume_coverage(colourspace, mesh):
+    """
+    Returns given *RGB* colourspace percentage coverage of the convex hull of
+    an arbitrary mesh by intersecting their volumes in *CIE XYZ* colourspace.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume coverage percentage.
+    mesh : array_like
+        *CIE XYZ* tristimulus values of the mesh whose convex hull defines
+        the covered volume.
+
+    Returns
+    -------
+    float
+        Percentage coverage of volume.
+
+    Notes
+    -----
+    -   The *RGB* colourspace volume in *CIE XYZ* colourspace is the
+        parallelepiped of its cube vertices and the covered volume is the
+        convex hull of the mesh, i.e. the volume tested by
+        :func:`colour.is_within_mesh_volume` definition, the result is thus
+        the limit to which :func:`colour.RGB_colourspace_volume_coverage_\\
+MonteCarlo` definition converges when the mesh is within the *CIE XYZ*
+        colourspace unit cube.
+
+    Examples
+    --------
+    >>> from colour.models import RGB_COLOURSPACE_sRGB as sRGB
+    >>> mesh = np.array(
+    ...     [[0.1, 0.1, 0.1],
+    ...      [0.2, 0.1, 0.1],
+    ...      [0.1, 0.2, 0.1],
+    ...      [0.1, 0.1, 0.2]]
+    ... )
+    >>> RGB_colourspace_volume_coverage(sRGB, mesh)  # doctest: +ELLIPSIS
+    99.5181221...
+    """
+
+    vertices = RGB_to_XYZ(
+        np.array(list(itertools.product([0, 1], repeat=3))),
+        colourspace.whitepoint,
+        colourspace.whitepoint,
+        colourspace.matrix_RGB_to_XYZ)
+
+    mesh = as_float_array(mesh)
+
+    return 100 * (mesh_volume_intersection(vertices, mesh) /
+                  mesh_volume_intersection(mesh))
+
+
+def RGB_colourspace_pointer_gamut_coverage(colourspace):
+    """
+    Returns given *RGB* colourspace percentage coverage of Pointer's Gamut
+    volume by intersecting their volumes.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the *Pointer's Gamut* coverage percentage.
+
+    Returns
+    -------
+    float
+        Percentage coverage of *Pointer's Gamut* volume.
+
+    Examples
+    --------
+    >>> from colour.models import RGB_COLOURSPACE_sRGB as sRGB
+    >>> RGB_colourspace_pointer_gamut_coverage(sRGB)  # doctest: +ELLIPSIS
+    81.1911688...
+    """
+
+    return RGB_colourspace_volume_coverage(
+        colourspace,
+        Lab_to_XYZ(
+            LCHab_to_Lab(DATA_POINTER_GAMUT_VOLUME),
+            CCS_ILLUMINANT_POINTER_GAMUT))
+
+
+def RGB_colourspace_visible_spectrum_coverage(colourspace):
+    """
+    Returns given *RGB* colourspace percentage coverage of visible spectrum
+    volume by intersecting their volumes.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the visible spectrum coverage percentage.
+
+    Returns
+    -------
+    float
+        Percentage coverage of visible spectrum volume.
+
+    Notes
+    -----
+    -   The visible spectrum volume is not clipped to the *CIE XYZ*
+        colourspace unit cube sampled by
+        :func:`colour.RGB_colourspace_visible_spectrum_coverage_MonteCarlo`
+        definition, the results are thus not directly comparable.
+
+    Examples
+    --------
+    >>> from colour.models import RGB_COLOURSPACE_sRGB as sRGB
+    >>> RGB_colourspace_visible_spectrum_coverage(sRGB)  # doctest: +ELLIPSIS
+    48.1945349...
+    """
+
+    return RGB_colourspace_volume_coverage(colourspace, XYZ_outer_surface())
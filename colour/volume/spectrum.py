@@ -18,9 +18,9 @@ References
 import numpy as np
 
 from colour.colorimetry import (MSDS_CMFS, msds_to_XYZ, SpectralShape, sd_ones)
-from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.volume import is_within_mesh_volume
-from colour.utilities import zeros
+from colour.utilities import CACHE_REGISTRY, content_digest, zeros
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -42,8 +42,8 @@ interval of 5.
 SPECTRAL_SHAPE_OUTER_SURFACE_XYZ : SpectralShape
 """
 
-_CACHE_OUTER_SURFACE_XYZ = {}
-_CACHE_OUTER_SURFACE_XYZ_POINTS = {}
+_CACHE_OUTER_SURFACE_XYZ = CACHE_REGISTRY.register_cache(
+    '{0}._CACHE_OUTER_SURFACE_XYZ'.format(__name__), 8, persistent=True)
 
 
 def generate_pulse_waves(bins):
@@ -118,16 +118,13 @@ def generate_pulse_waves(bins):
            [ 1.,  1.,  1.,  1.,  1.]])
     """
 
-    square_waves = []
-    square_waves_basis = np.tril(
-        np.ones((bins, bins), dtype=DEFAULT_FLOAT_DTYPE))[0:-1, :]
-    for square_wave_basis in square_waves_basis:
-        for i in range(bins):
-            square_waves.append(np.roll(square_wave_basis, i))
+    offsets = (np.arange(bins) - np.arange(bins)[..., np.newaxis]) % bins
+    widths = np.arange(1, bins)[..., np.newaxis, np.newaxis]
+    square_waves = (offsets < widths).astype(DEFAULT_FLOAT_DTYPE)
 
     return np.vstack([
         zeros(bins),
-        np.vstack(square_waves),
+        np.reshape(square_waves, (-1, bins)),
         np.ones(bins, dtype=DEFAULT_FLOAT_DTYPE)
     ])
 
@@ -135,18 +132,32 @@ def generate_pulse_waves(bins):
 def XYZ_outer_surface(cmfs=MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
                       .copy().align(SPECTRAL_SHAPE_OUTER_SURFACE_XYZ),
                       illuminant=sd_ones(SPECTRAL_SHAPE_OUTER_SURFACE_XYZ),
+                      hue_samples=None,
                       **kwargs):
     """
     Generates the *CIE XYZ* colourspace outer surface for given colour matching
     functions using multi-spectral conversion of pulse waves to *CIE XYZ*
     tristimulus values.
 
+    The conversion being linear, the *CIE XYZ* tristimulus values of the
+    single bin pulse waves, i.e. the colour matching functions weighted by the
+    illuminant, are computed first. The tristimulus values of every other
+    pulse wave are then the difference of two of their cyclic cumulative
+    sums, thus the pulse waves returned by
+    :func:`colour.volume.generate_pulse_waves` definition are never built.
+
     Parameters
     ----------
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
     illuminant : SpectralDistribution, optional
         Illuminant spectral distribution.
+    hue_samples : int, optional
+        Number of evenly spaced wavelengths at which the pulse waves start and
+        end, all the wavelengths are used if not given. Sub-sampling by hue
+        reduces the number of *CIE XYZ* tristimulus values for mesh
+        generation from :math:`bins^2` to :math:`hue\\_samples^2`, all of them
+        lying on the outer surface.
 
     Other Parameters
     ----------------
@@ -159,6 +170,12 @@ def XYZ_outer_surface(cmfs=MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
     ndarray
         Outer surface *CIE XYZ* tristimulus values.
 
+    Notes
+    -----
+    -   The outer surfaces are cached in memory and, if the
+        *COLOUR_SCIENCE__CACHE_DIR* environment variable is set, on disk, see
+        :class:`colour.utilities.PersistentCache` class.
+
     References
     ----------
     :cite:`Lindbloom2015`, :cite:`Mansencal2018`
@@ -207,12 +224,32 @@ def XYZ_outer_surface(cmfs=MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
     settings = {'method': 'Integration', 'shape': cmfs.shape}
     settings.update(kwargs)
 
-    key = (hash(cmfs), hash(illuminant), str(settings))
+    key = content_digest(cmfs, illuminant, settings, hue_samples)
     XYZ = _CACHE_OUTER_SURFACE_XYZ.get(key)
 
     if XYZ is None:
-        pulse_waves = generate_pulse_waves(len(cmfs.wavelengths))
-        XYZ = msds_to_XYZ(pulse_waves, cmfs, illuminant, **settings) / 100
+        bins = len(cmfs.wavelengths)
+
+        XYZ_b = msds_to_XYZ(
+            np.identity(bins, dtype=DEFAULT_FLOAT_DTYPE), cmfs, illuminant,
+            **settings) / 100
+        XYZ_c = np.cumsum(np.vstack([zeros([1, 3]), XYZ_b, XYZ_b]), axis=0)
+
+        transitions = np.arange(bins)
+        if hue_samples is not None:
+            transitions = np.unique(
+                np.linspace(0, bins, hue_samples, endpoint=False).astype(
+                    DEFAULT_INT_DTYPE))
+
+        count = len(transitions)
+        offsets = np.arange(1, count)[..., np.newaxis] + np.arange(count)
+        ends = transitions[offsets % count] + bins * (offsets >= count)
+
+        XYZ = np.vstack([
+            zeros([1, 3]),
+            np.reshape(XYZ_c[ends] - XYZ_c[transitions], (-1, 3)),
+            XYZ_c[bins],
+        ])
 
         _CACHE_OUTER_SURFACE_XYZ[key] = XYZ
 
@@ -272,11 +309,6 @@ def is_within_visible_spectrum(
     array([ True, False], dtype=bool)
     """
 
-    key = (hash(cmfs), hash(illuminant), str(kwargs))
-    vertices = _CACHE_OUTER_SURFACE_XYZ_POINTS.get(key)
-
-    if vertices is None:
-        _CACHE_OUTER_SURFACE_XYZ_POINTS[key] = vertices = (XYZ_outer_surface(
-            cmfs, illuminant, **kwargs))
+    vertices = XYZ_outer_surface(cmfs, illuminant, **kwargs)
 
     return is_within_mesh_volume(XYZ, vertices, tolerance)
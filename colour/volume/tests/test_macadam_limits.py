@@ -7,7 +7,9 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.volume import is_within_macadam_limits
+from colour.colorimetry import SDS_ILLUMINANTS, SpectralShape
+from colour.volume import (XYZ_optimal_colour_stimuli, XYZ_outer_surface,
+                           is_within_macadam_limits)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -17,7 +19,43 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestIsWithinMacadamLimits']
+__all__ = ['TestXYZOptimalColourStimuli', 'TestIsWithinMacadamLimits']
+
+
+class TestXYZOptimalColourStimuli(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.macadam_limits.XYZ_optimal_colour_stimuli`
+    definition unit tests methods.
+    """
+
+    def test_XYZ_optimal_colour_stimuli(self):
+        """
+        Tests :func:`colour.volume.macadam_limits.XYZ_optimal_colour_stimuli`
+        definition.
+        """
+
+        self.assertEqual(XYZ_optimal_colour_stimuli('A').shape, (220, 3))
+
+        illuminant = SDS_ILLUMINANTS['D65']
+        XYZ = XYZ_optimal_colour_stimuli(illuminant)
+        self.assertEqual(XYZ.shape, (7142, 3))
+        np.testing.assert_almost_equal(
+            XYZ[-1], [0.95046506, 1.00000000, 1.08897024], decimal=7)
+
+        np.testing.assert_equal(
+            XYZ_optimal_colour_stimuli(illuminant, hue_samples=16),
+            XYZ_outer_surface(
+                illuminant=illuminant.copy().align(
+                    SpectralShape(360, 780, 5)),
+                hue_samples=16))
+
+    def test_raise_exception_XYZ_optimal_colour_stimuli(self):
+        """
+        Tests :func:`colour.volume.macadam_limits.XYZ_optimal_colour_stimuli`
+        definition raised exception.
+        """
+
+        self.assertRaises(KeyError, XYZ_optimal_colour_stimuli, 'B')
 
 
 class TestIsWithinMacadamLimits(unittest.TestCase):
@@ -44,6 +82,14 @@ class TestIsWithinMacadamLimits(unittest.TestCase):
         self.assertFalse(
             is_within_macadam_limits(np.array([0.0025, 0.0088, 0.0340]), 'C'))
 
+        self.assertTrue(
+            is_within_macadam_limits(
+                np.array([0.3205, 0.4131, 0.5100]), SDS_ILLUMINANTS['A']))
+
+        self.assertFalse(
+            is_within_macadam_limits(
+                np.array([0.0005, 0.0031, 0.0010]), SDS_ILLUMINANTS['A']))
+
     def test_n_dimensional_is_within_macadam_limits(self):
         """
         Tests :func:`colour.volume.macadam_limits.is_within_macadam_limits`
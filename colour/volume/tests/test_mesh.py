@@ -5,10 +5,12 @@ Defines unit tests for :mod:`colour.volume.mesh` module.
 
 import numpy as np
 import unittest
-from itertools import permutations
+from itertools import permutations, product
 
-from colour.volume import is_within_mesh_volume
-from colour.utilities import ignore_numpy_errors
+from colour.models import RGB_COLOURSPACE_sRGB
+from colour.volume import (GamutHull, XYZ_outer_surface, is_within_mesh_volume,
+                           mesh_volume, mesh_volume_intersection)
+from colour.utilities import CACHE_REGISTRY, ignore_numpy_errors
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -17,7 +19,134 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestIsWithinMeshVolume']
+__all__ = [
+    'TestGamutHull', 'TestIsWithinMeshVolume', 'TestMeshVolume',
+    'TestMeshVolumeIntersection'
+]
+
+
+class TestGamutHull(unittest.TestCase):
+    """
+    Defines :class:`colour.volume.mesh.GamutHull` class unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._mesh = np.array([
+            [-1.0, -1.0, 1.0],
+            [1.0, -1.0, 1.0],
+            [1.0, -1.0, -1.0],
+            [-1.0, -1.0, -1.0],
+            [0.0, 1.0, 0.0],
+        ])
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('mesh', 'equations', 'triangulation')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(GamutHull))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'contains')
+
+        for method in required_methods:
+            self.assertIn(method, dir(GamutHull))
+
+    def test_contains(self):
+        """
+        Tests :meth:`colour.volume.mesh.GamutHull.contains` method.
+        """
+
+        random_state = np.random.RandomState(4)
+        points = random_state.uniform(-0.1, 1.5, (10000, 3))
+
+        XYZ = np.array(list(product([0, 1], repeat=3)))
+        for mesh in (self._mesh, XYZ_outer_surface(),
+                     np.dot(XYZ, RGB_COLOURSPACE_sRGB.matrix_RGB_to_XYZ.T)):
+            hull = GamutHull(mesh)
+            np.testing.assert_equal(
+                hull.contains(points),
+                np.max(
+                    np.dot(points, hull.equations[..., :-1].T) +
+                    hull.equations[..., -1],
+                    axis=-1) <= 0)
+
+            # The hull boundary is within the hull.
+            self.assertTrue(np.all(hull.contains(mesh)))
+
+        hull = GamutHull(self._mesh)
+        np.testing.assert_equal(
+            hull.contains(points * 2 - 1),
+            hull.triangulation.find_simplex(points * 2 - 1) >= 0)
+
+        within = hull.contains(points * 2 - 1)
+        within_t = hull.contains(points * 2 - 1, 0.1)
+        self.assertTrue(np.all(within_t[within]))
+        self.assertGreater(np.sum(within_t), np.sum(within))
+
+    def test_cache_GamutHull(self):
+        """
+        Tests :class:`colour.volume.mesh.GamutHull` class cache.
+        """
+
+        cache = CACHE_REGISTRY.registry[
+            'colour.volume.mesh._CACHE_GAMUT_HULLS']
+
+        mesh = self._mesh * 2
+        hits, misses = cache.hits, cache.misses
+        GamutHull(mesh)
+        self.assertEqual((cache.hits, cache.misses), (hits, misses + 1))
+
+        hull = GamutHull(np.copy(mesh))
+        self.assertEqual((cache.hits, cache.misses), (hits + 1, misses + 1))
+        self.assertIs(hull.equations, GamutHull(mesh).equations)
+
+        GamutHull(mesh + 1)
+        self.assertEqual(cache.misses, misses + 2)
+
+    def test_n_dimensional_contains(self):
+        """
+        Tests :meth:`colour.volume.mesh.GamutHull.contains` method
+        n-dimensional arrays support.
+        """
+
+        hull = GamutHull(self._mesh)
+
+        a = np.array([0.0005, 0.0031, 0.0010])
+        b = hull.contains(a)
+        self.assertEqual(b.shape, ())
+
+        a = np.tile(a, (6, 1))
+        b = np.tile(b, 6)
+        np.testing.assert_equal(hull.contains(a), b)
+
+        a = np.reshape(a, (2, 3, 3))
+        b = np.reshape(b, (2, 3))
+        np.testing.assert_equal(hull.contains(a), b)
+
+    @ignore_numpy_errors
+    def test_nan_contains(self):
+        """
+        Tests :meth:`colour.volume.mesh.GamutHull.contains` method nan
+        support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        within = GamutHull(self._mesh).contains(cases)
+
+        self.assertFalse(np.any(within[~np.all(np.isfinite(cases), -1)]))
 
 
 class TestIsWithinMeshVolume(unittest.TestCase):
@@ -90,5 +219,60 @@ class TestIsWithinMeshVolume(unittest.TestCase):
             is_within_mesh_volume(case, self._mesh)
 
 
+class TestMeshVolume(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh.mesh_volume` definition unit tests
+    methods.
+    """
+
+    def test_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.mesh_volume` definition.
+        """
+
+        vertices = np.array([
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 0.0, 1.0],
+        ])
+        faces = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+
+        self.assertAlmostEqual(mesh_volume(vertices, faces), 1 / 6, places=7)
+
+        self.assertAlmostEqual(
+            mesh_volume(vertices * 2 + 10, faces), 8 / 6, places=7)
+
+        self.assertAlmostEqual(
+            mesh_volume(vertices, faces[..., ::-1]), -1 / 6, places=7)
+
+
+class TestMeshVolumeIntersection(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh.mesh_volume_intersection` definition
+    unit tests methods.
+    """
+
+    def test_mesh_volume_intersection(self):
+        """
+        Tests :func:`colour.volume.mesh.mesh_volume_intersection` definition.
+        """
+
+        cube = np.array(list(product([0.0, 1.0], repeat=3)))
+
+        self.assertAlmostEqual(
+            mesh_volume_intersection(cube), 1, places=7)
+
+        self.assertAlmostEqual(
+            mesh_volume_intersection(cube, cube + 0.5), 0.125, places=7)
+
+        self.assertAlmostEqual(
+            mesh_volume_intersection(cube, cube * 0.5, cube + 0.25),
+            0.015625,
+            places=7)
+
+        self.assertEqual(mesh_volume_intersection(cube, cube + 2), 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -29,6 +29,9 @@ from colour.volume import (
     RGB_colourspace_volume_coverage_MonteCarlo,
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
+    RGB_colourspace_volume, RGB_colourspace_volume_coverage,
+    RGB_colourspace_pointer_gamut_coverage,
+    RGB_colourspace_visible_spectrum_coverage, XYZ_outer_surface,
     is_within_pointer_gamut)
 from colour.utilities import disable_multiprocessing
 
@@ -43,7 +46,10 @@ __all__ = [
     'TestRGB_colourspaceLimits', 'TestRGB_colourspaceVolumeMonteCarlo',
     'TestRGB_colourspace_volume_coverage_MonteCarlo',
     'TestRGB_colourspacePointerGamutCoverageMonteCarlo',
-    'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo'
+    'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo',
+    'TestRGB_colourspaceVolume', 'TestRGB_colourspaceVolumeCoverage',
+    'TestRGB_colourspacePointerGamutCoverage',
+    'TestRGB_colourspaceVisibleSpectrumCoverage'
 ]
 
 
@@ -111,6 +117,67 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
             821700.0 * 1e-6,
             places=1)
 
+    def test_seed_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition independent random streams support.
+        """
+
+        volume = RGB_colourspace_volume_MonteCarlo(
+            RGB_COLOURSPACE_BT709, 10e3, seed=4, chunk_size=1000, processes=1)
+
+        self.assertEqual(
+            RGB_colourspace_volume_MonteCarlo(
+                RGB_COLOURSPACE_BT709,
+                10e3,
+                seed=4,
+                chunk_size=1000,
+                processes=2), volume)
+
+        self.assertNotEqual(
+            RGB_colourspace_volume_MonteCarlo(
+                RGB_COLOURSPACE_BT709,
+                10e3,
+                seed=5,
+                chunk_size=1000,
+                processes=1), volume)
+
+        self.assertAlmostEqual(volume * 1e-6, 821700.0 * 1e-6, places=1)
+
+    def test_target_standard_error_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition convergence based stopping criterion.
+        """
+
+        # Stopping after the first chunk is equivalent to drawing a single
+        # chunk of samples.
+        self.assertEqual(
+            RGB_colourspace_volume_MonteCarlo(
+                RGB_COLOURSPACE_BT709,
+                10e6,
+                seed=4,
+                target_standard_error=1e12,
+                chunk_size=1000,
+                processes=1),
+            RGB_colourspace_volume_MonteCarlo(
+                RGB_COLOURSPACE_BT709,
+                1000,
+                seed=4,
+                chunk_size=1000,
+                processes=1))
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_MonteCarlo(
+                RGB_COLOURSPACE_BT709,
+                10e6,
+                seed=4,
+                target_standard_error=10000,
+                chunk_size=1000,
+                processes=1) * 1e-6,
+            821700.0 * 1e-6,
+            places=1)
+
 
 class TestRGB_colourspace_volume_coverage_MonteCarlo(unittest.TestCase):
     """
@@ -137,6 +204,32 @@ RGB_colourspace_volume_coverage_MonteCarlo` definition.
             81.044349070100140,
             decimal=7)
 
+    def test_seed_RGB_colourspace_volume_coverage_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_coverage_MonteCarlo` definition independent random
+        streams support.
+        """
+
+        coverage = RGB_colourspace_volume_coverage_MonteCarlo(
+            RGB_COLOURSPACE_BT709,
+            is_within_pointer_gamut,
+            10e3,
+            seed=4,
+            chunk_size=1000,
+            processes=1)
+
+        self.assertEqual(
+            RGB_colourspace_volume_coverage_MonteCarlo(
+                RGB_COLOURSPACE_BT709,
+                is_within_pointer_gamut,
+                10e3,
+                seed=4,
+                chunk_size=1000,
+                processes=2), coverage)
+
+        self.assertAlmostEqual(coverage, 81.0, delta=5)
+
 
 class TestRGB_colourspacePointerGamutCoverageMonteCarlo(unittest.TestCase):
     """
@@ -190,5 +283,146 @@ RGB_colourspace_visible_spectrum_coverage_MonteCarlo` definition.
             decimal=7)
 
 
+class TestRGB_colourspaceVolume(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume` definition unit
+    tests methods.
+    """
+
+    def test_RGB_colourspace_volume(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume` definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume(RGB_COLOURSPACE_BT709),
+            820301.1711,
+            delta=10)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume(RGB_COLOURSPACE_BT2020),
+            1854837.3579,
+            delta=20)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume(RGB_COLOURSPACE_BT709, tolerance=1e-5),
+            820301.1711,
+            delta=0.1)
+
+        with disable_multiprocessing():
+            self.assertAlmostEqual(
+                RGB_colourspace_volume_MonteCarlo(
+                    RGB_COLOURSPACE_BT709,
+                    10e5,
+                    RGB_colourspace_limits(RGB_COLOURSPACE_BT709),
+                    seed=1),
+                RGB_colourspace_volume(RGB_COLOURSPACE_BT709),
+                delta=820301 * 0.005)
+
+    def test_XYZ_to_model_RGB_colourspace_volume(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume` definition
+        with a given colour model.
+        """
+
+        for colourspace in (RGB_COLOURSPACE_BT709, RGB_COLOURSPACE_BT2020):
+            np.testing.assert_almost_equal(
+                RGB_colourspace_volume(
+                    colourspace,
+                    colourspace.whitepoint,
+                    XYZ_to_model=lambda x: x),
+                np.abs(np.linalg.det(colourspace.matrix_RGB_to_XYZ)),
+                decimal=10)
+
+
+class TestRGB_colourspaceVolumeCoverage(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_coverage`
+    definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_coverage(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_coverage`
+        definition.
+        """
+
+        mesh = np.array([
+            [0.2, 0.2, 0.2],
+            [0.3, 0.2, 0.2],
+            [0.2, 0.3, 0.2],
+            [0.2, 0.2, 0.3],
+        ])
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_coverage(RGB_COLOURSPACE_ACES2065_1,
+                                            mesh),
+            100,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_coverage(RGB_COLOURSPACE_BT709,
+                                            mesh + 10),
+            0,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_coverage(RGB_COLOURSPACE_BT709,
+                                            XYZ_outer_surface()),
+            RGB_colourspace_visible_spectrum_coverage(RGB_COLOURSPACE_BT709),
+            decimal=7)
+
+
+class TestRGB_colourspacePointerGamutCoverage(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_pointer_gamut_coverage`
+    definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_pointer_gamut_coverage(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_pointer_gamut_coverage` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_pointer_gamut_coverage(RGB_COLOURSPACE_BT709),
+            81.182091607,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_pointer_gamut_coverage(
+                RGB_COLOURSPACE_ACES2065_1),
+            100,
+            decimal=7)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
+                RGB_COLOURSPACE_BT709, 10e4, seed=1, processes=1),
+            RGB_colourspace_pointer_gamut_coverage(RGB_COLOURSPACE_BT709),
+            delta=1)
+
+
+class TestRGB_colourspaceVisibleSpectrumCoverage(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspace_visible_spectrum_coverage` definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_visible_spectrum_coverage(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_visible_spectrum_coverage` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_visible_spectrum_coverage(RGB_COLOURSPACE_BT709),
+            48.187398066,
+            decimal=7)
+
+        self.assertGreater(
+            RGB_colourspace_visible_spectrum_coverage(RGB_COLOURSPACE_BT2020),
+            RGB_colourspace_visible_spectrum_coverage(RGB_COLOURSPACE_BT709))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,8 +7,9 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT, SpectralShape,
-                                MSDS_CMFS_STANDARD_OBSERVER)
+from colour.colorimetry import (SDS_ILLUMINANTS, SPECTRAL_SHAPE_DEFAULT,
+                                SpectralShape, MSDS_CMFS_STANDARD_OBSERVER,
+                                msds_to_XYZ)
 from colour.volume import (generate_pulse_waves, XYZ_outer_surface,
                            is_within_visible_spectrum)
 from colour.utilities import ignore_numpy_errors
@@ -121,6 +122,26 @@ class TestXYZOuterSurface(unittest.TestCase):
             ]),
             decimal=7)
 
+        shape = SpectralShape(380, 780, 10)
+        cmfs = cmfs.copy().align(shape)
+        illuminant = SDS_ILLUMINANTS['D65'].copy().align(shape)
+        XYZ = XYZ_outer_surface(cmfs, illuminant)
+        np.testing.assert_almost_equal(
+            XYZ,
+            msds_to_XYZ(
+                generate_pulse_waves(len(shape.range())),
+                cmfs,
+                illuminant,
+                method='Integration',
+                shape=shape) / 100,
+            decimal=12)
+
+        XYZ_s = XYZ_outer_surface(cmfs, illuminant, hue_samples=8)
+        self.assertEqual(XYZ_s.shape, (58, 3))
+        XYZ = np.around(XYZ, 12).tolist()
+        for XYZ_i in np.around(XYZ_s, 12).tolist():
+            self.assertIn(XYZ_i, XYZ)
+
 
 class TestIsWithinVisibleSpectrum(unittest.TestCase):
     """